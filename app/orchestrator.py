@@ -85,6 +85,27 @@ class Orchestrator:
         (self.data_dir / "forecasts").mkdir(parents=True, exist_ok=True)
         (self.data_dir / "resolutions").mkdir(parents=True, exist_ok=True)
 
+        # Persistent forecast cache: restarts reuse recently fetched forecasts
+        try:
+            from core.forecast_sources import enable_disk_cache
+            enable_disk_cache(self.data_dir / "forecasts")
+        except Exception as e:
+            logger.debug(f"Forecast disk cache nicht verfuegbar: {e}")
+
+        # Klassifikation/Validierung/Textparsing pro Markttext: persistent
+        try:
+            from core.market_text_cache import enable_market_text_persistence
+            enable_market_text_persistence(self.data_dir / "collector" / "state")
+        except Exception as e:
+            logger.debug(f"Market text cache nicht verfuegbar: {e}")
+
+        # NOAA points -> gridpoint mapping: einmal aufloesen, dann persistent
+        try:
+            from core.noaa_client import enable_gridpoint_persistence
+            enable_gridpoint_persistence(self.data_dir / "forecasts")
+        except Exception as e:
+            logger.debug(f"NOAA gridpoint cache nicht verfuegbar: {e}")
+
     def run_pipeline(self) -> PipelineResult:
         """
         Execute the weather observer pipeline.
@@ -112,6 +133,36 @@ class Orchestrator:
             timestamp=datetime.now().isoformat()
         )
 
+        # Run-scoped forecast cache: weather observer and paper trader checks
+        # share one request per source per city
+        try:
+            from core.forecast_sources import reset_forecast_cache
+            reset_forecast_cache()
+        except Exception as e:
+            logger.debug(f"Forecast cache reset fehlgeschlagen: {e}")
+
+        # Markt-Snapshots (Preise) gelten nur fuer diesen Run; innerhalb des
+        # Runs teilen sich alle Paper-Trader-Checks einen Abruf pro Markt
+        try:
+            from paper_trader.snapshot_client import reset_snapshot_cache
+            reset_snapshot_cache()
+        except Exception as e:
+            logger.debug(f"Snapshot cache reset fehlgeschlagen: {e}")
+
+        # Tages-Max/Min pro (Stadt, Ortsdatum) gelten nur fuer diesen Run
+        try:
+            from core.daily_extremes import reset_daily_extremes_cache
+            reset_daily_extremes_cache()
+        except Exception as e:
+            logger.debug(f"Daily extremes reset fehlgeschlagen: {e}")
+
+        # Source-Metriken (Latenz, Fehlerquote, Cache-Status) pro Run
+        try:
+            from shared.metrics import reset_metrics
+            reset_metrics()
+        except Exception as e:
+            logger.debug(f"Metrics reset fehlgeschlagen: {e}")
+
         # Step 1: Collector
         print("[1/6] Collector: Maerkte abrufen ...", end="", flush=True)
         collector_result = self._run_collector()
@@ -128,10 +179,19 @@ class Orchestrator:
 
         # Step 2: Weather Observer
         print("[2/6] Weather Observer: Analyse + Edge ...", end="", flush=True)
-        weather_result = self._run_weather_observer()
+        weather_result = self._run_weather_observer(
+            collector_result.data.get("candidates") if collector_result.success else None
+        )
         result.add_step(weather_result)
         print(f" {'OK' if weather_result.success else 'FAIL'} ({weather_result.message})")
 
+        # Neue Markttext-Analysen (Collector + Weather Observer) speichern
+        try:
+            from core.market_text_cache import get_market_text_cache
+            get_market_text_cache().flush()
+        except Exception as e:
+            logger.debug(f"Market text cache flush fehlgeschlagen: {e}")
+
         # Step 2b: Market Condition Assessment (READ-ONLY)
         edge_obs_count = weather_result.data.get("edge_observations", 0)
         market_condition = self._assess_market_condition(edge_obs_count)
@@ -154,12 +214,19 @@ class Orchestrator:
             logger.debug(f"Evolution Agent Entry fehlgeschlagen (unkritisch): {e}")
 
         # Step 4: Paper Trader (mit DrawdownProtector-Snapshot)
+        # Position-State-Lock: die einzelnen Schritte holen Snapshots und
+        # Forecasts ohne Lock und nehmen ihn nur fuer Kapital-/Positions-
+        # Aenderungen - der Exit-Monitor (cockpit.py --exit-monitor) wartet
+        # nie auf Netzwerk-Calls dieses Schritts
         print("[4/6] Paper Trader: Trades simulieren ...", end="", flush=True)
         self._record_equity_snapshot("pre_paper_trader")
         paper_result = self._run_paper_trader()
         result.add_step(paper_result)
         print(f" {'OK' if paper_result.success else 'FAIL'} ({paper_result.message})")
 
+        # Step 4b: Live-Preisfeed auf offene Positionen + Kandidaten ausrichten
+        self._update_price_feed_watchlist(collector_result.data.get("candidates") or [])
+
         # Step 5: Outcome Tracker
         print("[5/6] Outcome Tracker: Kalibrierung ...", end="", flush=True)
         outcome_result = self._run_outcome_tracker(weather_result.data)
@@ -350,11 +417,19 @@ class Orchestrator:
             return StepResult(
                 name="collector",
                 success=True,
-                message=f"Fetched {stats.total_fetched} markets, {stats.total_candidates} weather candidates",
+                message=(
+                    f"Fetched {stats.total_fetched} markets, {stats.total_candidates} weather candidates "
+                    f"(+{stats.markets_added} ~{stats.markets_changed} -{stats.markets_removed})"
+                ),
                 data={
                     "total_fetched": stats.total_fetched,
                     "total_candidates": stats.total_candidates,
-                    "filter_results": stats.filter_results
+                    "filter_results": stats.filter_results,
+                    "markets_added": stats.markets_added,
+                    "markets_changed": stats.markets_changed,
+                    "markets_removed": stats.markets_removed,
+                    # In-memory handoff to the weather observer (typed)
+                    "candidates": stats.candidates,
                 }
             )
         except Exception as e:
@@ -370,6 +445,8 @@ class Orchestrator:
         """Loesche Collector-Rohdaten die aelter als max_age_days sind.
 
         Bereinigt raw/, normalized/ und candidates/ Unterverzeichnisse.
+        Archivierte Raw-Payloads (raw/objects/) ohne Manifest-Referenz
+        werden danach entfernt.
         Gibt die Anzahl geloeschter Verzeichnisse zurueck.
         """
         collector_dir = self.data_dir / "collector"
@@ -392,55 +469,64 @@ class Orchestrator:
                 except (ValueError, OSError):
                     continue
 
+        if deleted:
+            from collector.storage import StorageManager
+            StorageManager(base_dir=str(collector_dir)).prune_raw_objects()
+
         return deleted
 
-    def _run_weather_observer(self) -> StepResult:
-        """Run the weather observation engine."""
+    def _load_candidates_from_disk(self) -> List[Any]:
+        """Kandidaten von heute (bzw. letzte nicht-leere Datei) als NormalizedMarket.
+
+        Fallback, wenn der Collector-Schritt keine Kandidaten im Speicher
+        geliefert hat (z.B. Collector fehlgeschlagen).
+        """
+        from collector.normalizer import NormalizedMarket
+
+        today = date.today().isoformat()
+        candidates_root = self.data_dir / "collector" / "candidates"
+        candidates_file = candidates_root / today / "candidates.jsonl"
+
+        # Fallback to most recent non-empty candidates file if today's is missing/empty
+        if not candidates_file.exists() or candidates_file.stat().st_size == 0:
+            if candidates_root.exists():
+                for day_dir in sorted(candidates_root.iterdir(), reverse=True):
+                    fallback = day_dir / "candidates.jsonl"
+                    if fallback.exists() and fallback.stat().st_size > 0:
+                        candidates_file = fallback
+                        logger.info(f"Using fallback candidates file: {fallback}")
+                        break
+
+        candidates = []
+        if candidates_file.exists() and candidates_file.stat().st_size > 0:
+            with open(candidates_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        try:
+                            candidates.append(NormalizedMarket(**json.loads(line)))
+                        except Exception as e:
+                            logger.debug(f"Skipping invalid candidate: {e}")
+        return candidates
+
+    def _run_weather_observer(self, candidates: Optional[List[Any]] = None) -> StepResult:
+        """Run the weather observation engine.
+
+        Args:
+            candidates: NormalizedMarket-Kandidaten direkt aus dem Collector-
+                Schritt; None = von Disk laden (candidates.jsonl)
+        """
         try:
             from core.weather_engine import create_engine
-            from core.weather_market_filter import WeatherMarket, WeatherMarketFilter
+            from core.weather_market_filter import WeatherMarket
             from collector.client import PolymarketClient
-            import json
-            import yaml
-            from datetime import datetime
 
-            # Load config and create filter
-            config_path = self.data_dir.parent / "config" / "weather.yaml"
-            with open(config_path) as f:
-                weather_config = yaml.safe_load(f)
-            weather_filter = WeatherMarketFilter(weather_config)
-
-            # Load collected weather candidates (stored in date-based path)
-            from datetime import date
-            today = date.today().isoformat()
-            candidates_root = self.data_dir / "collector" / "candidates"
-            candidates_file = candidates_root / today / "candidates.jsonl"
-            raw_candidates = []
-
-            # Fallback to most recent non-empty candidates file if today's is missing/empty
-            if not candidates_file.exists() or candidates_file.stat().st_size == 0:
-                if candidates_root.exists():
-                    for day_dir in sorted(candidates_root.iterdir(), reverse=True):
-                        fallback = day_dir / "candidates.jsonl"
-                        if fallback.exists() and fallback.stat().st_size > 0:
-                            candidates_file = fallback
-                            logger.info(f"Using fallback candidates file: {fallback}")
-                            break
-
-            # Step 1: Load raw candidate data
-            if candidates_file.exists() and candidates_file.stat().st_size > 0:
-                with open(candidates_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            try:
-                                data = json.loads(line)
-                                raw_candidates.append(data)
-                            except Exception as e:
-                                logger.debug(f"Skipping invalid candidate: {e}")
+            # Step 1: Candidates - in-memory handoff, disk only as fallback
+            if candidates is None:
+                candidates = self._load_candidates_from_disk()
 
             # Step 2: Fetch real market odds from Polymarket API
-            market_ids = [c.get("market_id", "") for c in raw_candidates if c.get("market_id")]
+            market_ids = [c.market_id for c in candidates if c.market_id]
             real_prices = {}
             if market_ids:
                 try:
@@ -451,10 +537,11 @@ class Orchestrator:
                     logger.warning(f"Failed to fetch real market prices: {e}")
 
             # Step 3: Convert to WeatherMarket with real odds
+            # (filtering happens once, inside WeatherEngine.run)
             weather_markets = []
-            for data in raw_candidates:
+            for candidate in candidates:
                 try:
-                    market_id = data.get("market_id", "")
+                    market_id = candidate.market_id
 
                     # Get real odds and liquidity if available
                     odds_yes = 0.05  # Default fallback
@@ -479,24 +566,20 @@ class Orchestrator:
                             except Exception:
                                 pass
 
-                    market = WeatherMarket(
+                    weather_markets.append(WeatherMarket(
                         market_id=market_id,
-                        question=data.get("title", ""),
-                        resolution_text=data.get("resolution_text", ""),
-                        description=data.get("description", ""),
+                        question=candidate.title or "",
+                        resolution_text=candidate.resolution_text or "",
+                        description="",
                         category="WEATHER",
                         is_binary=True,
                         liquidity_usd=liquidity_usd,
                         odds_yes=odds_yes,
-                        resolution_time=datetime.fromisoformat(data["end_date"]) if data.get("end_date") else datetime.now(),
-                    )
-
-                    # Run through filter to populate detected_city and detected_threshold
-                    filter_result = weather_filter.filter_market(market)
-                    if filter_result.passed and filter_result.market:
-                        weather_markets.append(filter_result.market)
-                    else:
-                        logger.debug(f"Market {market.market_id} filtered out: {filter_result.rejection_reasons}")
+                        resolution_time=(
+                            datetime.fromisoformat(candidate.end_date)
+                            if candidate.end_date else datetime.now()
+                        ),
+                    ))
                 except Exception as e:
                     logger.debug(f"Skipping invalid candidate: {e}")
 
@@ -506,7 +589,11 @@ class Orchestrator:
             def market_fetcher():
                 return weather_markets
 
-            engine = create_engine(market_fetcher=market_fetcher)
+            config_path = self.data_dir.parent / "config" / "weather.yaml"
+            engine = create_engine(
+                config_path=str(config_path) if config_path.exists() else None,
+                market_fetcher=market_fetcher,
+            )
             result = engine.run()
 
             return StepResult(
@@ -594,6 +681,7 @@ class Orchestrator:
             from paper_trader.position_manager import check_and_close_resolved, check_mid_trade_exits
             from paper_trader.averaging_down import check_averaging_down
             from paper_trader.edge_reversal import check_edge_reversal_exits
+            from paper_trader.snapshot_client import get_market_snapshots
 
             # Step 1: Check mid-trade exits FIRST (take-profit / stop-loss)
             mid_trade = check_mid_trade_exits()
@@ -623,12 +711,13 @@ class Orchestrator:
             eligible = get_eligible_proposals()
             logger.info(f"Found {len(eligible)} eligible proposals for paper trading")
 
-            # Simulate entries
+            # Simulate entries (Snapshots gebuendelt vorab, ausserhalb des Locks)
             entered = 0
             skipped = 0
+            snapshots = get_market_snapshots([p.market_id for p in eligible]) if eligible else {}
 
             for proposal in eligible:
-                position, record = simulate_entry(proposal)
+                position, record = simulate_entry(proposal, snapshots)
                 if position is not None:
                     entered += 1
                     logger.info(f"Paper ENTRY: {proposal.market_id[:30]}... | {position.side} @ {position.entry_price:.4f}")
@@ -673,6 +762,24 @@ class Orchestrator:
                 error=str(e)
             )
 
+    def _update_price_feed_watchlist(self, candidates: List[Any]) -> None:
+        """CLOB-Preisfeed (falls gestartet) beobachtet offene Positionen + Kandidaten.
+
+        Non-blocking: Fehler werden nur geloggt, Snapshots fallen auf Gamma zurueck.
+        """
+        try:
+            from paper_trader.price_feed import get_price_feed
+            feed = get_price_feed()
+            if feed is None:
+                return
+            from paper_trader.position_manager import get_open_positions
+            market_ids = [p.market_id for p in get_open_positions()]
+            market_ids += [c.market_id for c in candidates if c.market_id]
+            feed.set_watchlist(market_ids)
+            logger.info(f"Preisfeed: {feed.stats()}")
+        except Exception as e:
+            logger.debug(f"Preisfeed-Watchlist fehlgeschlagen (unkritisch): {e}")
+
     def _run_outcome_tracker(self, weather_data: Dict[str, Any]) -> StepResult:
         """Record observations for calibration tracking."""
         try:
@@ -772,6 +879,57 @@ class Orchestrator:
             logger.debug(f"Drawdown-Status nicht verfuegbar: {e}")
             return {}
 
+    def _get_forecast_cache_summary(self) -> Dict[str, Any]:
+        """Hole Forecast-Cache Hit/Miss-Zaehler dieses Runs fuer Summary."""
+        try:
+            from core.forecast_sources import get_forecast_cache
+            stats = get_forecast_cache().stats()
+            logger.info(
+                f"Forecast cache: {stats['hits']} hits ({stats['disk_hits']} disk), "
+                f"{stats['misses']} misses"
+            )
+            return stats
+        except Exception as e:
+            logger.debug(f"Forecast-Cache-Status nicht verfuegbar: {e}")
+            return {}
+
+    def _get_source_metrics_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Hole Latenz-/Fehler-/Cache-Metriken pro Datenquelle dieses Runs."""
+        try:
+            from shared.metrics import get_metrics_registry
+            metrics = get_metrics_registry().snapshot()
+            for source, m in metrics.items():
+                if m["requests"]:
+                    logger.info(
+                        f"Source {source}: {m['requests']} req, "
+                        f"err={m['error_rate']:.1%}, p50={m['latency_p50_ms']:.0f}ms, "
+                        f"p95={m['latency_p95_ms']:.0f}ms, p99={m['latency_p99_ms']:.0f}ms"
+                    )
+            return metrics
+        except Exception as e:
+            logger.debug(f"Source-Metriken nicht verfuegbar: {e}")
+            return {}
+
+    @staticmethod
+    def _format_source_metrics(metrics: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Status-Zeilen: eine pro Quelle, langsamste (p95) zuerst."""
+        if not metrics:
+            return []
+        lines = ["Source metrics:"]
+        ordered = sorted(metrics.items(), key=lambda item: -item[1].get("latency_p95_ms", 0.0))
+        for source, m in ordered:
+            cache = m.get("cache", {})
+            cache_text = ", ".join(f"{k}={v}" for k, v in sorted(cache.items())) or "-"
+            lines.append(
+                f"  {source:<26} req={m.get('requests', 0):<4} "
+                f"err={m.get('error_rate', 0.0):>6.1%}  "
+                f"p50={m.get('latency_p50_ms', 0.0):>6.0f}ms "
+                f"p95={m.get('latency_p95_ms', 0.0):>6.0f}ms "
+                f"p99={m.get('latency_p99_ms', 0.0):>6.0f}ms  "
+                f"{m.get('payload_bytes', 0) / 1024:>7.1f}KB  cache: {cache_text}"
+            )
+        return lines
+
     def _build_summary(self, result: PipelineResult) -> Dict[str, Any]:
         """Build the pipeline summary."""
         collector_step = next((s for s in result.steps if s.name == "collector"), None)
@@ -781,6 +939,7 @@ class Orchestrator:
         outcome_step = next((s for s in result.steps if s.name == "outcome_tracker"), None)
 
         dd = self._get_drawdown_summary()
+        fc = self._get_forecast_cache_summary()
         from core.market_condition import load_last_condition
         mc = load_last_condition()
         return {
@@ -800,6 +959,10 @@ class Orchestrator:
             "drawdown_recovery_mode": dd.get("is_recovery_mode", False),
             "drawdown_size_factor": dd.get("size_factor", 1.0),
             "market_condition": mc.get("condition", "WATCH"),
+            "forecast_cache_hits": fc.get("hits", 0),
+            "forecast_cache_disk_hits": fc.get("disk_hits", 0),
+            "forecast_cache_misses": fc.get("misses", 0),
+            "source_metrics": self._get_source_metrics_summary(),
         }
 
     @staticmethod
@@ -841,7 +1004,11 @@ class Orchestrator:
                 f"Drawdown:             {result.summary.get('drawdown_pct', 0.0):.1f}% "
                 f"{'[RECOVERY MODE]' if result.summary.get('drawdown_recovery_mode') else '[OK]'}",
                 f"Market Condition:     {result.summary.get('market_condition', 'WATCH')}",
+                f"Forecast cache:       {result.summary.get('forecast_cache_hits', 0)} hits "
+                f"({result.summary.get('forecast_cache_disk_hits', 0)} disk), "
+                f"{result.summary.get('forecast_cache_misses', 0)} misses",
             ]
+            entry_lines.extend(self._format_source_metrics(result.summary.get("source_metrics", {})))
 
             errors = [s for s in result.steps if not s.success]
             if errors:
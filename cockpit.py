@@ -13,6 +13,8 @@
 #   python cockpit.py --run-once         # Run pipeline once, exit
 #   python cockpit.py --status           # Show status only
 #   python cockpit.py --scheduler        # Run every 15 minutes
+#   python cockpit.py --exit-monitor     # Fast TP/SL exits only (own process)
+#   python cockpit.py --scheduler --exit-monitor   # Both in one process
 #
 # =============================================================================
 
@@ -395,8 +397,63 @@ def run_once() -> int:
         return 1
 
 
-def run_scheduler(interval_seconds: int = 900) -> int:
-    """Run pipeline on a schedule with crash resilience."""
+def _start_exit_monitor(feed, interval_seconds: float, manage_watchlist: bool):
+    """Start the fast exit loop in a daemon thread (stopped at exit)."""
+    from paper_trader.exit_monitor import ExitMonitor
+
+    monitor = ExitMonitor(
+        feed=feed,
+        interval_seconds=interval_seconds,
+        manage_watchlist=manage_watchlist,
+    ).start()
+    atexit.register(monitor.stop)
+    return monitor
+
+
+def run_exit_monitor(interval_seconds: float = 5.0) -> int:
+    """Run only the fast TP/SL/trailing exit loop (no pipeline).
+
+    Shares the position state lock with a scheduler in another process,
+    so it can run next to `--scheduler` without taking cockpit.lock.
+    """
+    print_header()
+    print(f"{C.BOLD}Exit Monitor Mode{C.RESET}")
+    print(f"  Interval: {interval_seconds:g}s (plus every price update)")
+    print(f"  PID:      {os.getpid()}")
+
+    feed = None
+    try:
+        from paper_trader.price_feed import start_price_feed, stop_price_feed
+        feed = start_price_feed()
+        if feed is not None:
+            atexit.register(stop_price_feed)
+    except Exception as e:
+        logger.warning("Preisfeed konnte nicht gestartet werden: %s", e)
+    print(f"  Feed:     {'CLOB WebSocket' if feed is not None else 'Gamma polling'}")
+    print(f"\n{C.DIM}Press Ctrl+C to stop{C.RESET}\n")
+
+    monitor = _start_exit_monitor(feed, interval_seconds, manage_watchlist=True)
+    try:
+        while True:
+            time.sleep(60)
+            stats = monitor.stats()
+            print(
+                f"{C.DIM}{datetime.now().strftime('%H:%M:%S')}{C.RESET} "
+                f"Positions: {stats['positions']} | Checks: {stats['checks']} | "
+                f"Exits: {stats['exits']} | P&L: {stats['pnl_eur']:+.2f} EUR"
+            )
+    except KeyboardInterrupt:
+        monitor.stop()
+        print(f"\n{C.YELLOW}Exit monitor stopped{C.RESET}")
+        return 0
+
+
+def run_scheduler(interval_seconds: int = 900, exit_monitor_interval: float | None = None) -> int:
+    """Run pipeline on a schedule with crash resilience.
+
+    With exit_monitor_interval the fast exit loop runs as a thread next to
+    the pipeline (both hold the position state lock while trading).
+    """
     run_count = 0
     consecutive_errors = 0
     start_time = datetime.now()
@@ -410,6 +467,21 @@ def run_scheduler(interval_seconds: int = 900) -> int:
 
     write_heartbeat()  # Initial heartbeat
 
+    # Long-lived CLOB price feed: live top-of-book for open positions and
+    # candidates (optional - without websocket-client snapshots use Gamma)
+    feed = None
+    try:
+        from paper_trader.price_feed import start_price_feed, stop_price_feed
+        feed = start_price_feed()
+        if feed is not None:
+            atexit.register(stop_price_feed)
+    except Exception as e:
+        logger.warning("Preisfeed konnte nicht gestartet werden: %s", e)
+
+    # The pipeline owns the feed watchlist; the exit loop only adds positions
+    if exit_monitor_interval is not None:
+        _start_exit_monitor(feed, exit_monitor_interval, manage_watchlist=False)
+
     try:
         while True:
             run_count += 1
@@ -583,6 +655,9 @@ Examples:
   python cockpit.py --run-once         Run pipeline once, exit
   python cockpit.py --status           Show status only
   python cockpit.py --scheduler        Run every 15 minutes
+  python cockpit.py --exit-monitor     Fast TP/SL exits only (own process)
+  python cockpit.py --scheduler --exit-monitor
+                                       Pipeline + fast exits in one process
 """
     )
 
@@ -594,6 +669,10 @@ Examples:
                         help='Run pipeline on a schedule')
     parser.add_argument('--interval', type=int, default=900,
                         help='Interval between runs in seconds (default: 900)')
+    parser.add_argument('--exit-monitor', action='store_true',
+                        help='Check take-profit/stop-loss exits on every price update')
+    parser.add_argument('--exit-interval', type=float, default=5.0,
+                        help='Exit check interval without price updates in seconds (default: 5)')
     parser.add_argument('--no-color', action='store_true',
                         help='Disable colors')
 
@@ -601,6 +680,8 @@ Examples:
 
     if args.interval < 60:
         parser.error("Interval muss mindestens 60 Sekunden sein")
+    if args.exit_interval < 1:
+        parser.error("Exit-Interval muss mindestens 1 Sekunde sein")
 
     if args.no_color:
         C.disable()
@@ -623,12 +704,19 @@ Examples:
     except Exception:
         pass  # Monitor ist optional
 
-    # Lockfile only for long-running modes (scheduler, interactive)
-    if args.scheduler or not (args.run_once or args.status):
+    # Lockfile only for long-running modes (scheduler, interactive).
+    # A standalone exit monitor runs next to the scheduler without it.
+    standalone_exit_monitor = args.exit_monitor and not args.scheduler
+    if not standalone_exit_monitor and (args.scheduler or not (args.run_once or args.status)):
         acquire_lock()
 
     if args.scheduler:
-        sys.exit(run_scheduler(args.interval))
+        sys.exit(run_scheduler(
+            args.interval,
+            exit_monitor_interval=args.exit_interval if args.exit_monitor else None,
+        ))
+    elif standalone_exit_monitor:
+        sys.exit(run_exit_monitor(args.exit_interval))
     elif args.run_once:
         sys.exit(run_once())
     elif args.status:
@@ -21,6 +21,7 @@ from .sanitizer import Sanitizer
 from .filter import MarketFilter
 from .normalizer import MarketNormalizer
 from .storage import StorageManager
+from .market_state import MarketStateStore
 from .collector import Collector
 
 __all__ = [
@@ -29,5 +30,6 @@ __all__ = [
     "MarketFilter",
     "MarketNormalizer",
     "StorageManager",
+    "MarketStateStore",
     "Collector",
 ]
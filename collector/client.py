@@ -6,7 +6,17 @@
 #
 # DESIGN:
 # - Only uses official Polymarket Gamma API endpoints
-# - Implements exponential backoff for retries
+# - Requests go through the shared HTTP transport: pooled connections,
+#   gzip, conditional GETs (304 for unchanged pages), retries with
+#   exponential backoff, per-host rate limiter (token bucket, Retry-After,
+#   circuit breaker) instead of fixed sleeps
+# - Weather/climate tags are paginated concurrently with speculative
+#   next-page prefetch into bounded page buffers; markets are streamed
+#   in a stable order (iter_weather_markets)
+# - Prices/snapshots for known ids are fetched in bulk: /markets with
+#   repeated id= (or condition_ids=) parameters, MARKETS_BATCH_SIZE ids
+#   per request (fetch_markets_by_ids); ids the list omits (e.g. closed
+#   markets) are looked up one by one via /markets/{id}
 # - Clear error handling and logging
 # - NO web scraping
 #
@@ -16,24 +26,27 @@
 #
 # =============================================================================
 
-import time
 import logging
-from typing import List, Dict, Any, Optional
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
-from urllib.parse import urlencode
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional
 import json
-import ssl
+
+from shared.http_transport import get_http_transport
 
 logger = logging.getLogger(__name__)
 
+# Sentinel closing a tag's page buffer
+_END_OF_TAG = object()
+
 
 class PolymarketClient:
     """
     HTTP client for Polymarket Gamma API.
 
     Features:
-    - Exponential backoff retry logic
+    - Retry logic with exponential backoff (shared transport)
     - Configurable timeouts
     - Pagination support
     - Clear error logging
@@ -42,13 +55,15 @@ class PolymarketClient:
     BASE_URL = "https://gamma-api.polymarket.com"
     DEFAULT_TIMEOUT = 30  # seconds
     MAX_RETRIES = 3
-    INITIAL_BACKOFF = 1.0  # seconds
-    MAX_BACKOFF = 30.0  # seconds
 
-    # Delay between paginated API requests (seconds)
-    API_DELAY_SECONDS = 0.5
-    # Delay between batch event fetches (seconds)
-    BATCH_DELAY_SECONDS = 0.3
+    # Event tags paginated by fetch_weather_markets (merge order)
+    WEATHER_TAGS = ("weather", "climate")
+    EVENTS_PAGE_SIZE = 100
+    # Pages buffered per tag ahead of the consumer (bounds memory)
+    PAGE_BUFFER = 4
+    # Ids per bulk /markets request (keeps the URL well below 8 KB even
+    # for 66-char condition ids)
+    MARKETS_BATCH_SIZE = 50
 
     def __init__(
         self,
@@ -65,9 +80,6 @@ class PolymarketClient:
         self.timeout = timeout
         self.max_retries = max_retries
 
-        # Create SSL context that works on Windows
-        self.ssl_context = ssl.create_default_context()
-
     def fetch_markets(
         self,
         limit: int = 100,
@@ -136,9 +148,6 @@ class PolymarketClient:
             all_markets.extend(markets)
             offset += len(markets)
 
-            # Small delay between pages to be respectful
-            time.sleep(self.API_DELAY_SECONDS)
-
             if len(markets) < limit:
                 logger.info("Received fewer markets than requested - end of data")
                 break
@@ -189,7 +198,7 @@ class PolymarketClient:
         Fetch weather-related markets from Polymarket.
 
         Weather markets are tagged with "weather" or "climate" on Polymarket.
-        This method fetches events with these tags and extracts the markets.
+        List form of iter_weather_markets().
 
         Args:
             max_markets: Maximum total markets to return
@@ -198,73 +207,244 @@ class PolymarketClient:
         Returns:
             List of market dictionaries from weather events
         """
-        all_markets = []
-        seen_ids = set()
+        all_markets = list(self.iter_weather_markets(max_markets, include_closed))
+        logger.info(f"Total weather markets fetched: {len(all_markets)}")
+        return all_markets
 
-        # Fetch from both weather and climate tags
-        for tag in ["weather", "climate"]:
-            offset = 0
-            page_size = 100
+    def iter_weather_markets(
+        self,
+        max_markets: int = 500,
+        include_closed: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream weather markets page by page.
+
+        Both tags are paginated concurrently; while one page is processed the
+        next offset is already in flight (speculative prefetch). Each tag
+        buffers at most PAGE_BUFFER pages, so memory stays bounded no matter
+        how many markets the API returns. Markets are yielded in a stable
+        order (tag order, then offset) - identical to walking the tags one
+        after the other - and deduplicated via seen_ids.
 
-            while len(all_markets) < max_markets:
-                logger.info(f"Fetching {tag} events: offset={offset}")
+        Closing the generator early stops the background pagination.
+        """
+        tags = self.WEATHER_TAGS
+        stop = threading.Event()
+        buffers = [queue.Queue(maxsize=self.PAGE_BUFFER) for _ in tags]
+        seen_ids = set()
+        count = 0
 
-                events = self.fetch_events(
-                    limit=page_size,
-                    offset=offset,
-                    tag_slug=tag,
-                    closed=None,  # Get all, filter later
+        with ThreadPoolExecutor(max_workers=len(tags)) as tag_pool, \
+                ThreadPoolExecutor(max_workers=2 * len(tags)) as page_pool:
+            for tag, buffer in zip(tags, buffers):
+                tag_pool.submit(
+                    self._paginate_tag, page_pool, tag, max_markets, include_closed, buffer, stop,
                 )
+            try:
+                for tag, buffer in zip(tags, buffers):
+                    while True:
+                        events = buffer.get()
+                        if events is _END_OF_TAG:
+                            break
+                        if isinstance(events, Exception):
+                            raise events
+                        for market in self._extract_markets(events, tag, seen_ids, include_closed):
+                            yield market
+                            count += 1
+                            if count >= max_markets:
+                                return
+            finally:
+                stop.set()
+
+    def _paginate_tag(
+        self,
+        page_pool: ThreadPoolExecutor,
+        tag: str,
+        max_markets: int,
+        include_closed: bool,
+        buffer: "queue.Queue",
+        stop: threading.Event,
+    ) -> None:
+        """
+        Producer: paginate one tag into a bounded buffer, prefetching
+        offset + page_size while the current page is handed over.
 
-                if not events:
+        Stops at the last (short/empty) page, once the tag alone holds
+        max_markets eligible markets, or when the consumer sets stop.
+        Errors are passed through the buffer and re-raised by the consumer.
+        """
+        page_size = self.EVENTS_PAGE_SIZE
+        eligible_ids = set()
+        offset = 0
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            logger.info(f"Fetching {tag} events: offset={offset}")
+            current = page_pool.submit(
+                self.fetch_events, limit=page_size, offset=offset, tag_slug=tag, closed=None,
+            )
+
+            while current is not None and not stop.is_set():
+                events = current.result()
+
+                # Speculative prefetch: a full page means there may be more
+                upcoming = None
+                if len(events) >= page_size:
+                    logger.info(f"Fetching {tag} events: offset={offset + len(events)}")
+                    upcoming = page_pool.submit(
+                        self.fetch_events,
+                        limit=page_size,
+                        offset=offset + len(events),
+                        tag_slug=tag,
+                        closed=None,  # Get all, filter later
+                    )
+
+                if not events or not put(events):
                     break
 
-                # Extract markets from events
                 for event in events:
-                    event_closed = event.get("closed", False)
-                    event_title = event.get("title", "")
-                    event_tags = event.get("tags", [])
-                    tag_labels = [
-                        t.get("label", "") for t in event_tags
-                        if isinstance(t, dict)
-                    ]
+                    for market in event.get("markets", []):
+                        if include_closed or not (event.get("closed", False) or market.get("closed", False)):
+                            eligible_ids.add(market.get("id") or market.get("conditionId"))
+                if len(eligible_ids) >= max_markets and upcoming is not None:
+                    upcoming.cancel()
+                    break
 
-                    markets = event.get("markets", [])
-                    for market in markets:
-                        market_id = market.get("id") or market.get("conditionId")
-                        market_closed = market.get("closed", False)
+                offset += len(events)
+                current = upcoming
+        except Exception as e:
+            put(e)
+            return
+        put(_END_OF_TAG)
+
+    @staticmethod
+    def _extract_markets(
+        events: List[Dict[str, Any]],
+        tag: str,
+        seen_ids: set,
+        include_closed: bool,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield open, not yet seen markets of one event page, enriched with event metadata."""
+        for event in events:
+            event_closed = event.get("closed", False)
+            event_title = event.get("title", "")
+            event_tags = event.get("tags", [])
+            tag_labels = [
+                t.get("label", "") for t in event_tags
+                if isinstance(t, dict)
+            ]
+
+            markets = event.get("markets", [])
+            for market in markets:
+                market_id = market.get("id") or market.get("conditionId")
+                market_closed = market.get("closed", False)
+
+                # Skip if already seen
+                if market_id in seen_ids:
+                    continue
 
-                        # Skip if already seen
-                        if market_id in seen_ids:
-                            continue
+                # Skip closed markets if not requested
+                if not include_closed and (event_closed or market_closed):
+                    continue
 
-                        # Skip closed markets if not requested
-                        if not include_closed and (event_closed or market_closed):
-                            continue
+                seen_ids.add(market_id)
 
-                        seen_ids.add(market_id)
+                # Enrich market with event metadata
+                market["_event_title"] = event_title
+                market["_event_tags"] = tag_labels
+                market["_source_tag"] = tag
 
-                        # Enrich market with event metadata
-                        market["_event_title"] = event_title
-                        market["_event_tags"] = tag_labels
-                        market["_source_tag"] = tag
+                yield market
 
-                        all_markets.append(market)
+    def fetch_markets_by_ids(
+        self,
+        market_ids: List[str],
+        batch_size: Optional[int] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch specific markets in bulk.
 
-                        if len(all_markets) >= max_markets:
-                            break
+        Ids are chunked into batch_size ids per /markets request, one
+        request per id kind (numeric Gamma ids as id=, 0x condition ids as
+        condition_ids=; Gamma may AND-combine both filters). Requested ids
+        missing from the bulk response - omitted by the list endpoint
+        (e.g. closed markets) or lost to a failed request - are looked up
+        one by one via fetch_market(), so no caller silently loses them.
 
-                    if len(all_markets) >= max_markets:
-                        break
+        Args:
+            market_ids: Gamma market ids and/or condition ids
+            batch_size: Ids per request (default: MARKETS_BATCH_SIZE)
 
-                offset += len(events)
-                time.sleep(self.BATCH_DELAY_SECONDS)  # Rate limiting
+        Returns:
+            Dict mapping each requested id that was found to its market
+        """
+        batch_size = max(1, batch_size or self.MARKETS_BATCH_SIZE)
+        wanted = list(dict.fromkeys(mid for mid in market_ids if mid))
+        found: Dict[str, Dict[str, Any]] = {}
 
-                if len(events) < page_size:
-                    break
+        def collect(markets: List[Any], requested: set) -> None:
+            for market in markets:
+                if not isinstance(market, dict):
+                    continue
+                for key in (market.get("id"), market.get("conditionId")):
+                    if key is not None and str(key) in requested:
+                        found[str(key)] = market
+
+        for start in range(0, len(wanted), batch_size):
+            chunk = wanted[start:start + batch_size]
+            requested = set(chunk)
+            ids = [mid for mid in chunk if not mid.startswith("0x")]
+            condition_ids = [mid for mid in chunk if mid.startswith("0x")]
+
+            for param, values in (("id", ids), ("condition_ids", condition_ids)):
+                if not values:
+                    continue
+                try:
+                    collect(self._request("/markets", {"limit": len(values), param: values}), requested)
+                except Exception as e:
+                    logger.warning(
+                        f"Bulk market fetch failed ({len(values)} ids), falling back to single lookups: {e}"
+                    )
+
+            for mid in chunk:
+                if mid in found:
+                    continue
+                try:
+                    market = self.fetch_market(mid)
+                except Exception as single_error:
+                    logger.warning(f"Failed to fetch market {mid}: {single_error}")
+                    continue
+                if market is not None:
+                    collect([market], requested)
 
-        logger.info(f"Total weather markets fetched: {len(all_markets)}")
-        return all_markets
+        logger.debug(f"Bulk fetched {len(found)}/{len(wanted)} markets")
+        return found
+
+    def fetch_market(self, market_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one market via the single-market endpoint (/markets/{id}).
+
+        Unlike the bulk /markets list, this also returns markets the list
+        endpoint leaves out (e.g. closed ones).
+
+        Returns:
+            The market, or None if the response holds no market
+
+        Raises:
+            RuntimeError: If the request fails
+        """
+        for market in self._request(f"/markets/{market_id}"):
+            if isinstance(market, dict):
+                return market
+        return None
 
     def fetch_market_prices(
         self,
@@ -274,7 +454,8 @@ class PolymarketClient:
         Fetch current prices/odds for specific markets.
 
         This is used by the Weather Engine to get live odds for edge calculation.
-        Only fetches price data, no trade execution.
+        Only fetches price data, no trade execution. Bulk requests, see
+        fetch_markets_by_ids().
 
         Args:
             market_ids: List of market IDs to fetch prices for
@@ -282,31 +463,17 @@ class PolymarketClient:
         Returns:
             Dict mapping market_id to price data
         """
-        prices = {}
-
-        for market_id in market_ids:
-            try:
-                result = self._request(f"/markets/{market_id}")
-                if result and isinstance(result, list) and len(result) > 0:
-                    market = result[0]
-                elif isinstance(result, dict):
-                    market = result
-                else:
-                    continue
-
-                prices[market_id] = {
-                    "outcomePrices": market.get("outcomePrices"),
-                    "bestBid": market.get("bestBid"),
-                    "bestAsk": market.get("bestAsk"),
-                    "lastTradePrice": market.get("lastTradePrice"),
-                    "volume": market.get("volume"),
-                    "liquidity": market.get("liquidity"),
-                }
-
-                time.sleep(0.2)
-
-            except Exception as e:
-                logger.warning(f"Failed to fetch prices for {market_id}: {e}")
+        prices = {
+            market_id: {
+                "outcomePrices": market.get("outcomePrices"),
+                "bestBid": market.get("bestBid"),
+                "bestAsk": market.get("bestAsk"),
+                "lastTradePrice": market.get("lastTradePrice"),
+                "volume": market.get("volume"),
+                "liquidity": market.get("liquidity"),
+            }
+            for market_id, market in self.fetch_markets_by_ids(market_ids).items()
+        }
 
         logger.info(f"Fetched prices for {len(prices)}/{len(market_ids)} markets")
         return prices
@@ -366,76 +533,36 @@ class PolymarketClient:
             RuntimeError: If all retry attempts fail
         """
         url = f"{self.BASE_URL}{endpoint}"
-        if params:
-            url = f"{url}?{urlencode(params)}"
-
-        backoff = self.INITIAL_BACKOFF
-        last_error = None
-
-        for attempt in range(self.max_retries):
-            try:
-                logger.debug(f"Request attempt {attempt + 1}: {url}")
-
-                request = Request(
-                    url,
-                    headers={
-                        "User-Agent": "PolymarketEUCollector/1.0",
-                        "Accept": "application/json",
-                    },
-                )
-
-                with urlopen(
-                    request,
-                    timeout=self.timeout,
-                    context=self.ssl_context,
-                ) as response:
-                    data = response.read().decode("utf-8")
-                    result = json.loads(data)
-
-                    # API may return list directly or wrapped in object
-                    if isinstance(result, list):
-                        return result
-                    elif isinstance(result, dict):
-                        # Check common wrapper keys
-                        for key in ["data", "markets", "events", "results"]:
-                            if key in result and isinstance(result[key], list):
-                                return result[key]
-                        # If it's a single object, wrap in list
-                        return [result]
-                    else:
-                        logger.warning(f"Unexpected response type: {type(result)}")
-                        return []
-
-            except HTTPError as e:
-                last_error = e
-                logger.warning(
-                    f"HTTP error {e.code} on attempt {attempt + 1}: {e.reason}"
-                )
-
-                # Don't retry client errors (4xx) except 429 (rate limit)
-                if 400 <= e.code < 500 and e.code != 429:
-                    raise RuntimeError(f"Client error: {e.code} {e.reason}")
-
-            except URLError as e:
-                last_error = e
-                logger.warning(f"URL error on attempt {attempt + 1}: {e.reason}")
 
-            except json.JSONDecodeError as e:
-                last_error = e
-                logger.warning(f"JSON decode error on attempt {attempt + 1}: {e}")
-
-            except Exception as e:
-                last_error = e
-                logger.warning(f"Unexpected error on attempt {attempt + 1}: {e}")
+        response = get_http_transport().get(
+            url,
+            params=params,
+            headers={"User-Agent": "PolymarketEUCollector/1.0"},
+            timeout=self.timeout,
+            max_attempts=self.max_retries,
+            source="gamma",
+        )
 
-            # Exponential backoff before retry
-            if attempt < self.max_retries - 1:
-                sleep_time = min(backoff, self.MAX_BACKOFF)
-                logger.info(f"Retrying in {sleep_time:.1f}s...")
-                time.sleep(sleep_time)
-                backoff *= 2
+        if not response.ok:
+            # Don't retry client errors (4xx) except 429 (rate limit)
+            if 400 <= response.status < 500 and response.status != 429:
+                raise RuntimeError(f"Client error: {response.status}")
+            raise RuntimeError(
+                f"All {self.max_retries} retry attempts failed. Last error: {response.error}"
+            )
 
-        # All retries exhausted
-        raise RuntimeError(
-            f"All {self.max_retries} retry attempts failed. Last error: {last_error}"
-        )
+        result = response.data
+
+        # API may return list directly or wrapped in object
+        if isinstance(result, list):
+            return result
+        elif isinstance(result, dict):
+            # Check common wrapper keys
+            for key in ["data", "markets", "events", "results"]:
+                if key in result and isinstance(result[key], list):
+                    return result[key]
+            # If it's a single object, wrap in list
+            return [result]
+        else:
+            logger.warning(f"Unexpected response type: {type(result)}")
+            return []
@@ -4,26 +4,32 @@
 #
 # WEATHER-ONLY COLLECTOR
 #
-# PIPELINE:
-# 1. Fetch markets from Polymarket API
-# 2. Sanitize (strip forbidden fields)
-# 3. Filter for weather relevance
-# 4. Normalize to standard format
-# 5. Save raw, normalized, and candidate records
+# PIPELINE (streaming, one market at a time):
+# 1. Fetch markets from Polymarket API (page by page)
+#    -> diff against persistent market state (added/changed/removed)
+# 2. Sanitize (strip forbidden fields)       - new/changed markets only
+# 3. Filter for weather relevance            - new/changed markets only
+# 4. Normalize to standard format            - new/changed markets only
+# 5. Stream raw (archived once per distinct payload), normalized, and
+#    candidate records to disk
 # 6. Generate run report
 #
+# Candidates are also returned in memory (CollectorStats.candidates) so the
+# orchestrator hands them straight to the weather observer.
+#
 # =============================================================================
 
 import logging
 from datetime import datetime, date, timezone
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field
 
 from .client import PolymarketClient
 from .sanitizer import Sanitizer
 from .filter import MarketFilter, FilterResult, FilteredMarket
 from .normalizer import MarketNormalizer, NormalizedMarket
-from .storage import StorageManager
+from .storage import RecordStream, StorageManager
+from .market_state import DUPLICATE, UNCHANGED, MarketDelta, MarketStateStore
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +43,14 @@ class CollectorStats:
     filter_results: Dict[str, int]
     fields_removed: Dict[str, int]
     run_duration_seconds: float
+    # Delta sync against the persistent market state
+    markets_added: int = 0
+    markets_changed: int = 0
+    markets_removed: int = 0
+    markets_unchanged: int = 0
+    # Typed in-memory candidate set (handed to the weather observer; the
+    # candidates file is the persisted/replay copy)
+    candidates: List[NormalizedMarket] = field(default_factory=list, repr=False)
 
 
 class Collector:
@@ -51,6 +65,9 @@ class Collector:
     - Storage for persistence
     """
 
+    # Candidates listed in the run report
+    REPORT_CANDIDATES = 20
+
     def __init__(
         self,
         output_dir: str = "data/collector",
@@ -75,10 +92,17 @@ class Collector:
 
     def run(self, dry_run: bool = False) -> CollectorStats:
         """
-        Execute the full collection pipeline.
+        Execute the collection pipeline (streaming delta sync).
+
+        Markets flow one at a time through fetch -> sanitize -> filter ->
+        normalize -> write; only the (small) candidate set is kept in memory,
+        so memory stays flat regardless of how many markets the API returns. Only
+        markets that are new or changed since the last run are sanitized,
+        filtered and normalized; all others are taken from the persistent
+        market state.
 
         Args:
-            dry_run: If True, don't write files
+            dry_run: If True, don't write files (state is not persisted)
 
         Returns:
             CollectorStats with run statistics
@@ -95,86 +119,124 @@ class Collector:
         if not dry_run:
             self.storage.ensure_directories()
 
-        # Step 1: Fetch weather markets from events with weather/climate tags
-        logger.info("Step 1: Fetching weather markets from Polymarket API...")
-        logger.info("  (Using /events?tag_slug=weather and /events?tag_slug=climate)")
-        raw_markets = self.client.fetch_weather_markets(
-            max_markets=self.max_markets,
-            include_closed=False,  # Only fetch active/open markets
-        )
-        logger.info(f"Fetched {len(raw_markets)} weather-tagged markets")
-
-        # Step 2: Sanitize
-        logger.info("Step 2: Sanitizing (removing forbidden fields)...")
-        sanitized_markets, fields_removed = self.sanitizer.sanitize_markets(raw_markets)
-        logger.info(f"Sanitized {len(sanitized_markets)} markets")
-        if fields_removed:
-            logger.info(f"Removed {sum(fields_removed.values())} forbidden field occurrences")
+        state = MarketStateStore(self.storage.state_file)
+        state.load()
+        delta = MarketDelta()
 
-        # Save raw (sanitized) response
+        # Output streams (written to .tmp, committed at the end)
+        streams: Dict[str, RecordStream] = {}
         if not dry_run:
-            self.storage.save_raw_response(sanitized_markets)
+            streams = {
+                "raw": self.storage.stream_raw_response(),
+                "normalized": self.storage.stream_normalized_markets(),
+                "candidates": self.storage.stream_candidates(),
+            }
+
+        filter_stats = {result.value: 0 for result in FilterResult}
+        fields_removed: Dict[str, int] = {}
+        candidates: List[NormalizedMarket] = []
+        exclusion_samples: Dict[str, List[str]] = {}
+        total_fetched = 0
+        total = 0
+        total_candidates = 0
 
-        # Step 3: Filter for weather relevance
-        logger.info("Step 3: Filtering for weather relevance...")
-        filtered_markets, filter_stats = self.filter.filter_markets(sanitized_markets)
-        logger.info(f"Filter results: {filter_stats}")
+        # Steps 1-4: fetch -> (delta) -> sanitize -> filter -> normalize
+        logger.info("Steps 1-4: Streaming weather markets from Polymarket API...")
+        logger.info("  (Using /events?tag_slug=weather and /events?tag_slug=climate)")
 
-        # Step 4: Normalize all markets
-        logger.info("Step 4: Normalizing market data...")
-        all_normalized: List[NormalizedMarket] = []
-        candidates: List[NormalizedMarket] = []
+        def counted(markets: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+            nonlocal total_fetched
+            for market in markets:
+                total_fetched += 1
+                yield market
 
-        for fm in filtered_markets:
-            normalized = self.normalizer.normalize(
-                market=fm.market,
-                notes=fm.notes,
-            )
+        raw_markets = counted(self.client.iter_weather_markets(
+            max_markets=self.max_markets,
+            include_closed=False,  # Only fetch active/open markets
+        ))
+
+        try:
+            for entry in self._process(raw_markets, state, delta, streams.get("raw")):
+                normalized = NormalizedMarket(**entry["normalized"])
+                result = entry["filter"]["result"]
+
+                total += 1
+                filter_stats[result] += 1
+                for name, count in entry["fields_removed"].items():
+                    fields_removed[name] = fields_removed.get(name, 0) + count
+
+                # Step 5: Stream outputs
+                if streams:
+                    streams["normalized"].write(entry["normalized"])
+                if entry["candidate"]:
+                    total_candidates += 1
+                    if streams:
+                        streams["candidates"].write(entry["normalized"])
+                    candidates.append(normalized)
+                elif result != FilterResult.INCLUDED_WEATHER.value:
+                    samples = exclusion_samples.setdefault(result, [])
+                    if len(samples) < 3:
+                        samples.append((normalized.title or "Unknown")[:60])
+        except Exception:
+            for stream in streams.values():
+                stream.discard()
+            raise
+
+        # A run cut off at max_markets did not see the whole feed: markets
+        # beyond the cap are not gone, keep their state
+        if total_fetched < self.max_markets:
+            delta.removed = len(state.prune_unseen())
+        else:
+            logger.info(f"Fetch stopped at max_markets={self.max_markets}, skipping prune")
+        filter_stats["total"] = total
 
-            # Set category for weather markets
-            if fm.result == FilterResult.INCLUDED_WEATHER:
-                normalized = NormalizedMarket(
-                    market_id=normalized.market_id,
-                    title=normalized.title,
-                    resolution_text=normalized.resolution_text,
-                    end_date=normalized.end_date,
-                    created_time=normalized.created_time,
-                    category="WEATHER_EVENT",
-                    tags=normalized.tags,
-                    url=normalized.url,
-                    collector_notes=normalized.collector_notes + fm.matched_keywords,
-                    collected_at=normalized.collected_at,
-                )
-
-            all_normalized.append(normalized)
-
-            # Include complete weather markets as candidates
-            if fm.result == FilterResult.INCLUDED_WEATHER and normalized.is_complete():
-                candidates.append(normalized)
-
-        logger.info(f"Normalized {len(all_normalized)} markets")
-        logger.info(f"Found {len(candidates)} weather candidates")
-
-        # Step 5: Save outputs
-        if not dry_run:
+        logger.info(
+            f"Delta: {delta.added} added | {delta.changed} changed | "
+            f"{delta.removed} removed | {delta.unchanged} unchanged"
+        )
+        logger.info(f"Filter results: {filter_stats}")
+        logger.info(f"Normalized {total} markets ({delta.fresh} re-processed)")
+        logger.info(f"Found {total_candidates} weather candidates")
+
+        # Step 5: Commit outputs (normalized/candidates only when the set changed)
+        if streams:
             logger.info("Step 5: Saving outputs...")
-            self.storage.save_normalized_markets(all_normalized)
-            self.storage.save_candidates(candidates)
+            raw_path = streams["raw"].commit()
+            logger.info(
+                f"Saved raw response: {raw_path} ({streams['raw'].count} markets, "
+                f"{getattr(streams['raw'], 'new_objects', streams['raw'].count)} new payloads)"
+            )
+            if delta.has_changes or not self.storage.has_outputs():
+                for name in ("normalized", "candidates"):
+                    path = streams[name].commit()
+                    logger.info(f"Saved {name}: {path} ({streams[name].count} records)")
+            else:
+                streams["normalized"].discard()
+                streams["candidates"].discard()
+                logger.info("No market changes - normalized/candidate files kept")
+            state.save()
 
         # Step 6: Generate report
         end_time = datetime.now(timezone.utc)
         duration = (end_time - start_time).total_seconds()
 
         stats = CollectorStats(
-            total_fetched=len(raw_markets),
-            total_sanitized=len(sanitized_markets),
-            total_candidates=len(candidates),
+            total_fetched=total_fetched,
+            total_sanitized=total,
+            total_candidates=total_candidates,
             filter_results=filter_stats,
             fields_removed=fields_removed,
             run_duration_seconds=duration,
+            markets_added=delta.added,
+            markets_changed=delta.changed,
+            markets_removed=delta.removed,
+            markets_unchanged=delta.unchanged,
+            candidates=candidates,
         )
 
-        report = self._generate_report(stats, candidates, filtered_markets)
+        report = self._generate_report(
+            stats, candidates[:self.REPORT_CANDIDATES], exclusion_samples,
+        )
 
         if not dry_run:
             self.storage.save_report(report)
@@ -189,19 +251,97 @@ class Collector:
 
         return stats
 
+    def _process(
+        self,
+        markets: Iterator[Dict[str, Any]],
+        state: MarketStateStore,
+        delta: MarketDelta,
+        raw_stream: Optional[RecordStream],
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Streaming pipeline: yields one state entry per fetched market.
+
+        Unchanged markets come straight from the state (the raw manifest
+        references their archived payload); new/changed ones are sanitized
+        (and appended to the raw dump), filtered and normalized.
+        """
+        state.begin_run()
+        for market in markets:
+            key, status = state.classify(market)
+            if status == DUPLICATE:
+                continue
+            delta.record(status)
+            if status == UNCHANGED:
+                entry = state.get(key)
+                if raw_stream is not None:
+                    raw_stream.reference(entry.get("raw_hash"))
+                yield entry
+                continue
+
+            sanitized, removed = self.sanitizer.sanitize(market)
+            raw_hash = raw_stream.write(sanitized) if raw_stream is not None else None
+
+            fm = next(self.filter.filter_stream([sanitized]))
+            normalized, is_candidate = self._normalize(fm)
+            entry = {
+                "fields_removed": removed,
+                "filter": {
+                    "result": fm.result.value,
+                    "matched_keywords": fm.matched_keywords,
+                    "notes": fm.notes,
+                },
+                "normalized": normalized.to_dict(),
+                "candidate": is_candidate,
+            }
+            if raw_hash:
+                entry["raw_hash"] = raw_hash
+            state.put(key, market, entry)
+            yield entry
+
+    def _normalize(self, fm: FilteredMarket) -> Tuple[NormalizedMarket, bool]:
+        """
+        Normalize one filtered market.
+
+        Returns:
+            (normalized record, is_candidate)
+        """
+        normalized = self.normalizer.normalize(
+            market=fm.market,
+            notes=fm.notes,
+        )
+
+        # Set category for weather markets
+        if fm.result == FilterResult.INCLUDED_WEATHER:
+            normalized = NormalizedMarket(
+                market_id=normalized.market_id,
+                title=normalized.title,
+                resolution_text=normalized.resolution_text,
+                end_date=normalized.end_date,
+                created_time=normalized.created_time,
+                category="WEATHER_EVENT",
+                tags=normalized.tags,
+                url=normalized.url,
+                collector_notes=normalized.collector_notes + fm.matched_keywords,
+                collected_at=normalized.collected_at,
+            )
+
+        # Include complete weather markets as candidates
+        is_candidate = fm.result == FilterResult.INCLUDED_WEATHER and normalized.is_complete()
+        return normalized, is_candidate
+
     def _generate_report(
         self,
         stats: CollectorStats,
         candidates: List[NormalizedMarket],
-        filtered: List[FilteredMarket],
+        exclusion_samples: Dict[str, List[str]],
     ) -> str:
         """
         Generate markdown run report.
 
         Args:
             stats: Run statistics
-            candidates: List of candidate markets
-            filtered: List of filtered market results
+            candidates: First REPORT_CANDIDATES candidate markets
+            exclusion_samples: Up to 3 sample titles per exclusion reason
 
         Returns:
             Markdown report string
@@ -219,6 +359,13 @@ class Collector:
             f"- **Total Sanitized:** {stats.total_sanitized}",
             f"- **Weather Candidates:** {stats.total_candidates}",
             "",
+            "## Delta Sync",
+            "",
+            f"- **Added:** {stats.markets_added}",
+            f"- **Changed:** {stats.markets_changed}",
+            f"- **Removed:** {stats.markets_removed}",
+            f"- **Unchanged:** {stats.markets_unchanged}",
+            "",
             "## Filter Results",
             "",
             "| Result | Count |",
@@ -249,7 +396,7 @@ class Collector:
         ])
 
         if candidates:
-            for i, candidate in enumerate(candidates[:20], 1):
+            for i, candidate in enumerate(candidates[:self.REPORT_CANDIDATES], 1):
                 title = candidate.title[:80] if candidate.title else "Unknown"
                 lines.append(f"### {i}. {title}...")
                 lines.append("")
@@ -262,8 +409,8 @@ class Collector:
                     lines.append(f"- **Weather Keywords:** {', '.join(candidate.collector_notes[:5])}")
                 lines.append("")
 
-            if len(candidates) > 20:
-                lines.append(f"*... and {len(candidates) - 20} more candidates*")
+            if stats.total_candidates > len(candidates):
+                lines.append(f"*... and {stats.total_candidates - len(candidates)} more candidates*")
         else:
             lines.append("*No weather candidates found.*")
 
@@ -273,17 +420,6 @@ class Collector:
             "",
         ])
 
-        # Sample excluded markets by reason
-        exclusion_samples: Dict[str, List[str]] = {}
-        for fm in filtered:
-            if fm.result != FilterResult.INCLUDED_WEATHER:
-                reason = fm.result.value
-                title = fm.market.get("question", fm.market.get("title", "Unknown"))[:60]
-                if reason not in exclusion_samples:
-                    exclusion_samples[reason] = []
-                if len(exclusion_samples[reason]) < 3:
-                    exclusion_samples[reason].append(title)
-
         for reason, samples in sorted(exclusion_samples.items()):
             lines.append(f"### {reason}")
             lines.append("")
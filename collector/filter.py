@@ -15,7 +15,7 @@
 # =============================================================================
 
 import logging
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Iterable, Iterator, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
@@ -137,6 +137,24 @@ class MarketFilter:
             classification_result=classification,
         )
 
+    def filter_stream(self, markets: Iterable[Dict[str, Any]]) -> Iterator[FilteredMarket]:
+        """
+        Filter markets one at a time (generator, no intermediate list).
+
+        Errors are fail-closed: the market is yielded as EXCLUDED_INCOMPLETE.
+        """
+        for market in markets:
+            try:
+                yield self.filter_market(market)
+            except Exception as e:
+                logger.warning(f"Filter error for market {market.get('id', 'unknown')}: {e}")
+                yield FilteredMarket(
+                    market=market,
+                    result=FilterResult.EXCLUDED_INCOMPLETE,
+                    matched_keywords=[],
+                    notes=[f"Filter error: {str(e)[:100]}"],
+                )
+
     def filter_markets(
         self,
         markets: List[Dict[str, Any]]
@@ -159,20 +177,9 @@ class MarketFilter:
             "total": len(markets),
         }
 
-        for market in markets:
-            try:
-                result = self.filter_market(market)
-                filtered.append(result)
-                counts[result.result.value] = counts.get(result.result.value, 0) + 1
-            except Exception as e:
-                logger.warning(f"Filter error for market {market.get('id', 'unknown')}: {e}")
-                filtered.append(FilteredMarket(
-                    market=market,
-                    result=FilterResult.EXCLUDED_INCOMPLETE,
-                    matched_keywords=[],
-                    notes=[f"Filter error: {str(e)[:100]}"],
-                ))
-                counts["excluded_incomplete"] += 1
+        for result in self.filter_stream(markets):
+            filtered.append(result)
+            counts[result.result.value] = counts.get(result.result.value, 0) + 1
 
         # Log summary
         logger.info(
@@ -14,7 +14,8 @@ import logging
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 
-import requests
+from shared.http_transport import get_http_transport
+from shared.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,9 @@ WEATHER_KEYWORDS = [
     "below",       # z.B. "Will temperature be below 0C"
 ]
 
+# Substring-Semantik wie bisher (`kw in text`), aber ein Durchlauf fuer alle Keywords
+_WEATHER_KEYWORD_MATCHER = KeywordMatcher(WEATHER_KEYWORDS, word_boundary=False)
+
 
 def discover_weather_markets(
     limit: int = 500,
@@ -74,14 +78,17 @@ def discover_weather_markets(
             "ascending": "false",
         }
 
-        resp = requests.get(
+        response = get_http_transport().get(
             f"{GAMMA_API_BASE}/markets",
             params=params,
             timeout=timeout,
             headers={"User-Agent": "PolymarketWeatherBot/1.0"},
+            source="gamma",
         )
-        resp.raise_for_status()
-        markets = resp.json()
+        if not response.ok:
+            logger.warning(f"Gamma API: Request fehlgeschlagen: {response.error}")
+            return []
+        markets = response.data
 
         if not isinstance(markets, list):
             logger.warning(f"Gamma API unexpected response format: {type(markets)}")
@@ -104,12 +111,6 @@ def discover_weather_markets(
         )
         return weather_markets
 
-    except requests.exceptions.Timeout:
-        logger.warning("Gamma API: Timeout nach {}s".format(timeout))
-        return []
-    except requests.exceptions.RequestException as e:
-        logger.warning(f"Gamma API: Request fehlgeschlagen: {e}")
-        return []
     except Exception as e:
         logger.warning(f"Gamma API: Unerwarteter Fehler: {e}")
         return []
@@ -124,7 +125,7 @@ def _is_weather_market(market: Dict[str, Any]) -> bool:
         str(market.get("groupItemTitle", "")),
     ]).lower()
 
-    return any(kw.lower() in searchable for kw in WEATHER_KEYWORDS)
+    return _WEATHER_KEYWORD_MATCHER.matches_any(searchable)
 
 
 def _get_liquidity(market: Dict[str, Any]) -> float:
@@ -150,17 +151,16 @@ def get_market_details(market_id: str, timeout: int = DEFAULT_TIMEOUT) -> Option
     Returns:
         Market-Dict oder None
     """
-    try:
-        resp = requests.get(
-            f"{GAMMA_API_BASE}/markets/{market_id}",
-            timeout=timeout,
-            headers={"User-Agent": "PolymarketWeatherBot/1.0"},
-        )
-        resp.raise_for_status()
-        return resp.json()
-    except Exception as e:
-        logger.debug(f"Gamma API market details fehlgeschlagen fuer {market_id}: {e}")
+    response = get_http_transport().get(
+        f"{GAMMA_API_BASE}/markets/{market_id}",
+        timeout=timeout,
+        headers={"User-Agent": "PolymarketWeatherBot/1.0"},
+        source="gamma",
+    )
+    if not response.ok:
+        logger.debug(f"Gamma API market details fehlgeschlagen fuer {market_id}: {response.error}")
         return None
+    return response.data
 
 
 def normalize_gamma_market(market: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -0,0 +1,233 @@
+# =============================================================================
+# POLYMARKET EU AI COLLECTOR
+# Module: collector/market_state.py
+# Purpose: Persistent per-market state for incremental (delta) collection
+# =============================================================================
+#
+# The collector runs every 15 minutes, but most weather markets do not change
+# between runs. This store remembers, per market id:
+#
+# - updatedAt (Gamma) and a content hash of the descriptive fields
+# - the filter result and normalized record (small; the sanitized market
+#   itself is only written to the raw dump)
+#
+# so only NEW or CHANGED markets go through Sanitizer -> MarketFilter ->
+# MarketNormalizer. Markets that disappear from the feed are dropped.
+#
+# CHANGE DETECTION:
+# - same updatedAt as stored            -> unchanged (no hashing)
+# - otherwise compare content hash      -> unchanged / changed
+#   (prices and volumes are NOT part of the hash; Gamma bumps updatedAt on
+#    trading activity, which must not trigger re-classification)
+#
+# The header carries STATE_VERSION and the classifier's CLASSIFIER_VERSION
+# (core/market_text_cache.py): a keyword/pattern change re-classifies every
+# market even when its updatedAt did not move.
+#
+# STORAGE: data/collector/state/market_state.json (atomic rewrite)
+# Contains only normalized data - no prices, volumes or probabilities.
+#
+# =============================================================================
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.market_text_cache import CLASSIFIER_VERSION
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored entry layout or the pipeline semantics change;
+# a version mismatch discards the state (full re-processing once).
+STATE_VERSION = 3
+
+# Fields read by the classifier, filter and normalizer (plus the
+# client's event enrichment). Volatile trading fields are deliberately absent.
+FINGERPRINT_FIELDS: Tuple[str, ...] = (
+    "id", "market_id", "marketId", "conditionId",
+    "question", "title", "name",
+    "description", "resolutionSource", "resolution", "resolutionDetails", "rules",
+    "resolution_text",
+    "endDate", "endDateIso", "end_date", "closeTime", "resolutionDate", "expirationDate",
+    "createdAt", "created_at", "createTime",
+    "category", "categories", "tags", "slug",
+    "closed", "active",
+    "_event_title", "_event_tags", "_source_tag",
+)
+
+
+def market_key(market: Dict[str, Any]) -> str:
+    """Stable key for a raw market (id, else conditionId, else content hash)."""
+    market_id = market.get("id") or market.get("conditionId")
+    if market_id:
+        return str(market_id)
+    return f"hash:{market_fingerprint(market)}"
+
+
+def market_fingerprint(market: Dict[str, Any]) -> str:
+    """Content hash over FINGERPRINT_FIELDS."""
+    relevant = {name: market.get(name) for name in FINGERPRINT_FIELDS if name in market}
+    payload = json.dumps(relevant, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+# Per-market delta status
+ADDED = "added"
+CHANGED = "changed"
+UNCHANGED = "unchanged"
+DUPLICATE = "duplicate"
+
+
+@dataclass
+class MarketDelta:
+    """Added/changed/unchanged/removed counts of one run."""
+    added: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+    def record(self, status: str) -> None:
+        if status in (ADDED, CHANGED, UNCHANGED):
+            setattr(self, status, getattr(self, status) + 1)
+
+    @property
+    def fresh(self) -> int:
+        """Markets that were (re-)processed."""
+        return self.added + self.changed
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            "added": self.added,
+            "changed": self.changed,
+            "removed": self.removed,
+            "unchanged": self.unchanged,
+        }
+
+
+class MarketStateStore:
+    """
+    market id -> processed entry, persisted as JSON.
+
+    Entry layout:
+        {
+            "updated_at": str | None,
+            "content_hash": str,
+            "first_seen": str (ISO),
+            "fields_removed": {field: count},
+            "filter": {"result": str, "matched_keywords": [...], "notes": [...]},
+            "normalized": {...},          # NormalizedMarket.to_dict()
+            "candidate": bool,
+            "raw_hash": str,              # archived sanitized payload (optional)
+        }
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._seen: set = set()
+
+    def load(self) -> None:
+        """Load state from disk. Missing, corrupt or outdated files start empty."""
+        self._entries = {}
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Market state unreadable, starting fresh: {e}")
+            return
+
+        if data.get("version") != STATE_VERSION:
+            logger.info("Market state version changed, re-processing all markets")
+            return
+        if data.get("classifier_version") != CLASSIFIER_VERSION:
+            logger.info("Classifier version changed, re-processing all markets")
+            return
+        self._entries = data.get("markets", {})
+
+    def save(self) -> None:
+        """Write state atomically (.tmp + rename)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": STATE_VERSION,
+            "classifier_version": CLASSIFIER_VERSION,
+            "saved_at": datetime.now(timezone.utc).isoformat(),
+            "markets": self._entries,
+        }
+        fd, tmp = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp, str(self.path))
+        except Exception:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def begin_run(self) -> None:
+        """Reset the set of keys seen in the current fetch."""
+        self._seen = set()
+
+    def classify(self, market: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Classify one fetched market against the stored state.
+
+        Returns:
+            (key, status) with status ADDED / CHANGED / UNCHANGED, or
+            DUPLICATE for a key already seen in this run.
+        """
+        key = market_key(market)
+        if key in self._seen:
+            return key, DUPLICATE
+        self._seen.add(key)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return key, ADDED
+
+        updated_at = market.get("updatedAt")
+        if updated_at and updated_at == entry.get("updated_at"):
+            return key, UNCHANGED
+
+        if market_fingerprint(market) == entry.get("content_hash"):
+            # Only trading activity moved updatedAt
+            entry["updated_at"] = updated_at
+            return key, UNCHANGED
+        return key, CHANGED
+
+    def prune_unseen(self) -> List[str]:
+        """Drop markets not seen since begin_run(); returns their keys."""
+        removed = [key for key in self._entries if key not in self._seen]
+        for key in removed:
+            del self._entries[key]
+        return removed
+
+    def put(self, key: str, market: Dict[str, Any], entry: Dict[str, Any]) -> None:
+        """Store a freshly processed market (keeps first_seen of existing entries)."""
+        previous = self._entries.get(key)
+        entry["updated_at"] = market.get("updatedAt")
+        entry["content_hash"] = market_fingerprint(market)
+        entry["first_seen"] = (
+            previous.get("first_seen") if previous
+            else datetime.now(timezone.utc).isoformat()
+        )
+        self._entries[key] = entry
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
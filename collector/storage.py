@@ -6,24 +6,32 @@
 #
 # STORAGE STRUCTURE:
 # data/collector/
-# ├── raw/<date>/           - Raw API responses (sanitized)
+# ├── raw/<date>/           - Raw API responses (sanitized) / run manifests
+# ├── raw/objects/<xx>/     - Content-addressed market payloads (archive mode)
 # ├── normalized/<date>/    - Normalized records (all)
 # ├── candidates/<date>/    - Clean + complete records only
-# └── reports/<date>/       - Run reports
+# ├── reports/<date>/       - Run reports
+# └── state/                - Market state for delta sync (not date-partitioned)
 #
 # FILE FORMATS:
-# - Raw: markets_<timestamp>.json
+# - Raw: markets_<timestamp>.manifest.json (archive mode, default) -
+#   list of sha256 hashes; each distinct sanitized market payload is stored
+#   once as objects/<xx>/<hash>.json.gz. Plain markets_<timestamp>.json
+#   (raw_archive=False and older days) stays readable via load_raw_response.
 # - Normalized: markets.jsonl
 # - Candidates: candidates.jsonl
 # - Reports: report.md
+# - State: market_state.json
 #
 # =============================================================================
 
 import os
+import gzip
+import hashlib
 import json
 import logging
 from datetime import datetime, date, timezone
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 from pathlib import Path
 
 from .normalizer import NormalizedMarket
@@ -31,6 +39,164 @@ from .normalizer import NormalizedMarket
 logger = logging.getLogger(__name__)
 
 
+class RecordStream:
+    """
+    Streams records to disk one at a time.
+
+    Writes to <path>.tmp; commit() renames atomically, discard() drops the
+    partial file (the previous version stays untouched).
+
+    Formats:
+    - "jsonl": one JSON object per line
+    - "json":  a single JSON array (compact, one record per line)
+    """
+
+    def __init__(self, path: Path, fmt: str = "jsonl"):
+        self.path = Path(path)
+        self.fmt = fmt
+        self.count = 0
+        self._tmp = self.path.with_name(self.path.name + ".tmp")
+        self._file = open(self._tmp, "w", encoding="utf-8")
+        if fmt == "json":
+            self._file.write("[")
+
+    def write(self, record: Dict[str, Any]) -> Optional[str]:
+        line = json.dumps(record, ensure_ascii=False)
+        if self.fmt == "json":
+            self._file.write(("\n" if self.count == 0 else ",\n") + line)
+        else:
+            self._file.write(line + "\n")
+        self.count += 1
+        return None
+
+    def reference(self, digest: Optional[str]) -> None:
+        """Archive-only: plain dumps contain written records only."""
+
+    def commit(self) -> Path:
+        if self.fmt == "json":
+            self._file.write("\n]\n")
+        self._file.close()
+        os.replace(self._tmp, self.path)
+        return self.path
+
+    def discard(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+        try:
+            os.unlink(self._tmp)
+        except OSError:
+            pass
+
+
+MANIFEST_FORMAT = "raw-manifest-v1"
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+def payload_hash(record: Dict[str, Any]) -> str:
+    """sha256 of the canonical (sorted, compact) JSON form."""
+    canonical = json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RawArchive:
+    """
+    Content-addressed store of sanitized market payloads.
+
+    objects/<first two hex chars>/<sha256>.json.gz, written once
+    (atomic, deterministic gzip) and shared by all run manifests.
+    """
+
+    def __init__(self, objects_dir: Path):
+        self.objects_dir = Path(objects_dir)
+
+    def _path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.json.gz"
+
+    def put(self, record: Dict[str, Any], digest: Optional[str] = None) -> str:
+        """Store a payload (no-op if already present); returns its hash."""
+        digest = digest or payload_hash(record)
+        path = self._path(digest)
+        if path.exists():
+            return digest
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(gzip.compress(data.encode("utf-8"), mtime=0))
+        os.replace(tmp, path)
+        return digest
+
+    def get(self, digest: str) -> Dict[str, Any]:
+        with open(self._path(digest), "rb") as f:
+            return json.loads(gzip.decompress(f.read()).decode("utf-8"))
+
+    def has(self, digest: str) -> bool:
+        return self._path(digest).exists()
+
+    def prune(self, referenced: Set[str]) -> int:
+        """Delete objects not in referenced; returns number removed."""
+        removed = 0
+        if not self.objects_dir.exists():
+            return 0
+        for path in self.objects_dir.glob("*/*.json.gz"):
+            if path.name[:-len(".json.gz")] not in referenced:
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+
+class ManifestStream:
+    """
+    Streaming writer for an archive-mode raw dump.
+
+    write() stores the payload in the archive and records its hash;
+    reference() records an already archived payload (unchanged markets).
+    The manifest itself is written on commit().
+    """
+
+    def __init__(self, path: Path, archive: RawArchive):
+        self.path = Path(path)
+        self.archive = archive
+        self.count = 0
+        self.new_objects = 0
+        self._hashes: List[str] = []
+
+    def write(self, record: Dict[str, Any]) -> str:
+        digest = payload_hash(record)
+        if not self.archive.has(digest):
+            self.archive.put(record, digest)
+            self.new_objects += 1
+        self._hashes.append(digest)
+        self.count += 1
+        return digest
+
+    def reference(self, digest: Optional[str]) -> None:
+        if digest:
+            self._hashes.append(digest)
+            self.count += 1
+
+    def commit(self) -> Path:
+        manifest = {
+            "format": MANIFEST_FORMAT,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "count": len(self._hashes),
+            "hashes": self._hashes,
+        }
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, self.path)
+        return self.path
+
+    def discard(self) -> None:
+        # Objects are shared and content-addressed; unreferenced ones are
+        # removed by StorageManager.prune_raw_objects()
+        self._hashes = []
+
+
 class StorageManager:
     """
     Manages file storage for collector output.
@@ -42,6 +208,7 @@ class StorageManager:
         self,
         base_dir: str = "data/collector",
         run_date: Optional[date] = None,
+        raw_archive: bool = True,
     ):
         """
         Initialize storage manager.
@@ -49,16 +216,22 @@ class StorageManager:
         Args:
             base_dir: Base directory for all collector data
             run_date: Date for partitioning (defaults to today)
+            raw_archive: Store raw dumps as manifest + content-addressed
+                compressed objects (False = plain JSON file per run)
         """
         self.base_dir = Path(base_dir)
         self.run_date = run_date or date.today()
         self.date_str = self.run_date.isoformat()
+        self.raw_archive = raw_archive
 
         # Directory paths
         self.raw_dir = self.base_dir / "raw" / self.date_str
         self.normalized_dir = self.base_dir / "normalized" / self.date_str
         self.candidates_dir = self.base_dir / "candidates" / self.date_str
         self.reports_dir = self.base_dir / "reports" / self.date_str
+        self.state_dir = self.base_dir / "state"
+        self.state_file = self.state_dir / "market_state.json"
+        self.archive = RawArchive(self.base_dir / "raw" / "objects")
 
     def ensure_directories(self) -> None:
         """Create all required directories if they don't exist."""
@@ -67,6 +240,7 @@ class StorageManager:
             self.normalized_dir,
             self.candidates_dir,
             self.reports_dir,
+            self.state_dir,
         ]:
             directory.mkdir(parents=True, exist_ok=True)
             logger.debug(f"Ensured directory exists: {directory}")
@@ -84,19 +258,40 @@ class StorageManager:
             filename: Optional custom filename
 
         Returns:
-            Path to saved file
+            Path to saved file (manifest in archive mode)
+        """
+        stream = self.stream_raw_response(filename)
+        for record in data:
+            stream.write(record)
+        filepath = stream.commit()
+
+        logger.info(f"Saved raw response: {filepath} ({len(data)} markets)")
+        return filepath
+
+    def stream_raw_response(self, filename: Optional[str] = None):
+        """
+        Open a streaming writer for the raw (sanitized) dump.
+
+        Returns a ManifestStream in archive mode, else a RecordStream
+        writing a compact JSON array.
         """
         if filename is None:
             timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
             filename = f"markets_{timestamp}.json"
+        if self.raw_archive:
+            if not filename.endswith(MANIFEST_SUFFIX):
+                filename = filename[:-len(".json")] if filename.endswith(".json") else filename
+                filename += MANIFEST_SUFFIX
+            return ManifestStream(self.raw_dir / filename, self.archive)
+        return RecordStream(self.raw_dir / filename, fmt="json")
 
-        filepath = self.raw_dir / filename
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def stream_normalized_markets(self, filename: str = "markets.jsonl") -> RecordStream:
+        """Open a streaming writer for normalized markets."""
+        return RecordStream(self.normalized_dir / filename)
 
-        logger.info(f"Saved raw response: {filepath} ({len(data)} markets)")
-        return filepath
+    def stream_candidates(self, filename: str = "candidates.jsonl") -> RecordStream:
+        """Open a streaming writer for candidate markets."""
+        return RecordStream(self.candidates_dir / filename)
 
     def save_normalized_markets(
         self,
@@ -148,6 +343,17 @@ class StorageManager:
         logger.info(f"Saved candidates: {filepath} ({len(candidates)} records)")
         return filepath
 
+    def has_outputs(
+        self,
+        markets_filename: str = "markets.jsonl",
+        candidates_filename: str = "candidates.jsonl",
+    ) -> bool:
+        """True if today's normalized and candidate files already exist."""
+        return (
+            (self.normalized_dir / markets_filename).exists()
+            and (self.candidates_dir / candidates_filename).exists()
+        )
+
     def save_report(
         self,
         report_content: str,
@@ -175,6 +381,9 @@ class StorageManager:
         """
         Load a raw response file.
 
+        Accepts plain dumps (markets_<ts>.json) and archive manifests, by
+        manifest name or by the plain name of the same run.
+
         Args:
             filename: Filename to load
 
@@ -182,9 +391,42 @@ class StorageManager:
             List of market dictionaries
         """
         filepath = self.raw_dir / filename
+        if not filename.endswith(MANIFEST_SUFFIX) and not filepath.exists():
+            stem = filename[:-len(".json")] if filename.endswith(".json") else filename
+            filepath = self.raw_dir / (stem + MANIFEST_SUFFIX)
 
         with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+            data = json.load(f)
+
+        if isinstance(data, dict) and data.get("format") == MANIFEST_FORMAT:
+            return [self.archive.get(digest) for digest in data["hashes"]]
+        return data
+
+    def list_raw_responses(self) -> List[str]:
+        """Raw dump filenames of this day (plain and manifests), oldest first."""
+        if not self.raw_dir.exists():
+            return []
+        return sorted(p.name for p in self.raw_dir.glob("markets_*.json"))
+
+    def prune_raw_objects(self) -> int:
+        """
+        Delete archived payloads no longer referenced by any manifest
+        (call after old raw/<date> directories were removed).
+        """
+        referenced: Set[str] = set()
+        raw_root = self.base_dir / "raw"
+        for manifest_path in raw_root.glob(f"*/*{MANIFEST_SUFFIX}"):
+            try:
+                with open(manifest_path, "r", encoding="utf-8") as f:
+                    referenced.update(json.load(f).get("hashes", []))
+            except (OSError, ValueError) as e:
+                # Unreadable manifest: keep everything rather than lose data
+                logger.warning(f"Raw manifest unreadable ({manifest_path}): {e}")
+                return 0
+        removed = self.archive.prune(referenced)
+        if removed:
+            logger.info(f"Pruned {removed} unreferenced raw objects")
+        return removed
 
     def load_candidates(self, filename: str = "candidates.jsonl") -> List[Dict[str, Any]]:
         """
@@ -0,0 +1,287 @@
+# =============================================================================
+# DAILY EXTREMES - Daily max/min distribution from hourly forecasts
+# =============================================================================
+#
+# Polymarket temperature markets resolve on the daily HIGH (or LOW) of a
+# city's local calendar day, not on the temperature at one hour.
+#
+# For each (city, local date) this stage:
+# - takes the hourly series of every source (SourceForecast.hourly_temperatures,
+#   UTC-naive timestamps)
+# - cuts the local-day window [00:00, 24:00) in the city's timezone
+#   (CITY_CONFIG in weather.yaml; DST-aware via zoneinfo)
+# - derives each source's daily max and min (vectorized with NumPy when
+#   installed, pure Python otherwise)
+# - summarises them as quantiles across sources
+#
+# Results are cached per run, so every strike/bucket market on that
+# city/date reuses the same precomputation.
+#
+# ISOLATION:
+# - READ-ONLY: pure computation over already fetched forecasts
+#
+# =============================================================================
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:
+    ZoneInfo = None
+    ZoneInfoNotFoundError = Exception
+
+from .forecast_sources import SourceForecast
+
+logger = logging.getLogger(__name__)
+
+# Quantiles reported across sources
+QUANTILES: Tuple[float, ...] = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+METRIC_DAILY_MAX = "daily_max"
+METRIC_DAILY_MIN = "daily_min"
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+# =============================================================================
+# DATA MODEL
+# =============================================================================
+
+
+@dataclass
+class DailyExtremes:
+    """Per-source daily max/min for one city and local date (°F)."""
+    city: str
+    local_date: date
+    timezone: str
+    source_max_f: Dict[str, float] = field(default_factory=dict)
+    source_min_f: Dict[str, float] = field(default_factory=dict)
+    max_quantiles: Dict[float, float] = field(default_factory=dict)
+    min_quantiles: Dict[float, float] = field(default_factory=dict)
+
+    def values(self, metric: str) -> Dict[str, float]:
+        """source_name -> daily extreme for METRIC_DAILY_MAX / METRIC_DAILY_MIN."""
+        if metric == METRIC_DAILY_MAX:
+            return self.source_max_f
+        if metric == METRIC_DAILY_MIN:
+            return self.source_min_f
+        raise ValueError(f"Unknown daily metric: {metric}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "city": self.city,
+            "local_date": self.local_date.isoformat(),
+            "timezone": self.timezone,
+            "source_max_f": {k: round(v, 2) for k, v in self.source_max_f.items()},
+            "source_min_f": {k: round(v, 2) for k, v in self.source_min_f.items()},
+            "max_quantiles": {str(q): round(v, 2) for q, v in self.max_quantiles.items()},
+            "min_quantiles": {str(q): round(v, 2) for q, v in self.min_quantiles.items()},
+        }
+
+
+# =============================================================================
+# COMPUTATION
+# =============================================================================
+
+
+def _zone(tz_name: str):
+    """tzinfo for an IANA name; UTC if unknown or no tz database."""
+    if ZoneInfo is not None and tz_name:
+        try:
+            return ZoneInfo(tz_name)
+        except (ZoneInfoNotFoundError, ValueError) as e:
+            logger.debug(f"Timezone {tz_name} unavailable ({e}), using UTC day")
+    return timezone.utc
+
+
+def local_date_of(moment: datetime, tz_name: str) -> date:
+    """
+    Local calendar date of moment (naive = UTC) in tz_name.
+
+    A market resolving at 03:00 UTC belongs to the previous day in any
+    US city; ladders and daily windows must use this date, not the UTC one.
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(_zone(tz_name)).date()
+
+
+def local_day_window(local_date: date, tz_name: str) -> Tuple[datetime, datetime]:
+    """
+    UTC-naive [start, end) of a local calendar day.
+
+    Handles DST (23h / 25h days). Unknown timezones (or no tz database,
+    e.g. Windows without tzdata) fall back to the UTC day.
+    """
+    tz = _zone(tz_name)
+
+    start = datetime.combine(local_date, time.min, tzinfo=tz)
+    end = datetime.combine(local_date + timedelta(days=1), time.min, tzinfo=tz)
+    return (
+        start.astimezone(timezone.utc).replace(tzinfo=None),
+        end.astimezone(timezone.utc).replace(tzinfo=None),
+    )
+
+
+def quantiles(values: Sequence[float], qs: Sequence[float] = QUANTILES) -> Dict[float, float]:
+    """Linear-interpolated quantiles (same definition as numpy.quantile)."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    result = {}
+    for q in qs:
+        pos = q * last
+        lo = int(pos)
+        hi = min(lo + 1, last)
+        result[q] = ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+    return result
+
+
+def _extremes_numpy(seconds, temps, owners, source_count, start, end):
+    t = np.asarray(seconds, dtype=float)
+    v = np.asarray(temps, dtype=float)
+    o = np.asarray(owners, dtype=np.intp)
+    mask = (t >= start) & (t < end)
+
+    highs = np.full(source_count, -np.inf)
+    lows = np.full(source_count, np.inf)
+    np.maximum.at(highs, o[mask], v[mask])
+    np.minimum.at(lows, o[mask], v[mask])
+    return [
+        (float(h), float(l)) if np.isfinite(h) else None
+        for h, l in zip(highs, lows)
+    ]
+
+
+def _extremes_python(seconds, temps, owners, source_count, start, end):
+    highs: List[Optional[float]] = [None] * source_count
+    lows: List[Optional[float]] = [None] * source_count
+    for t, v, o in zip(seconds, temps, owners):
+        if start <= t < end:
+            highs[o] = v if highs[o] is None else max(highs[o], v)
+            lows[o] = v if lows[o] is None else min(lows[o], v)
+    return [(h, l) if h is not None else None for h, l in zip(highs, lows)]
+
+
+def compute_daily_extremes(
+    city: str,
+    local_date: date,
+    tz_name: str,
+    forecasts: Sequence[SourceForecast],
+    use_numpy: Optional[bool] = None,
+) -> DailyExtremes:
+    """
+    Derive per-source daily max/min for one local day.
+
+    Sources without hourly points inside the window are left out.
+
+    Args:
+        city: City name
+        local_date: Calendar date in the city's timezone
+        tz_name: IANA timezone (e.g. "America/New_York")
+        forecasts: Source forecasts with hourly_temperatures
+        use_numpy: Force/forbid NumPy (default: use it if installed)
+    """
+    start, end = local_day_window(local_date, tz_name)
+    start_s = (start - _EPOCH).total_seconds()
+    end_s = (end - _EPOCH).total_seconds()
+
+    # Flatten all hourly series into parallel arrays
+    seconds: List[float] = []
+    temps: List[float] = []
+    owners: List[int] = []
+    for i, sf in enumerate(forecasts):
+        for t, temp in sf.hourly_temperatures or ():
+            if t.tzinfo is not None:
+                t = t.astimezone(timezone.utc).replace(tzinfo=None)
+            seconds.append((t - _EPOCH).total_seconds())
+            temps.append(temp)
+            owners.append(i)
+
+    if use_numpy is None:
+        use_numpy = np is not None
+    kernel = _extremes_numpy if (use_numpy and np is not None and seconds) else _extremes_python
+    per_source = kernel(seconds, temps, owners, len(forecasts), start_s, end_s)
+
+    result = DailyExtremes(city=city, local_date=local_date, timezone=tz_name or "UTC")
+    for sf, extremes in zip(forecasts, per_source):
+        if extremes is not None:
+            result.source_max_f[sf.source_name], result.source_min_f[sf.source_name] = extremes
+    result.max_quantiles = quantiles(list(result.source_max_f.values()))
+    result.min_quantiles = quantiles(list(result.source_min_f.values()))
+    return result
+
+
+# =============================================================================
+# RUN-SCOPED CACHE
+# =============================================================================
+
+
+class DailyExtremesCache:
+    """
+    (city, local date) -> DailyExtremes for the current run.
+
+    An entry is recomputed when later forecasts bring sources it has not
+    seen (e.g. a deadline-limited build followed by a complete one).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, date], Tuple[frozenset, DailyExtremes]] = {}
+
+    def get_or_compute(
+        self,
+        city: str,
+        local_date: date,
+        tz_name: str,
+        forecasts: Sequence[SourceForecast],
+    ) -> DailyExtremes:
+        key = (city.strip().lower(), local_date)
+        sources = frozenset(sf.source_name for sf in forecasts)
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and sources <= cached[0]:
+            return cached[1]
+
+        extremes = compute_daily_extremes(city, local_date, tz_name, forecasts)
+        with self._lock:
+            current = self._entries.get(key)
+            if current is None or not sources <= current[0]:
+                self._entries[key] = (sources, extremes)
+        return extremes
+
+    def get(self, city: str, local_date: date) -> Optional[DailyExtremes]:
+        with self._lock:
+            cached = self._entries.get((city.strip().lower(), local_date))
+        return cached[1] if cached else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_cache = DailyExtremesCache()
+
+
+def get_daily_extremes_cache() -> DailyExtremesCache:
+    """Return the process-wide (run-scoped) daily extremes cache."""
+    return _cache
+
+
+def reset_daily_extremes_cache() -> None:
+    """Drop all precomputed extremes. Call at the start of a pipeline run."""
+    _cache.clear()
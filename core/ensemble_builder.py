@@ -15,21 +15,36 @@
 
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Optional, Dict, List, Any
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, time as dt_time
+from typing import Optional, Dict, List, Any, Tuple
 
-from .forecast_sources import SourceForecast, ForecastSourceBase
+from .forecast_sources import SourceForecast, ForecastSourceBase, GLOBAL_CITY_COORDINATES
 from .forecast_sources.open_meteo_client import OpenMeteoSource
 from .forecast_sources.met_norway_client import MetNorwaySource
 from .forecast_sources.openweather_client import OpenWeatherSource
 from .forecast_sources.tomorrow_client import TomorrowIoSource
-from .weather_probability_model import compute_probability_from_forecast_temp
+from .forecast_sources.async_fetch import prefetch_forecasts, MAX_CONCURRENT_REQUESTS
+from .daily_extremes import (
+    METRIC_DAILY_MAX, METRIC_DAILY_MIN, get_daily_extremes_cache, local_date_of,
+)
+from .probability_memo import content_hash, get_ensemble_memo
+from .weather_probability_model import (
+    SigmaHorizonTable,
+    compute_probability_batch,
+    compute_weighted_stats,
+)
 from .weather_signal import WeatherConfidence
 
 logger = logging.getLogger(__name__)
 
+# (lower_f, upper_f) of an event; None = open end
+Interval = Tuple[Optional[float], Optional[float]]
+
+# What a market resolves on: temperature at target_time, or the local-day high/low
+METRIC_POINT = "point"
+
 
 # =============================================================================
 # ENSEMBLE FORECAST DATA MODEL
@@ -59,7 +74,11 @@ class EnsembleForecast:
     max_source_deviation: float
 
     # Confidence adjustment from ensemble disagreement
-    confidence_adjustment: str  # "NONE", "DEGRADED_LOW_SOURCES", "DEGRADED_VARIANCE"
+    confidence_adjustment: str  # "NONE", "DEGRADED_LOW_SOURCES", "DEGRADED_VARIANCE", "PARTIAL_SOURCES"
+
+    # Built at the market deadline while slower sources were still pending
+    partial: bool = False
+    pending_sources: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -77,6 +96,8 @@ class EnsembleForecast:
             "max_source_deviation": round(self.max_source_deviation, 4),
             "confidence_adjustment": self.confidence_adjustment,
             "sources": [sf.source_name for sf in self.source_forecasts],
+            "partial": self.partial,
+            "pending_sources": list(self.pending_sources),
         }
 
 
@@ -92,6 +113,14 @@ class EnsembleBuilder:
     - Computes per-source probability using Normal-CDF math
     - Weights: equal, but correlated models share weight
     - Confidence degrades if too few independent sources or high variance
+    - build_ladder(): one distribution per (city, date), every strike and
+      bucket evaluated as a CDF difference
+    - Daily-max/min markets use each source's local-day extreme from the
+      hourly series (core.daily_extremes, cached per run)
+    - Deadline mode (MARKET_BUDGET_SECONDS): once the budget has passed and
+      MIN_INDEPENDENT_SOURCES are in hand, build from the partial result.
+      Late sources keep running and fill the forecast cache for the next
+      market in the same city.
     """
 
     def __init__(self, config: Dict[str, Any]):
@@ -100,6 +129,10 @@ class EnsembleBuilder:
         self.variance_threshold = ensemble_cfg.get("VARIANCE_THRESHOLD", 0.15)
         self.min_independent_sources = ensemble_cfg.get("MIN_INDEPENDENT_SOURCES", 2)
         self.source_timeout = ensemble_cfg.get("SOURCE_TIMEOUT_SECONDS", 12)
+        self.max_concurrent_requests = ensemble_cfg.get("MAX_CONCURRENT_REQUESTS", MAX_CONCURRENT_REQUESTS)
+        self.batch_all_cities = ensemble_cfg.get("BATCH_ALL_CITIES", True)
+        # None/0 = wait for every source (up to SOURCE_TIMEOUT_SECONDS + 5)
+        self.market_budget_seconds = ensemble_cfg.get("MARKET_BUDGET_SECONDS")
         self.correlated_models = ensemble_cfg.get("CORRELATED_MODELS", {
             "GFS": ["open_meteo_gfs", "openweather_gfs"],
         })
@@ -110,6 +143,14 @@ class EnsembleBuilder:
             "SIGMA_HORIZON_ADJUSTMENTS",
             {1: 0.8, 2: 0.9, 3: 1.0, 5: 1.2, 7: 1.5, 10: 2.0}
         )
+        self._sigma_table = SigmaHorizonTable(self.base_sigma, self.sigma_horizon_adjustments)
+
+        # City -> IANA timezone for local-day windows (CITY_CONFIG)
+        self.city_timezones: Dict[str, str] = {
+            name.lower(): cfg.get("timezone")
+            for name, cfg in (config.get("CITY_CONFIG") or {}).items()
+            if isinstance(cfg, dict) and cfg.get("timezone")
+        }
 
         # Build reverse lookup: model_name -> group_name
         self._model_to_group: Dict[str, str] = {}
@@ -125,23 +166,109 @@ class EnsembleBuilder:
             TomorrowIoSource(),
         ]
 
+        # One pool for the whole builder instead of one per market.
+        # Sized for concurrent markets: late sources from one market must
+        # not queue ahead of the next market's fetches.
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_workers = len(self._sources) * max(1, int(config.get("MARKET_WORKERS", 1)))
+
+    def prefetch(self, cities: List[str]) -> Dict[str, Any]:
+        """
+        Fetch all sources for all cities concurrently into the forecast cache.
+
+        Call once per run before build(); build() then answers from memory.
+        Batch-capable sources load every tracked city in the same request.
+        """
+        if not self.enabled:
+            return {"requested": 0, "fetched": 0, "failed": 0, "duration_seconds": 0.0}
+        return prefetch_forecasts(
+            cities,
+            self._sources,
+            timeout=self.source_timeout,
+            max_concurrency=self.max_concurrent_requests,
+            batch_cities=list(GLOBAL_CITY_COORDINATES) if self.batch_all_cities else (),
+        )
+
+    def precompute_daily_extremes(self, city_dates: List[Tuple[str, date]]) -> int:
+        """
+        Derive daily max/min for every (city, local date) of the run.
+
+        Reads the (prefetched) forecasts and fills the run-scoped daily
+        extremes cache; ladder builds then reuse it. Returns the number
+        of (city, date) pairs with at least one source.
+        """
+        if not self.enabled:
+            return 0
+        cache = get_daily_extremes_cache()
+        computed = 0
+        for city, local_date in dict.fromkeys(city_dates):
+            forecasts, _ = self._fetch_all(city, datetime.combine(local_date, dt_time(12)))
+            if forecasts:
+                extremes = cache.get_or_compute(city, local_date, self._timezone(city), forecasts)
+                computed += 1 if extremes.source_max_f else 0
+        return computed
+
     def build(
         self,
         city: str,
         target_time: datetime,
         threshold_f: float,
         event_type: str = "exceeds",
+        metric: str = METRIC_POINT,
     ) -> Optional[EnsembleForecast]:
         """
         Build an ensemble forecast for a city/threshold.
 
         Returns None if no sources return data.
         """
+        if event_type == "exceeds":
+            interval = (threshold_f, None)
+        elif event_type == "below":
+            interval = (None, threshold_f)
+        else:
+            raise ValueError(f"Unknown event_type: {event_type}")
+
+        ladder = self.build_ladder(city, target_time, [interval], metric=metric)
+        return ladder[0] if ladder else None
+
+    def build_ladder(
+        self,
+        city: str,
+        target_time: datetime,
+        intervals: List[Interval],
+        metric: str = METRIC_POINT,
+    ) -> Optional[List[EnsembleForecast]]:
+        """
+        Build one ensemble per interval from a single predictive distribution.
+
+        All strikes and buckets of a (city, date) ladder share one fetch;
+        each source contributes N(forecast, sigma) and every interval is a
+        CDF difference of the same distribution, so the ladder is
+        internally consistent (buckets sum up, strikes are monotone).
+
+        Args:
+            city: City name
+            target_time: Resolution time of the ladder
+            intervals: (lower_f, upper_f) per market; None = open end
+            metric: METRIC_POINT, METRIC_DAILY_MAX or METRIC_DAILY_MIN.
+                Daily metrics use the local-day extreme of each source's
+                hourly series on target_time's date.
+
+        Returns:
+            One EnsembleForecast per interval (same order), or None if no
+            sources return data.
+        """
         if not self.enabled:
             return None
 
-        # Fetch all sources in parallel
-        forecasts = self._fetch_all(city, target_time)
+        for lower, upper in intervals:
+            if lower is None and upper is None:
+                raise ValueError("interval needs at least one bound")
+            if lower is not None and upper is not None and upper < lower:
+                raise ValueError(f"invalid interval ({lower}, {upper})")
+
+        # Fetch all sources in parallel (deadline-bounded)
+        forecasts, pending = self._fetch_all(city, target_time)
 
         if not forecasts:
             logger.warning(f"Ensemble: no sources returned data for {city}")
@@ -154,81 +281,165 @@ class EnsembleBuilder:
         days = hours / 24
         sigma = self._calculate_sigma(days)
 
-        # Compute per-source probabilities
-        per_source_probs: Dict[str, float] = {}
-        for sf in forecasts:
-            prob = compute_probability_from_forecast_temp(
-                temperature_f=sf.temperature_f,
-                threshold_f=threshold_f,
-                sigma=sigma,
-                event_type=event_type,
-            )
-            per_source_probs[sf.source_name] = prob
-
         # Compute weights (correlated models share weight)
         weights = self._compute_weights(forecasts)
 
-        # Weighted ensemble mean probability
         total_weight = sum(weights.values())
         if total_weight <= 0:
             return None
 
-        ensemble_mean = sum(
-            weights[sf.source_name] * per_source_probs[sf.source_name]
-            for sf in forecasts
-        ) / total_weight
-
-        # Weighted variance
-        ensemble_var = sum(
-            weights[sf.source_name] * (per_source_probs[sf.source_name] - ensemble_mean) ** 2
-            for sf in forecasts
-        ) / total_weight
-
-        # Max deviation
-        max_dev = max(
-            abs(per_source_probs[sf.source_name] - ensemble_mean)
-            for sf in forecasts
+        # Distribution centre per source
+        centres = self._source_centres(city, target_time, forecasts, metric)
+
+        # Same inputs as an earlier build (typically the previous run) -> memoized ladder
+        memo = get_ensemble_memo()
+        memo_key = (
+            "ensemble",
+            city.strip().lower(),
+            target_time.date(),
+            tuple(intervals),
+            metric,
+            content_hash(tuple(
+                (sf.source_name, sf.model_name, centre, weights[sf.source_name])
+                for sf, centre in zip(forecasts, centres)
+            )),
+            tuple(pending),
+            self._sigma_table.bucket(days),
+            sigma,
+            self.min_independent_sources,
+            self.variance_threshold,
+        )
+        cached = memo.get(memo_key)
+        if cached is not None:
+            return [
+                replace(ensemble, target_time=target_time, source_forecasts=forecasts)
+                for ensemble in cached
+            ]
+
+        # CDF of every source at every ladder boundary in one pass
+        boundaries = sorted({b for interval in intervals for b in interval if b is not None})
+        cdf_rows = compute_probability_batch(
+            means=[centre for centre in centres for _ in boundaries],
+            sigmas=[sigma] * (len(forecasts) * len(boundaries)),
+            thresholds=[b for _ in forecasts for b in boundaries],
+            event_types="below",
+        ).probabilities
+        column = {b: i for i, b in enumerate(boundaries)}
+
+        def cdf(source_index: int, bound: Optional[float], open_value: float) -> float:
+            if bound is None:
+                return open_value
+            return cdf_rows[source_index * len(boundaries) + column[bound]]
+
+        # Per-source interval probabilities = CDF differences
+        source_weights = [weights[sf.source_name] for sf in forecasts]
+        values: List[float] = []
+        for lower, upper in intervals:
+            for i in range(len(forecasts)):
+                values.append(max(0.0, cdf(i, upper, 1.0) - cdf(i, lower, 0.0)))
+        means, variances, max_devs = compute_weighted_stats(
+            values,
+            weights=source_weights * len(intervals),
+            groups=[g for g in range(len(intervals)) for _ in forecasts],
         )
 
         # Ensemble temperature (simple weighted mean)
         ensemble_temp = sum(
-            weights[sf.source_name] * sf.temperature_f
-            for sf in forecasts
+            weights[sf.source_name] * centre
+            for sf, centre in zip(forecasts, centres)
         ) / total_weight
 
-        temps = [sf.temperature_f for sf in forecasts]
-        temp_spread = max(temps) - min(temps)
+        temp_spread = max(centres) - min(centres)
 
         # Count independent models
         independent_count = self._count_independent_models(forecasts)
 
-        # Confidence adjustment
-        adjustment = "NONE"
-        if independent_count < self.min_independent_sources:
-            adjustment = "DEGRADED_LOW_SOURCES"
-        elif ensemble_var > self.variance_threshold:
-            adjustment = "DEGRADED_VARIANCE"
-
-        return EnsembleForecast(
-            city=city,
-            target_time=target_time,
-            source_forecasts=forecasts,
-            ensemble_temperature_f=ensemble_temp,
-            temperature_spread_f=temp_spread,
-            source_count=len(forecasts),
-            independent_model_count=independent_count,
-            per_source_probabilities=per_source_probs,
-            ensemble_mean_probability=ensemble_mean,
-            ensemble_variance=ensemble_var,
-            max_source_deviation=max_dev,
-            confidence_adjustment=adjustment,
-        )
+        results: List[EnsembleForecast] = []
+        for g in range(len(intervals)):
+            row = values[g * len(forecasts):(g + 1) * len(forecasts)]
+            ensemble_var = variances[g]
+
+            # Confidence adjustment
+            adjustment = "NONE"
+            if independent_count < self.min_independent_sources:
+                adjustment = "DEGRADED_LOW_SOURCES"
+            elif ensemble_var > self.variance_threshold:
+                adjustment = "DEGRADED_VARIANCE"
+            elif pending:
+                adjustment = "PARTIAL_SOURCES"
+
+            results.append(EnsembleForecast(
+                city=city,
+                target_time=target_time,
+                source_forecasts=forecasts,
+                ensemble_temperature_f=ensemble_temp,
+                temperature_spread_f=temp_spread,
+                source_count=len(forecasts),
+                independent_model_count=independent_count,
+                per_source_probabilities={
+                    sf.source_name: prob for sf, prob in zip(forecasts, row)
+                },
+                ensemble_mean_probability=means[g],
+                ensemble_variance=ensemble_var,
+                max_source_deviation=max_devs[g],
+                confidence_adjustment=adjustment,
+                partial=bool(pending),
+                pending_sources=pending,
+            ))
+
+        memo.put(memo_key, results)
+        return results
+
+    def _timezone(self, city: str) -> str:
+        return self.city_timezones.get(city.strip().lower(), "UTC")
+
+    def local_date(self, city: str, moment: datetime) -> date:
+        """Calendar date of moment in the city's timezone (CITY_CONFIG)."""
+        return local_date_of(moment, self._timezone(city))
+
+    def _source_centres(
+        self,
+        city: str,
+        target_time: datetime,
+        forecasts: List[SourceForecast],
+        metric: str,
+    ) -> List[float]:
+        """
+        Forecast value per source for the market's metric.
+
+        Daily metrics prefer the local-day extreme from the hourly series,
+        then the source's own (UTC-day) max/min, then the point value.
+        """
+        if metric == METRIC_POINT:
+            return [sf.temperature_f for sf in forecasts]
+        if metric not in (METRIC_DAILY_MAX, METRIC_DAILY_MIN):
+            raise ValueError(f"Unknown metric: {metric}")
+
+        extremes = get_daily_extremes_cache().get_or_compute(
+            city, self.local_date(city, target_time), self._timezone(city), forecasts
+        ).values(metric)
 
-    def _fetch_all(self, city: str, target_time: datetime) -> List[SourceForecast]:
-        """Fetch from all available sources in parallel with timeouts."""
+        centres = []
+        for sf in forecasts:
+            own = sf.temperature_max_f if metric == METRIC_DAILY_MAX else sf.temperature_min_f
+            value = extremes.get(sf.source_name, own)
+            centres.append(value if value is not None else sf.temperature_f)
+        return centres
+
+    def _fetch_all(
+        self, city: str, target_time: datetime
+    ) -> Tuple[List[SourceForecast], List[str]]:
+        """
+        Fetch from all available sources in parallel with timeouts.
+
+        Returns:
+            (forecasts, pending source names). pending is non-empty only
+            when the market budget cut the wait short; those fetches are
+            not cancelled and still land in the forecast cache.
+        """
         available = [s for s in self._sources if s.is_available()]
         if not available:
-            return []
+            return [], []
 
         results: List[SourceForecast] = []
 
@@ -239,21 +450,52 @@ class EnsembleBuilder:
                 logger.debug(f"Ensemble source {source.source_name} failed for {city}: {e}")
                 return None
 
-        with ThreadPoolExecutor(max_workers=len(available)) as pool:
-            futures = {pool.submit(_fetch_one, s): s for s in available}
-            for future in as_completed(futures, timeout=self.source_timeout + 5):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._executor_workers, thread_name_prefix="ensemble-source"
+            )
+
+        futures = {self._executor.submit(_fetch_one, s): s for s in available}
+        pending = set(futures)
+
+        start = time.monotonic()
+        hard_deadline = start + self.source_timeout + 5
+        budget_deadline = start + self.market_budget_seconds if self.market_budget_seconds else None
+
+        while pending:
+            now = time.monotonic()
+            budget_passed = budget_deadline is not None and now >= budget_deadline
+            if budget_passed and self._count_independent_models(results) >= self.min_independent_sources:
+                break
+            if now >= hard_deadline:
+                logger.debug(f"Ensemble: source timeout for {city}, using {len(results)} results")
+                break
+
+            # Wake up on the next completion or when the budget expires
+            wake_at = hard_deadline
+            if budget_deadline is not None and not budget_passed:
+                wake_at = min(wake_at, budget_deadline)
+            done, pending = wait(pending, timeout=wake_at - now, return_when=FIRST_COMPLETED)
+            for future in done:
                 try:
-                    result = future.result(timeout=2)
+                    result = future.result()
                     if result is not None:
                         results.append(result)
                 except Exception:
                     pass
 
+        pending_names = sorted(futures[f].source_name for f in pending)
+        if pending_names:
+            logger.debug(
+                f"Ensemble: building {city} from partial results after "
+                f"{time.monotonic() - start:.1f}s, pending: {pending_names}"
+            )
+
         logger.debug(
             f"Ensemble fetched {len(results)}/{len(available)} sources for {city}: "
             f"{[r.source_name for r in results]}"
         )
-        return results
+        return results, pending_names
 
     def _compute_weights(self, forecasts: List[SourceForecast]) -> Dict[str, float]:
         """
@@ -315,14 +557,7 @@ class EnsembleBuilder:
 
     def _calculate_sigma(self, days_to_resolution: float) -> float:
         """Calculate sigma adjusted for forecast horizon."""
-        adjustment = 1.0
-        sorted_keys = sorted(self.sigma_horizon_adjustments.keys())
-        for key in sorted_keys:
-            if days_to_resolution >= key:
-                adjustment = self.sigma_horizon_adjustments[key]
-            else:
-                break
-        return self.base_sigma * adjustment
+        return self._sigma_table.sigma(days_to_resolution)
 
 
 def degrade_confidence(
@@ -336,6 +571,9 @@ def degrade_confidence(
     1. If DEGRADED_LOW_SOURCES -> force LOW
     2. If DEGRADED_VARIANCE -> one step down (HIGH->MEDIUM, MEDIUM->LOW)
     3. Return min(horizon, adjusted)
+
+    PARTIAL_SOURCES is informational: the ensemble already had
+    MIN_INDEPENDENT_SOURCES, so it does not degrade confidence.
     """
     if ensemble_adjustment == "DEGRADED_LOW_SOURCES":
         return WeatherConfidence.LOW
@@ -11,16 +11,22 @@
 #
 # =============================================================================
 
-import json
 import logging
 import os
-import ssl
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional, Dict, List, Tuple
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+
+from shared.http_transport import get_http_transport
+
+from .cache import (
+    ForecastCache,
+    ForecastDiskStore,
+    get_forecast_cache,
+    reset_forecast_cache,
+    enable_disk_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -79,21 +85,30 @@ def get_coords(city: str) -> Optional[Tuple[float, float]]:
 # =============================================================================
 
 REQUEST_TIMEOUT = 12
+USER_AGENT = "PolymarketBeobachter/2.0"
 
 
-def api_get(url: str, headers: Optional[Dict] = None, timeout: int = REQUEST_TIMEOUT) -> Optional[Dict]:
-    """HTTP GET with JSON response. Shared across all forecast sources."""
-    try:
-        ctx = ssl.create_default_context()
-        req_headers = {"User-Agent": "PolymarketBeobachter/2.0"}
-        if headers:
-            req_headers.update(headers)
-        request = Request(url, headers=req_headers)
-        with urlopen(request, timeout=timeout, context=ctx) as response:
-            return json.loads(response.read().decode("utf-8"))
-    except (HTTPError, URLError, Exception) as e:
-        logger.debug(f"API request failed for {url[:80]}: {e}")
+def api_get(
+    url: str,
+    headers: Optional[Dict] = None,
+    timeout: int = REQUEST_TIMEOUT,
+    source: Optional[str] = None,
+) -> Optional[Dict]:
+    """
+    HTTP GET with JSON response. Shared across all forecast sources.
+
+    Goes through the shared transport (pooled connections, conditional
+    GETs, per-host rate limiting, metrics labelled with source); returns
+    None on any failure.
+    """
+    req_headers = {"User-Agent": USER_AGENT}
+    if headers:
+        req_headers.update(headers)
+    response = get_http_transport().get(url, headers=req_headers, timeout=timeout, source=source)
+    if not response.ok:
+        logger.debug(f"API request failed for {url[:80]}: {response.error}")
         return None
+    return response.data
 
 
 # =============================================================================
@@ -144,6 +159,9 @@ class SourceForecast:
 class ForecastSourceBase(ABC):
     """Abstract base class for all forecast sources."""
 
+    # Max locations per batched request; 1 = no native batch support
+    batch_size: int = 1
+
     @property
     @abstractmethod
     def source_name(self) -> str:
@@ -162,13 +180,114 @@ class ForecastSourceBase(ABC):
         return False
 
     @abstractmethod
-    def fetch(self, city: str, target_time: datetime) -> Optional[SourceForecast]:
+    def build_request(self, city: str) -> Optional[Tuple[str, Dict[str, str]]]:
+        """
+        Build the raw forecast request for a city.
+
+        Returns (url, extra_headers) or None if the city is unsupported
+        or the source is not configured.
+        """
+        ...
+
+    @abstractmethod
+    def parse(self, data: Dict, city: str, target_time: datetime) -> Optional[SourceForecast]:
+        """
+        Convert a raw API response into a SourceForecast for target_time.
+
+        May raise on malformed data; fetch() logs and returns None.
+        """
+        ...
+
+    def build_batch_request(
+        self, cities: List[str]
+    ) -> Optional[Tuple[str, Dict[str, str], List[Tuple[float, float]]]]:
+        """
+        Build one raw request covering several cities.
+
+        Only sources with batch_size > 1 override this. Returns
+        (url, extra_headers, coords_in_response_order) or None.
+        """
+        return None
+
+    def split_batch(self, data, count: int) -> List[Optional[Dict]]:
+        """Split a batched response into one raw payload per location."""
+        return [None] * count
+
+    def fetch(self, city: str, target_time: datetime, timeout: int = REQUEST_TIMEOUT) -> Optional[SourceForecast]:
         """
         Fetch forecast for a city at a target time.
 
+        The raw response is served from the shared forecast cache when
+        available, so any target_time for the same city costs no request.
+
         Returns SourceForecast or None if unavailable.
         """
-        ...
+        coords = get_coords(city)
+        if coords is None:
+            logger.debug(f"{self.source_name}: no coords for {city}")
+            return None
+
+        request = self.build_request(city)
+        if request is None:
+            return None
+        url, headers = request
+
+        data = get_forecast_cache().get_or_fetch(
+            self.source_name, coords,
+            lambda: api_get(url, headers=headers, timeout=timeout, source=self.source_name),
+        )
+        if data is None:
+            return None
+
+        try:
+            return self.parse(data, city, target_time)
+        except Exception as e:
+            logger.debug(f"{self.source_name} parse error for {city}: {e}")
+            return None
+
+    def fetch_many(
+        self,
+        cities: List[str],
+        target_time: datetime,
+        timeout: int = REQUEST_TIMEOUT,
+    ) -> Dict[str, Optional[SourceForecast]]:
+        """
+        Fetch forecasts for several cities at one target time.
+
+        Sources with native batch support load all uncached cities with
+        one request per batch_size chunk; others fall back to fetch()
+        per city. Cities missing from a failed batch are retried singly.
+
+        Returns {city: SourceForecast or None} in input order.
+        """
+        if self.batch_size > 1:
+            cache = get_forecast_cache()
+            pending = []
+            seen = set()
+            for city in cities:
+                coords = get_coords(city)
+                if coords is None or coords in seen:
+                    continue
+                seen.add(coords)
+                if not cache.contains(self.source_name, coords):
+                    pending.append(city)
+
+            for i in range(0, len(pending), self.batch_size):
+                chunk = pending[i:i + self.batch_size]
+                if len(chunk) < 2:
+                    continue
+                request = self.build_batch_request(chunk)
+                if request is None:
+                    continue
+                url, headers, coords_list = request
+                data = api_get(url, headers=headers, timeout=timeout, source=self.source_name)
+                if data is None:
+                    continue
+                for coords, payload in zip(coords_list, self.split_batch(data, len(coords_list))):
+                    if payload is not None:
+                        cache.put(self.source_name, coords, payload)
+
+        return {city: self.fetch(city, target_time, timeout=timeout) for city in cities}
 
     def is_available(self) -> bool:
         """Check if this source can be used (e.g. API key present)."""
@@ -182,4 +301,10 @@ __all__ = [
     "get_coords",
     "api_get",
     "REQUEST_TIMEOUT",
+    "USER_AGENT",
+    "ForecastCache",
+    "get_forecast_cache",
+    "reset_forecast_cache",
+    "ForecastDiskStore",
+    "enable_disk_cache",
 ]
@@ -0,0 +1,325 @@
+# =============================================================================
+# ASYNC FORECAST PREFETCH - Concurrent fetch engine with connection pooling
+# =============================================================================
+#
+# Fetches the raw payload for every (source, city) pair of a run at once
+# and stores it in the shared forecast cache. The per-market sync path
+# (ForecastSourceBase.fetch) then answers from memory.
+#
+# - One httpx.AsyncClient per prefetch: keep-alive connection pool per host
+# - Global concurrency bound via asyncio.Semaphore
+# - Batch-capable sources (Open-Meteo) get one request for all cities
+# - Shares the transport's ETag/Last-Modified store: unchanged payloads
+#   come back as 304
+# - Paced by the shared rate limiter like HttpTransport.get: per-host
+#   token bucket (async wait), circuit breaker, 429 Retry-After
+# - Wall time ~ latency of the slowest source instead of markets x sources
+# - Falls back to a thread pool with the sync api_get if httpx is missing
+#
+# ISOLATION: READ-ONLY, no trading imports
+# =============================================================================
+
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from shared.http_transport import get_http_transport
+from shared.rate_limiter import get_rate_limiter
+from shared.metrics import get_metrics_registry
+
+from . import (
+    ForecastSourceBase,
+    get_coords,
+    api_get,
+    REQUEST_TIMEOUT,
+    USER_AGENT,
+)
+from .cache import get_forecast_cache, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for simultaneous in-flight requests across all hosts
+MAX_CONCURRENT_REQUESTS = 16
+
+# Idle keep-alive connections are closed after this many seconds
+KEEPALIVE_EXPIRY_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class FetchJob:
+    """
+    One raw forecast request.
+
+    Single-location jobs use coords; batched jobs (sources with
+    batch_size > 1) list every location in batch_coords, in the order
+    the response returns them.
+    """
+    source_name: str
+    coords: Tuple[float, float]
+    url: str
+    headers: Tuple[Tuple[str, str], ...] = ()
+    batch_coords: Tuple[Tuple[float, float], ...] = ()
+
+
+def _pending_cities(source: ForecastSourceBase, cities: Iterable[str]) -> List[str]:
+    """Cities with known coords that are not yet cached, one per location."""
+    cache = get_forecast_cache()
+    seen = set()
+    pending = []
+    for city in cities:
+        coords = get_coords(city)
+        if coords is None:
+            continue
+        key = make_cache_key(source.source_name, coords)
+        if key in seen:
+            continue
+        seen.add(key)
+        if not cache.contains(source.source_name, coords):
+            pending.append(city)
+    return pending
+
+
+def plan_jobs(
+    sources: Iterable[ForecastSourceBase],
+    cities: Iterable[str],
+    batch_cities: Iterable[str] = (),
+) -> List[FetchJob]:
+    """
+    Build the deduplicated request list for sources x cities.
+
+    Skips unavailable sources, unknown cities and pairs that are already
+    cached (memory or disk). Sources with native batch support get one
+    job per batch_size chunk; batch_cities are added to those chunks
+    (a whole city list costs the same single round trip).
+    """
+    cities = list(cities)
+    batch_cities = list(batch_cities)
+    jobs: List[FetchJob] = []
+
+    for source in sources:
+        if not source.is_available():
+            continue
+
+        if source.batch_size > 1:
+            pending = _pending_cities(source, cities + batch_cities)
+            for i in range(0, len(pending), source.batch_size):
+                chunk = pending[i:i + source.batch_size]
+                request = source.build_batch_request(chunk) if len(chunk) > 1 else None
+                if request is None:
+                    # Single leftover city (or no batch URL): plain request
+                    jobs.extend(_single_jobs(source, chunk))
+                    continue
+                url, headers, coords_list = request
+                jobs.append(FetchJob(
+                    source_name=source.source_name,
+                    coords=coords_list[0],
+                    url=url,
+                    headers=tuple(sorted(headers.items())),
+                    batch_coords=tuple(coords_list),
+                ))
+            continue
+
+        jobs.extend(_single_jobs(source, _pending_cities(source, cities)))
+
+    return jobs
+
+
+def _single_jobs(source: ForecastSourceBase, cities: List[str]) -> List[FetchJob]:
+    jobs = []
+    for city in cities:
+        request = source.build_request(city)
+        if request is None:
+            continue
+        url, headers = request
+        jobs.append(FetchJob(
+            source_name=source.source_name,
+            coords=get_coords(city),
+            url=url,
+            headers=tuple(sorted(headers.items())),
+        ))
+    return jobs
+
+
+async def _fetch_one(client, semaphore: asyncio.Semaphore, job: FetchJob, timeout: float) -> Optional[Dict]:
+    validators = get_http_transport().validators
+    limiter = get_rate_limiter()
+    metrics = get_metrics_registry()
+    headers = dict(job.headers)
+    headers.update(validators.conditional_headers(job.url))
+
+    # Same per-host pacing/circuit as HttpTransport.get; the token wait
+    # happens outside the semaphore so a throttled host does not hold
+    # slots other hosts could use
+    wait = limiter.reserve(job.url)
+    if wait is None:
+        metrics.record_cache(job.source_name, "rejected")
+        return None
+    if wait > 0:
+        await asyncio.sleep(wait)
+
+    async with semaphore:
+        started = time.perf_counter()
+        try:
+            response = await client.get(job.url, headers=headers, timeout=timeout)
+        except Exception as e:
+            metrics.record_request(job.source_name, time.perf_counter() - started, success=False)
+            limiter.record(job.url, None)
+            logger.debug(f"Async forecast request failed for {job.url[:80]}: {e}")
+            return None
+
+    elapsed = time.perf_counter() - started
+    status = response.status_code
+    limiter.record(job.url, status, response.headers.get("Retry-After"))
+
+    if status == 304:
+        cached = validators.get(job.url)
+        metrics.record_request(
+            job.source_name, elapsed, success=cached is not None, cache_status="not_modified",
+        )
+        if cached is None:
+            return None
+        validators.mark_revalidated()
+        return json.loads(cached[2])
+
+    if not 200 <= status < 300:
+        metrics.record_request(job.source_name, elapsed, success=False)
+        logger.debug(f"Async forecast request failed for {job.url[:80]}: HTTP {status}")
+        return None
+
+    body = response.content
+    try:
+        data = json.loads(body) if body else None
+    except ValueError as e:
+        metrics.record_request(job.source_name, elapsed, success=False, payload_bytes=len(body))
+        logger.debug(f"Async forecast response for {job.url[:80]} is not JSON: {e}")
+        return None
+    metrics.record_request(job.source_name, elapsed, success=True, payload_bytes=len(body))
+    validators.put(job.url, response.headers.get("ETag"), response.headers.get("Last-Modified"), body)
+    return data
+
+
+async def fetch_jobs_async(
+    jobs: List[FetchJob],
+    timeout: float = REQUEST_TIMEOUT,
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    transport: Optional[Any] = None,
+) -> List[Optional[Dict]]:
+    """
+    Fetch all jobs concurrently over one pooled client.
+
+    Args:
+        jobs: Requests to run
+        timeout: Per-request timeout in seconds
+        max_concurrency: Global bound on in-flight requests
+        transport: Optional httpx transport (injectable for testing)
+
+    Returns:
+        Parsed JSON payloads (None on failure), in job order
+    """
+    limits = httpx.Limits(
+        max_connections=max_concurrency,
+        max_keepalive_connections=max_concurrency,
+        keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+    async with httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        limits=limits,
+        timeout=timeout,
+        transport=transport,
+        follow_redirects=True,
+    ) as client:
+        return await asyncio.gather(*(
+            _fetch_one(client, semaphore, job, timeout) for job in jobs
+        ))
+
+
+def _fetch_jobs_threaded(jobs: List[FetchJob], timeout: float, max_concurrency: int) -> List[Optional[Dict]]:
+    """Fallback without httpx: sync api_get on a bounded thread pool."""
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(jobs)))) as pool:
+        return list(pool.map(
+            lambda job: api_get(job.url, headers=dict(job.headers), timeout=timeout, source=job.source_name),
+        jobs,
+        ))
+
+
+def _run_coroutine(coro):
+    """Run a coroutine to completion, also when called from a running loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def prefetch_forecasts(
+    cities: Iterable[str],
+    sources: Iterable[ForecastSourceBase],
+    timeout: float = REQUEST_TIMEOUT,
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    transport: Optional[Any] = None,
+    batch_cities: Iterable[str] = (),
+) -> Dict[str, Any]:
+    """
+    Warm the shared forecast cache for every source and city concurrently.
+
+    Args:
+        cities: City names (duplicates are fine)
+        sources: Forecast sources to query
+        timeout: Per-request timeout in seconds
+        max_concurrency: Global bound on in-flight requests
+        transport: Optional httpx transport (injectable for testing)
+        batch_cities: Extra cities for sources with native batch requests
+
+    Returns:
+        Summary dict with requested, fetched, failed, duration_seconds
+    """
+    sources = list(sources)
+    by_name = {source.source_name: source for source in sources}
+    jobs = plan_jobs(sources, cities, batch_cities)
+    if not jobs:
+        return {"requested": 0, "fetched": 0, "failed": 0, "duration_seconds": 0.0}
+
+    start = time.perf_counter()
+    if httpx is not None:
+        payloads = _run_coroutine(fetch_jobs_async(jobs, timeout, max_concurrency, transport))
+    else:
+        payloads = _fetch_jobs_threaded(jobs, timeout, max_concurrency)
+    duration = time.perf_counter() - start
+
+    cache = get_forecast_cache()
+    fetched = 0
+    for job, payload in zip(jobs, payloads):
+        if not job.batch_coords:
+            cache.put(job.source_name, job.coords, payload)
+            fetched += payload is not None
+            continue
+        # Failed batches are not negative-cached: fetch() retries singly
+        if payload is None:
+            continue
+        parts = by_name[job.source_name].split_batch(payload, len(job.batch_coords))
+        for coords, part in zip(job.batch_coords, parts):
+            if part is not None:
+                cache.put(job.source_name, coords, part)
+        fetched += any(part is not None for part in parts)
+
+    logger.info(
+        f"Forecast prefetch: {fetched}/{len(jobs)} payloads in {duration:.2f}s "
+        f"(concurrency={max_concurrency})"
+    )
+    return {
+        "requested": len(jobs),
+        "fetched": fetched,
+        "failed": len(jobs) - fetched,
+        "duration_seconds": round(duration, 3),
+    }
@@ -0,0 +1,331 @@
+# =============================================================================
+# FORECAST CACHE - Run-scoped raw payload cache
+# =============================================================================
+#
+# Polymarket lists a dozen threshold markets per city and day. Every market
+# used to trigger a fresh request to every forecast provider, although each
+# provider response already contains the full hourly series for the whole
+# forecast window.
+#
+# This cache keeps the raw JSON response per (source, city coordinates).
+# Sources parse the cached payload for any target_time, so one pipeline run
+# makes at most one request per source per city.
+#
+# - Thread-safe: concurrent requests for the same key share one fetch
+# - Failed fetches (None) are cached too, so a dead source is not retried
+#   for every market of the same city within a run
+# - Entries expire after a per-source TTL; the orchestrator clears the
+#   in-memory layer at every pipeline start
+# - Optional disk layer (ForecastDiskStore, SQLite under data/forecasts/)
+#   survives restarts: a cockpit or watchdog relaunch reuses forecasts
+#   fetched minutes ago instead of re-downloading everything
+#
+# ISOLATION: READ-ONLY, no trading imports
+# =============================================================================
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from shared.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# Default lifetime of a cached payload (one pipeline interval)
+DEFAULT_MAX_AGE_SECONDS = 900
+
+# Per-source lifetime of a cached payload. Providers refresh their model
+# runs hourly at best, so reusing a response for 30 min loses nothing.
+SOURCE_TTL_SECONDS: Dict[str, float] = {
+    "open_meteo": 1800,
+    "met_norway": 1800,   # MET sets Expires ~30 min ahead
+    "openweather": 1800,
+    "tomorrow_io": 3600,  # Free tier: 500 calls/day
+    "weatherapi": 1800,
+    "noaa": 3600,         # NWS gridpoint forecasts update ~hourly
+}
+
+# Coordinate precision for cache keys (~11 m), merges city aliases like "nyc"
+COORD_PRECISION = 4
+
+CacheKey = Tuple[str, float, float]
+
+
+def make_cache_key(source_name: str, coords: Tuple[float, float]) -> CacheKey:
+    """Build the cache key for a source and (lat, lon) pair."""
+    lat, lon = coords
+    return (source_name, round(lat, COORD_PRECISION), round(lon, COORD_PRECISION))
+
+
+class ForecastDiskStore:
+    """
+    SQLite store for raw forecast payloads (warm start across restarts).
+
+    One row per (source, lat, lon) with the fetch timestamp. Failed fetches
+    are never persisted. All errors are logged and treated as a miss.
+    """
+
+    FILENAME = "forecast_cache.sqlite"
+
+    def __init__(self, directory: Path):
+        self.path = Path(directory) / self.FILENAME
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS payloads ("
+                " source TEXT NOT NULL, lat REAL NOT NULL, lon REAL NOT NULL,"
+                " fetched_at REAL NOT NULL, payload TEXT NOT NULL,"
+                " PRIMARY KEY (source, lat, lon))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.path), timeout=5)
+
+    def load(self, key: CacheKey, max_age_seconds: float) -> Optional[Tuple[float, Dict]]:
+        """Return (fetched_at, payload) if a fresh row exists."""
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute(
+                    "SELECT fetched_at, payload FROM payloads WHERE source=? AND lat=? AND lon=?",
+                    key,
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Forecast disk cache read failed for {key}: {e}")
+            return None
+
+        if row is None:
+            return None
+        fetched_at, payload_json = row
+        if time.time() - fetched_at > max_age_seconds:
+            return None
+        try:
+            return fetched_at, json.loads(payload_json)
+        except ValueError:
+            return None
+
+    def save(self, key: CacheKey, fetched_at: float, payload: Dict) -> None:
+        """Insert or replace the payload for key."""
+        try:
+            payload_json = json.dumps(payload, separators=(",", ":"))
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO payloads (source, lat, lon, fetched_at, payload)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (*key, fetched_at, payload_json),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.debug(f"Forecast disk cache write failed for {key}: {e}")
+
+    def prune(self, max_age_seconds: float) -> int:
+        """Delete rows older than max_age_seconds. Returns deleted row count."""
+        try:
+            with self._lock, self._connect() as conn:
+                cursor = conn.execute(
+                    "DELETE FROM payloads WHERE fetched_at < ?",
+                    (time.time() - max_age_seconds,),
+                )
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.debug(f"Forecast disk cache prune failed: {e}")
+            return 0
+
+
+class ForecastCache:
+    """
+    Cache of raw forecast payloads keyed by (source, lat, lon).
+
+    Lookup order: memory -> disk store (if attached) -> fetcher.
+
+    Usage:
+        data = cache.get_or_fetch("open_meteo", (lat, lon), lambda: api_get(url))
+    """
+
+    def __init__(
+        self,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        source_ttls: Optional[Dict[str, float]] = None,
+        store: Optional[ForecastDiskStore] = None,
+    ):
+        self.max_age_seconds = max_age_seconds
+        self.source_ttls = dict(SOURCE_TTL_SECONDS if source_ttls is None else source_ttls)
+        self._store = store
+        self._entries: Dict[CacheKey, Tuple[float, Optional[Dict]]] = {}
+        self._key_locks: Dict[CacheKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def ttl_for(self, source_name: str) -> float:
+        """Lifetime of a cached payload for this source."""
+        return self.source_ttls.get(source_name, self.max_age_seconds)
+
+    def attach_store(self, store: Optional[ForecastDiskStore]) -> None:
+        """Attach (or detach with None) the persistent disk layer."""
+        self._store = store
+        if store is not None:
+            store.prune(max([self.max_age_seconds, *self.source_ttls.values()]))
+
+    def _lock_for(self, key: CacheKey) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = threading.Lock()
+                self._key_locks[key] = lock
+            return lock
+
+    def _lookup(self, key: CacheKey) -> Tuple[bool, Optional[Dict]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            stored_at, payload = entry
+            if time.time() - stored_at > self.ttl_for(key[0]):
+                del self._entries[key]
+                return False, None
+            return True, payload
+
+    def _load_from_store(self, key: CacheKey) -> Tuple[bool, Optional[Dict]]:
+        """Promote a fresh disk row into memory. Caller holds the key lock."""
+        store = self._store
+        if store is None:
+            return False, None
+        stored = store.load(key, self.ttl_for(key[0]))
+        if stored is None:
+            return False, None
+        fetched_at, payload = stored
+        with self._lock:
+            self._entries[key] = (fetched_at, payload)
+            self.disk_hits += 1
+        return True, payload
+
+    def contains(self, source_name: str, coords: Tuple[float, float]) -> bool:
+        """True if a fresh payload is available without fetching."""
+        key = make_cache_key(source_name, coords)
+        found, _ = self._lookup(key)
+        if found:
+            return True
+        with self._lock_for(key):
+            found, _ = self._load_from_store(key)
+            return found
+
+    def put(self, source_name: str, coords: Tuple[float, float], payload: Optional[Dict]) -> None:
+        """Store a fetched payload (None marks a failed fetch)."""
+        key = make_cache_key(source_name, coords)
+        fetched_at = time.time()
+        with self._lock:
+            self._entries[key] = (fetched_at, payload)
+            self.misses += 1
+        get_metrics_registry().record_cache(source_name, "miss")
+        if payload is not None and self._store is not None:
+            self._store.save(key, fetched_at, payload)
+
+    def get_or_fetch(
+        self,
+        source_name: str,
+        coords: Tuple[float, float],
+        fetcher: Callable[[], Optional[Dict]],
+    ) -> Optional[Dict]:
+        """
+        Return the cached payload for (source, coords) or fetch it once.
+
+        Concurrent callers for the same key wait for the first fetch
+        instead of issuing their own request.
+        """
+        key = make_cache_key(source_name, coords)
+
+        metrics = get_metrics_registry()
+
+        found, payload = self._lookup(key)
+        if found:
+            with self._lock:
+                self.hits += 1
+            metrics.record_cache(source_name, "hit")
+            return payload
+
+        with self._lock_for(key):
+            # Another thread may have filled the entry while we waited
+            found, payload = self._lookup(key)
+            if found:
+                with self._lock:
+                    self.hits += 1
+                metrics.record_cache(source_name, "hit")
+                return payload
+
+            found, payload = self._load_from_store(key)
+            if found:
+                with self._lock:
+                    self.hits += 1
+                metrics.record_cache(source_name, "disk")
+                return payload
+
+            try:
+                payload = fetcher()
+            except Exception as e:
+                logger.debug(f"Forecast cache fetch failed for {key}: {e}")
+                payload = None
+
+            self.put(source_name, coords, payload)
+            return payload
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset counters (disk layer is kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for logging and status output."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+            }
+
+
+# =============================================================================
+# PROCESS-WIDE INSTANCE
+# =============================================================================
+
+_forecast_cache: Optional[ForecastCache] = None
+_forecast_cache_lock = threading.Lock()
+
+
+def get_forecast_cache() -> ForecastCache:
+    """Get the shared forecast cache instance."""
+    global _forecast_cache
+    if _forecast_cache is None:
+        with _forecast_cache_lock:
+            if _forecast_cache is None:
+                _forecast_cache = ForecastCache()
+    return _forecast_cache
+
+
+def reset_forecast_cache() -> None:
+    """Clear the shared forecast cache. Call at the start of a pipeline run."""
+    get_forecast_cache().clear()
+
+
+def enable_disk_cache(directory: Path) -> Optional[ForecastDiskStore]:
+    """
+    Attach a persistent disk layer under directory to the shared cache.
+
+    Returns the store, or None if the directory cannot be used.
+    """
+    try:
+        store = ForecastDiskStore(directory)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Forecast disk cache disabled: {e}")
+        return None
+    get_forecast_cache().attach_store(store)
+    return store
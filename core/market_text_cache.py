@@ -0,0 +1,163 @@
+# =============================================================================
+# MARKET TEXT CACHE - Content-hash cache for text-only market analysis
+# =============================================================================
+#
+# A market's question/description/resolution text stays the same for days
+# until it resolves, yet every run re-ran the same regex work on it:
+#
+# - WeatherMarketClassifier.classify_market  -> ClassificationResult
+# - WeatherValidator.validate                -> 6-point checklist
+# - WeatherMarketFilter.filter_market        -> parsed structural fields
+#                                               (type, city, threshold, ...)
+#
+# Results are cached under a hash of (namespace, CLASSIFIER_VERSION, text
+# fields, tags). Only text-derived results are cached; odds, liquidity and
+# time checks are always evaluated fresh.
+#
+# PERSISTENCE:
+# - In memory by default; enable_market_text_persistence(dir) attaches a
+#   JSON file (the orchestrator does this), flush() writes it if dirty
+# - The file header carries CLASSIFIER_VERSION; a bump discards it
+# - Entries unused for MAX_AGE_DAYS are dropped on flush
+#
+# ISOLATION:
+# - READ-ONLY: derived data only, no prices
+#
+# =============================================================================
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump on ANY change to classifier keywords/patterns, validator checks or
+# the filter's text parsing - cached results are then recomputed.
+CLASSIFIER_VERSION = 2
+
+CACHE_FILENAME = "market_text_cache.json"
+MAX_AGE_DAYS = 14
+MAX_ENTRIES = 20000
+
+
+def text_key(namespace: str, *parts: Any) -> str:
+    """Stable hash of (namespace, version, text parts)."""
+    payload = json.dumps(
+        [namespace, CLASSIFIER_VERSION, parts],
+        ensure_ascii=False, sort_keys=True, default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class MarketTextCache:
+    """Thread-safe key -> JSON value store with optional JSON file."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self._lock = threading.Lock()
+        # key -> [value, last_used (epoch seconds)]
+        self._entries: Dict[str, list] = {}
+        self._path: Optional[Path] = None
+        self._dirty = False
+        self._hits = 0
+        self._misses = 0
+        if path is not None:
+            self.attach(path)
+
+    def attach(self, path: Optional[Path]) -> None:
+        """Use (and load) a persistence file; None = memory only."""
+        with self._lock:
+            self._path = Path(path) if path is not None else None
+            if self._path is None or not self._path.exists():
+                return
+            try:
+                with open(self._path, "r", encoding="utf-8") as f:
+                    stored = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.debug(f"Market text cache unreadable ({self._path}): {e}")
+                return
+            if not isinstance(stored, dict) or stored.get("version") != CLASSIFIER_VERSION:
+                logger.info("Market text cache: classifier version changed, starting fresh")
+                self._dirty = True
+                return
+            for key, item in stored.get("entries", {}).items():
+                if isinstance(item, list) and len(item) == 2:
+                    self._entries.setdefault(key, item)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self._misses += 1
+                return None
+            item[1] = time.time()
+            self._hits += 1
+            return item[0]
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = [value, time.time()]
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Prune stale entries and write the file (if attached and changed)."""
+        with self._lock:
+            cutoff = time.time() - MAX_AGE_DAYS * 86400
+            stale = [k for k, item in self._entries.items() if item[1] < cutoff]
+            for key in stale:
+                del self._entries[key]
+            if len(self._entries) > MAX_ENTRIES:
+                by_age = sorted(self._entries, key=lambda k: self._entries[k][1])
+                for key in by_age[:len(self._entries) - MAX_ENTRIES]:
+                    del self._entries[key]
+            if self._path is None or not (self._dirty or stale):
+                return
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self._path.with_suffix(".tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(
+                        {"version": CLASSIFIER_VERSION, "entries": self._entries},
+                        f, ensure_ascii=False,
+                    )
+                tmp_path.replace(self._path)
+                self._dirty = False
+            except OSError as e:
+                logger.debug(f"Market text cache not writable ({self._path}): {e}")
+
+    def clear(self) -> None:
+        """Drop the in-memory entries (the file is left untouched)."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_cache = MarketTextCache()
+
+
+def get_market_text_cache() -> MarketTextCache:
+    """Return the process-wide market text cache."""
+    return _cache
+
+
+def enable_market_text_persistence(directory: Path) -> None:
+    """Persist cached text analysis as JSON in directory."""
+    _cache.attach(Path(directory) / CACHE_FILENAME)
+
+
+def reset_market_text_cache() -> None:
+    """Drop all cached results and detach the file (tests)."""
+    _cache.clear()
+    _cache.attach(None)
@@ -14,10 +14,8 @@
 #
 # =============================================================================
 
-import json
 import logging
 import os
-import ssl
 import time
 from pathlib import Path
 
@@ -31,34 +29,19 @@ except ImportError:
     pass
 from datetime import datetime, timezone
 from typing import Optional, Dict
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+
+from shared.http_transport import get_http_transport
 
 from .weather_probability_model import ForecastData
+from .forecast_sources.cache import get_forecast_cache
 
 logger = logging.getLogger(__name__)
 
 REQUEST_TIMEOUT = 15
 MAX_MARKET_FORECAST_SECONDS = 30   # Max time for all API calls per single market
-MAX_TOTAL_FORECAST_SECONDS = 300   # Max time for all markets combined (5 minutes)
-API_CALL_DELAY = 0.2               # 200ms between consecutive API calls
-
-# Global forecast start time - reset by caller or at first use
-_forecast_global_start: float = 0.0
-
-
-def reset_forecast_timer():
-    """Reset the global forecast timer. Call before processing a batch of markets."""
-    global _forecast_global_start
-    _forecast_global_start = time.time()
-
 
-def is_global_forecast_timeout() -> bool:
-    """Check if the global forecast timeout has been exceeded."""
-    global _forecast_global_start
-    if _forecast_global_start == 0.0:
-        _forecast_global_start = time.time()
-    return (time.time() - _forecast_global_start) > MAX_TOTAL_FORECAST_SECONDS
+# Pacing between calls and skipping dead providers is handled per host by
+# shared.rate_limiter (token bucket + circuit breaker) inside the transport
 
 
 # =============================================================================
@@ -100,19 +83,21 @@ def _get_coords(city: str) -> Optional[tuple]:
     return GLOBAL_CITY_COORDINATES.get(key)
 
 
-def _api_get(url: str, headers: Optional[Dict] = None, timeout: int = REQUEST_TIMEOUT) -> Optional[Dict]:
-    """HTTP GET with JSON response."""
-    try:
-        ctx = ssl.create_default_context()
-        req_headers = {"User-Agent": "PolymarketBeobachter/2.0"}
-        if headers:
-            req_headers.update(headers)
-        request = Request(url, headers=req_headers)
-        with urlopen(request, timeout=timeout, context=ctx) as response:
-            return json.loads(response.read().decode("utf-8"))
-    except (HTTPError, URLError, Exception) as e:
-        logger.debug(f"API request failed for {url[:80]}: {e}")
+def _api_get(
+    url: str,
+    headers: Optional[Dict] = None,
+    timeout: int = REQUEST_TIMEOUT,
+    source: Optional[str] = None,
+) -> Optional[Dict]:
+    """HTTP GET with JSON response via the shared transport."""
+    req_headers = {"User-Agent": "PolymarketBeobachter/2.0"}
+    if headers:
+        req_headers.update(headers)
+    response = get_http_transport().get(url, headers=req_headers, timeout=timeout, source=source)
+    if not response.ok:
+        logger.debug(f"API request failed for {url[:80]}: {response.error}")
         return None
+    return response.data
 
 
 # =============================================================================
@@ -137,7 +122,7 @@ def _fetch_tomorrow_io(city: str, target_time: datetime) -> Optional[ForecastDat
         f"&units=imperial"
     )
 
-    data = _api_get(url)
+    data = get_forecast_cache().get_or_fetch("tomorrow_io", coords, lambda: _api_get(url, source="tomorrow_io"))
     if data is None:
         return None
 
@@ -213,7 +198,7 @@ def _fetch_openweather(city: str, target_time: datetime) -> Optional[ForecastDat
         f"&units=imperial"
     )
 
-    data = _api_get(url)
+    data = get_forecast_cache().get_or_fetch("openweather", coords, lambda: _api_get(url, source="openweather"))
     if data is None:
         return None
 
@@ -277,19 +262,18 @@ def _fetch_weatherapi(city: str, target_time: datetime) -> Optional[ForecastData
         return None
 
     lat, lon = coords
-    # Calculate days ahead (max 10 for free tier)
-    now = datetime.now(timezone.utc).replace(tzinfo=None)
     target_naive = target_time.replace(tzinfo=None) if target_time.tzinfo else target_time
-    days_ahead = max(1, min(10, int((target_naive - now).total_seconds() / 86400) + 1))
 
+    # Always request the full window (max 10 days) so one cached response
+    # answers every target date for this city
     url = (
         f"https://api.weatherapi.com/v1/forecast.json"
         f"?key={api_key}"
         f"&q={lat},{lon}"
-        f"&days={days_ahead}"
+        f"&days=10"
     )
 
-    data = _api_get(url)
+    data = get_forecast_cache().get_or_fetch("weatherapi", coords, lambda: _api_get(url, source="weatherapi"))
     if data is None:
         return None
 
@@ -365,14 +349,6 @@ def fetch_forecast_multi(city: str, target_time: datetime) -> Optional[ForecastD
         logger.debug("No city provided for forecast fetch")
         return None
 
-    # Check global timeout across all markets
-    if is_global_forecast_timeout():
-        logger.warning(
-            "Globales Forecast-Timeout erreicht (%ds), ueberspringe %s",
-            MAX_TOTAL_FORECAST_SECONDS, city
-        )
-        return None
-
     market_start = time.time()
 
     # Try commercial APIs first (global coverage)
@@ -381,7 +357,7 @@ def fetch_forecast_multi(city: str, target_time: datetime) -> Optional[ForecastD
         ("openweather", _fetch_openweather),
         ("weatherapi", _fetch_weatherapi),
     ]
-    for idx, (name, fetcher) in enumerate(api_sources):
+    for name, fetcher in api_sources:
         # Check per-market timeout
         if (time.time() - market_start) > MAX_MARKET_FORECAST_SECONDS:
             logger.warning(
@@ -389,16 +365,6 @@ def fetch_forecast_multi(city: str, target_time: datetime) -> Optional[ForecastD
                 MAX_MARKET_FORECAST_SECONDS, city
             )
             break
-        # Check global timeout
-        if is_global_forecast_timeout():
-            logger.warning(
-                "Globales Forecast-Timeout erreicht (%ds), breche ab bei %s",
-                MAX_TOTAL_FORECAST_SECONDS, city
-            )
-            break
-        # Rate-limit delay between API calls (not before the first one)
-        if idx > 0:
-            time.sleep(API_CALL_DELAY)
         try:
             result = fetcher(city, target_time)
             if result is not None:
@@ -407,10 +373,8 @@ def fetch_forecast_multi(city: str, target_time: datetime) -> Optional[ForecastD
         except Exception as e:
             logger.debug(f"{name} failed for {city}: {e}")
 
-    # NOAA fallback (US cities only) - also check timeouts
-    if ((time.time() - market_start) <= MAX_MARKET_FORECAST_SECONDS
-            and not is_global_forecast_timeout()):
-        time.sleep(API_CALL_DELAY)  # Rate-limit before NOAA call
+    # NOAA fallback (US cities only) - also check timeout
+    if (time.time() - market_start) <= MAX_MARKET_FORECAST_SECONDS:
         try:
             from .noaa_client import fetch_forecast_for_city
             result = fetch_forecast_for_city(city, target_time)
@@ -447,14 +411,6 @@ def fetch_all_forecasts(city: str, target_time: datetime):
     if not city:
         return []
 
-    # Check global timeout
-    if is_global_forecast_timeout():
-        logger.warning(
-            "Globales Forecast-Timeout erreicht (%ds), ueberspringe %s (ensemble)",
-            MAX_TOTAL_FORECAST_SECONDS, city
-        )
-        return []
-
     sources = [
         OpenMeteoSource(),
         MetNorwaySource(),
@@ -466,8 +422,6 @@ def fetch_all_forecasts(city: str, target_time: datetime):
     for source in sources:
         if not source.is_available():
             continue
-        if is_global_forecast_timeout():
-            break
         try:
             result = source.fetch(city, target_time)
             if result is not None:
@@ -477,27 +431,25 @@ def fetch_all_forecasts(city: str, target_time: datetime):
             logger.debug(f"Ensemble source {source.source_name} failed for {city}: {e}")
 
     # Also try NOAA for US cities
-    if not is_global_forecast_timeout():
-        try:
-            from .noaa_client import fetch_forecast_for_city, geocode_city
-            if geocode_city(city) is not None:
-                noaa_result = fetch_forecast_for_city(city, target_time)
-                if noaa_result is not None:
-                    # Wrap NOAA ForecastData as SourceForecast
-                    from datetime import timezone as _tz
-                    results.append(SourceForecast(
-                        city=city,
-                        target_time=target_time,
-                        forecast_time=noaa_result.forecast_time,
-                        source_name="noaa",
-                        model_name="noaa_gfs",
-                        temperature_f=noaa_result.temperature_f,
-                        temperature_min_f=noaa_result.temperature_min_f,
-                        temperature_max_f=noaa_result.temperature_max_f,
-                    ))
-                    logger.debug(f"Ensemble source noaa OK for {city}")
-        except Exception as e:
-            logger.debug(f"Ensemble source noaa failed for {city}: {e}")
+    try:
+        from .noaa_client import fetch_forecast_for_city, geocode_city
+        if geocode_city(city) is not None:
+            noaa_result = fetch_forecast_for_city(city, target_time)
+            if noaa_result is not None:
+                # Wrap NOAA ForecastData as SourceForecast
+                results.append(SourceForecast(
+                    city=city,
+                    target_time=target_time,
+                    forecast_time=noaa_result.forecast_time,
+                    source_name="noaa",
+                    model_name="noaa_gfs",
+                    temperature_f=noaa_result.temperature_f,
+                    temperature_min_f=noaa_result.temperature_min_f,
+                    temperature_max_f=noaa_result.temperature_max_f,
+                ))
+                logger.debug(f"Ensemble source noaa OK for {city}")
+    except Exception as e:
+        logger.debug(f"Ensemble source noaa failed for {city}: {e}")
 
     logger.info(f"Ensemble: {len(results)} sources for {city}: {[r.source_name for r in results]}")
     return results
@@ -13,13 +13,15 @@
 
 import json
 import logging
-import ssl
+import threading
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Optional, Dict, Tuple
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+
+from shared.http_transport import get_http_transport
 
 from .weather_probability_model import ForecastData
+from .forecast_sources.cache import get_forecast_cache
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +111,32 @@ def geocode_city(city_name: str) -> Optional[Tuple[float, float]]:
 NOAA_API_BASE = "https://api.weather.gov"
 REQUEST_TIMEOUT = 15  # seconds
 
+_NOAA_HEADERS = {
+    "User-Agent": "PolymarketBeobachter/2.0 (weather-forecast-research)",
+    "Accept": "application/geo+json",
+}
+
+
+def _noaa_get(url: str) -> Tuple[int, Optional[Dict], str]:
+    """
+    Make a GET request to the NOAA API.
+
+    Args:
+        url: Full URL
+
+    Returns:
+        (http_status, parsed JSON dict or None, final URL after redirects).
+        Status is 0 on network errors or when the rate limiter refuses
+        (circuit open).
+    """
+    response = get_http_transport().get(
+        url, headers=_NOAA_HEADERS, timeout=REQUEST_TIMEOUT, source="noaa"
+    )
+    if not response.ok:
+        logger.warning(f"NOAA API error for {url}: {response.error}")
+        return response.status, None, response.url
+    return response.status, response.data, response.url
+
 
 def _noaa_request(url: str) -> Optional[Dict]:
     """
@@ -120,20 +148,7 @@ def _noaa_request(url: str) -> Optional[Dict]:
     Returns:
         Parsed JSON dict or None on error
     """
-    try:
-        ctx = ssl.create_default_context()
-        request = Request(url, headers={
-            "User-Agent": "PolymarketBeobachter/2.0 (weather-forecast-research)",
-            "Accept": "application/geo+json",
-        })
-        with urlopen(request, timeout=REQUEST_TIMEOUT, context=ctx) as response:
-            return json.loads(response.read().decode("utf-8"))
-    except (HTTPError, URLError) as e:
-        logger.warning(f"NOAA API error for {url}: {e}")
-        return None
-    except Exception as e:
-        logger.error(f"NOAA request failed: {e}")
-        return None
+    return _noaa_get(url)[1]
 
 
 def _get_forecast_url(lat: float, lon: float) -> Optional[str]:
@@ -161,6 +176,109 @@ def _get_forecast_url(lat: float, lon: float) -> Optional[str]:
     return forecast_url
 
 
+# =============================================================================
+# GRIDPOINT RESOLUTION CACHE
+# =============================================================================
+#
+# The points -> gridpoint forecast URL mapping practically never changes.
+# It is resolved once per location, kept in memory and (optionally)
+# persisted as JSON. Refreshed only when NOAA answers the forecast URL
+# with 404 or a redirect.
+# =============================================================================
+
+GRIDPOINT_FILENAME = "noaa_gridpoints.json"
+
+
+class GridpointCache:
+    """Thread-safe (lat, lon) -> forecast URL mapping with optional JSON file."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self._lock = threading.Lock()
+        self._urls: Dict[str, str] = {}
+        self._path: Optional[Path] = None
+        if path is not None:
+            self.attach(path)
+
+    @staticmethod
+    def _key(lat: float, lon: float) -> str:
+        # Same precision as the points URL: city aliases share an entry
+        return f"{lat:.4f},{lon:.4f}"
+
+    def attach(self, path: Optional[Path]) -> None:
+        """Use (and load) a persistence file; None = memory only."""
+        with self._lock:
+            self._path = Path(path) if path is not None else None
+            if self._path is None or not self._path.exists():
+                return
+            try:
+                with open(self._path, "r", encoding="utf-8") as f:
+                    stored = json.load(f)
+                if isinstance(stored, dict):
+                    self._urls.update({k: v for k, v in stored.items() if isinstance(v, str)})
+            except (OSError, ValueError) as e:
+                logger.debug(f"NOAA gridpoint file unreadable ({self._path}): {e}")
+
+    def get(self, lat: float, lon: float) -> Optional[str]:
+        with self._lock:
+            return self._urls.get(self._key(lat, lon))
+
+    def set(self, lat: float, lon: float, forecast_url: str) -> None:
+        with self._lock:
+            self._urls[self._key(lat, lon)] = forecast_url
+            self._save()
+
+    def invalidate(self, lat: float, lon: float) -> None:
+        with self._lock:
+            if self._urls.pop(self._key(lat, lon), None) is not None:
+                self._save()
+
+    def clear(self) -> None:
+        """Drop the in-memory mapping (the file is left untouched)."""
+        with self._lock:
+            self._urls.clear()
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def _save(self) -> None:
+        # Caller holds the lock
+        if self._path is None:
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._urls, f, sort_keys=True)
+            tmp_path.replace(self._path)
+        except OSError as e:
+            logger.debug(f"NOAA gridpoint file not writable ({self._path}): {e}")
+
+
+_gridpoint_cache = GridpointCache()
+
+
+def get_gridpoint_cache() -> GridpointCache:
+    """Return the process-wide gridpoint cache."""
+    return _gridpoint_cache
+
+
+def enable_gridpoint_persistence(directory: Path) -> None:
+    """Persist resolved gridpoints as JSON in directory."""
+    _gridpoint_cache.attach(Path(directory) / GRIDPOINT_FILENAME)
+
+
+def _resolve_forecast_url(lat: float, lon: float) -> Optional[str]:
+    """Forecast URL from the gridpoint cache, resolving via /points on a miss."""
+    forecast_url = _gridpoint_cache.get(lat, lon)
+    if forecast_url is not None:
+        return forecast_url
+
+    forecast_url = _get_forecast_url(lat, lon)
+    if forecast_url is not None:
+        _gridpoint_cache.set(lat, lon, forecast_url)
+    return forecast_url
+
+
 def fetch_forecast(lat: float, lon: float) -> Optional[Dict]:
     """
     Fetch 7-day forecast from NOAA for given coordinates.
@@ -172,12 +290,28 @@ def fetch_forecast(lat: float, lon: float) -> Optional[Dict]:
     Returns:
         NOAA forecast response dict or None
     """
-    forecast_url = _get_forecast_url(lat, lon)
+    return get_forecast_cache().get_or_fetch("noaa", (lat, lon), lambda: _fetch_forecast_uncached(lat, lon))
+
+
+def _fetch_forecast_uncached(lat: float, lon: float) -> Optional[Dict]:
+    """Forecast request via the cached gridpoint, bypassing the forecast cache."""
+    forecast_url = _resolve_forecast_url(lat, lon)
     if forecast_url is None:
         logger.warning(f"Could not get forecast URL for ({lat}, {lon})")
         return None
 
-    return _noaa_request(forecast_url)
+    status, data, final_url = _noaa_get(forecast_url)
+
+    moved = data is not None and final_url != forecast_url
+    if status == 404 or moved:
+        # Gridpoint mapping changed: resolve again via /points
+        logger.info(f"NOAA gridpoint for ({lat}, {lon}) moved (status={status}) - re-resolving")
+        _gridpoint_cache.invalidate(lat, lon)
+        fresh_url = _resolve_forecast_url(lat, lon)
+        if status == 404 and fresh_url is not None and fresh_url != forecast_url:
+            data = _noaa_request(fresh_url)
+
+    return data
 
 
 def fetch_forecast_for_city(city_name: str, target_time: datetime) -> Optional[ForecastData]:
@@ -915,65 +915,115 @@ class ResolutionChecker:
         FAIL-CLOSED: Any error or ambiguity returns None (not resolved).
         """
         try:
-            import json as _json
-            import ssl
-            from urllib.request import urlopen, Request
+            from shared.http_transport import get_http_transport
 
             url = f"https://gamma-api.polymarket.com/markets/{market_id}"
-            ctx = ssl.create_default_context()
-            req = Request(url, headers={"User-Agent": "PolymarketBeobachter/1.0"})
-            resp = urlopen(req, timeout=10, context=ctx)
-            market = _json.loads(resp.read())
-
-            if not market.get("closed"):
+            response = get_http_transport().get(
+                url, headers={"User-Agent": "PolymarketBeobachter/1.0"}, timeout=10, source="gamma",
+            )
+            if not response.ok:
+                logger.warning(f"Failed to check resolution for {market_id}: {response.error}")
                 return None
+            return self._resolution_from_market(market_id, response.data)
 
-            # Parse outcomePrices and outcomes (both are stringified JSON arrays)
-            outcome_prices_raw = market.get("outcomePrices", "[]")
-            outcomes_raw = market.get("outcomes", "[]")
+        except Exception as e:
+            logger.warning(f"Failed to check resolution for {market_id}: {e}")
+            return None
 
-            if isinstance(outcome_prices_raw, str):
-                outcome_prices = _json.loads(outcome_prices_raw)
-            else:
-                outcome_prices = outcome_prices_raw
+    def check_market_resolutions(
+        self,
+        market_ids: List[str],
+        client: Optional[Any] = None,
+    ) -> Dict[str, Optional[ResolutionRecord]]:
+        """
+        Check many markets with bulk Gamma requests (chunked by the
+        collector client) instead of one request per market.
 
-            if isinstance(outcomes_raw, str):
-                outcomes = _json.loads(outcomes_raw)
-            else:
-                outcomes = outcomes_raw
+        Ids the bulk /markets list omits (closed markets may be missing)
+        are looked up one by one via /markets/{id} by the client.
 
-            if not outcome_prices or not outcomes:
-                logger.debug(f"Market {market_id} closed but missing price/outcome data")
-                return None
+        Args:
+            market_ids: Markets to check
+            client: PolymarketClient (injectable for testing)
 
-            # Find the winning outcome: price closest to 1.0
-            prices = [float(p) for p in outcome_prices]
-            max_price = max(prices)
-            if max_price < 0.9:
-                # Not clearly settled (e.g. all prices near 0 = voided/cancelled)
-                logger.debug(f"Market {market_id} closed but max price {max_price:.4f} < 0.9, skipping")
-                return None
+        Returns:
+            Dict market_id -> ResolutionRecord, or None if not resolved or
+            unparseable (FAIL-CLOSED). Ids that could not be fetched at all
+            are missing from the dict.
+        """
+        if client is None:
+            from collector.client import PolymarketClient
+            client = PolymarketClient(timeout=10)
 
-            winner_idx = prices.index(max_price)
-            if winner_idx >= len(outcomes):
-                return None
+        try:
+            markets = client.fetch_markets_by_ids(market_ids)
+        except Exception as e:
+            logger.warning(f"Bulk resolution check failed: {e}")
+            markets = {}
+
+        results: Dict[str, Optional[ResolutionRecord]] = {}
+        for market_id in market_ids:
+            market = markets.get(market_id)
+            if market is None:
+                # Neither the bulk nor the single lookup found it
+                logger.warning(f"Market {market_id} not found, resolution unknown")
+                continue
+            try:
+                results[market_id] = self._resolution_from_market(market_id, market)
+            except Exception as e:
+                logger.warning(f"Failed to check resolution for {market_id}: {e}")
+                results[market_id] = None
+        return results
+
+    def _resolution_from_market(
+        self, market_id: str, market: Dict[str, Any],
+    ) -> Optional[ResolutionRecord]:
+        """ResolutionRecord for a closed, clearly settled Gamma market, else None."""
+        if not market.get("closed"):
+            return None
 
-            winner = outcomes[winner_idx].strip().upper()
-            if winner not in VALID_RESOLUTIONS:
-                logger.debug(f"Unknown resolution value for {market_id}: {winner}")
-                return None
+        # Parse outcomePrices and outcomes (both are stringified JSON arrays)
+        outcome_prices_raw = market.get("outcomePrices", "[]")
+        outcomes_raw = market.get("outcomes", "[]")
 
-            return create_resolution_record(
-                market_id=market_id,
-                resolution=winner,
-                resolution_source=f"gamma-api.polymarket.com/markets/{market_id}",
-                resolved_timestamp_utc=market.get("updatedAt"),
-            )
+        if isinstance(outcome_prices_raw, str):
+            outcome_prices = json.loads(outcome_prices_raw)
+        else:
+            outcome_prices = outcome_prices_raw
 
-        except Exception as e:
-            logger.warning(f"Failed to check resolution for {market_id}: {e}")
+        if isinstance(outcomes_raw, str):
+            outcomes = json.loads(outcomes_raw)
+        else:
+            outcomes = outcomes_raw
+
+        if not outcome_prices or not outcomes:
+            logger.debug(f"Market {market_id} closed but missing price/outcome data")
+            return None
+
+        # Find the winning outcome: price closest to 1.0
+        prices = [float(p) for p in outcome_prices]
+        max_price = max(prices)
+        if max_price < 0.9:
+            # Not clearly settled (e.g. all prices near 0 = voided/cancelled)
+            logger.debug(f"Market {market_id} closed but max price {max_price:.4f} < 0.9, skipping")
             return None
 
+        winner_idx = prices.index(max_price)
+        if winner_idx >= len(outcomes):
+            return None
+
+        winner = outcomes[winner_idx].strip().upper()
+        if winner not in VALID_RESOLUTIONS:
+            logger.debug(f"Unknown resolution value for {market_id}: {winner}")
+            return None
+
+        return create_resolution_record(
+            market_id=market_id,
+            resolution=winner,
+            resolution_source=f"gamma-api.polymarket.com/markets/{market_id}",
+            resolved_timestamp_utc=market.get("updatedAt"),
+        )
+
     def update_resolutions(self, max_checks: int = 50) -> Dict[str, Any]:
         """
         Check unresolved markets and record any new resolutions.
@@ -998,9 +1048,16 @@ class ResolutionChecker:
         new_resolutions = 0
         errors = 0
 
+        # One bulk lookup for all markets (chunked), not one request each
+        resolutions = self.check_market_resolutions(to_check)
+
         for market_id in to_check:
+            if market_id not in resolutions:
+                # Neither the bulk nor the single lookup returned the market
+                errors += 1
+                continue
             try:
-                resolution = self.check_market_resolution(market_id)
+                resolution = resolutions.get(market_id)
                 if resolution:
                     success, _ = self.storage.write_resolution(resolution)
                     if success:
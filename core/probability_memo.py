@@ -0,0 +1,108 @@
+# =============================================================================
+# PROBABILITY MEMO - LRU memoization of probability / ensemble results
+# =============================================================================
+#
+# Between consecutive 15-minute runs the forecast for most cities does not
+# change. Results are memoized process-wide (engines and models are
+# re-created every run) under
+#
+#   (city, target date, threshold/intervals, event_type/metric,
+#    forecast content hash, horizon bucket, ...)
+#
+# so unchanged inputs skip recomputation and the associated logging.
+# The horizon bucket is the SigmaHorizonTable step, which together with
+# the sigma value pins down the distribution width exactly.
+#
+# Size-bounded LRU; no TTL needed because any forecast change alters the
+# content hash.
+#
+# ISOLATION:
+# - READ-ONLY: in-memory only, no persistence
+#
+# =============================================================================
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+def content_hash(*parts: Any) -> str:
+    """Stable short hash of plain values (floats, strings, tuples)."""
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:16]
+
+
+class ProbabilityMemo:
+    """Thread-safe LRU with hit/miss counters."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def resize(self, max_entries: int) -> None:
+        with self._lock:
+            self.max_entries = max(1, max_entries)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_probability_memo = ProbabilityMemo()
+_ensemble_memo = ProbabilityMemo()
+
+
+def get_probability_memo() -> ProbabilityMemo:
+    """Memo for WeatherProbabilityModel.compute_probability results."""
+    return _probability_memo
+
+
+def get_ensemble_memo() -> ProbabilityMemo:
+    """Memo for EnsembleBuilder.build_ladder results."""
+    return _ensemble_memo
+
+
+def configure_memos(max_entries: int) -> None:
+    """Apply PROBABILITY_MEMO_SIZE to both memos."""
+    _probability_memo.resize(max_entries)
+    _ensemble_memo.resize(max_entries)
+
+
+def reset_probability_memos() -> None:
+    """Drop all memoized results (tests)."""
+    _probability_memo.clear()
+    _ensemble_memo.clear()
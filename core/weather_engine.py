@@ -34,10 +34,12 @@
 import json
 import logging
 import os
-from dataclasses import dataclass
-from datetime import datetime, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Tuple
 
 import yaml
 
@@ -60,7 +62,15 @@ from .weather_probability_model import (
     compute_edge,
     meets_edge_threshold,
 )
-from .ensemble_builder import EnsembleBuilder, EnsembleForecast, degrade_confidence
+from .ensemble_builder import (
+    EnsembleBuilder,
+    EnsembleForecast,
+    Interval,
+    METRIC_POINT,
+    degrade_confidence,
+)
+from .daily_extremes import METRIC_DAILY_MAX, METRIC_DAILY_MIN
+from .probability_memo import DEFAULT_MAX_ENTRIES, configure_memos
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +103,7 @@ class EngineRunResult:
     - markets_filtered: Number passing filter
     - run_timestamp: When the run occurred
     - run_duration_seconds: How long the run took
+    - market_latencies: Processing time per market_id in seconds
     """
     observations: List[WeatherObservation]
     edge_observations: List[WeatherObservation]
@@ -101,9 +112,11 @@ class EngineRunResult:
     run_timestamp: str
     run_duration_seconds: float
     config_hash: str
+    market_latencies: Dict[str, float] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for logging."""
+        latencies = list(self.market_latencies.values())
         return {
             "run_timestamp": self.run_timestamp,
             "run_duration_seconds": self.run_duration_seconds,
@@ -112,6 +125,10 @@ class EngineRunResult:
             "observations_total": len(self.observations),
             "edge_observations": len(self.edge_observations),
             "config_hash": self.config_hash,
+            "market_latency_max_seconds": round(max(latencies), 3) if latencies else 0.0,
+            "market_latency_mean_seconds": (
+                round(sum(latencies) / len(latencies), 3) if latencies else 0.0
+            ),
         }
 
 
@@ -139,6 +156,8 @@ class WeatherEngine:
        b. Compute probability
        c. Calculate edge
        d. Generate signal
+       Markets of the same (city, resolution date) form a ladder and
+       share one ensemble distribution (strikes/buckets = CDF differences).
     4. Return List[WeatherObservation]
 
     NO SIDE EFFECTS (except optional logging).
@@ -182,6 +201,18 @@ class WeatherEngine:
         self.log_all_observations = config.get("LOG_ALL_OBSERVATIONS", True)
         self.observation_log_path = config.get("OBSERVATION_LOG_PATH", "logs/weather_observations.jsonl")
 
+        # Parallel market processing (1 = sequential)
+        self.market_workers = max(1, int(config.get("MARKET_WORKERS", 1)))
+
+        # Evaluate (city, date) ladders from one distribution (ensemble only)
+        self.ladder_evaluation = bool(config.get("LADDER_EVALUATION", True))
+
+        # Markets resolve on the local-day high/low (ensemble only)
+        self.daily_extremes = bool(config.get("DAILY_EXTREMES", True))
+
+        # Process-wide LRU of probability/ensemble results (survives runs)
+        configure_memos(int(config.get("PROBABILITY_MEMO_SIZE", DEFAULT_MAX_ENTRIES)))
+
         # Compute config hash for audit
         config_json = json.dumps(config, sort_keys=True)
         import hashlib
@@ -237,16 +268,49 @@ class WeatherEngine:
         # =====================================================================
         # STEP 3: Process each filtered market
         # =====================================================================
-        # Reset global forecast timer before processing markets
-        try:
-            from .multi_forecast import reset_forecast_timer
-            reset_forecast_timer()
-        except ImportError:
-            pass
-
-        for market in filtered_markets:
-            observation = self._process_market(market)
+        # Fetch all (source, city) forecasts concurrently up front; the
+        # per-market ensemble builds below then answer from the cache
+        if self._ensemble_enabled and self._ensemble_builder is not None and filtered_markets:
+            try:
+                self._ensemble_builder.prefetch(
+                    [m.detected_city for m in filtered_markets if m.detected_city]
+                )
+            except Exception as e:
+                logger.warning(f"Forecast prefetch failed: {e}")
+
+            # Daily max/min per (city, local date), shared by all markets on it
+            if self.daily_extremes:
+                try:
+                    self._ensemble_builder.precompute_daily_extremes(sorted({
+                        (m.detected_city, self._local_date(m))
+                        for m in filtered_markets if m.detected_city
+                    }))
+                except Exception as e:
+                    logger.warning(f"Daily extremes precompute failed: {e}")
+
+        # Ladders (or single markets) run on a worker pool; results are
+        # put back into the input order so observations and log lines
+        # stay deterministic
+        units = self._group_ladders(filtered_markets)
+        unit_markets = [[filtered_markets[i] for i in unit] for unit in units]
+        workers = min(self.market_workers, len(units))
+        if workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="weather-market"
+            ) as pool:
+                unit_results = list(pool.map(self._process_unit_timed, unit_markets))
+        else:
+            unit_results = [self._process_unit_timed(u) for u in unit_markets]
+
+        timed_results: List[Optional[Tuple[WeatherObservation, float]]] = [None] * len(filtered_markets)
+        for unit, (unit_observations, latency) in zip(units, unit_results):
+            for index, observation in zip(unit, unit_observations):
+                timed_results[index] = (observation, latency)
+
+        market_latencies: Dict[str, float] = {}
+        for market, (observation, latency) in zip(filtered_markets, timed_results):
             observations.append(observation)
+            market_latencies[market.market_id] = latency
 
             # Log observation if configured
             if self.log_all_observations or observation.has_edge:
@@ -268,15 +332,108 @@ class WeatherEngine:
             run_timestamp=run_timestamp,
             run_duration_seconds=duration,
             config_hash=self._config_hash,
+            market_latencies=market_latencies,
         )
 
         logger.info(
             f"WeatherObserver run complete | duration={duration:.2f}s | "
-            f"observations={len(observations)} | with_edge={len(edge_observations)}"
+            f"observations={len(observations)} | with_edge={len(edge_observations)} | "
+            f"workers={max(workers, 1)}"
         )
 
         return result
 
+    def _group_ladders(self, markets: List[WeatherMarket]) -> List[List[int]]:
+        """
+        Group market indices into processing units.
+
+        With ensemble + LADDER_EVALUATION, markets sharing (city, local
+        resolution date, metric) form one unit; everything else is a unit
+        of one.
+        Units keep first-appearance order.
+        """
+        if not (self.ladder_evaluation and self._ensemble_enabled and self._ensemble_builder is not None):
+            return [[i] for i in range(len(markets))]
+
+        units: List[List[int]] = []
+        ladder_index: Dict[Tuple[str, Any, str], int] = {}
+        for i, market in enumerate(markets):
+            if market.detected_city is None or market.detected_threshold is None:
+                units.append([i])
+                continue
+            key = (market.detected_city, self._local_date(market), self._market_metric(market))
+            if key in ladder_index:
+                units[ladder_index[key]].append(i)
+            else:
+                ladder_index[key] = len(units)
+                units.append([i])
+        return units
+
+    def _process_unit_timed(self, markets: List[WeatherMarket]) -> Tuple[List[WeatherObservation], float]:
+        """Process a unit (single market or ladder); latency is per unit."""
+        start = time.perf_counter()
+        if len(markets) == 1:
+            observations = [self._process_market(markets[0])]
+        else:
+            observations = self._process_ladder(markets)
+        return observations, round(time.perf_counter() - start, 4)
+
+    def _process_ladder(self, markets: List[WeatherMarket]) -> List[WeatherObservation]:
+        """
+        Evaluate every strike/bucket of one (city, date) ladder from a
+        single ensemble distribution. Falls back to per-market processing
+        if the ensemble has no data.
+        """
+        city = markets[0].detected_city
+        try:
+            ensembles = self._ensemble_builder.build_ladder(
+                city=city,
+                target_time=markets[0].resolution_time,
+                intervals=[self._market_interval(m) for m in markets],
+                metric=self._market_metric(markets[0]),
+            )
+        except Exception as e:
+            logger.warning(f"Ladder build failed for {city} ({len(markets)} markets): {e}")
+            ensembles = None
+
+        if ensembles is None:
+            return [self._process_market(m) for m in markets]
+
+        logger.debug(f"Ladder {city} {self._local_date(markets[0])}: {len(markets)} markets")
+        return [
+            self._observe_ensemble(market, city, ensemble)
+            for market, ensemble in zip(markets, ensembles)
+        ]
+
+    def _local_date(self, market: WeatherMarket) -> date:
+        """Resolution date in the market city's timezone (as daily_extremes)."""
+        return self._ensemble_builder.local_date(market.detected_city, market.resolution_time)
+
+    def _market_metric(self, market: WeatherMarket) -> str:
+        """
+        Daily low for 'lowest/minimum' questions, daily high for
+        'highest/maximum' questions and bucket ladders; plain thresholds
+        ("exceed 100°F tomorrow") keep the point forecast.
+        """
+        if not self.daily_extremes:
+            return METRIC_POINT
+        question = market.question.lower()
+        if any(word in question for word in ("lowest", "minimum", "low temperature")):
+            return METRIC_DAILY_MIN
+        if (
+            any(word in question for word in ("highest", "maximum", "high temperature"))
+            or market.detected_event_type == "between"
+        ):
+            return METRIC_DAILY_MAX
+        return METRIC_POINT
+
+    @staticmethod
+    def _market_interval(market: WeatherMarket) -> Interval:
+        """Event interval in °F; markets without a detected range are 'exceeds threshold'."""
+        if market.detected_range_f is not None:
+            return market.detected_range_f
+        return (market.detected_threshold, None)
+
     def _process_market(self, market: WeatherMarket) -> WeatherObservation:
         """
         Process a single market through the probability pipeline.
@@ -322,19 +479,25 @@ class WeatherEngine:
         Try to process market via ensemble. Returns None if ensemble has no data.
         """
         try:
-            ensemble = self._ensemble_builder.build(
+            ladder = self._ensemble_builder.build_ladder(
                 city=city,
                 target_time=market.resolution_time,
-                threshold_f=market.detected_threshold,
-                event_type="exceeds",
+                intervals=[self._market_interval(market)],
+                metric=self._market_metric(market),
             )
         except Exception as e:
             logger.warning(f"Ensemble build failed for {market.market_id}: {e}")
             return None
 
-        if ensemble is None:
+        if not ladder:
             return None
 
+        return self._observe_ensemble(market, city, ladder[0])
+
+    def _observe_ensemble(
+        self, market: WeatherMarket, city: str, ensemble: EnsembleForecast
+    ) -> WeatherObservation:
+        """Turn a market's ensemble forecast into OBSERVE / NO_SIGNAL."""
         # Use ensemble probability
         fair_prob = ensemble.ensemble_mean_probability
 
@@ -435,6 +598,17 @@ class WeatherEngine:
                 config_snapshot=self.config,
             )
 
+        lower, upper = self._market_interval(market)
+        if lower is not None and upper is not None:
+            return create_no_signal(
+                market_id=market.market_id, city=city,
+                event_description=market.question,
+                market_probability=market.odds_yes,
+                reason="Bucket market requires ensemble distribution",
+                config_snapshot=self.config,
+            )
+        event_type, threshold_f = ("exceeds", lower) if lower is not None else ("below", upper)
+
         try:
             forecast = self._forecast_fetcher(city, market.resolution_time)
         except Exception as e:
@@ -459,8 +633,8 @@ class WeatherEngine:
         try:
             prob_result = self._model.compute_probability(
                 forecast=forecast,
-                threshold_f=market.detected_threshold,
-                event_type="exceeds",
+                threshold_f=threshold_f,
+                event_type=event_type,
             )
         except Exception as e:
             logger.error(f"Probability computation failed: {e}")
@@ -11,7 +11,10 @@
 # - Accuracy > Coverage
 # - False positives are worse than false negatives
 # - If ambiguous → NOT_WEATHER
-# - Word-boundary aware matching (no substring hacks)
+# - Word-boundary aware matching (no substring hacks), all keywords of a
+#   set matched in one pass (shared.keyword_matcher)
+# - Results cached by text hash (core/market_text_cache.py); bump
+#   CLASSIFIER_VERSION there when keywords or patterns change
 # - Fail-closed on uncertainty
 #
 # =============================================================================
@@ -22,6 +25,10 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, Any, List, Optional, Set
 
+from shared.keyword_matcher import KeywordMatcher
+
+from .market_text_cache import get_market_text_cache, text_key
+
 logger = logging.getLogger(__name__)
 
 
@@ -293,6 +300,11 @@ class WeatherMarketClassifier:
         GENERIC_PREDICTION_KEYWORDS
     )
 
+    # Precompiled single-pass matchers (shared/keyword_matcher.py)
+    _NEGATIVE_MATCHER = KeywordMatcher(ALL_NEGATIVE_KEYWORDS)
+    _TEXT_SIGNAL_MATCHER = KeywordMatcher(ALL_TEXT_SIGNALS)
+    _AUTHORITY_MATCHER = KeywordMatcher(RESOLUTION_AUTHORITIES)
+
     # =========================================================================
     # METHODS
     # =========================================================================
@@ -329,6 +341,48 @@ class WeatherMarketClassifier:
         event_tags = market.get("_event_tags") or []
         event_title = market.get("_event_title") or ""
 
+        # Unchanged market text -> cached result (no regex work)
+        cache = get_market_text_cache()
+        key = text_key(
+            "classify", title, description, resolution, category, tags, event_title, event_tags,
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            return ClassificationResult(
+                classification=WeatherClassification(cached["classification"]),
+                matched_text_signals=list(cached["matched_text_signals"]),
+                matched_structural_signals=list(cached["matched_structural_signals"]),
+                rejection_reason=cached["rejection_reason"],
+                confidence_score=cached["confidence_score"],
+                market_id=market_id,
+                market_title=title,
+            )
+
+        result = self._classify_text(
+            title, description, resolution, category, tags, event_title, event_tags,
+        )
+        result.market_id = market_id
+        result.market_title = title
+        cache.put(key, {
+            "classification": result.classification.value,
+            "matched_text_signals": list(result.matched_text_signals),
+            "matched_structural_signals": list(result.matched_structural_signals),
+            "rejection_reason": result.rejection_reason,
+            "confidence_score": result.confidence_score,
+        })
+        return result
+
+    def _classify_text(
+        self,
+        title: str,
+        description: str,
+        resolution: str,
+        category: str,
+        tags: Any,
+        event_title: str,
+        event_tags: List[str],
+    ) -> ClassificationResult:
+        """Signal matching and classification (uncached)."""
         # Combine text for analysis (include event title)
         combined_text = f"{title} {description} {resolution} {event_title}".lower()
         category_text = f"{category} {' '.join(tags) if isinstance(tags, list) else tags}".lower()
@@ -345,8 +399,6 @@ class WeatherMarketClassifier:
                 classification=WeatherClassification.NOT_WEATHER,
                 rejection_reason=rejection_reason,
                 confidence_score=1.0,
-                market_id=market_id,
-                market_title=title,
             )
 
         # =====================================================================
@@ -379,8 +431,6 @@ class WeatherMarketClassifier:
                 matched_text_signals=matched_text_signals,
                 matched_structural_signals=matched_structural_signals,
                 confidence_score=confidence_score,
-                market_id=market_id,
-                market_title=title,
             )
         elif has_text_signal or has_structural_signal:
             # Only one type of signal → POSSIBLE (log but don't process)
@@ -390,8 +440,6 @@ class WeatherMarketClassifier:
                 matched_structural_signals=matched_structural_signals,
                 rejection_reason="Insufficient signal coverage (needs both text and structural)",
                 confidence_score=confidence_score,
-                market_id=market_id,
-                market_title=title,
             )
         else:
             # No signals → NOT_WEATHER
@@ -399,8 +447,6 @@ class WeatherMarketClassifier:
                 classification=WeatherClassification.NOT_WEATHER,
                 rejection_reason="No weather signals detected",
                 confidence_score=0.0,
-                market_id=market_id,
-                market_title=title,
             )
 
     def _check_negative_filters(self, text: str) -> Optional[str]:
@@ -409,11 +455,10 @@ class WeatherMarketClassifier:
 
         Returns rejection reason if any negative filter triggers, None otherwise.
         """
-        for keyword in self.ALL_NEGATIVE_KEYWORDS:
-            # Use word boundary to avoid false matches
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, text, re.IGNORECASE):
-                return f"Negative filter: '{keyword}'"
+        # Word-boundary aware, one pass over the text
+        keyword = self._NEGATIVE_MATCHER.first(text)
+        if keyword:
+            return f"Negative filter: '{keyword}'"
 
         return None
 
@@ -421,15 +466,11 @@ class WeatherMarketClassifier:
         """
         Check for textual weather signals.
 
-        Uses word-boundary aware matching.
+        Uses word-boundary aware matching (one pass, order of appearance).
         """
-        matched: List[str] = []
-
-        # Check all text keywords
-        for keyword in self.ALL_TEXT_SIGNALS:
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, text, re.IGNORECASE):
-                matched.append(f"text:{keyword}")
+        matched: List[str] = [
+            f"text:{keyword}" for keyword in self._TEXT_SIGNAL_MATCHER.find_all(text)
+        ]
 
         # Check temperature symbol pattern (°F, °C)
         if self.TEMPERATURE_SYMBOL_PATTERN.search(text):
@@ -459,11 +500,8 @@ class WeatherMarketClassifier:
                 matched.append(f"category:{cat_keyword}")
 
         # Check resolution source references authority
-        resolution_lower = resolution.lower()
-        for authority in self.RESOLUTION_AUTHORITIES:
-            pattern = r'\b' + re.escape(authority) + r'\b'
-            if re.search(pattern, resolution_lower, re.IGNORECASE):
-                matched.append(f"authority:{authority}")
+        for authority in self._AUTHORITY_MATCHER.find_all(resolution.lower()):
+            matched.append(f"authority:{authority}")
 
         # Check for location + date pattern
         if self.LOCATION_DATE_PATTERN.search(text):
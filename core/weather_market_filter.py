@@ -29,6 +29,10 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any, List, Tuple
 
+from shared.keyword_matcher import KeywordMatcher
+
+from .market_text_cache import get_market_text_cache, text_key
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,6 +64,10 @@ class WeatherMarket:
     detected_city: Optional[str] = None
     detected_threshold: Optional[float] = None
     detected_metric: Optional[str] = None
+    # Event shape (ladder evaluation): "exceeds", "below" or "between";
+    # range in °F as (lower, upper), None = open end
+    detected_event_type: Optional[str] = None
+    detected_range_f: Optional[Tuple[Optional[float], Optional[float]]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for logging."""
@@ -75,6 +83,8 @@ class WeatherMarket:
             "detected_city": self.detected_city,
             "detected_threshold": self.detected_threshold,
             "detected_metric": self.detected_metric,
+            "detected_event_type": self.detected_event_type,
+            "detected_range_f": list(self.detected_range_f) if self.detected_range_f else None,
         }
 
 
@@ -162,6 +172,7 @@ class WeatherMarketFilter:
         "storm", "hurricane", "tornado", "climate", "heat",
         "cold", "freeze", "precipitation", "humidity",
     }
+    _CATEGORY_MATCHER = KeywordMatcher(WEATHER_CATEGORY_KEYWORDS, word_boundary=False)
 
     # Temperature threshold patterns
     TEMPERATURE_PATTERNS = [
@@ -171,8 +182,10 @@ class WeatherMarketFilter:
         re.compile(r'be\s+(\d+)\s*°?\s*([FC])\s*(or\s+)?(higher|below|lower)?', re.I),
         # "above 40°F", "exceed 100°F", ">= 32°F", "over 90°F"
         re.compile(r'(above|exceed|>=?|over)\s*(\d+\.?\d*)\s*°?\s*([FC])', re.I),
-        # "40°F or higher", "100°F+"
-        re.compile(r'(\d+\.?\d*)\s*°?\s*([FC])\s*(or\s+)?(higher|above|\+)', re.I),
+        # "40°F or higher", "100°F+", "31°F or below"
+        re.compile(
+            r'(\d+\.?\d*)\s*°?\s*([FC])\s*(?:(or\s+)?(higher|above|\+)|or\s+(below|lower))', re.I
+        ),
         # "below 32°F", "under 0°C", "< 50°F"
         re.compile(r'(below|under|<=?)\s*(\d+\.?\d*)\s*°?\s*([FC])', re.I),
         # "reach 100°F", "hit 90°F"
@@ -226,16 +239,19 @@ class WeatherMarketFilter:
         rejection_reasons: List[str] = []
         filter_details: Dict[str, Any] = {}
 
+        # Text-derived fields (cached per market text)
+        text_fields = self._analyze_text(market)
+
         # =====================================================================
         # DETECT MARKET TYPE
         # =====================================================================
-        market_type = self._detect_market_type(market)
+        market_type = text_fields["market_type"]
         filter_details["market_type"] = market_type
 
         # =====================================================================
         # CHECK 1: Category is WEATHER
         # =====================================================================
-        is_weather = self._check_weather_category(market)
+        is_weather = text_fields["is_weather_category"]
         filter_details["is_weather_category"] = is_weather
         if not is_weather:
             rejection_reasons.append(
@@ -290,7 +306,7 @@ class WeatherMarketFilter:
         # =====================================================================
         # CHECK 6: Market type specific validation
         # =====================================================================
-        detected_city = self._detect_city(market)
+        detected_city = text_fields["detected_city"]
         filter_details["detected_city"] = detected_city
 
         if market_type == "CITY_TEMPERATURE":
@@ -303,7 +319,7 @@ class WeatherMarketFilter:
                 )
 
             # Also check for explicit temperature threshold
-            resolution_check = self._check_resolution_explicit(market)
+            resolution_check = text_fields["resolution_check"]
             filter_details["resolution_check"] = resolution_check
             if not resolution_check["is_explicit"]:
                 rejection_reasons.append(
@@ -312,7 +328,7 @@ class WeatherMarketFilter:
 
         elif market_type == "GLOBAL_RANKING":
             # Global ranking markets don't need city, but need ranking criteria
-            ranking_check = self._check_ranking_explicit(market)
+            ranking_check = text_fields["ranking_check"]
             filter_details["ranking_check"] = ranking_check
             if not ranking_check["is_explicit"]:
                 rejection_reasons.append(
@@ -321,7 +337,7 @@ class WeatherMarketFilter:
 
         elif market_type == "CLIMATE_METRIC":
             # Climate metric markets need explicit measurement criteria
-            metric_check = self._check_metric_explicit(market)
+            metric_check = text_fields["metric_check"]
             filter_details["metric_check"] = metric_check
             if not metric_check["is_explicit"]:
                 rejection_reasons.append(
@@ -346,6 +362,8 @@ class WeatherMarketFilter:
             if market_type == "CITY_TEMPERATURE":
                 resolution_check = filter_details.get("resolution_check", {})
                 market.detected_threshold = resolution_check.get("threshold_f")
+                market.detected_event_type = resolution_check.get("event_type")
+                market.detected_range_f = resolution_check.get("range_f")
 
         return FilterResult(
             passed=passed,
@@ -354,6 +372,52 @@ class WeatherMarketFilter:
             filter_details=filter_details,
         )
 
+    def _analyze_text(self, market: WeatherMarket) -> Dict[str, Any]:
+        """
+        Parse the text-only fields of a market: type, weather category,
+        city and the type-specific explicitness check.
+
+        Cached by content hash (core/market_text_cache.py), so unchanged
+        markets skip all regex work. Odds, liquidity and time are NOT part
+        of this and are checked fresh in filter_market().
+        """
+        cache = get_market_text_cache()
+        key = text_key(
+            "filter", market.question, market.description,
+            market.resolution_text, market.category,
+        )
+        cached = cache.get(key)
+        if cached is None:
+            market_type = self._detect_market_type(market)
+            cached = {
+                "market_type": market_type,
+                "is_weather_category": self._check_weather_category(market),
+                "detected_city": self._detect_city(market),
+                "resolution_check": (
+                    self._check_resolution_explicit(market)
+                    if market_type == "CITY_TEMPERATURE" else None
+                ),
+                "ranking_check": (
+                    self._check_ranking_explicit(market)
+                    if market_type == "GLOBAL_RANKING" else None
+                ),
+                "metric_check": (
+                    self._check_metric_explicit(market)
+                    if market_type == "CLIMATE_METRIC" else None
+                ),
+            }
+            cache.put(key, cached)
+
+        fields = dict(cached)
+        for name in ("resolution_check", "ranking_check", "metric_check"):
+            if fields[name] is not None:
+                fields[name] = dict(fields[name])
+        resolution_check = fields["resolution_check"]
+        # JSON round trip turns the range tuple into a list
+        if resolution_check is not None and resolution_check.get("range_f") is not None:
+            resolution_check["range_f"] = tuple(resolution_check["range_f"])
+        return fields
+
     def _detect_market_type(self, market: WeatherMarket) -> str:
         """
         Detect the type of weather market.
@@ -478,7 +542,7 @@ class WeatherMarketFilter:
 
         # Check keywords in question/description
         combined_text = f"{market.question} {market.description}".lower()
-        return any(kw in combined_text for kw in self.WEATHER_CATEGORY_KEYWORDS)
+        return self._CATEGORY_MATCHER.matches_any(combined_text)
 
     def _detect_city(self, market: WeatherMarket) -> Optional[str]:
         """
@@ -508,6 +572,7 @@ class WeatherMarketFilter:
         - reason: str (if not explicit)
         - threshold_f: float (if detected, in Fahrenheit)
         - metric: str (if detected)
+        - event_type / range_f: event shape in °F (see _event_range)
         """
         combined_text = f"{market.question} {market.resolution_text} {market.description}"
 
@@ -527,7 +592,7 @@ class WeatherMarketFilter:
                 }
 
         # Try to extract temperature threshold
-        for pattern in self.TEMPERATURE_PATTERNS:
+        for pattern_index, pattern in enumerate(self.TEMPERATURE_PATTERNS):
             match = pattern.search(combined_text)
             if match:
                 groups = match.groups()
@@ -555,12 +620,15 @@ class WeatherMarketFilter:
                     else:
                         threshold_f = threshold
 
+                    event_type, range_f = self._event_range(pattern_index, match, threshold, unit)
                     return {
                         "is_explicit": True,
                         "threshold_f": threshold_f,
                         "metric": "temperature",
                         "original_value": threshold,
                         "original_unit": unit,
+                        "event_type": event_type,
+                        "range_f": range_f,
                     }
 
         # No threshold detected
@@ -570,11 +638,60 @@ class WeatherMarketFilter:
         }
 
 
+    @staticmethod
+    def _event_range(
+        pattern_index: int, match: "re.Match", threshold: float, unit: str
+    ) -> Tuple[str, Tuple[Optional[float], Optional[float]]]:
+        """
+        Event shape of a matched temperature pattern, as a °F interval.
+
+        Ladder markets ("between 48-49°F", "be 10°C", "be 56°F or higher")
+        resolve on whole degrees, so their edges sit half a degree out;
+        bucket and tail ranges of one ladder then tile without gaps. The
+        same holds for every inclusive tail, however it is phrased
+        ("56°F or higher", "56°F+", ">= 56°F", "<= 31°F", "31°F or below").
+        Strict thresholds ("exceed 100°F", "below 32°F") keep the number.
+        """
+        if pattern_index == 0:
+            low, high = sorted((float(match.group(1)), float(match.group(2))))
+            return "between", (_to_fahrenheit(low - 0.5, unit), _to_fahrenheit(high + 0.5, unit))
+
+        if pattern_index == 1:
+            direction = (match.group(4) or "").lower()
+            if direction == "higher":
+                return "exceeds", (_to_fahrenheit(threshold - 0.5, unit), None)
+            if direction in ("below", "lower"):
+                return "below", (None, _to_fahrenheit(threshold + 0.5, unit))
+            return "between", (
+                _to_fahrenheit(threshold - 0.5, unit), _to_fahrenheit(threshold + 0.5, unit)
+            )
+
+        if pattern_index == 2 and match.group(1) == ">=":
+            return "exceeds", (_to_fahrenheit(threshold - 0.5, unit), None)
+
+        if pattern_index == 3:
+            if match.group(5):
+                return "below", (None, _to_fahrenheit(threshold + 0.5, unit))
+            return "exceeds", (_to_fahrenheit(threshold - 0.5, unit), None)
+
+        if pattern_index == 4:
+            if match.group(1) == "<=":
+                return "below", (None, _to_fahrenheit(threshold + 0.5, unit))
+            return "below", (None, _to_fahrenheit(threshold, unit))
+
+        return "exceeds", (_to_fahrenheit(threshold, unit), None)
+
 # =============================================================================
 # MODULE-LEVEL FUNCTION
 # =============================================================================
 
 
+def _to_fahrenheit(value: Optional[float], unit: str) -> Optional[float]:
+    if value is None or unit != 'C':
+        return value
+    return value * 9 / 5 + 32
+
+
 def create_filter_from_config(config_path: str) -> WeatherMarketFilter:
     """
     Create a WeatherMarketFilter from a YAML config file.
@@ -20,6 +20,12 @@
 #
 # If market prices this at 3%, edge = (7.7 - 3) / 3 = 1.57 (157% edge)
 #
+# BATCH ENGINE:
+# compute_probability_batch() evaluates every (market, source) row of a run
+# in one pass (NumPy if installed, pure Python otherwise) and aggregates
+# weighted ensemble mean / variance / max deviation per group.
+# The scalar functions below are thin wrappers around it.
+#
 # CRITICAL ISOLATION:
 # - NO imports from panic, execution, or learning modules
 # - NO memory of past predictions
@@ -29,10 +35,17 @@
 
 import logging
 import math
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
+from .probability_memo import content_hash, get_probability_memo
 from .weather_signal import WeatherConfidence
 
 logger = logging.getLogger(__name__)
@@ -190,6 +203,38 @@ def probability_below(
     return normal_cdf(threshold, mean, sigma)
 
 
+# =============================================================================
+# SIGMA HORIZON TABLE
+# =============================================================================
+
+
+class SigmaHorizonTable:
+    """
+    Precomputed SIGMA_HORIZON_ADJUSTMENTS lookup.
+
+    The multiplier is the value of the largest key <= days (1.0 below the
+    first key); lookup is a bisect over the sorted keys. bucket() is the
+    step index, so equal buckets always mean equal sigma.
+    """
+
+    def __init__(self, base_sigma: float, adjustments: Dict[float, float]):
+        self.base_sigma = base_sigma
+        items = sorted((float(k), float(v)) for k, v in adjustments.items())
+        self._keys = [k for k, _ in items]
+        self._multipliers = [v for _, v in items]
+
+    def bucket(self, days_to_resolution: float) -> int:
+        """-1 below the first key, else index of the applicable key."""
+        return bisect_right(self._keys, days_to_resolution) - 1
+
+    def multiplier(self, days_to_resolution: float) -> float:
+        index = self.bucket(days_to_resolution)
+        return self._multipliers[index] if index >= 0 else 1.0
+
+    def sigma(self, days_to_resolution: float) -> float:
+        return self.base_sigma * self.multiplier(days_to_resolution)
+
+
 # =============================================================================
 # WEATHER PROBABILITY MODEL
 # =============================================================================
@@ -234,6 +279,8 @@ class WeatherProbabilityModel:
             {1: 0.8, 2: 0.9, 3: 1.0, 5: 1.2, 7: 1.5, 10: 2.0}
         )
 
+        self._sigma_table = SigmaHorizonTable(self.base_sigma_f, self.sigma_horizon_adjustments)
+
         # Maximum forecast horizon
         self.max_horizon_days = config.get("MAX_FORECAST_HORIZON_DAYS", 10)
 
@@ -285,23 +332,43 @@ class WeatherProbabilityModel:
                 reason="Forecast horizon too long"
             )
 
+        # Determine confidence level
+        confidence = self._determine_confidence(hours_to_resolution)
+
+        # Unchanged forecast in the same horizon bucket -> memoized result
+        memo = get_probability_memo()
+        memo_key = (
+            "probability",
+            forecast.city,
+            forecast.target_time.date(),
+            float(threshold_f),
+            event_type,
+            content_hash(
+                forecast.source, forecast.temperature_f,
+                forecast.temperature_min_f, forecast.temperature_max_f,
+            ),
+            self._sigma_table.bucket(days_to_resolution),
+            self._sigma_table.sigma(days_to_resolution),
+            confidence.value,
+        )
+        cached = memo.get(memo_key)
+        if cached is not None:
+            return replace(
+                cached,
+                hours_to_resolution=hours_to_resolution,
+                computation_details={
+                    **cached.computation_details,
+                    "days_to_resolution": days_to_resolution,
+                },
+            )
+
         # Calculate adjusted sigma based on horizon
         sigma = self._calculate_adjusted_sigma(days_to_resolution)
 
         # Compute probability based on event type
-        if event_type == "exceeds":
-            fair_prob = probability_exceeds(
-                threshold_f, forecast.temperature_f, sigma
-            )
-        elif event_type == "below":
-            fair_prob = probability_below(
-                threshold_f, forecast.temperature_f, sigma
-            )
-        else:
-            raise ValueError(f"Unknown event_type: {event_type}")
-
-        # Determine confidence level
-        confidence = self._determine_confidence(hours_to_resolution)
+        fair_prob = compute_probability_from_forecast_temp(
+            forecast.temperature_f, threshold_f, sigma, event_type
+        )
 
         # Build computation details
         details = {
@@ -314,14 +381,14 @@ class WeatherProbabilityModel:
             "data_source": forecast.source,
         }
 
-        logger.info(
+        logger.debug(
             f"Probability computed | city={forecast.city} | "
             f"forecast={forecast.temperature_f}°F | threshold={threshold_f}°F | "
             f"sigma={sigma:.2f} | P({event_type})={fair_prob:.4f} | "
             f"confidence={confidence.value}"
         )
 
-        return ProbabilityResult(
+        result = ProbabilityResult(
             fair_probability=fair_prob,
             confidence=confidence,
             sigma_used=sigma,
@@ -330,6 +397,8 @@ class WeatherProbabilityModel:
             hours_to_resolution=hours_to_resolution,
             computation_details=details,
         )
+        memo.put(memo_key, result)
+        return result
 
     def _calculate_adjusted_sigma(self, days_to_resolution: float) -> float:
         """
@@ -343,17 +412,8 @@ class WeatherProbabilityModel:
         Returns:
             Adjusted sigma value
         """
-        # Find the appropriate adjustment factor
-        adjustment = 1.0
-
-        # Find the largest key that's <= days_to_resolution
-        sorted_keys = sorted(self.sigma_horizon_adjustments.keys())
-        for key in sorted_keys:
-            if days_to_resolution >= key:
-                adjustment = self.sigma_horizon_adjustments[key]
-            else:
-                break
-
+        # Largest key <= days_to_resolution (precomputed bisect table)
+        adjustment = self._sigma_table.multiplier(days_to_resolution)
         adjusted_sigma = self.base_sigma_f * adjustment
 
         logger.debug(
@@ -439,15 +499,204 @@ def compute_probability_from_forecast_temp(
     Returns:
         Probability of the event
     """
-    if sigma <= 0:
-        raise ValueError(f"sigma must be positive, got {sigma}")
+    # Single row: the pure-Python kernel beats NumPy's per-call overhead
+    return compute_probability_batch(
+        [temperature_f], [sigma], [threshold_f], event_type, use_numpy=False
+    ).probabilities[0]
+
+
+# =============================================================================
+# BATCH PROBABILITY ENGINE
+# =============================================================================
+
+# Abramowitz & Stegun 7.1.26 (|error| < 1.5e-7) - NumPy has no erf
+_AS_P = 0.3275911
+_AS_A = (0.254829592, -0.284496736, 1.421413741, -1.453152027, 1.061405429)
+_EVENT_SIGNS = {"exceeds": 1, "below": 0}
+
+
+@dataclass
+class BatchProbabilityResult:
+    """
+    Output of compute_probability_batch.
 
-    if event_type == "exceeds":
-        return probability_exceeds(threshold_f, temperature_f, sigma)
-    elif event_type == "below":
-        return probability_below(threshold_f, temperature_f, sigma)
+    probabilities: one fair probability per input row
+    mean/variance/max_deviation: weighted ensemble stats per group
+    (index = group id; groups without rows have weight 0 and stats 0.0)
+    """
+    probabilities: List[float]
+    mean: List[float]
+    variance: List[float]
+    max_deviation: List[float]
+
+    @property
+    def group_count(self) -> int:
+        return len(self.mean)
+
+
+def _exceeds_flags(event_types: Union[str, Sequence[str]], n: int) -> List[int]:
+    if isinstance(event_types, str):
+        event_types = [event_types] * n
+    elif len(event_types) != n:
+        raise ValueError(f"event_types has {len(event_types)} entries, expected {n}")
+    flags = []
+    for event_type in event_types:
+        flag = _EVENT_SIGNS.get(event_type)
+        if flag is None:
+            raise ValueError(f"Unknown event_type: {event_type}")
+        flags.append(flag)
+    return flags
+
+
+def _probabilities_numpy(means, sigmas, thresholds, flags):
+    mu = np.asarray(means, dtype=float)
+    sd = np.asarray(sigmas, dtype=float)
+    th = np.asarray(thresholds, dtype=float)
+
+    # erf(z / sqrt(2)) via A&S, then CDF
+    x = (th - mu) / (sd * math.sqrt(2))
+    t = 1.0 / (1.0 + _AS_P * np.abs(x))
+    a1, a2, a3, a4, a5 = _AS_A
+    poly = ((((a5 * t + a4) * t + a3) * t + a2) * t + a1) * t
+    erf = np.sign(x) * (1.0 - poly * np.exp(-x * x))
+    cdf = 0.5 * (1.0 + erf)
+    return np.where(np.asarray(flags, dtype=bool), 1.0 - cdf, cdf)
+
+
+def _stats_numpy(values, weights, groups, group_count):
+    v = np.asarray(values, dtype=float)
+    w = np.asarray(weights, dtype=float)
+    g = np.asarray(groups, dtype=np.intp)
+
+    weight_sum = np.bincount(g, weights=w, minlength=group_count)
+    safe_sum = np.where(weight_sum > 0, weight_sum, 1.0)
+    mean = np.bincount(g, weights=w * v, minlength=group_count) / safe_sum
+    dev = v - mean[g]
+    variance = np.bincount(g, weights=w * dev * dev, minlength=group_count) / safe_sum
+    max_dev = np.zeros(group_count)
+    np.maximum.at(max_dev, g, np.abs(dev))
+    return mean.tolist(), variance.tolist(), max_dev.tolist()
+
+
+def _probabilities_python(means, sigmas, thresholds, flags):
+    probs = []
+    for mu, sd, th, exceeds in zip(means, sigmas, thresholds, flags):
+        cdf = standard_normal_cdf((th - mu) / sd)
+        probs.append(1.0 - cdf if exceeds else cdf)
+    return probs
+
+
+def _stats_python(values, weights, groups, group_count):
+    weight_sum = [0.0] * group_count
+    weighted = [0.0] * group_count
+    for v, w, g in zip(values, weights, groups):
+        weight_sum[g] += w
+        weighted[g] += w * v
+    mean = [weighted[i] / weight_sum[i] if weight_sum[i] > 0 else 0.0 for i in range(group_count)]
+
+    variance = [0.0] * group_count
+    max_dev = [0.0] * group_count
+    for v, w, g in zip(values, weights, groups):
+        dev = v - mean[g]
+        variance[g] += w * dev * dev
+        max_dev[g] = max(max_dev[g], abs(dev))
+    variance = [variance[i] / weight_sum[i] if weight_sum[i] > 0 else 0.0 for i in range(group_count)]
+    return mean, variance, max_dev
+
+
+def _resolve_numpy(use_numpy: Optional[bool]) -> bool:
+    if use_numpy is None:
+        return np is not None
+    if use_numpy and np is None:
+        raise RuntimeError("NumPy is not installed")
+    return use_numpy
+
+
+def _check_weights_groups(
+    n: int, weights: Optional[Sequence[float]], groups: Optional[Sequence[int]]
+) -> Tuple[List[float], List[int], int]:
+    weights = [1.0] * n if weights is None else list(weights)
+    groups = [0] * n if groups is None else list(groups)
+    if len(weights) != n or len(groups) != n:
+        raise ValueError("weights and groups must match the number of rows")
+    if any(g < 0 for g in groups):
+        raise ValueError("group ids must be non-negative")
+    return weights, groups, (max(groups) + 1 if groups else 0)
+
+
+def compute_weighted_stats(
+    values: Sequence[float],
+    weights: Optional[Sequence[float]] = None,
+    groups: Optional[Sequence[int]] = None,
+    use_numpy: Optional[bool] = None,
+) -> Tuple[List[float], List[float], List[float]]:
+    """
+    Weighted mean, variance and max |deviation from mean| per group.
+
+    Used for ensemble aggregation of per-source probabilities that were
+    not produced by compute_probability_batch (e.g. ladder buckets).
+
+    Returns:
+        (mean, variance, max_deviation), each indexed by group id
+    """
+    weights, groups, group_count = _check_weights_groups(len(values), weights, groups)
+    if not values:
+        return [], [], []
+    stats = _stats_numpy if _resolve_numpy(use_numpy) else _stats_python
+    return stats(values, weights, groups, group_count)
+
+
+def compute_probability_batch(
+    means: Sequence[float],
+    sigmas: Sequence[float],
+    thresholds: Sequence[float],
+    event_types: Union[str, Sequence[str]] = "exceeds",
+    weights: Optional[Sequence[float]] = None,
+    groups: Optional[Sequence[int]] = None,
+    use_numpy: Optional[bool] = None,
+) -> BatchProbabilityResult:
+    """
+    Compute fair probabilities for many (market, source) rows at once.
+
+    Each row is one forecast mean / sigma / threshold. Rows sharing a
+    group id (e.g. all sources of one market) are aggregated into the
+    weighted ensemble mean, variance and max deviation of that group.
+
+    Args:
+        means: Forecast temperatures (F)
+        sigmas: Adjusted standard deviations (> 0)
+        thresholds: Threshold temperatures (F)
+        event_types: "exceeds"/"below", one for all rows or one per row
+        weights: Row weights for the ensemble stats (default 1.0)
+        groups: Group id per row, 0..G-1 (default: all rows in group 0)
+        use_numpy: Force/forbid NumPy (default: use it if installed)
+
+    Returns:
+        BatchProbabilityResult
+    """
+    n = len(means)
+    if len(sigmas) != n or len(thresholds) != n:
+        raise ValueError("means, sigmas and thresholds must have equal length")
+    for sigma in sigmas:
+        if sigma <= 0:
+            raise ValueError(f"sigma must be positive, got {sigma}")
+
+    flags = _exceeds_flags(event_types, n)
+    weights, groups, group_count = _check_weights_groups(n, weights, groups)
+    if n == 0:
+        return BatchProbabilityResult(probabilities=[], mean=[], variance=[], max_deviation=[])
+
+    if _resolve_numpy(use_numpy):
+        probs = _probabilities_numpy(means, sigmas, thresholds, flags)
+        mean, variance, max_dev = _stats_numpy(probs, weights, groups, group_count)
+        probs = probs.tolist()
     else:
-        raise ValueError(f"Unknown event_type: {event_type}")
+        probs = _probabilities_python(means, sigmas, thresholds, flags)
+        mean, variance, max_dev = _stats_python(probs, weights, groups, group_count)
+
+    return BatchProbabilityResult(
+        probabilities=probs, mean=mean, variance=variance, max_deviation=max_dev,
+    )
 
 
 def compute_edge(
@@ -30,6 +30,8 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
 
+from .market_text_cache import get_market_text_cache, text_key
+
 logger = logging.getLogger(__name__)
 
 
@@ -239,6 +241,28 @@ class WeatherValidator:
         Returns:
             WeatherValidationChecklist with all 6 criteria results
         """
+        # Unchanged market text -> cached checklist (no regex work)
+        cache = get_market_text_cache()
+        key = text_key("validate", market_question, resolution_text, description)
+        cached = cache.get(key)
+        if cached is not None:
+            return WeatherValidationChecklist(
+                **{**cached, "blocking_reasons": tuple(cached["blocking_reasons"])}
+            )
+
+        checklist = self._validate_text(market_question, resolution_text, description)
+        stored = checklist.to_dict()
+        del stored["is_valid"]
+        cache.put(key, stored)
+        return checklist
+
+    def _validate_text(
+        self,
+        market_question: str,
+        resolution_text: str,
+        description: str,
+    ) -> WeatherValidationChecklist:
+        """Run the 6 checks on the market text (uncached)."""
         full_text = f"{market_question} {resolution_text} {description}".lower()
         blocking_reasons: List[str] = []
 
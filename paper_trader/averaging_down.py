@@ -35,6 +35,7 @@ from paper_trader.snapshot_client import get_market_snapshots
 from paper_trader.capital_manager import get_capital_manager, allocate_capital
 from paper_trader.slippage import calculate_entry_price
 from paper_trader.kelly import kelly_size
+from paper_trader.state_lock import get_position_state_lock
 
 logger = logging.getLogger(__name__)
 
@@ -159,6 +160,9 @@ def check_averaging_down() -> Dict[str, Any]:
     4. Compute new edge
     5. If edge improved → execute add-on entry
 
+    Snapshots and forecasts are fetched without the position state lock;
+    the add-on entries (capital + positions log) run under it.
+
     Returns:
         Summary dict with counts
     """
@@ -197,6 +201,7 @@ def check_averaging_down() -> Dict[str, Any]:
     addon_count = 0
     skipped_count = 0
     total_cost = 0.0
+    candidates = []
 
     for position in open_positions:
         snapshot = snapshots.get(position.market_id)
@@ -223,9 +228,8 @@ def check_averaging_down() -> Dict[str, Any]:
             skipped_count += 1
             continue
 
-        # Check 3: Capital available
-        state = capital_mgr.get_state()
-        can_open, reason = capital_mgr.can_open_position(len(open_positions) + addon_count)
+        # Check 3: Capital available (re-checked under the lock before entry)
+        can_open, reason = capital_mgr.can_open_position(len(open_positions) + len(candidates))
         if not can_open:
             logger.debug(f"Averaging down: {reason}")
             skipped_count += 1
@@ -290,22 +294,37 @@ def check_averaging_down() -> Dict[str, Any]:
             skipped_count += 1
             continue
 
-        # All checks passed - execute add-on entry
+        # All checks passed - add-on entry below
         logger.info(
             f"AVERAGING DOWN: {position.market_id} | {city} | "
             f"entry @ {entry_price:.4f} → current @ {current_price:.4f} | "
             f"edge: {original_edge:.2%} → {new_edge:.2%} (+{edge_improvement:.2%})"
         )
+        candidates.append((position, snapshot, prob_result.fair_probability, new_edge, city))
+
+    if candidates:
+        with get_position_state_lock():
+            # Re-read: the exit monitor may have closed positions or
+            # released capital meanwhile
+            current_open = paper_logger.get_open_positions()
+            still_open = {p.position_id for p in current_open}
+            for position, snapshot, fair_probability, new_edge, city in candidates:
+                if position.position_id not in still_open:
+                    skipped_count += 1
+                    continue
+                can_open, reason = capital_mgr.can_open_position(len(current_open) + addon_count)
+                if not can_open:
+                    logger.debug(f"Averaging down: {reason}")
+                    skipped_count += 1
+                    continue
 
-        addon_result = _execute_addon(
-            position, snapshot, prob_result.fair_probability, new_edge, city
-        )
+                addon_result = _execute_addon(position, snapshot, fair_probability, new_edge, city)
 
-        if addon_result is not None:
-            addon_count += 1
-            total_cost += addon_result.cost_basis_eur
-        else:
-            skipped_count += 1
+                if addon_result is not None:
+                    addon_count += 1
+                    total_cost += addon_result.cost_basis_eur
+                else:
+                    skipped_count += 1
 
     summary = {
         "checked": len(open_positions),
@@ -67,6 +67,9 @@ class CapitalManager:
         self._config_path = config_path or CAPITAL_CONFIG_PATH
         self._lock = Lock()
         self._state: Optional[CapitalState] = None
+        # (mtime_ns, size, inode) of the config as last loaded/saved: another
+        # process (exit monitor / pipeline) may have written it since
+        self._file_signature: Optional[tuple] = None
         self._load_config()
         if auto_reconcile:
             self.reconcile()
@@ -80,6 +83,7 @@ class CapitalManager:
 
         with open(self._config_path, "r", encoding="utf-8") as f:
             data = json.load(f)
+        self._file_signature = self._current_signature()
 
         self._state = CapitalState(
             initial_capital_eur=data.get("initial_capital_eur", 5000.0),
@@ -167,6 +171,14 @@ class CapitalManager:
             shutil.copy2(str(self._config_path), backup_path)
 
         self._atomic_write(self._config_path, data)
+        self._file_signature = self._current_signature()
+
+    def _current_signature(self) -> Optional[tuple]:
+        try:
+            st = self._config_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
 
     def reconcile(self) -> None:
         """Gleiche Kapital mit offenen Positionen ab (FIX M2).
@@ -218,8 +230,8 @@ class CapitalManager:
             self._save_config("Kapital-Reconciliation korrigiert")
 
     def get_state(self) -> CapitalState:
-        """Get current capital state."""
-        if self._state is None:
+        """Get current capital state (reloaded if another process saved it)."""
+        if self._state is None or self._current_signature() != self._file_signature:
             self._load_config()
         return self._state  # type: ignore
 
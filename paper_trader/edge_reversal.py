@@ -30,6 +30,7 @@ from paper_trader.logger import get_paper_logger
 from paper_trader.snapshot_client import get_market_snapshots
 from paper_trader.simulator import simulate_exit_market
 from paper_trader.averaging_down import extract_city, extract_threshold_f
+from paper_trader.state_lock import get_position_state_lock
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +59,9 @@ def check_edge_reversal_exits() -> Dict[str, Any]:
     4. Compute edge against current market price
     5. If edge reversed or below minimum: exit position
 
+    Snapshots and forecasts are fetched without the position state lock;
+    only the exits run under it.
+
     Returns:
         Summary dict with checked, skipped, exited, pnl_eur
     """
@@ -95,6 +99,7 @@ def check_edge_reversal_exits() -> Dict[str, Any]:
     exited_count = 0
     skipped_count = 0
     total_pnl = 0.0
+    exits = []
 
     for position in open_positions:
         snapshot = snapshots.get(position.market_id)
@@ -167,19 +172,28 @@ def check_edge_reversal_exits() -> Dict[str, Any]:
             )
 
         if should_exit:
-            logger.info(
-                f"EDGE REVERSAL: {position.market_id} | {city} | "
-                f"entry @ {position.entry_price:.4f} | current @ {current_price:.4f} | "
-                f"{exit_reason}"
-            )
-
-            closed, record = simulate_exit_market(
-                position, snapshot, f"Edge reversal: {exit_reason}"
-            )
-
-            exited_count += 1
-            if closed.realized_pnl_eur is not None:
-                total_pnl += closed.realized_pnl_eur
+            exits.append((position, snapshot, city, exit_reason))
+
+    if exits:
+        with get_position_state_lock():
+            # Re-read: the exit monitor may have closed positions meanwhile
+            still_open = {p.position_id for p in paper_logger.get_open_positions()}
+            for position, snapshot, city, exit_reason in exits:
+                if position.position_id not in still_open:
+                    continue
+                logger.info(
+                    f"EDGE REVERSAL: {position.market_id} | {city} | "
+                    f"entry @ {position.entry_price:.4f} | current @ {snapshot.mid_price:.4f} | "
+                    f"{exit_reason}"
+                )
+
+                closed, record = simulate_exit_market(
+                    position, snapshot, f"Edge reversal: {exit_reason}"
+                )
+
+                exited_count += 1
+                if closed.realized_pnl_eur is not None:
+                    total_pnl += closed.realized_pnl_eur
 
     summary = {
         "checked": len(open_positions),
@@ -0,0 +1,211 @@
+# =============================================================================
+# POLYMARKET BEOBACHTER - FAST EXIT MONITOR
+# =============================================================================
+#
+# GOVERNANCE INTENT:
+# Runs the PositionManager take-profit / stop-loss / trailing-stop check
+# (check_mid_trade_exits) outside the 15-minute pipeline, so exit latency
+# is bounded by price-update latency instead of the pipeline interval.
+#
+# TRIGGERS:
+# - Every price feed update for a market with an open position
+#   (bursts are coalesced: at most one check per MIN_CHECK_GAP_SECONDS)
+# - Otherwise every interval_seconds: Gamma snapshots via the warm
+#   snapshot client, with cached entries capped at interval_seconds of
+#   age (the client's own TTL is longer), so every check sees a price at
+#   most one interval old
+#
+# CONSISTENCY:
+# check_mid_trade_exits fetches snapshots without the position state lock
+# (paper_trader/state_lock.py) and applies exits under it; the pipeline's
+# paper trader steps do the same with their snapshots and forecasts.
+# Capital, TP state and the positions log are never modified by both at
+# once, and neither side waits for the other's network calls.
+#
+# Entry points: cockpit.py --exit-monitor (own process) or
+# cockpit.py --scheduler --exit-monitor (thread next to the pipeline).
+#
+# PAPER TRADING ONLY:
+# NO real orders are placed. NO real money is at risk.
+#
+# =============================================================================
+
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SECONDS = 5.0
+# Price updates arrive in bursts; one check covers all of them
+MIN_CHECK_GAP_SECONDS = 1.0
+# How often the set of open-position markets (and the feed watchlist) is re-read
+POSITIONS_REFRESH_SECONDS = 60.0
+
+
+def _open_position_markets() -> List[str]:
+    from paper_trader.position_manager import get_open_positions
+    return [p.market_id for p in get_open_positions()]
+
+
+def _check_mid_trade_exits(max_age_seconds: float) -> Dict[str, Any]:
+    from paper_trader.position_manager import get_position_manager
+    return get_position_manager().check_mid_trade_exits(max_age_seconds=max_age_seconds)
+
+
+class ExitMonitor:
+    """
+    Event-driven loop around PositionManager.check_mid_trade_exits.
+
+    check and open_markets are injectable for testing.
+    """
+
+    def __init__(
+        self,
+        feed: Optional[Any] = None,
+        interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+        min_check_gap_seconds: float = MIN_CHECK_GAP_SECONDS,
+        manage_watchlist: bool = True,
+        check: Optional[Callable[[], Dict[str, Any]]] = None,
+        open_markets: Optional[Callable[[], List[str]]] = None,
+    ):
+        """
+        Args:
+            feed: PriceFeed whose updates trigger checks (None = interval only)
+            interval_seconds: Check interval without price updates
+            min_check_gap_seconds: Minimum time between two checks
+            manage_watchlist: True if the monitor owns the feed watchlist
+                (own process); False next to the pipeline, which sets the
+                watchlist itself - open positions are then only added
+        """
+        self.feed = feed
+        self.interval_seconds = interval_seconds
+        self.min_check_gap_seconds = min_check_gap_seconds
+        self.manage_watchlist = manage_watchlist
+        self._check = check or (lambda: _check_mid_trade_exits(interval_seconds))
+        self._open_markets = open_markets or _open_position_markets
+
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._markets: Set[str] = set()
+        self._markets_refreshed: Optional[float] = None
+        self._last_check = 0.0
+
+        self.checks = 0
+        self.triggered_checks = 0
+        self.exits = 0
+        self.errors = 0
+        self.pnl_eur = 0.0
+
+    # -------------------------------------------------------------------------
+    # LIFECYCLE
+    # -------------------------------------------------------------------------
+
+    def start(self) -> "ExitMonitor":
+        """Run the loop in a daemon thread."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run, name="exit-monitor", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run(self) -> None:
+        """Loop until stop(); blocks the calling thread."""
+        if self.feed is not None:
+            self.feed.add_listener(self._on_price_update)
+        try:
+            self.check_once()
+            while not self._stop.is_set():
+                triggered = self._wakeup.wait(self.interval_seconds)
+                if self._stop.is_set():
+                    break
+                # Coalesce a burst of updates into one check
+                gap = self._last_check + self.min_check_gap_seconds - time.monotonic()
+                if gap > 0 and self._stop.wait(gap):
+                    break
+                self._wakeup.clear()
+                if triggered:
+                    self.triggered_checks += 1
+                self.check_once()
+        finally:
+            if self.feed is not None:
+                self.feed.remove_listener(self._on_price_update)
+
+    def _on_price_update(self, market_id: str) -> None:
+        # Called on the feed thread: only flag, never check here
+        if market_id in self._markets:
+            self._wakeup.set()
+
+    # -------------------------------------------------------------------------
+    # CHECK
+    # -------------------------------------------------------------------------
+
+    def check_once(self) -> Dict[str, Any]:
+        """One TP/SL/trailing check (locks only around the exits, see header)."""
+        self._last_check = time.monotonic()
+        try:
+            summary = self._check()
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Exit monitor check failed: {e}")
+            return {}
+
+        self.checks += 1
+        exits = summary.get("take_profit", 0) + summary.get("stop_loss", 0)
+        if exits:
+            self.exits += exits
+            self.pnl_eur += summary.get("pnl_eur", 0.0)
+            logger.info(
+                f"Exit monitor: {summary.get('take_profit', 0)} TP/Trail, "
+                f"{summary.get('stop_loss', 0)} SL, P&L: {summary.get('pnl_eur', 0.0):+.2f} EUR"
+            )
+        self._refresh_markets(force=bool(exits))
+        return summary
+
+    def _refresh_markets(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if (
+            not force and self._markets_refreshed is not None
+            and now - self._markets_refreshed < POSITIONS_REFRESH_SECONDS
+        ):
+            return
+        self._markets_refreshed = now
+        try:
+            markets = self._open_markets()
+        except Exception as e:
+            logger.debug(f"Exit monitor: open positions not readable: {e}")
+            return
+        self._markets = set(markets)
+        if self.feed is None:
+            return
+        try:
+            if self.manage_watchlist:
+                self.feed.set_watchlist(markets)
+            else:
+                self.feed.watch(markets)
+        except Exception as e:
+            logger.debug(f"Exit monitor: watchlist update failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "positions": len(self._markets),
+            "checks": self.checks,
+            "triggered_checks": self.triggered_checks,
+            "exits": self.exits,
+            "errors": self.errors,
+            "pnl_eur": round(self.pnl_eur, 2),
+        }
@@ -91,6 +91,9 @@ class PaperTradingLogger:
         # In-memory cache for open positions (FIX K6)
         self._open_positions_cache: Optional[List[PaperPosition]] = None
         self._cache_dirty: bool = True
+        # (mtime_ns, size) of the positions log the cache was built from -
+        # appends by another process (exit monitor / pipeline) invalidate it
+        self._cache_signature: Optional[tuple] = None
 
         # Initialize files with headers
         self._init_files()
@@ -261,12 +264,18 @@ class PaperTradingLogger:
         Get all currently open positions.
 
         Uses an in-memory cache with a dirty-flag to avoid re-reading
-        the entire JSONL file on every call (FIX K6).
+        the entire JSONL file on every call (FIX K6). The file's stat
+        signature catches writes from other processes.
 
         Returns:
             List of OPEN PaperPosition objects
         """
-        if not self._cache_dirty and self._open_positions_cache is not None:
+        signature = self._positions_signature()
+        if (
+            not self._cache_dirty
+            and self._open_positions_cache is not None
+            and signature == self._cache_signature
+        ):
             return self._open_positions_cache
 
         all_positions = self.read_all_positions()
@@ -279,8 +288,16 @@ class PaperTradingLogger:
         # Filter to open only
         self._open_positions_cache = [p for p in position_states.values() if p.status == "OPEN"]
         self._cache_dirty = False
+        self._cache_signature = signature
         return self._open_positions_cache
 
+    def _positions_signature(self) -> Optional[tuple]:
+        try:
+            st = self.positions_log_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def get_executed_proposal_ids(self) -> set:
         """
         Get set of proposal IDs that have been paper-executed.
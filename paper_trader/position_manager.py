@@ -37,6 +37,7 @@ from paper_trader.snapshot_client import get_market_snapshots
 from paper_trader.simulator import simulate_exit_resolution, simulate_exit_market
 from paper_trader.capital_manager import release_capital
 from paper_trader.slippage import calculate_exit_price
+from paper_trader.state_lock import get_position_state_lock
 
 
 logger = logging.getLogger(__name__)
@@ -137,10 +138,19 @@ class PositionManager:
                 "total_pnl_eur": 0.0,
             }
 
-        # Get snapshots for all open position markets
+        # Get snapshots for all open position markets (Gamma: the live
+        # price feed does not know the resolution status). Network only
+        # outside the position state lock.
         market_ids = [p.market_id for p in open_positions]
-        snapshots = get_market_snapshots(market_ids)
+        snapshots = get_market_snapshots(market_ids, live=False)
 
+        with get_position_state_lock():
+            return self._close_resolved(snapshots)
+
+    def _close_resolved(self, snapshots: Dict[str, MarketSnapshot]) -> Dict[str, Any]:
+        """Close resolved positions (caller holds the position state lock)."""
+        # Re-read: the exit monitor may have closed positions meanwhile
+        open_positions = self.get_open_positions()
         closed_count = 0
         total_pnl = 0.0
         still_open = 0
@@ -364,7 +374,7 @@ class PositionManager:
 
         return remaining_pnl
 
-    def check_mid_trade_exits(self) -> Dict[str, Any]:
+    def check_mid_trade_exits(self, max_age_seconds: Optional[float] = None) -> Dict[str, Any]:
         """
         Check open positions for staged take-profit or stop-loss conditions.
 
@@ -375,6 +385,10 @@ class PositionManager:
         - Trailing Stop: Exit wenn Preis unter Stop faellt
         - Stop-Loss: -25% sofortiger Vollausgang
 
+        Args:
+            max_age_seconds: Max. Alter gecachter Gamma-Snapshots (Exit-Monitor:
+                sein Intervall; None = Cache-TTL des Snapshot-Clients)
+
         Returns:
             Summary with counts and P&L
         """
@@ -383,8 +397,18 @@ class PositionManager:
             return {"checked": 0, "take_profit": 0, "stop_loss": 0, "pnl_eur": 0.0}
 
         market_ids = [p.market_id for p in open_positions]
-        snapshots = get_market_snapshots(market_ids)
+        snapshots = get_market_snapshots(market_ids, max_age_seconds=max_age_seconds)
+
+        # Snapshots above without the lock; TP state, capital and the
+        # positions log only change under it
+        with get_position_state_lock():
+            return self._apply_mid_trade_exits(snapshots)
 
+    def _apply_mid_trade_exits(self, snapshots: Dict[str, MarketSnapshot]) -> Dict[str, Any]:
+        """TP/SL/trailing exits for the given snapshots (caller holds the position state lock)."""
+        # Re-read: positions closed by the other lock holder are skipped,
+        # positions opened since the snapshot fetch have no snapshot yet
+        open_positions = self.get_open_positions()
         tp_state = _load_tp_state()
         tp_count = 0
         sl_count = 0
@@ -631,9 +655,9 @@ def check_and_close_resolved() -> Dict[str, Any]:
     return get_position_manager().check_and_close_resolved()
 
 
-def check_mid_trade_exits() -> Dict[str, Any]:
+def check_mid_trade_exits(max_age_seconds: Optional[float] = None) -> Dict[str, Any]:
     """Convenience function to check take-profit/stop-loss exits."""
-    return get_position_manager().check_mid_trade_exits()
+    return get_position_manager().check_mid_trade_exits(max_age_seconds)
 
 
 def get_position_summary() -> Dict[str, Any]:
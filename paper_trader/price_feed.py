@@ -0,0 +1,626 @@
+# =============================================================================
+# POLYMARKET BEOBACHTER - CLOB PRICE FEED
+# =============================================================================
+#
+# GOVERNANCE INTENT:
+# Long-lived, READ-ONLY subscriber on the Polymarket CLOB market WebSocket
+# channel. Keeps a local order book (and thus top-of-book) for every
+# watched market: open positions and current candidates.
+#
+# MarketSnapshotClient uses the feed as a zero-latency snapshot source;
+# markets without a live book fall back to Gamma. Take-profit / stop-loss
+# checks therefore see the price of the last book update instead of the
+# price of the last 15-minute pipeline run.
+#
+# PROTOCOL (wss://ws-subscriptions-clob.polymarket.com/ws/market):
+# - Subscribe:   {"assets_ids": [...], "type": "market"}
+#                {"assets_ids": [...], "operation": "subscribe"|"unsubscribe"}
+# - "book":         full book snapshot for one asset
+# - "price_change": level updates (size 0 removes the level)
+# - Keep-alive: text "PING" every PING_INTERVAL_SECONDS, server answers "PONG"
+#
+# Assets are the YES outcome tokens (clobTokenIds[0]), matching the
+# YES-priced Gamma snapshots. After a disconnect all books are dropped
+# (deltas may have been missed) until the resubscription delivers fresh
+# "book" messages.
+#
+# TRANSPORT:
+# - websocket-client (optional dependency); without it the feed is not
+#   started and all snapshots come from Gamma
+# - connect is pluggable: LocalFeedServer is an in-process stand-in for
+#   tests and offline runs
+#
+# LAYER ISOLATION:
+# - Price data is used for PAPER TRADING ONLY
+# - NEVER feeds back to Layer 1 (core_analyzer)
+#
+# =============================================================================
+
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import websocket  # websocket-client
+except ImportError:
+    websocket = None
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from paper_trader.models import MarketSnapshot
+
+logger = logging.getLogger(__name__)
+
+WS_MARKET_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+
+PING_INTERVAL_SECONDS = 10.0
+CONNECT_TIMEOUT_SECONDS = 10.0
+# recv() wakes up at least this often (ping, stop flag)
+RECV_POLL_SECONDS = 1.0
+RECONNECT_MIN_SECONDS = 1.0
+RECONNECT_MAX_SECONDS = 60.0
+
+# Connection factory: (url, timeout) -> object with send(text),
+# recv(timeout) -> Optional[str] (None on timeout) and close()
+Connect = Callable[[str, float], Any]
+# market_ids -> {market_id: YES token id}
+TokenResolver = Callable[[List[str]], Dict[str, str]]
+
+
+# =============================================================================
+# LOCAL ORDER BOOK
+# =============================================================================
+
+
+class OrderBook:
+    """Price levels of one asset (price -> size)."""
+
+    def __init__(self):
+        self.bids: Dict[float, float] = {}
+        self.asks: Dict[float, float] = {}
+        self.updated_at: Optional[float] = None
+
+    def replace(self, bids: Iterable[Dict[str, Any]], asks: Iterable[Dict[str, Any]]) -> None:
+        self.bids = _levels(bids)
+        self.asks = _levels(asks)
+
+    def apply(self, side: str, price: float, size: float) -> None:
+        levels = self.bids if side.upper() == "BUY" else self.asks
+        if size <= 0:
+            levels.pop(price, None)
+        else:
+            levels[price] = size
+
+    def best_bid(self) -> Optional[float]:
+        return max(self.bids) if self.bids else None
+
+    def best_ask(self) -> Optional[float]:
+        return min(self.asks) if self.asks else None
+
+
+def _levels(raw: Iterable[Dict[str, Any]]) -> Dict[float, float]:
+    levels = {}
+    for level in raw or ():
+        try:
+            price, size = float(level["price"]), float(level["size"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if size > 0:
+            levels[price] = size
+    return levels
+
+
+# =============================================================================
+# TRANSPORTS
+# =============================================================================
+
+
+class _WebSocketConnection:
+    """websocket-client connection with a recv() that times out quietly."""
+
+    def __init__(self, url: str, timeout: float):
+        self._ws = websocket.create_connection(url, timeout=timeout)
+
+    def send(self, text: str) -> None:
+        self._ws.send(text)
+
+    def recv(self, timeout: float) -> Optional[str]:
+        self._ws.settimeout(timeout)
+        try:
+            return self._ws.recv()
+        except websocket.WebSocketTimeoutException:
+            return None
+
+    def close(self) -> None:
+        self._ws.close()
+
+
+def websocket_connect(url: str, timeout: float) -> _WebSocketConnection:
+    """Default Connect (requires websocket-client)."""
+    if websocket is None:
+        raise ConnectionError("websocket-client not installed")
+    return _WebSocketConnection(url, timeout)
+
+
+_CLOSED = object()
+
+
+class _LocalConnection:
+    def __init__(self, server: "LocalFeedServer"):
+        self._server = server
+        self._inbox: "queue.Queue" = queue.Queue()
+        self.closed = False
+
+    def send(self, text: str) -> None:
+        if self.closed:
+            raise ConnectionError("connection closed")
+        if text == "PING":
+            self._inbox.put("PONG")
+            return
+        self._server._received(json.loads(text))
+
+    def recv(self, timeout: float) -> Optional[str]:
+        try:
+            item = self._inbox.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if item is _CLOSED:
+            raise ConnectionError("connection closed by server")
+        return item
+
+    def close(self) -> None:
+        self.closed = True
+        self._inbox.put(_CLOSED)
+
+
+class LocalFeedServer:
+    """
+    In-process stand-in for the CLOB market channel.
+
+    Pass server.connect as PriceFeed(connect=...); publish() pushes
+    messages to every open connection, drop_connections() simulates a
+    network failure. Subscription messages are recorded in order.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connections: List[_LocalConnection] = []
+        self._changed = threading.Condition(self._lock)
+        self.subscriptions: List[Dict[str, Any]] = []
+        self.connects = 0
+
+    def connect(self, url: str, timeout: float) -> _LocalConnection:
+        connection = _LocalConnection(self)
+        with self._lock:
+            self._connections.append(connection)
+            self.connects += 1
+        return connection
+
+    def _received(self, message: Dict[str, Any]) -> None:
+        with self._changed:
+            self.subscriptions.append(message)
+            self._changed.notify_all()
+
+    def subscribed_assets(self) -> List[str]:
+        """Assets currently subscribed on the latest connection."""
+        with self._lock:
+            assets: List[str] = []
+            for message in self.subscriptions:
+                if message.get("type") == "market":
+                    assets = list(message.get("assets_ids", []))
+                elif message.get("operation") == "subscribe":
+                    assets += [a for a in message.get("assets_ids", []) if a not in assets]
+                elif message.get("operation") == "unsubscribe":
+                    assets = [a for a in assets if a not in message.get("assets_ids", [])]
+            return assets
+
+    def wait_for_subscriptions(self, count: int, timeout: float = 2.0) -> bool:
+        """Block until at least count subscription messages arrived."""
+        with self._changed:
+            return self._changed.wait_for(lambda: len(self.subscriptions) >= count, timeout)
+
+    def publish(self, message: Any) -> None:
+        text = json.dumps(message)
+        with self._lock:
+            connections = [c for c in self._connections if not c.closed]
+        for connection in connections:
+            connection._inbox.put(text)
+
+    def drop_connections(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+
+
+# =============================================================================
+# TOKEN RESOLUTION
+# =============================================================================
+
+
+def resolve_yes_tokens(market_ids: List[str]) -> Dict[str, str]:
+    """Default TokenResolver: YES token (clobTokenIds[0]) via bulk Gamma lookup."""
+    from collector.client import PolymarketClient
+
+    tokens = {}
+    for market_id, market in PolymarketClient(timeout=15).fetch_markets_by_ids(market_ids).items():
+        raw = market.get("clobTokenIds")
+        try:
+            token_ids = json.loads(raw) if isinstance(raw, str) else raw
+        except ValueError:
+            continue
+        if token_ids:
+            tokens[market_id] = str(token_ids[0])
+    return tokens
+
+
+# =============================================================================
+# PRICE FEED
+# =============================================================================
+
+
+class PriceFeed:
+    """
+    Background subscriber keeping a local book per watched market.
+
+    Thread-safe; listeners are called with the market_id after every
+    top-of-book relevant update (from the feed thread).
+    """
+
+    def __init__(
+        self,
+        url: str = WS_MARKET_URL,
+        connect: Optional[Connect] = None,
+        token_resolver: Optional[TokenResolver] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            url: Market channel URL
+            connect: Connection factory (default: websocket-client;
+                injectable for testing, e.g. LocalFeedServer.connect)
+            token_resolver: market ids -> YES token ids (default: Gamma)
+            clock: Monotonic clock (injectable for testing)
+        """
+        self.url = url
+        self._connect = connect or websocket_connect
+        self._resolve = token_resolver or resolve_yes_tokens
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._market_to_asset: Dict[str, str] = {}
+        self._asset_to_market: Dict[str, str] = {}
+        self._token_cache: Dict[str, str] = {}
+        self._books: Dict[str, OrderBook] = {}
+        self._conn = None
+        self._listeners: List[Callable[[str], None]] = []
+
+        self._connected = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.messages = 0
+        self.reconnects = 0
+
+    # -------------------------------------------------------------------------
+    # LIFECYCLE
+    # -------------------------------------------------------------------------
+
+    def start(self) -> "PriceFeed":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="clob-price-feed", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        with self._lock:
+            conn = self._conn
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    def wait_connected(self, timeout: float) -> bool:
+        return self._connected.wait(timeout)
+
+    def add_listener(self, callback: Callable[[str], None]) -> None:
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str], None]) -> None:
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    # -------------------------------------------------------------------------
+    # WATCHLIST
+    # -------------------------------------------------------------------------
+
+    def watched_markets(self) -> List[str]:
+        with self._lock:
+            return list(self._market_to_asset)
+
+    def set_watchlist(self, market_ids: Iterable[str]) -> None:
+        """Watch exactly these markets (subscribe new, unsubscribe dropped)."""
+        wanted = list(dict.fromkeys(m for m in market_ids if m))
+        with self._lock:
+            dropped = [m for m in self._market_to_asset if m not in wanted]
+        self._unwatch(dropped)
+        self.watch(wanted)
+
+    def watch(self, market_ids: Iterable[str]) -> None:
+        """Add markets to the watchlist (token ids resolved once per market)."""
+        with self._lock:
+            new = [m for m in dict.fromkeys(market_ids) if m and m not in self._market_to_asset]
+            unresolved = [m for m in new if m not in self._token_cache]
+        if not new:
+            return
+        if unresolved:
+            try:
+                resolved = self._resolve(unresolved)
+            except Exception as e:
+                logger.warning(f"Price feed: token resolution failed: {e}")
+                resolved = {}
+            with self._lock:
+                self._token_cache.update(resolved)
+
+        with self._lock:
+            assets = []
+            for market_id in new:
+                asset = self._token_cache.get(market_id)
+                if asset and market_id not in self._market_to_asset:
+                    self._market_to_asset[market_id] = asset
+                    self._asset_to_market[asset] = market_id
+                    assets.append(asset)
+            conn = self._conn
+        if assets and conn is not None:
+            self._send(conn, {"assets_ids": assets, "operation": "subscribe"})
+        if assets:
+            logger.info(f"Price feed: watching {len(assets)} new markets")
+
+    def _unwatch(self, market_ids: List[str]) -> None:
+        with self._lock:
+            assets = []
+            for market_id in market_ids:
+                asset = self._market_to_asset.pop(market_id, None)
+                if asset is not None:
+                    self._asset_to_market.pop(asset, None)
+                    self._books.pop(asset, None)
+                    assets.append(asset)
+            conn = self._conn
+        if assets and conn is not None:
+            self._send(conn, {"assets_ids": assets, "operation": "unsubscribe"})
+
+    # -------------------------------------------------------------------------
+    # READ SIDE
+    # -------------------------------------------------------------------------
+
+    def top_of_book(self, market_id: str) -> Optional[Tuple[Optional[float], Optional[float]]]:
+        """(best_bid, best_ask) of a live book, or None."""
+        with self._lock:
+            if not self._connected.is_set():
+                return None
+            book = self._books.get(self._market_to_asset.get(market_id, ""))
+            if book is None:
+                return None
+            return book.best_bid(), book.best_ask()
+
+    def snapshot(self, market_id: str) -> Optional[MarketSnapshot]:
+        """MarketSnapshot from the live book (None without a two-sided book)."""
+        from paper_trader.snapshot_client import classify_liquidity
+
+        top = self.top_of_book(market_id)
+        if top is None or top[0] is None or top[1] is None:
+            return None
+        best_bid, best_ask = top
+        mid_price = (best_bid + best_ask) / 2
+        spread_pct = ((best_ask - best_bid) / mid_price) * 100 if mid_price > 0 else None
+        return MarketSnapshot(
+            market_id=market_id,
+            snapshot_time=datetime.now().isoformat(),
+            best_bid=best_bid,
+            best_ask=best_ask,
+            mid_price=mid_price,
+            spread_pct=spread_pct,
+            liquidity_bucket=classify_liquidity(spread_pct),
+            # Resolution status only comes from Gamma
+            is_resolved=False,
+            resolved_outcome=None,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "connected": self._connected.is_set(),
+                "watched": len(self._market_to_asset),
+                "books": len(self._books),
+                "messages": self.messages,
+                "reconnects": self.reconnects,
+            }
+
+    # -------------------------------------------------------------------------
+    # FEED THREAD
+    # -------------------------------------------------------------------------
+
+    def _send(self, conn: Any, message: Any) -> None:
+        text = message if isinstance(message, str) else json.dumps(message)
+        try:
+            with self._send_lock:
+                conn.send(text)
+        except Exception as e:
+            # The feed thread notices the broken connection and reconnects
+            logger.debug(f"Price feed send failed: {e}")
+
+    def _run(self) -> None:
+        backoff = RECONNECT_MIN_SECONDS
+        while not self._stop.is_set():
+            try:
+                conn = self._connect(self.url, CONNECT_TIMEOUT_SECONDS)
+            except Exception as e:
+                logger.warning(f"Price feed connect failed: {e} (retry in {backoff:.0f}s)")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, RECONNECT_MAX_SECONDS)
+                continue
+
+            with self._lock:
+                self._conn = conn
+                assets = list(self._asset_to_market)
+            try:
+                with self._send_lock:
+                    conn.send(json.dumps({"assets_ids": assets, "type": "market"}))
+                self._connected.set()
+                logger.info(f"Price feed connected ({len(assets)} markets)")
+                backoff = RECONNECT_MIN_SECONDS
+                last_ping = self._clock()
+
+                while not self._stop.is_set():
+                    if self._clock() - last_ping >= PING_INTERVAL_SECONDS:
+                        with self._send_lock:
+                            conn.send("PING")
+                        last_ping = self._clock()
+                    text = conn.recv(RECV_POLL_SECONDS)
+                    if text is not None:
+                        self._handle(text)
+            except Exception as e:
+                if not self._stop.is_set():
+                    logger.warning(f"Price feed disconnected: {e} (retry in {backoff:.0f}s)")
+            finally:
+                self._connected.clear()
+                with self._lock:
+                    self._conn = None
+                    # Deltas may have been missed: wait for fresh snapshots
+                    self._books.clear()
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
+            if not self._stop.is_set():
+                self.reconnects += 1
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, RECONNECT_MAX_SECONDS)
+
+    def _handle(self, text: str) -> None:
+        if text in ("PONG", ""):
+            return
+        try:
+            payload = json.loads(text)
+        except ValueError:
+            logger.debug(f"Price feed: non-JSON message {text[:80]!r}")
+            return
+
+        updated: List[str] = []
+        with self._lock:
+            self.messages += 1
+            for event in payload if isinstance(payload, list) else [payload]:
+                if isinstance(event, dict):
+                    updated.extend(self._apply(event))
+            listeners = list(self._listeners)
+
+        for market_id in dict.fromkeys(updated):
+            for callback in listeners:
+                try:
+                    callback(market_id)
+                except Exception as e:
+                    logger.warning(f"Price feed listener failed: {e}")
+
+    def _apply(self, event: Dict[str, Any]) -> List[str]:
+        """Apply one event to the books. Caller holds self._lock."""
+        event_type = event.get("event_type")
+        now = self._clock()
+        updated = []
+
+        if event_type == "book":
+            asset = str(event.get("asset_id", ""))
+            market_id = self._asset_to_market.get(asset)
+            if market_id is not None:
+                book = self._books.setdefault(asset, OrderBook())
+                book.replace(event.get("bids") or event.get("buys"), event.get("asks") or event.get("sells"))
+                book.updated_at = now
+                updated.append(market_id)
+
+        elif event_type == "price_change":
+            # Current format: price_changes[] with asset_id per entry;
+            # older format: asset_id on the event with changes[]
+            changes = event.get("price_changes")
+            if changes is None:
+                changes = [dict(c, asset_id=event.get("asset_id")) for c in event.get("changes", [])]
+            for change in changes:
+                asset = str(change.get("asset_id", ""))
+                book = self._books.get(asset)
+                if book is None:
+                    # No snapshot yet: a delta alone is not a book
+                    continue
+                try:
+                    book.apply(str(change.get("side", "")), float(change["price"]), float(change["size"]))
+                except (KeyError, TypeError, ValueError):
+                    continue
+                book.updated_at = now
+                updated.append(self._asset_to_market[asset])
+
+        return updated
+
+
+# =============================================================================
+# MODULE-LEVEL FEED
+# =============================================================================
+
+_price_feed: Optional[PriceFeed] = None
+
+
+def get_price_feed() -> Optional[PriceFeed]:
+    """The running price feed, or None if none was started."""
+    return _price_feed
+
+
+def start_price_feed(
+    connect: Optional[Connect] = None,
+    token_resolver: Optional[TokenResolver] = None,
+) -> Optional[PriceFeed]:
+    """
+    Start the process-wide feed and attach it to the snapshot client.
+
+    Returns None (Gamma-only snapshots) if websocket-client is missing and
+    no connect factory is given.
+    """
+    global _price_feed
+    if _price_feed is not None:
+        return _price_feed
+    if connect is None and websocket is None:
+        logger.info("Price feed disabled: websocket-client not installed (Gamma snapshots only)")
+        return None
+
+    from paper_trader.snapshot_client import get_snapshot_client
+
+    _price_feed = PriceFeed(connect=connect, token_resolver=token_resolver).start()
+    get_snapshot_client().attach_price_feed(_price_feed)
+    return _price_feed
+
+
+def stop_price_feed() -> None:
+    """Stop the process-wide feed and detach it from the snapshot client."""
+    global _price_feed
+    if _price_feed is None:
+        return
+    from paper_trader.snapshot_client import get_snapshot_client
+
+    get_snapshot_client().attach_price_feed(None)
+    _price_feed.stop()
+    _price_feed = None
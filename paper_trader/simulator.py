@@ -25,7 +25,7 @@ import sys
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple, Final
+from typing import Dict, Optional, Tuple, Final
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -51,6 +51,7 @@ from paper_trader.capital_manager import (
 )
 from paper_trader.kelly import kelly_size, FALLBACK_POSITION_EUR
 from paper_trader.drawdown_protector import check_can_open_position
+from paper_trader.state_lock import get_position_state_lock
 
 
 logger = logging.getLogger(__name__)
@@ -131,7 +132,8 @@ class ExecutionSimulator:
 
     def simulate_entry(
         self,
-        proposal: Proposal
+        proposal: Proposal,
+        snapshots: Optional[Dict[str, MarketSnapshot]] = None,
     ) -> Tuple[Optional[PaperPosition], PaperTradeRecord]:
         """
         Simulate entering a paper position.
@@ -141,13 +143,32 @@ class ExecutionSimulator:
         - Applies conservative slippage
         - If snapshot unavailable, returns SKIP record
 
+        The snapshot is fetched before the position state lock is taken;
+        limit checks, capital allocation and logging run under it.
+
         Args:
             proposal: The proposal to simulate entry for
+            snapshots: Prefetched snapshots (market_id -> snapshot; a missing
+                market counts as no snapshot). None = fetch here.
 
         Returns:
             Tuple of (PaperPosition or None, PaperTradeRecord)
             Position is None if entry was skipped.
         """
+        if snapshots is not None:
+            snapshot = snapshots.get(proposal.market_id)
+        else:
+            snapshot = get_market_snapshot(proposal.market_id)
+
+        with get_position_state_lock():
+            return self._enter(proposal, snapshot)
+
+    def _enter(
+        self,
+        proposal: Proposal,
+        snapshot: Optional[MarketSnapshot],
+    ) -> Tuple[Optional[PaperPosition], PaperTradeRecord]:
+        """Entry decision for a fetched snapshot (caller holds the position state lock)."""
         now = datetime.now().isoformat()
 
         # Check position limit BEFORE attempting entry
@@ -251,9 +272,7 @@ class ExecutionSimulator:
                 logger.warning(f"SKIP: {skip_reason} for {proposal.market_id}")
                 return (None, record)
 
-        # Get market snapshot - or create simulated one from proposal
-        snapshot = get_market_snapshot(proposal.market_id)
-
+        # No market snapshot: create simulated one from proposal
         if snapshot is None:
             # Create simulated snapshot from proposal price data
             implied_prob = proposal.implied_probability
@@ -663,9 +682,12 @@ def get_simulator() -> ExecutionSimulator:
     return _simulator
 
 
-def simulate_entry(proposal: Proposal) -> Tuple[Optional[PaperPosition], PaperTradeRecord]:
+def simulate_entry(
+    proposal: Proposal,
+    snapshots: Optional[Dict[str, MarketSnapshot]] = None,
+) -> Tuple[Optional[PaperPosition], PaperTradeRecord]:
     """Convenience function to simulate entry."""
-    return get_simulator().simulate_entry(proposal)
+    return get_simulator().simulate_entry(proposal, snapshots)
 
 
 def simulate_exit_market(
@@ -15,23 +15,37 @@
 #   Polymarket API → collector/client → snapshot_client → paper_trader logs
 #   ❌ NO FLOW to core_analyzer (Layer 1)
 #
+# SNAPSHOT CACHE:
+# Mid-trade exits, edge reversal, averaging down, entries and resolution
+# checks all ask for the same open positions within one run. Snapshots are
+# cached per market for a short TTL (SNAPSHOT_CACHE_TTL_SECONDS), and
+# concurrent requests for a market share one in-flight fetch. The
+# orchestrator clears the cache at every pipeline start
+# (reset_snapshot_cache). Callers that poll more often than the TTL (the
+# exit monitor) pass max_age_seconds to cap the age of served entries.
+#
+# LIVE SOURCE:
+# With a running CLOB price feed (paper_trader/price_feed.py) attached,
+# markets with a live book are answered from it without any request;
+# live=False forces Gamma (resolution status is only known there).
+#
 # =============================================================================
 
 import sys
 import json
 import logging
-import ssl
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
-from urllib.parse import urlencode, quote
+from typing import Callable, Optional, Dict, Any, List, Tuple
+from urllib.parse import quote
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from collector.client import PolymarketClient
+from shared.http_transport import get_http_transport
 from paper_trader.models import MarketSnapshot, LiquidityBucket
 
 logger = logging.getLogger(__name__)
@@ -46,6 +60,13 @@ SPREAD_HIGH_THRESHOLD = 2.0    # < 2% spread = HIGH liquidity
 SPREAD_MEDIUM_THRESHOLD = 5.0  # 2-5% spread = MEDIUM liquidity
 # > 5% spread = LOW liquidity
 
+# Lifetime of a cached snapshot: covers one paper trader step. Frequent
+# pollers cap it per call (max_age_seconds).
+SNAPSHOT_CACHE_TTL_SECONDS = 60.0
+
+# Max wait for another caller's in-flight fetch of the same market
+INFLIGHT_WAIT_SECONDS = 60.0
+
 
 def classify_liquidity(spread_pct: Optional[float]) -> str:
     """
@@ -91,22 +112,143 @@ class MarketSnapshotClient:
 
     GAMMA_API_BASE = "https://gamma-api.polymarket.com"
 
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_retries: int = 3,
+        cache_ttl_seconds: float = SNAPSHOT_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Initialize the snapshot client.
 
         Args:
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
+            cache_ttl_seconds: Snapshot cache lifetime (0 disables caching)
+            clock: Monotonic clock (injectable for testing)
         """
         self._client = PolymarketClient(
             timeout=timeout,
             max_retries=max_retries
         )
         self._timeout = timeout
-        self._ssl_context = ssl.create_default_context()
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # market_id -> (stored_at, snapshot or None = not found)
+        self._cache: Dict[str, Tuple[float, Optional[MarketSnapshot]]] = {}
+        self._inflight: Dict[str, threading.Event] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._price_feed = None
         logger.info("MarketSnapshotClient initialized (READ-ONLY, Gamma API)")
 
+    def attach_price_feed(self, feed: Optional[Any]) -> None:
+        """Use a PriceFeed as zero-latency source (None detaches)."""
+        self._price_feed = feed
+
+    def _live_snapshots(self, market_ids: List[str]) -> Dict[str, MarketSnapshot]:
+        """Snapshots from the live order books, for markets that have one."""
+        feed = self._price_feed
+        if feed is None:
+            return {}
+        live = {}
+        for market_id in market_ids:
+            snapshot = feed.snapshot(market_id)
+            if snapshot is not None:
+                live[market_id] = snapshot
+        return live
+
+    # -------------------------------------------------------------------------
+    # CACHE
+    # -------------------------------------------------------------------------
+
+    def _cached(
+        self,
+        market_id: str,
+        max_age_seconds: Optional[float] = None,
+    ) -> Tuple[bool, Optional[MarketSnapshot]]:
+        """Fresh cache entry for market_id. Caller holds self._lock."""
+        entry = self._cache.get(market_id)
+        if entry is None:
+            return False, None
+        stored_at, snapshot = entry
+        age = self._clock() - stored_at
+        if age > self.cache_ttl_seconds:
+            del self._cache[market_id]
+            return False, None
+        if max_age_seconds is not None and age > max_age_seconds:
+            # Still fresh for other callers; this one refetches
+            return False, None
+        return True, snapshot
+
+    def _get_coalesced(
+        self,
+        market_ids: List[str],
+        fetch: Callable[[List[str]], Dict[str, Optional[MarketSnapshot]]],
+        max_age_seconds: Optional[float] = None,
+    ) -> Dict[str, Optional[MarketSnapshot]]:
+        """
+        Serve market_ids from the cache; fetch the rest with ONE call to
+        fetch(), unless another thread is already fetching a market - then
+        wait for its result instead of requesting it again.
+
+        fetch() returns market_id -> snapshot (None = not found); ids it
+        omits failed and are not cached. max_age_seconds caps the age of
+        cache entries served to this call.
+        """
+        results: Dict[str, Optional[MarketSnapshot]] = {}
+        to_fetch: List[str] = []
+        waiting: Dict[str, threading.Event] = {}
+
+        with self._lock:
+            for market_id in dict.fromkeys(market_ids):
+                found, snapshot = self._cached(market_id, max_age_seconds)
+                if found:
+                    results[market_id] = snapshot
+                    self.cache_hits += 1
+                elif market_id in self._inflight:
+                    waiting[market_id] = self._inflight[market_id]
+                else:
+                    self._inflight[market_id] = threading.Event()
+                    to_fetch.append(market_id)
+                    self.cache_misses += 1
+
+        if to_fetch:
+            fetched: Dict[str, Optional[MarketSnapshot]] = {}
+            try:
+                fetched = fetch(to_fetch)
+            finally:
+                now = self._clock()
+                with self._lock:
+                    for market_id in to_fetch:
+                        if market_id in fetched and self.cache_ttl_seconds > 0:
+                            self._cache[market_id] = (now, fetched[market_id])
+                        self._inflight.pop(market_id).set()
+            for market_id in to_fetch:
+                results[market_id] = fetched.get(market_id)
+
+        for market_id, done in waiting.items():
+            done.wait(INFLIGHT_WAIT_SECONDS)
+            with self._lock:
+                found, results[market_id] = self._cached(market_id, max_age_seconds)
+                if found:
+                    self.cache_hits += 1
+
+        return {market_id: results.get(market_id) for market_id in market_ids}
+
+    def clear_cache(self) -> None:
+        """Drop cached snapshots (in-flight fetches are unaffected)."""
+        with self._lock:
+            self._cache.clear()
+            self.cache_hits = 0
+            self.cache_misses = 0
+
+    def cache_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._cache), "hits": self.cache_hits, "misses": self.cache_misses}
+
     def _fetch_gamma_market(self, market_id: str) -> Optional[Dict[str, Any]]:
         """
         Fetch a single market directly from Gamma API.
@@ -119,44 +261,38 @@ class MarketSnapshotClient:
         """
         # Try fetching by condition_id (slug-based lookup)
         url = f"{self.GAMMA_API_BASE}/markets?id={quote(market_id)}&limit=1"
-        try:
-            request = Request(url, headers={
-                "User-Agent": "PolymarketBeobachter/2.0",
-                "Accept": "application/json",
-            })
-            with urlopen(request, timeout=self._timeout, context=self._ssl_context) as response:
-                data = json.loads(response.read().decode("utf-8"))
-                if isinstance(data, list) and data:
-                    return data[0]
-                elif isinstance(data, dict):
-                    return data
-        except Exception as e:
-            logger.debug(f"Gamma API direct fetch failed for {market_id}: {e}")
+        response = get_http_transport().get(url, timeout=self._timeout, source="gamma")
+        if not response.ok:
+            logger.debug(f"Gamma API direct fetch failed for {market_id}: {response.error}")
+            return None
+
+        data = response.data
+        if isinstance(data, list) and data:
+            return data[0]
+        elif isinstance(data, dict):
+            return data
         return None
 
     def _fetch_gamma_markets_batch(self, market_ids: List[str]) -> Dict[str, Dict[str, Any]]:
         """
         Fetch multiple markets from Gamma API.
 
+        Bulk /markets requests with many ids each (chunked by the
+        collector client), instead of one request per market.
+
         Args:
             market_ids: List of market IDs
 
         Returns:
             Dict mapping market_id to market data
         """
-        results = {}
-        # Gamma API supports filtering - fetch in batches
         try:
-            all_markets = self._client.fetch_all_markets(max_markets=500)
-            for m in all_markets:
-                mid = m.get("id") or m.get("condition_id") or ""
-                if mid in market_ids:
-                    results[mid] = m
+            return self._client.fetch_markets_by_ids(market_ids)
         except Exception as e:
             logger.debug(f"Gamma batch fetch failed: {e}")
-        return results
+            return {}
 
-    def get_snapshot(self, market_id: str) -> Optional[MarketSnapshot]:
+    def get_snapshot(self, market_id: str, live: bool = True) -> Optional[MarketSnapshot]:
         """
         Get a price snapshot for a specific market.
 
@@ -169,10 +305,20 @@ class MarketSnapshotClient:
 
         Args:
             market_id: The market ID to fetch
+            live: Prefer the live price feed (if attached)
 
         Returns:
             MarketSnapshot if available, None otherwise
         """
+        if live:
+            snapshot = self._live_snapshots([market_id]).get(market_id)
+            if snapshot is not None:
+                return snapshot
+        return self._get_coalesced([market_id], self._fetch_single)[market_id]
+
+    def _fetch_single(self, market_ids: List[str]) -> Dict[str, Optional[MarketSnapshot]]:
+        """Fetch one market (direct lookup, paginated fallback) for the cache."""
+        market_id = market_ids[0]
         try:
             # Try direct Gamma API fetch first (fast, single market)
             market_data = self._fetch_gamma_market(market_id)
@@ -187,55 +333,80 @@ class MarketSnapshotClient:
 
             if market_data is None:
                 logger.warning(f"Market not found: {market_id}")
-                return None
+                return {market_id: None}
 
-            return self._create_snapshot(market_data)
+            return {market_id: self._create_snapshot(market_data)}
 
         except ConnectionError as e:
             logger.warning(f"Network error getting snapshot for {market_id}: {e} (transient)")
-            return None
+            return {}
         except TimeoutError as e:
             logger.warning(f"Timeout getting snapshot for {market_id}: {e} (transient)")
-            return None
+            return {}
         except ValueError as e:
             logger.error(f"Data parsing error for {market_id}: {e} (permanent)")
-            return None
+            return {}
         except Exception as e:
             logger.error(f"Unexpected error getting snapshot for {market_id}: {e}", exc_info=True)
-            return None
+            return {}
 
     def get_snapshots_batch(
         self,
-        market_ids: List[str]
+        market_ids: List[str],
+        live: bool = True,
+        max_age_seconds: Optional[float] = None,
     ) -> Dict[str, Optional[MarketSnapshot]]:
         """
-        Get price snapshots for multiple markets by fetching each individually.
+        Get price snapshots for multiple markets.
 
-        Uses direct Gamma API lookups per market ID to ensure weather markets
-        (which are typically not in the top-500) are found reliably.
+        Looks the ids up directly (bulk Gamma requests, MARKETS_BATCH_SIZE
+        ids each) so weather markets - typically not in the top-500 - are
+        found reliably: 200 markets take 4 requests instead of 200.
+        Markets fetched within the cache TTL are not requested again.
 
         Args:
             market_ids: List of market IDs to fetch
+            live: Prefer the live price feed (if attached)
+            max_age_seconds: Refetch cached snapshots older than this
+                (None = cache TTL)
 
         Returns:
             Dictionary mapping market_id to MarketSnapshot (or None)
         """
-        results = {}
+        live_snapshots = self._live_snapshots(market_ids) if live else {}
+        remaining = [m for m in market_ids if m not in live_snapshots]
+        fetched = (
+            self._get_coalesced(remaining, self._fetch_batch, max_age_seconds) if remaining else {}
+        )
+        results = {
+            market_id: live_snapshots[market_id] if market_id in live_snapshots else fetched.get(market_id)
+            for market_id in market_ids
+        }
+
+        found = sum(1 for v in results.values() if v is not None)
+        logger.info(f"Batch snapshots: {found}/{len(market_ids)} found")
+
+        return results
+
+    def _fetch_batch(self, market_ids: List[str]) -> Dict[str, Optional[MarketSnapshot]]:
+        """Bulk-fetch snapshots for the cache (errors are left out, not cached)."""
+        results: Dict[str, Optional[MarketSnapshot]] = {}
+        try:
+            markets = self._client.fetch_markets_by_ids(market_ids)
+        except Exception as e:
+            logger.warning(f"Batch snapshot fetch failed: {e}")
+            return results
 
         for market_id in market_ids:
+            market_data = markets.get(market_id)
+            if market_data is None:
+                results[market_id] = None
+                logger.debug(f"Market not found: {market_id}")
+                continue
             try:
-                market_data = self._fetch_gamma_market(market_id)
-                if market_data:
-                    results[market_id] = self._create_snapshot(market_data)
-                else:
-                    results[market_id] = None
-                    logger.debug(f"Market not found: {market_id}")
+                results[market_id] = self._create_snapshot(market_data)
             except Exception as e:
-                logger.warning(f"Error fetching snapshot for {market_id}: {e}")
-                results[market_id] = None
-
-        found = sum(1 for v in results.values() if v is not None)
-        logger.info(f"Batch snapshots: {found}/{len(market_ids)} found")
+                logger.warning(f"Error creating snapshot for {market_id}: {e}")
 
         return results
 
@@ -374,11 +545,23 @@ def get_snapshot_client() -> MarketSnapshotClient:
     return _snapshot_client
 
 
-def get_market_snapshot(market_id: str) -> Optional[MarketSnapshot]:
+def reset_snapshot_cache() -> None:
+    """Drop cached snapshots. Call at the start of a pipeline run."""
+    if _snapshot_client is not None:
+        _snapshot_client.clear_cache()
+
+
+def get_market_snapshot(market_id: str, live: bool = True) -> Optional[MarketSnapshot]:
     """Convenience function to get a single market snapshot."""
-    return get_snapshot_client().get_snapshot(market_id)
+    return get_snapshot_client().get_snapshot(market_id, live=live)
 
 
-def get_market_snapshots(market_ids: List[str]) -> Dict[str, Optional[MarketSnapshot]]:
+def get_market_snapshots(
+    market_ids: List[str],
+    live: bool = True,
+    max_age_seconds: Optional[float] = None,
+) -> Dict[str, Optional[MarketSnapshot]]:
     """Convenience function to get multiple market snapshots."""
-    return get_snapshot_client().get_snapshots_batch(market_ids)
+    return get_snapshot_client().get_snapshots_batch(
+        market_ids, live=live, max_age_seconds=max_age_seconds
+    )
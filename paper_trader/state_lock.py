@@ -0,0 +1,168 @@
+# =============================================================================
+# POLYMARKET BEOBACHTER - POSITION STATE LOCK
+# =============================================================================
+#
+# GOVERNANCE INTENT:
+# One lock around every read-modify-write of paper trading state:
+# - data/capital_config.json      (CapitalManager)
+# - data/tp_state.json            (PositionManager TP/trailing state)
+# - logs/paper_positions.jsonl    (PaperTradingLogger)
+#
+# Holders: the apply phase of the paper trader functions - entries
+# (simulator), TP/SL/trailing and resolution exits (position_manager),
+# edge reversal exits and averaging down - called by the 15-minute
+# pipeline and by the fast exit monitor (cockpit.py --exit-monitor, a
+# scheduler thread or its own process). Snapshots and forecasts are
+# fetched BEFORE the lock is taken; holders re-read open positions
+# under it.
+#
+# LOCKING:
+# - In-process: threading.RLock (reentrant, the pipeline step may call
+#   helpers that lock again)
+# - Cross-process: exclusive OS lock on data/position_state.lock
+#   (fcntl.flock on POSIX, msvcrt.locking on Windows), taken by the
+#   outermost holder only. Without either module the lock is
+#   in-process only.
+#
+# The lock file itself is never deleted; the OS releases the lock when
+# the holding process dies.
+#
+# =============================================================================
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import IO, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+logger = logging.getLogger(__name__)
+
+POSITION_STATE_LOCK_PATH = Path(__file__).parent.parent / "data" / "position_state.lock"
+
+# Retry interval while another process holds the file lock
+LOCK_POLL_SECONDS = 0.05
+# Waits longer than this are logged (the other holder is a full pipeline step)
+SLOW_WAIT_SECONDS = 1.0
+
+
+def _try_lock_file(fh: IO) -> bool:
+    """Non-blocking exclusive lock on fh; True if acquired."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        elif msvcrt is not None:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock_file(fh: IO) -> None:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+    except OSError as e:
+        logger.debug(f"Position state unlock failed: {e}")
+
+
+class PositionStateLock:
+    """
+    Reentrant lock shared by threads and processes.
+
+    Usage:
+        with get_position_state_lock():
+            ...  # capital / positions / TP state
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else POSITION_STATE_LOCK_PATH
+        self._thread_lock = threading.RLock()
+        # Nesting depth of the owning thread; only touched while holding _thread_lock
+        self._depth = 0
+        self._fh: Optional[IO] = None
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire the lock (blocking; timeout in seconds, None = forever).
+
+        Returns:
+            True if acquired, False on timeout
+        """
+        start = time.monotonic()
+        if not self._thread_lock.acquire(timeout=-1 if timeout is None else max(0.0, timeout)):
+            return False
+        if self._depth == 0:
+            try:
+                acquired = self._lock_file(None if timeout is None else start + timeout)
+            except BaseException:
+                self._thread_lock.release()
+                raise
+            if not acquired:
+                self._thread_lock.release()
+                return False
+            waited = time.monotonic() - start
+            if waited > SLOW_WAIT_SECONDS:
+                logger.info(f"Position state lock acquired after {waited:.1f}s")
+        self._depth += 1
+        return True
+
+    def release(self) -> None:
+        if self._depth <= 0:
+            raise RuntimeError("Position state lock released without being held")
+        self._depth -= 1
+        if self._depth == 0 and self._fh is not None:
+            _unlock_file(self._fh)
+            self._fh.close()
+            self._fh = None
+        self._thread_lock.release()
+
+    def _lock_file(self, deadline: Optional[float]) -> bool:
+        if fcntl is None and msvcrt is None:
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fh = open(self.path, "a+")
+        while not _try_lock_file(fh):
+            if deadline is not None and time.monotonic() >= deadline:
+                fh.close()
+                return False
+            time.sleep(LOCK_POLL_SECONDS)
+        self._fh = fh
+        return True
+
+    def __enter__(self) -> "PositionStateLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+
+# =============================================================================
+# MODULE-LEVEL FUNCTIONS
+# =============================================================================
+
+_state_lock: Optional[PositionStateLock] = None
+_state_lock_guard = threading.Lock()
+
+
+def get_position_state_lock() -> PositionStateLock:
+    """Get the process-wide position state lock."""
+    global _state_lock
+    with _state_lock_guard:
+        if _state_lock is None:
+            _state_lock = PositionStateLock()
+        return _state_lock
@@ -12,10 +12,18 @@ from .enums import (
     ObservationOutcome,
 )
 from .logging_config import setup_logging
+from .rate_limiter import RateLimiter, get_rate_limiter
+from .http_transport import HttpTransport, get_http_transport
+from .keyword_matcher import KeywordMatcher
 
 __all__ = [
     "ConfidenceLevel",
     "WeatherValidationResult",
     "ObservationOutcome",
     "setup_logging",
+    "RateLimiter",
+    "get_rate_limiter",
+    "HttpTransport",
+    "get_http_transport",
+    "KeywordMatcher",
 ]
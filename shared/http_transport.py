@@ -0,0 +1,380 @@
+# =============================================================================
+# WEATHER OBSERVER - SHARED HTTP TRANSPORT
+# =============================================================================
+#
+# One GET path for ALL outbound HTTP (Gamma API, forecast providers, NOAA).
+#
+# - requests.Session with pooled keep-alive connections per host
+# - gzip/deflate negotiated and decoded transparently
+# - ETag / Last-Modified conditional GETs: unchanged resources come back
+#   as 304 and are served from a small in-memory ValidatorStore
+# - Unified timeouts, retries with exponential backoff (network errors,
+#   429, 5xx; other 4xx fail immediately)
+# - Paced by shared.rate_limiter (token bucket + circuit breaker per host)
+# - Every attempt is recorded in shared.metrics (latency, bytes, status)
+#
+# Both layers MAY import from shared/.
+# =============================================================================
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .metrics import get_metrics_registry
+from .rate_limiter import RateLimiter, get_rate_limiter, host_of
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# DEFAULTS
+# =============================================================================
+
+DEFAULT_TIMEOUT = 15          # seconds per attempt
+DEFAULT_MAX_ATTEMPTS = 2      # 1 retry
+INITIAL_BACKOFF = 0.5         # seconds
+MAX_BACKOFF = 8.0             # seconds
+POOL_CONNECTIONS = 16         # hosts with a cached pool
+POOL_MAXSIZE = 32             # keep-alive connections per host
+USER_AGENT = "PolymarketBeobachter/2.0"
+
+# Validator store bounds: only small, frequently polled resources.
+# The byte budget caps the raw bodies held in total (LRU evicted), so
+# a long-running scheduler never holds entries x max body in memory.
+VALIDATOR_MAX_ENTRIES = 512
+VALIDATOR_MAX_BODY_BYTES = 2_000_000
+VALIDATOR_MAX_TOTAL_BYTES = 48_000_000
+
+
+# =============================================================================
+# RESPONSE
+# =============================================================================
+
+
+@dataclass
+class HttpResponse:
+    """
+    Result of a transport GET.
+
+    status is 0 when no HTTP response was received (network error or
+    the rate limiter refused the request).
+    """
+    url: str
+    status: int
+    data: Any = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    not_modified: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and (200 <= self.status < 300 or self.not_modified)
+
+
+# =============================================================================
+# VALIDATOR STORE (ETag / Last-Modified)
+# =============================================================================
+
+
+class ValidatorStore:
+    """
+    Bounded LRU of url -> (etag, last_modified, raw body).
+
+    The raw body is kept (not the parsed object) so every 304 hands the
+    caller a fresh, independently mutable copy. Bounded by entry count
+    AND by the total size of the stored bodies.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = VALIDATOR_MAX_ENTRIES,
+        max_body_bytes: int = VALIDATOR_MAX_BODY_BYTES,
+        max_total_bytes: int = VALIDATOR_MAX_TOTAL_BYTES,
+    ):
+        self.max_entries = max_entries
+        self.max_body_bytes = min(max_body_bytes, max_total_bytes)
+        self.max_total_bytes = max_total_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[Optional[str], Optional[str], bytes]]" = OrderedDict()
+        self._total_bytes = 0
+        self._revalidated = 0
+
+    def get(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], bytes]]:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since for a stored url ({} if none)."""
+        entry = self.get(url)
+        if entry is None:
+            return {}
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def put(self, url: str, etag: Optional[str], last_modified: Optional[str], body: bytes) -> None:
+        if not (etag or last_modified) or len(body) > self.max_body_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(url, None)
+            if previous is not None:
+                self._total_bytes -= len(previous[2])
+            self._entries[url] = (etag, last_modified, body)
+            self._total_bytes += len(body)
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_total_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted[2])
+
+    def discard(self, url: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(url, None)
+            if entry is not None:
+                self._total_bytes -= len(entry[2])
+
+    def mark_revalidated(self) -> None:
+        with self._lock:
+            self._revalidated += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            self._revalidated = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "revalidated": self._revalidated,
+            }
+
+
+# =============================================================================
+# TRANSPORT
+# =============================================================================
+
+
+class HttpTransport:
+    """
+    Shared JSON-over-HTTP GET client.
+
+    Thread-safe for concurrent GETs (urllib3 connection pool).
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        session: Optional[requests.Session] = None,
+        validators: Optional[ValidatorStore] = None,
+        limiter: Optional[RateLimiter] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            timeout: Default per-attempt timeout in seconds
+            max_attempts: Default attempts per request (>= 1)
+            session: requests.Session (injectable for testing)
+            validators: ETag/Last-Modified store (default: new bounded store)
+            limiter: Rate limiter (default: process-wide limiter at call time)
+            sleep: Sleep function for backoff (injectable for testing)
+        """
+        self.timeout = timeout
+        self.max_attempts = max(1, max_attempts)
+        self.validators = validators if validators is not None else ValidatorStore()
+        self._limiter = limiter
+        self._sleep = sleep
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        session.headers.update({
+            "User-Agent": USER_AGENT,
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+        })
+        self._session = session
+
+    @property
+    def limiter(self) -> RateLimiter:
+        return self._limiter if self._limiter is not None else get_rate_limiter()
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        conditional: bool = True,
+        source: Optional[str] = None,
+    ) -> HttpResponse:
+        """
+        GET a JSON resource.
+
+        Args:
+            url: Absolute URL
+            params: Query parameters (appended to url; lists repeat the key)
+            headers: Extra request headers (override defaults)
+            timeout: Per-attempt timeout (default: transport timeout)
+            max_attempts: Attempts incl. the first (default: transport setting)
+            conditional: Send stored validators and accept 304
+            source: Metrics label (default: host of url)
+
+        Returns:
+            HttpResponse (never raises)
+        """
+        if params:
+            # doseq: list values become repeated keys (?id=1&id=2)
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(params, doseq=True)}"
+        timeout = timeout if timeout is not None else self.timeout
+        attempts = max(1, max_attempts if max_attempts is not None else self.max_attempts)
+        limiter = self.limiter
+        metrics = get_metrics_registry()
+        label = source or host_of(url)
+
+        request_headers = dict(headers or {})
+        if conditional:
+            request_headers.update(self.validators.conditional_headers(url))
+
+        backoff = INITIAL_BACKOFF
+        status = 0
+        last_error: Optional[str] = None
+        refetched = False
+
+        attempt = 0
+        while attempt < attempts:
+            attempt += 1
+            if not limiter.acquire(url):
+                metrics.record_cache(label, "rejected")
+                return HttpResponse(url=url, status=0, error="rate limiter refused request (circuit open)")
+
+            started = time.perf_counter()
+            try:
+                resp = self._session.get(url, headers=request_headers, timeout=timeout)
+            except requests.RequestException as e:
+                metrics.record_request(label, time.perf_counter() - started, success=False)
+                limiter.record(url, None)
+                status, last_error = 0, str(e)
+                logger.debug(f"GET {url[:80]} attempt {attempt} failed: {e}")
+            else:
+                elapsed = time.perf_counter() - started
+                status = resp.status_code
+                limiter.record(url, status, resp.headers.get("Retry-After"))
+
+                if status == 304 and conditional:
+                    cached = self.validators.get(url)
+                    metrics.record_request(
+                        label, elapsed, success=cached is not None, cache_status="not_modified",
+                    )
+                    if cached is not None:
+                        self.validators.mark_revalidated()
+                        return HttpResponse(
+                            url=resp.url or url, status=304, data=json.loads(cached[2]),
+                            headers=dict(resp.headers), not_modified=True,
+                        )
+                    # Body evicted after the validators were sent: drop them
+                    # and re-request unconditionally at once (not counted as
+                    # an attempt), otherwise every retry gets the same 304
+                    self.validators.discard(url)
+                    request_headers.pop("If-None-Match", None)
+                    request_headers.pop("If-Modified-Since", None)
+                    if not refetched:
+                        refetched = True
+                        attempt -= 1
+                        continue
+                    last_error = "304 without stored body"
+                elif 200 <= status < 300:
+                    body = resp.content
+                    try:
+                        data = json.loads(body) if body else None
+                    except ValueError as e:
+                        metrics.record_request(label, elapsed, success=False, payload_bytes=len(body))
+                        last_error = f"invalid JSON: {e}"
+                    else:
+                        metrics.record_request(label, elapsed, success=True, payload_bytes=len(body))
+                        if conditional:
+                            self.validators.put(
+                                url, resp.headers.get("ETag"), resp.headers.get("Last-Modified"), body
+                            )
+                        return HttpResponse(
+                            url=resp.url or url, status=status, data=data, headers=dict(resp.headers),
+                        )
+                elif status == 429:
+                    # The limiter already blocks the host until Retry-After
+                    metrics.record_request(label, elapsed, success=False)
+                    last_error = "HTTP 429"
+                    continue
+                elif 400 <= status < 500:
+                    metrics.record_request(label, elapsed, success=False)
+                    return HttpResponse(
+                        url=resp.url or url, status=status, headers=dict(resp.headers),
+                        error=f"HTTP {status}",
+                    )
+                else:
+                    metrics.record_request(label, elapsed, success=False)
+                    last_error = f"HTTP {status}"
+                logger.debug(f"GET {url[:80]} attempt {attempt}: {last_error}")
+
+            if attempt < attempts:
+                self._sleep(min(backoff, MAX_BACKOFF))
+                backoff *= 2
+
+        return HttpResponse(url=url, status=status, error=last_error or "request failed")
+
+    def get_json(self, url: str, **kwargs) -> Optional[Any]:
+        """GET and return parsed JSON, or None on any failure."""
+        response = self.get(url, **kwargs)
+        return response.data if response.ok else None
+
+    def close(self) -> None:
+        self._session.close()
+
+
+_transport: Optional[HttpTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_http_transport() -> HttpTransport:
+    """Return the process-wide transport (created on first use)."""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = HttpTransport()
+        return _transport
+
+
+def reset_http_transport() -> None:
+    """Close and drop the process-wide transport (tests)."""
+    global _transport
+    with _transport_lock:
+        if _transport is not None:
+            _transport.close()
+        _transport = None
+
+
+__all__ = [
+    "HttpResponse",
+    "HttpTransport",
+    "ValidatorStore",
+    "get_http_transport",
+    "reset_http_transport",
+]
@@ -0,0 +1,114 @@
+# =============================================================================
+# WEATHER OBSERVER - KEYWORD MATCHER
+# =============================================================================
+#
+# Precompiled multi-keyword matcher: finds ALL keywords of a set in one
+# pass over the text instead of one re.search per keyword.
+#
+# - The keyword set is compiled into a single trie-shaped regex
+#   alternation (shared prefixes are tested once per position)
+# - Word-boundary mode reproduces r'\b' + re.escape(kw) + r'\b' exactly:
+#   a zero-width lookahead reports overlapping hits ("highest temperature"
+#   AND "temperature"), and keywords that are word-prefixes of a longer
+#   hit at the same position ("record" in "record high") are added from a
+#   precomputed table
+# - Substring mode reproduces `kw in text`
+#
+# Cost: linear in text length (times the longest keyword), independent
+# of the number of keywords.
+#
+# Both layers MAY import from shared/.
+# =============================================================================
+
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _boundary_at(text: str, index: int) -> bool:
+    """re's \\b semantics between text[index-1] and text[index]."""
+    before = index > 0 and _is_word(text[index - 1])
+    after = index < len(text) and _is_word(text[index])
+    return before != after
+
+
+def _trie_regex(keywords: Iterable[str]) -> str:
+    """Alternation regex shaped like a trie; longer alternatives are tried first."""
+    trie: Dict = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node: Dict) -> str:
+        branches = [
+            re.escape(ch) + build(child)
+            for ch, child in sorted(node.items())
+            if ch != ""
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # Keyword ends here: greedy optional tries the longer one first
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    Finds which keywords of a fixed set occur in a text.
+
+    Keywords are matched case-insensitively (stored lower-case).
+    """
+
+    def __init__(self, keywords: Iterable[str], word_boundary: bool = True):
+        self.keywords: Set[str] = {k.lower() for k in keywords if k}
+        self.word_boundary = word_boundary
+
+        alternation = _trie_regex(self.keywords)
+        if not self.keywords:
+            self._pattern = None
+        elif word_boundary:
+            self._pattern = re.compile(r"(?=\b(" + alternation + r")\b)", re.IGNORECASE)
+        else:
+            self._pattern = re.compile(r"(?=(" + alternation + r"))", re.IGNORECASE)
+
+        # Shorter keywords that also match wherever a longer one matches
+        self._implied: Dict[str, List[str]] = {}
+        for longer in self.keywords:
+            implied = [
+                shorter for shorter in self.keywords
+                if shorter != longer and longer.startswith(shorter)
+                and (not word_boundary or _boundary_at(longer, len(shorter)))
+            ]
+            if implied:
+                self._implied[longer] = sorted(implied, key=len, reverse=True)
+
+    def find_all(self, text: str) -> List[str]:
+        """All keywords occurring in text, in order of first occurrence."""
+        if self._pattern is None or not text:
+            return []
+        found: Dict[str, None] = {}
+        for match in self._pattern.finditer(text):
+            keyword = match.group(1).lower()
+            found.setdefault(keyword)
+            for shorter in self._implied.get(keyword, ()):
+                found.setdefault(shorter)
+        return list(found)
+
+    def first(self, text: str) -> Optional[str]:
+        """Leftmost keyword in text (longest at that position), or None."""
+        if self._pattern is None or not text:
+            return None
+        match = self._pattern.search(text)
+        return match.group(1).lower() if match else None
+
+    def matches_any(self, text: str) -> bool:
+        return self.first(text) is not None
@@ -0,0 +1,140 @@
+# =============================================================================
+# WEATHER OBSERVER - SOURCE METRICS REGISTRY
+# =============================================================================
+#
+# In-process counters per data source (forecast providers, NOAA, Gamma).
+#
+# - Latency per HTTP attempt (bounded window -> p50/p95/p99)
+# - Payload bytes, successes, errors
+# - Cache status: hit (memory), disk, miss, not_modified (304),
+#   rejected (rate limiter / circuit open)
+#
+# Reset once per pipeline run; the orchestrator writes the snapshot into
+# the status summary.
+#
+# Both layers MAY import from shared/.
+# =============================================================================
+
+import math
+import threading
+from collections import Counter, deque
+from typing import Any, Dict, Optional, Sequence
+
+# Latency samples kept per source (most recent)
+LATENCY_WINDOW = 2048
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile (pct in 0..100); 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class _SourceStats:
+    __slots__ = ("latencies", "requests", "errors", "payload_bytes", "cache")
+
+    def __init__(self):
+        self.latencies: deque = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.errors = 0
+        self.payload_bytes = 0
+        self.cache: Counter = Counter()
+
+
+class MetricsRegistry:
+    """Thread-safe per-source request and cache metrics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sources: Dict[str, _SourceStats] = {}
+
+    def _stats(self, source: str) -> _SourceStats:
+        # Caller holds the lock
+        stats = self._sources.get(source)
+        if stats is None:
+            stats = _SourceStats()
+            self._sources[source] = stats
+        return stats
+
+    def record_request(
+        self,
+        source: str,
+        latency_seconds: float,
+        success: bool,
+        payload_bytes: int = 0,
+        cache_status: Optional[str] = None,
+    ) -> None:
+        """
+        Record one HTTP attempt.
+
+        Args:
+            source: Source label (e.g. 'open_meteo', 'noaa', 'gamma')
+            latency_seconds: Time until the response (or error)
+            success: Whether usable data came back
+            payload_bytes: Response body size
+            cache_status: Optional cache status (e.g. 'not_modified')
+        """
+        with self._lock:
+            stats = self._stats(source)
+            stats.requests += 1
+            stats.latencies.append(latency_seconds)
+            stats.payload_bytes += payload_bytes
+            if not success:
+                stats.errors += 1
+            if cache_status:
+                stats.cache[cache_status] += 1
+
+    def record_cache(self, source: str, status: str) -> None:
+        """Record a cache outcome without an HTTP attempt (hit, disk, miss, rejected)."""
+        with self._lock:
+            self._stats(source).cache[status] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-source summary, sorted by source name."""
+        with self._lock:
+            items = [
+                (name, list(s.latencies), s.requests, s.errors, s.payload_bytes, dict(s.cache))
+                for name, s in self._sources.items()
+            ]
+
+        result = {}
+        for name, latencies, requests, errors, payload_bytes, cache in sorted(items):
+            result[name] = {
+                "requests": requests,
+                "errors": errors,
+                "error_rate": round(errors / requests, 4) if requests else 0.0,
+                "latency_p50_ms": round(percentile(latencies, 50) * 1000, 1),
+                "latency_p95_ms": round(percentile(latencies, 95) * 1000, 1),
+                "latency_p99_ms": round(percentile(latencies, 99) * 1000, 1),
+                "payload_bytes": payload_bytes,
+                "cache": cache,
+            }
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._sources.clear()
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+    return _registry
+
+
+def reset_metrics() -> None:
+    """Clear all source metrics. Call at the start of a pipeline run."""
+    _registry.reset()
+
+
+__all__ = [
+    "MetricsRegistry",
+    "get_metrics_registry",
+    "reset_metrics",
+    "percentile",
+]
@@ -0,0 +1,414 @@
+# =============================================================================
+# WEATHER OBSERVER - RATE LIMITER & CIRCUIT BREAKER
+# =============================================================================
+#
+# Shared pacing for ALL outbound HTTP (Polymarket, forecast providers).
+#
+# - TokenBucket per host: steady rate + burst, requests wait for a token
+# - Adaptive: rate grows slowly on success (up to max_rate), halves on 429
+# - Retry-After on 429 blocks the host until the given time
+# - CircuitBreaker per host: N failures within a window -> host is skipped
+#   for a cooldown, then one trial request decides (half-open)
+#
+# Replaces the fixed sleeps between requests. A dead provider fails fast
+# instead of eating the forecast budget.
+#
+# Both layers MAY import from shared/.
+# =============================================================================
+
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# DEFAULT LIMITS
+# =============================================================================
+
+# host -> (requests per second, burst). Start values; the bucket adapts
+# upwards on success and backs off on 429.
+HOST_LIMITS: Dict[str, Tuple[float, int]] = {
+    "gamma-api.polymarket.com": (10.0, 10),
+    "clob.polymarket.com": (10.0, 10),
+    "api.open-meteo.com": (5.0, 5),
+    "api.met.no": (5.0, 5),
+    "api.weather.gov": (5.0, 5),
+    "api.tomorrow.io": (3.0, 3),          # Free tier: 3 req/s
+    "api.openweathermap.org": (1.0, 5),   # Free tier: 60 req/min
+    "api.weatherapi.com": (5.0, 5),
+}
+DEFAULT_HOST_LIMIT: Tuple[float, int] = (5.0, 5)
+
+# Adaptive rate bounds (multiples of the configured start rate)
+MAX_RATE_FACTOR = 4.0
+MIN_RATE_FACTOR = 0.1
+RATE_INCREASE_STEP = 0.05   # +5% of the start rate per successful request
+
+# Circuit breaker defaults
+FAILURE_THRESHOLD = 5       # Failures within the window that open the circuit
+FAILURE_WINDOW_SECONDS = 60
+COOLDOWN_SECONDS = 120
+
+# Callers never wait longer than this for a token
+MAX_WAIT_SECONDS = 30.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date).
+
+    Returns:
+        Seconds to wait (>= 0) or None if missing/unparseable
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def host_of(url: str) -> str:
+    """Lower-case host of a URL ('' if none)."""
+    return (urlparse(url).hostname or "").lower()
+
+
+# =============================================================================
+# TOKEN BUCKET
+# =============================================================================
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with adaptive rate.
+
+    reserve() hands out tokens in arrival order; the token balance may go
+    negative, which turns into a wait time for the caller.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.base_rate = float(rate)
+        self.rate = float(rate)
+        self.max_rate = self.base_rate * MAX_RATE_FACTOR
+        self.min_rate = self.base_rate * MIN_RATE_FACTOR
+        self.burst = max(1, int(burst))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+
+    def _refill(self, now: float) -> None:
+        # _updated may lie in the future while a Retry-After block is active
+        if now > self._updated:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token; return seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1.0
+            wait = max(0.0, self._updated - now)
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return wait
+
+    def refund(self) -> None:
+        """Return a reserved token that was not used."""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1.0)
+
+    def on_success(self) -> None:
+        """Additive increase towards max_rate."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.base_rate * RATE_INCREASE_STEP)
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        """Multiplicative decrease; block until Retry-After if given."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2.0)
+            block = retry_after if retry_after is not None else 1.0 / self.rate
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + block)
+
+
+# =============================================================================
+# CIRCUIT BREAKER
+# =============================================================================
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    CLOSED:    requests pass, failures are counted in a sliding window
+    OPEN:      requests are rejected until the cooldown has passed
+    HALF_OPEN: one trial request; success closes, failure re-opens
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        window_seconds: float = FAILURE_WINDOW_SECONDS,
+        cooldown_seconds: float = COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.window_seconds = window_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures: deque = deque()
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(self._clock())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == self.OPEN and now - self._opened_at >= self.cooldown_seconds:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now."""
+        with self._lock:
+            state = self._current_state(self._clock())
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures.clear()
+            self._state = self.CLOSED
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            now = self._clock()
+            if self._current_state(now) == self.HALF_OPEN:
+                self._open(now)
+                return
+            self._failures.append(now)
+            while self._failures and now - self._failures[0] > self.window_seconds:
+                self._failures.popleft()
+            if len(self._failures) >= self.failure_threshold:
+                self._open(now)
+
+    def _open(self, now: float) -> None:
+        # Caller holds the lock
+        self._state = self.OPEN
+        self._opened_at = now
+        self._trial_in_flight = False
+        self._failures.clear()
+
+
+# =============================================================================
+# RATE LIMITER (per-host registry)
+# =============================================================================
+
+
+class RateLimiter:
+    """
+    Registry of token buckets and circuit breakers, one pair per host.
+
+    Usage around every request (async callers: reserve() + asyncio.sleep):
+        if not limiter.acquire(url):
+            return None            # circuit open or wait too long
+        ... send request ...
+        limiter.record(url, status, retry_after_header)
+    """
+
+    def __init__(
+        self,
+        host_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        window_seconds: float = FAILURE_WINDOW_SECONDS,
+        cooldown_seconds: float = COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            host_limits: host -> (rate, burst); defaults to HOST_LIMITS
+            failure_threshold: Failures within window that open a circuit
+            window_seconds: Sliding failure window
+            cooldown_seconds: Time an open circuit rejects requests
+            clock: Monotonic clock (injectable for testing)
+            sleep: Sleep function (injectable for testing)
+        """
+        self._host_limits = dict(HOST_LIMITS if host_limits is None else host_limits)
+        self._failure_threshold = failure_threshold
+        self._window_seconds = window_seconds
+        self._cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self._host_limits.get(host, DEFAULT_HOST_LIMIT)
+                bucket = TokenBucket(rate, burst, clock=self._clock)
+                self._buckets[host] = bucket
+            return bucket
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    self._failure_threshold,
+                    self._window_seconds,
+                    self._cooldown_seconds,
+                    clock=self._clock,
+                )
+                self._breakers[host] = breaker
+            return breaker
+
+    def reserve(self, url: str, max_wait: float = MAX_WAIT_SECONDS) -> Optional[float]:
+        """
+        Non-blocking part of acquire(): check the circuit, take a token.
+
+        For callers that wait themselves (asyncio.sleep in the async
+        forecast prefetch).
+
+        Returns:
+            Seconds to wait before sending, or None if the host's circuit
+            is open or the wait would exceed max_wait.
+        """
+        host = host_of(url)
+        if not self.breaker(host).allow():
+            logger.debug(f"Circuit open for {host} - request skipped")
+            return None
+
+        bucket = self.bucket(host)
+        wait = bucket.reserve()
+        if wait > max_wait:
+            bucket.refund()
+            logger.debug(f"Rate limit wait {wait:.1f}s for {host} exceeds {max_wait:.1f}s")
+            return None
+        return wait
+
+    def acquire(self, url: str, max_wait: float = MAX_WAIT_SECONDS) -> bool:
+        """
+        Wait for permission to call url.
+
+        Returns:
+            False if the host's circuit is open or the wait would exceed
+            max_wait; the caller should treat this as a failed request.
+        """
+        wait = self.reserve(url, max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            self._sleep(wait)
+        return True
+
+    def record(self, url: str, status: Optional[int], retry_after: Optional[str] = None) -> None:
+        """
+        Feed a request outcome back.
+
+        Args:
+            url: Requested URL
+            status: HTTP status, or None for network errors/timeouts
+            retry_after: Raw Retry-After header value (429/503)
+        """
+        host = host_of(url)
+        bucket = self.bucket(host)
+        breaker = self.breaker(host)
+
+        if status == 429:
+            wait = parse_retry_after(retry_after)
+            bucket.on_throttled(wait)
+            logger.info(
+                f"Rate limited by {host} - rate now {bucket.rate:.2f}/s"
+                + (f", retry after {wait:.0f}s" if wait is not None else "")
+            )
+            return
+        if status is None or status >= 500:
+            if status == 503 and retry_after is not None:
+                bucket.on_throttled(parse_retry_after(retry_after))
+            breaker.record_failure()
+            return
+        # 2xx/3xx and non-throttling 4xx: the host is alive
+        bucket.on_success()
+        breaker.record_success()
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        """Per-host current rate and circuit state."""
+        with self._lock:
+            hosts = sorted(set(self._buckets) | set(self._breakers))
+        return {
+            host: {
+                "rate": round(self.bucket(host).rate, 2),
+                "circuit": self.breaker(host).state,
+            }
+            for host in hosts
+        }
+
+
+_rate_limiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate limiter."""
+    return _rate_limiter
+
+
+def reset_rate_limiter() -> None:
+    """Replace the process-wide limiter with a fresh one (tests)."""
+    global _rate_limiter
+    _rate_limiter = RateLimiter()
+
+
+__all__ = [
+    "TokenBucket",
+    "CircuitBreaker",
+    "RateLimiter",
+    "HOST_LIMITS",
+    "get_rate_limiter",
+    "reset_rate_limiter",
+    "parse_retry_after",
+    "host_of",
+]
@@ -119,6 +119,15 @@ def reset_singletons():
     _reset_all_singletons()
 
 
+@pytest.fixture(autouse=True)
+def isolated_tp_state(tmp_path, monkeypatch):
+    """TP-State und Position-State-Lock der Tests nicht nach data/ schreiben."""
+    import paper_trader.position_manager as position_manager
+    import paper_trader.state_lock as state_lock
+    monkeypatch.setattr(position_manager, "TP_STATE_PATH", tmp_path / "tp_state.json")
+    monkeypatch.setattr(state_lock, "_state_lock", state_lock.PositionStateLock(tmp_path / "state.lock"))
+
+
 @pytest.fixture
 def tmp_project_dir(tmp_path):
     """
@@ -1634,3 +1643,37 @@ class TestOrchestrator:
             error="Test error",
         ))
         assert result.state == RunState.DEGRADED
+
+    def test_weather_observer_nutzt_kandidaten_aus_dem_speicher(self, tmp_project_dir):
+        """Kandidaten aus dem Collector gehen ohne Disk-Roundtrip an die Engine."""
+        from app.orchestrator import Orchestrator
+        from collector.normalizer import NormalizedMarket
+
+        candidate = NormalizedMarket(
+            market_id="m1",
+            title="Will the highest temperature in NYC be 90°F or higher on July 20?",
+            resolution_text="Resolves per NOAA.",
+            end_date="2026-07-20T23:59:59+00:00",
+            created_time=None,
+            category="weather",
+            tags=[],
+            url="https://polymarket.com/event/m1",
+            collector_notes=[],
+            collected_at="2026-07-19T00:00:00+00:00",
+        )
+        engine = MagicMock()
+        engine.run.return_value = MagicMock(
+            observations=[], edge_observations=[], markets_processed=1, markets_filtered=1,
+        )
+
+        orch = Orchestrator(base_dir=tmp_project_dir)
+        with patch("collector.client.PolymarketClient.fetch_market_prices",
+                   return_value={"m1": {"outcomePrices": '["0.3", "0.7"]', "liquidity": "5000"}}), \
+                patch.object(Orchestrator, "_load_candidates_from_disk") as from_disk, \
+                patch("core.weather_engine.create_engine", return_value=engine) as create:
+            step = orch._run_weather_observer([candidate])
+
+        assert step.success
+        from_disk.assert_not_called()
+        markets = create.call_args.kwargs["market_fetcher"]()
+        assert [(m.market_id, m.odds_yes, m.liquidity_usd) for m in markets] == [("m1", 0.3, 5000.0)]
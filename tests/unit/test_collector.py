@@ -7,13 +7,20 @@
 # - Price/probability field exclusion (CRITICAL)
 # - Fail-closed behavior for incomplete data
 # - Contract test for raw response sanitization
+# - Incremental (delta sync) collection
+# - Parallel weather/climate pagination
+# - Streaming pipeline (bounded page buffers, streamed outputs)
 #
 # =============================================================================
 
 import unittest
 import json
+import tempfile
+import threading
+import time
 from datetime import date
 from pathlib import Path
+from unittest import mock
 
 # Import collector modules
 import sys
@@ -22,6 +29,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from collector.sanitizer import Sanitizer
 from collector.filter import MarketFilter, FilterResult, FilteredMarket
 from collector.normalizer import MarketNormalizer, NormalizedMarket
+from collector.client import PolymarketClient
+from collector.collector import Collector
+from collector.market_state import MarketStateStore
+from collector.storage import StorageManager
 
 
 class TestSanitizer(unittest.TestCase):
@@ -443,5 +454,413 @@ class TestContractSanitization(unittest.TestCase):
         self.assertIn("volume", removed)
 
 
+def _weather_market(market_id, question, updated_at="2026-07-01T00:00:00Z", **extra):
+    market = {
+        "id": market_id,
+        "question": question,
+        "description": "Resolves using the NOAA weather station reading for the city.",
+        "endDate": "2026-07-20T23:59:59Z",
+        "slug": f"market-{market_id}",
+        "updatedAt": updated_at,
+        "lastTradePrice": 0.123456789,
+        "_event_title": "Highest temperature in NYC",
+        "_event_tags": ["Weather"],
+    }
+    market.update(extra)
+    return market
+
+
+class _FakeClient:
+    def __init__(self, markets):
+        self.markets = markets
+
+    def iter_weather_markets(self, max_markets=500, include_closed=False):
+        for market in self.markets[:max_markets]:
+            yield dict(market)
+
+
+class _CountingSanitizer(Sanitizer):
+    def __init__(self):
+        super().__init__(log_removals=False)
+        self.calls = 0
+
+    def sanitize(self, data):
+        self.calls += 1
+        return super().sanitize(data)
+
+
+class TestIncrementalCollector(unittest.TestCase):
+    """Delta sync: only new/changed markets are re-processed."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.markets = [
+            _weather_market("1", "Will the highest temperature in NYC be 90°F or higher on July 20?"),
+            _weather_market("2", "Will it rain in London on July 20?"),
+        ]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, max_markets=500):
+        collector = Collector(output_dir=self.tmp.name, max_markets=max_markets)
+        collector.client = _FakeClient(self.markets)
+        collector.sanitizer = _CountingSanitizer()
+        stats = collector.run()
+        return collector, stats
+
+    def test_second_run_skips_unchanged_markets(self):
+        _, first = self._run()
+        self.assertEqual(first.markets_added, 2)
+
+        # Price movement bumps updatedAt but not the content hash
+        self.markets[0]["updatedAt"] = "2026-07-01T00:15:00Z"
+        self.markets[0]["lastTradePrice"] = 0.55
+        collector, second = self._run()
+
+        self.assertEqual(collector.sanitizer.calls, 0)
+        self.assertEqual(
+            (second.markets_added, second.markets_changed, second.markets_removed, second.markets_unchanged),
+            (0, 0, 0, 2),
+        )
+        self.assertEqual(second.total_candidates, first.total_candidates)
+        self.assertEqual(second.filter_results, first.filter_results)
+
+    def test_changed_added_and_removed_markets(self):
+        self._run()
+        self.markets[0]["question"] = "Will the highest temperature in NYC be 95°F or higher on July 20?"
+        self.markets[0]["updatedAt"] = "2026-07-02T00:00:00Z"
+        self.markets[1] = _weather_market("3", "Will it snow in Chicago on July 20?")
+
+        collector, stats = self._run()
+
+        self.assertEqual(collector.sanitizer.calls, 2)
+        self.assertEqual((stats.markets_added, stats.markets_changed, stats.markets_removed), (1, 1, 1))
+
+        rows = [
+            json.loads(line)
+            for line in (collector.storage.normalized_dir / "markets.jsonl").read_text().splitlines()
+        ]
+        self.assertEqual([r["market_id"] for r in rows], ["1", "3"])
+        self.assertIn("95°F", rows[0]["title"])
+
+        state = MarketStateStore(collector.storage.state_file)
+        state.load()
+        self.assertEqual(len(state), 2)
+        # Neither the state nor the raw dump holds price fields
+        self.assertNotIn("0.123456789", collector.storage.state_file.read_text(encoding="utf-8"))
+        storage = collector.storage
+        raw = storage.load_raw_response(storage.list_raw_responses()[-1])
+        self.assertEqual(sorted(m["id"] for m in raw), ["1", "3"])
+        self.assertNotIn("lastTradePrice", raw[0])
+
+    def test_classifier_version_change_reprocesses_unchanged_markets(self):
+        self._run()
+        with mock.patch("collector.market_state.CLASSIFIER_VERSION", -1):
+            collector, stats = self._run()
+
+        self.assertEqual(collector.sanitizer.calls, 2)
+        self.assertEqual((stats.markets_added, stats.markets_unchanged), (2, 0))
+        header = json.loads(collector.storage.state_file.read_text(encoding="utf-8"))
+        self.assertEqual(header["classifier_version"], -1)
+
+    def test_truncated_run_keeps_markets_beyond_max_markets(self):
+        self._run()
+        _, truncated = self._run(max_markets=1)
+        self.assertEqual(truncated.markets_removed, 0)
+
+        collector, full = self._run()
+        self.assertEqual(collector.sanitizer.calls, 0)
+        self.assertEqual((full.markets_added, full.markets_removed, full.markets_unchanged), (0, 0, 2))
+
+    def test_candidates_returned_in_memory(self):
+        collector, stats = self._run()
+        rows = [
+            json.loads(line)
+            for line in (collector.storage.candidates_dir / "candidates.jsonl").read_text().splitlines()
+        ]
+        self.assertEqual(len(stats.candidates), stats.total_candidates)
+        self.assertEqual([c.to_dict() for c in stats.candidates], rows)
+
+        # Unchanged run: candidates come from the state, same set
+        _, second = self._run()
+        self.assertEqual([c.market_id for c in second.candidates], [c.market_id for c in stats.candidates])
+
+    def test_report_contains_delta_counts(self):
+        collector, _ = self._run()
+        report = (collector.storage.reports_dir / "report.md").read_text(encoding="utf-8")
+        self.assertIn("## Delta Sync", report)
+        self.assertIn("- **Added:** 2", report)
+
+
+class _PagedClient(PolymarketClient):
+    """Serves fixed event pages per tag with a per-request delay."""
+
+    def __init__(self, pages_by_tag, delay=0.1):
+        super().__init__()
+        self.pages_by_tag = pages_by_tag
+        self.delay = delay
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def fetch_events(self, limit=100, offset=0, tag_slug=None, closed=None):
+        with self._lock:
+            self.requests.append((tag_slug, offset))
+        time.sleep(self.delay)
+        pages = self.pages_by_tag.get(tag_slug, [])
+        index = offset // limit
+        return pages[index] if index < len(pages) else []
+
+
+def _event_page(prefix, count, closed_ids=()):
+    return [
+        {
+            "title": f"{prefix} event {i}",
+            "tags": [{"label": "Weather"}],
+            "markets": [{"id": f"{prefix}{i}", "closed": f"{prefix}{i}" in closed_ids}],
+        }
+        for i in range(count)
+    ]
+
+
+class TestParallelPagination(unittest.TestCase):
+    """fetch_weather_markets: concurrent tags, prefetch, stable merge."""
+
+    def setUp(self):
+        shared = {"title": "Shared", "tags": [], "markets": [{"id": "shared"}]}
+        self.pages = {
+            "weather": [_event_page("w", 99) + [shared], _event_page("w2-", 100), _event_page("w3-", 10)],
+            "climate": [[shared] + _event_page("c", 99), _event_page("c2-", 5, closed_ids={"c2-0"})],
+        }
+
+    def test_stable_order_and_dedup(self):
+        client = _PagedClient(self.pages, delay=0.0)
+        markets = client.fetch_weather_markets(max_markets=1000)
+
+        ids = [m["id"] for m in markets]
+        self.assertEqual(len(ids), len(set(ids)))
+        # Weather pages first (offset order), then climate
+        self.assertEqual(ids[:2], ["w0", "w1"])
+        self.assertEqual(ids[99], "shared")
+        self.assertEqual(markets[99]["_source_tag"], "weather")
+        self.assertEqual(ids[210], "c0")
+        self.assertNotIn("c2-0", ids)
+        self.assertEqual(len(ids), 210 + 99 + 4)
+
+    def test_tags_fetched_concurrently(self):
+        client = _PagedClient(self.pages, delay=0.1)
+        started = time.monotonic()
+        client.fetch_weather_markets(max_markets=1000)
+        elapsed = time.monotonic() - started
+
+        # Serial: 3 weather + 2 climate pages = 0.5s; parallel ~ longest tag
+        self.assertLess(elapsed, 0.45)
+        self.assertEqual(
+            sorted(client.requests),
+            [("climate", 0), ("climate", 100), ("weather", 0), ("weather", 100), ("weather", 200)],
+        )
+
+    def test_max_markets_caps_result(self):
+        client = _PagedClient(self.pages, delay=0.0)
+        markets = client.fetch_weather_markets(max_markets=150)
+        self.assertEqual(len(markets), 150)
+        self.assertEqual(markets[-1]["id"], "w2-49")
+
+
+class TestStreamingPipeline(unittest.TestCase):
+    """Markets stream through the pipeline; pagination stays bounded."""
+
+    def test_consumer_pulls_pages_lazily(self):
+        pages = {"weather": [_event_page(f"p{i}-", 100) for i in range(20)], "climate": []}
+        client = _PagedClient(pages, delay=0.0)
+
+        stream = client.iter_weather_markets(max_markets=10_000)
+        first = next(stream)
+        time.sleep(0.2)
+        # Producer is held back by the bounded page buffer
+        requested = len([r for r in client.requests if r[0] == "weather"])
+        self.assertLessEqual(requested, PolymarketClient.PAGE_BUFFER + 3)
+        stream.close()
+
+        self.assertEqual(first["id"], "p0-0")
+
+    def test_pagination_error_reaches_consumer(self):
+        class FailingClient(_PagedClient):
+            def fetch_events(self, limit=100, offset=0, tag_slug=None, closed=None):
+                if tag_slug == "climate":
+                    raise RuntimeError("Client error: 500")
+                return super().fetch_events(limit, offset, tag_slug, closed)
+
+        client = FailingClient({"weather": [_event_page("w", 3)]}, delay=0.0)
+        with self.assertRaises(RuntimeError):
+            client.fetch_weather_markets()
+
+    def test_unchanged_run_keeps_outputs_and_writes_no_tmp(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            markets = [_weather_market("1", "Will it rain in London on July 20?")]
+            for _ in range(2):
+                collector = Collector(output_dir=tmp)
+                collector.client = _FakeClient(markets)
+                stats = collector.run()
+
+            self.assertEqual(stats.markets_unchanged, 1)
+            self.assertTrue(collector.storage.has_outputs())
+            leftovers = list(Path(tmp).rglob("*.tmp"))
+            self.assertEqual(leftovers, [])
+
+    def test_raw_stream_is_valid_json(self):
+        from collector.storage import RecordStream
+
+        with tempfile.TemporaryDirectory() as tmp:
+            stream = RecordStream(Path(tmp) / "raw.json", fmt="json")
+            stream.write({"id": "1"})
+            stream.write({"id": "2"})
+            path = stream.commit()
+            self.assertEqual(json.loads(path.read_text()), [{"id": "1"}, {"id": "2"}])
+
+            empty = RecordStream(Path(tmp) / "empty.json", fmt="json").commit()
+            self.assertEqual(json.loads(empty.read_text()), [])
+
+
+class _BulkMarketsClient(PolymarketClient):
+    """Answers /markets?id=...&condition_ids=... from a dict."""
+
+    def __init__(self, markets, fail_bulk=False, omit_closed=False):
+        super().__init__()
+        self.markets = markets
+        self.fail_bulk = fail_bulk
+        self.omit_closed = omit_closed
+        self.requests = []
+
+    def _request(self, endpoint, params=None):
+        self.requests.append((endpoint, params))
+        if endpoint.startswith("/markets/"):
+            market = self.markets.get(endpoint[len("/markets/"):])
+            return [market] if market else []
+        if self.fail_bulk:
+            raise RuntimeError("Client error: 422")
+        wanted = set(params.get("id", [])) | set(params.get("condition_ids", []))
+        return [
+            m for m in self.markets.values()
+            if (m["id"] in wanted or m.get("conditionId") in wanted)
+            and not (self.omit_closed and m.get("closed"))
+        ]
+
+
+class TestBulkMarketFetch(unittest.TestCase):
+    """fetch_markets_by_ids / fetch_market_prices: chunked bulk requests."""
+
+    def setUp(self):
+        self.markets = {
+            str(i): {"id": str(i), "conditionId": f"0x{i:04x}", "outcomePrices": f'["0.{i:02d}", "0.5"]'}
+            for i in range(1, 121)
+        }
+
+    def test_prices_for_many_markets_take_few_requests(self):
+        client = _BulkMarketsClient(self.markets)
+        ids = [str(i) for i in range(1, 121)] + ["999"]
+
+        prices = client.fetch_market_prices(ids)
+
+        self.assertEqual(len(prices), 120)
+        self.assertEqual(prices["7"]["outcomePrices"], '["0.07", "0.5"]')
+        # ceil(121 / 50) bulk requests + one single lookup for the unknown id
+        self.assertEqual([e for e, _ in client.requests], ["/markets"] * 3 + ["/markets/999"])
+
+    def test_condition_ids_are_matched(self):
+        client = _BulkMarketsClient(self.markets)
+        found = client.fetch_markets_by_ids(["0x0005", "6"])
+
+        self.assertEqual(set(found), {"0x0005", "6"})
+        # One request per id kind: Gamma may AND-combine id= and condition_ids=
+        params = [p for _, p in client.requests]
+        self.assertEqual([(p.get("id"), p.get("condition_ids")) for p in params], [(["6"], None), (None, ["0x0005"])])
+
+    def test_ids_omitted_by_bulk_response_use_single_lookups(self):
+        self.markets["5"]["closed"] = True
+        client = _BulkMarketsClient(self.markets, omit_closed=True)
+
+        found = client.fetch_markets_by_ids(["4", "5"])
+
+        self.assertEqual(set(found), {"4", "5"})
+        self.assertEqual([e for e, _ in client.requests], ["/markets", "/markets/5"])
+
+    def test_failed_chunk_falls_back_to_single_lookups(self):
+        client = _BulkMarketsClient(self.markets, fail_bulk=True)
+        found = client.fetch_markets_by_ids(["1", "2"], batch_size=2)
+
+        self.assertEqual(set(found), {"1", "2"})
+        self.assertEqual([e for e, _ in client.requests], ["/markets", "/markets/1", "/markets/2"])
+
+    def test_fetch_market_uses_single_endpoint(self):
+        client = _BulkMarketsClient(self.markets)
+
+        self.assertEqual(client.fetch_market("3")["id"], "3")
+        self.assertIsNone(client.fetch_market("999"))
+        self.assertEqual([e for e, _ in client.requests], ["/markets/3", "/markets/999"])
+
+
+class TestRawArchive(unittest.TestCase):
+    """Raw dumps: manifest of hashes + content-addressed gzip objects."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.markets = [
+            _weather_market("1", "Will the highest temperature in NYC be 90°F or higher on July 20?"),
+            _weather_market("2", "Will it rain in London on July 20?"),
+        ]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _objects(self):
+        return sorted(Path(self.tmp.name, "raw", "objects").rglob("*.json.gz"))
+
+    def _run(self, max_markets=500):
+        collector = Collector(output_dir=self.tmp.name, max_markets=max_markets)
+        collector.client = _FakeClient(self.markets)
+        collector.run()
+        return collector.storage
+
+    def test_unchanged_run_stores_no_new_objects(self):
+        storage = self._run()
+        first = storage.raw_dir / storage.list_raw_responses()[-1]
+        # Runs within the same second would share a filename
+        first.rename(storage.raw_dir / "markets_first.manifest.json")
+        objects = self._objects()
+        self.assertEqual(len(objects), 2)
+
+        storage = self._run()
+        self.assertEqual(self._objects(), objects)
+        second = [n for n in storage.list_raw_responses() if n != "markets_first.manifest.json"]
+        self.assertEqual(len(second), 1)
+
+        # Both runs replay the full fetched set, by logical or manifest name
+        for name in ("markets_first.json", second[0]):
+            raw = storage.load_raw_response(name)
+            self.assertEqual([m["id"] for m in raw], ["1", "2"])
+            self.assertNotIn("lastTradePrice", raw[0])
+
+    def test_plain_raw_files_still_load(self):
+        storage = StorageManager(base_dir=self.tmp.name, raw_archive=False)
+        storage.ensure_directories()
+        path = storage.save_raw_response([{"id": "1"}], filename="markets_legacy.json")
+        self.assertEqual(json.loads(path.read_text()), [{"id": "1"}])
+
+        archived = StorageManager(base_dir=self.tmp.name)
+        self.assertEqual(archived.load_raw_response("markets_legacy.json"), [{"id": "1"}])
+
+    def test_prune_removes_unreferenced_objects(self):
+        storage = StorageManager(base_dir=self.tmp.name)
+        storage.ensure_directories()
+        old = storage.save_raw_response([{"id": "1"}, {"id": "2"}], filename="markets_a.json")
+        storage.save_raw_response([{"id": "2"}], filename="markets_b.json")
+        self.assertEqual(len(self._objects()), 2)
+
+        old.unlink()
+        self.assertEqual(storage.prune_raw_objects(), 1)
+        self.assertEqual(storage.load_raw_response("markets_b.json"), [{"id": "2"}])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,147 @@
+"""
+UNIT TESTS - DAILY EXTREMES
+============================
+Tests for core/daily_extremes.py (local-day max/min from hourly series)
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+import core.daily_extremes as daily_extremes
+from core.daily_extremes import (
+    METRIC_DAILY_MAX,
+    compute_daily_extremes,
+    get_daily_extremes_cache,
+    local_date_of,
+    local_day_window,
+    quantiles,
+    reset_daily_extremes_cache,
+)
+from core.forecast_sources import SourceForecast
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    reset_daily_extremes_cache()
+    yield
+    reset_daily_extremes_cache()
+
+
+def make_forecast(name, start, temps, model="ecmwf"):
+    hourly = [(start + timedelta(hours=i), t) for i, t in enumerate(temps)]
+    return SourceForecast(
+        city="Seoul",
+        target_time=start,
+        forecast_time=start,
+        source_name=name,
+        model_name=model,
+        temperature_f=temps[0],
+        hourly_temperatures=hourly,
+    )
+
+
+class TestWindow:
+    def test_seoul_day_starts_at_15_utc(self):
+        start, end = local_day_window(date(2026, 7, 15), "Asia/Seoul")
+        assert start == datetime(2026, 7, 14, 15, 0)
+        assert end == datetime(2026, 7, 15, 15, 0)
+
+    def test_dst_day_has_23_hours(self):
+        start, end = local_day_window(date(2026, 3, 8), "America/New_York")
+        assert end - start == timedelta(hours=23)
+
+    def test_local_date_of_late_us_evening(self):
+        moment = datetime(2026, 1, 16, 3, 0)  # 22:00 EST on Jan 15
+        assert local_date_of(moment, "America/New_York") == date(2026, 1, 15)
+        assert local_date_of(moment, "UTC") == date(2026, 1, 16)
+
+    def test_unknown_timezone_uses_utc(self):
+        start, end = local_day_window(date(2026, 7, 15), "Mars/Olympus")
+        assert (start, end) == (datetime(2026, 7, 15), datetime(2026, 7, 16))
+
+
+class TestCompute:
+    def test_extremes_use_local_day(self):
+        # 48 hourly points from 2026-07-14 00:00 UTC; value = hour index
+        start = datetime(2026, 7, 14)
+        forecast = make_forecast("open_meteo", start, [float(i) for i in range(48)])
+
+        result = compute_daily_extremes("Seoul", date(2026, 7, 15), "Asia/Seoul", [forecast])
+
+        # Local 15 Jul = 14 Jul 15:00 .. 15 Jul 14:00 UTC -> indices 15..38
+        assert result.source_max_f == {"open_meteo": 38.0}
+        assert result.source_min_f == {"open_meteo": 15.0}
+
+    def test_source_without_hours_in_window_is_skipped(self):
+        early = make_forecast("met_norway", datetime(2026, 7, 1), [50.0] * 24)
+        result = compute_daily_extremes("Seoul", date(2026, 7, 15), "Asia/Seoul", [early])
+        assert result.source_max_f == {}
+        assert result.max_quantiles == {}
+
+    def test_quantiles_across_sources(self):
+        assert quantiles([70.0, 74.0, 72.0]) == {
+            0.05: pytest.approx(70.2), 0.25: 71.0, 0.5: 72.0, 0.75: 73.0, 0.95: pytest.approx(73.8),
+        }
+
+    @pytest.mark.skipif(daily_extremes.np is None, reason="NumPy not installed")
+    def test_numpy_matches_python(self):
+        start = datetime(2026, 7, 14)
+        forecasts = [
+            make_forecast("a", start, [float((i * 7) % 31) for i in range(48)]),
+            make_forecast("b", start + timedelta(minutes=30), [float((i * 5) % 17) for i in range(40)]),
+        ]
+        fast = compute_daily_extremes("Seoul", date(2026, 7, 15), "Asia/Seoul", forecasts, use_numpy=True)
+        slow = compute_daily_extremes("Seoul", date(2026, 7, 15), "Asia/Seoul", forecasts, use_numpy=False)
+        assert fast.source_max_f == slow.source_max_f
+        assert fast.source_min_f == slow.source_min_f
+
+
+class TestCache:
+    def test_reused_until_new_sources_arrive(self):
+        cache = get_daily_extremes_cache()
+        start = datetime(2026, 7, 14)
+        first = make_forecast("open_meteo", start, [60.0] * 48)
+        second = make_forecast("met_norway", start, [65.0] * 48)
+
+        a = cache.get_or_compute("Seoul", date(2026, 7, 15), "Asia/Seoul", [first])
+        assert cache.get_or_compute("Seoul", date(2026, 7, 15), "Asia/Seoul", [first]) is a
+
+        b = cache.get_or_compute("Seoul", date(2026, 7, 15), "Asia/Seoul", [first, second])
+        assert b is not a
+        assert set(b.source_max_f) == {"open_meteo", "met_norway"}
+        assert len(cache) == 1
+
+
+class TestEnsembleDailyMax:
+    def test_ladder_centres_on_daily_max(self):
+        from core.ensemble_builder import EnsembleBuilder
+
+        class Source:
+            def __init__(self, forecast):
+                self.source_name = forecast.source_name
+                self.forecast = forecast
+
+            def is_available(self):
+                return True
+
+            def fetch(self, city, target_time, timeout=None):
+                return self.forecast
+
+        start = datetime.combine(datetime.utcnow().date() + timedelta(days=1), datetime.min.time())
+        # Cold at target hour, warm later the same (UTC) day
+        temps = [50.0] * 12 + [80.0] * 12 + [50.0] * 48
+        builder = EnsembleBuilder({"CITY_CONFIG": {"Seoul": {"timezone": "UTC"}}})
+        builder._sources = [Source(make_forecast("open_meteo", start, temps))]
+        target = start + timedelta(hours=1)
+
+        point = builder.build("Seoul", target, threshold_f=70.0)
+        daily = builder.build("Seoul", target, threshold_f=70.0, metric=METRIC_DAILY_MAX)
+
+        assert point.ensemble_temperature_f == 50.0
+        assert daily.ensemble_temperature_f == 80.0
+        assert daily.ensemble_mean_probability > 0.9 > point.ensemble_mean_probability
@@ -0,0 +1,190 @@
+"""
+UNIT TESTS - ENSEMBLE BUILDER
+==============================
+Tests for core/ensemble_builder.py (deadline-driven partial builds, ladders)
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from datetime import datetime, timedelta
+
+from core.ensemble_builder import EnsembleBuilder, degrade_confidence
+from core.forecast_sources import SourceForecast
+from core.weather_signal import WeatherConfidence
+
+
+class FakeSource:
+    """Returns a fixed temperature, optionally blocking until released."""
+
+    def __init__(self, name, model, temperature_f, gate=None):
+        self.source_name = name
+        self.model = model
+        self.temperature_f = temperature_f
+        self.gate = gate
+        self.completed = threading.Event()
+
+    def is_available(self):
+        return True
+
+    def fetch(self, city, target_time, timeout=None):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.completed.set()
+        return SourceForecast(
+            city=city,
+            target_time=target_time,
+            forecast_time=datetime.utcnow(),
+            source_name=self.source_name,
+            model_name=self.model,
+            temperature_f=self.temperature_f,
+        )
+
+
+def make_builder(sources, budget=None, min_independent=2):
+    builder = EnsembleBuilder({
+        "ENSEMBLE": {
+            "MIN_INDEPENDENT_SOURCES": min_independent,
+            "SOURCE_TIMEOUT_SECONDS": 5,
+            "MARKET_BUDGET_SECONDS": budget,
+        },
+    })
+    builder._sources = sources
+    return builder
+
+
+TARGET = datetime.utcnow() + timedelta(days=2)
+
+
+class TestDeadlineBuild:
+    def test_builds_from_partial_results_after_budget(self):
+        gate = threading.Event()
+        slow = FakeSource("tomorrow_io", "tomorrow", 80.0, gate=gate)
+        builder = make_builder([
+            FakeSource("open_meteo", "open_meteo_gfs", 70.0),
+            FakeSource("met_norway", "ecmwf", 71.0),
+            slow,
+        ], budget=0.2)
+
+        started = time.monotonic()
+        ensemble = builder.build("London", TARGET, threshold_f=65.0)
+        elapsed = time.monotonic() - started
+        gate.set()
+
+        assert elapsed < 2.0
+        assert ensemble.partial
+        assert ensemble.pending_sources == ["tomorrow_io"]
+        assert ensemble.confidence_adjustment == "PARTIAL_SOURCES"
+        assert ensemble.source_count == 2
+        # The late source is not cancelled
+        assert slow.completed.wait(2)
+
+    def test_waits_past_budget_until_enough_independent_models(self):
+        gate = threading.Event()
+        threading.Timer(0.3, gate.set).start()
+        builder = make_builder([
+            FakeSource("open_meteo", "open_meteo_gfs", 70.0),
+            FakeSource("openweather", "openweather_gfs", 70.5),
+            FakeSource("met_norway", "ecmwf", 71.0, gate=gate),
+        ], budget=0.05)
+
+        ensemble = builder.build("London", TARGET, threshold_f=65.0)
+
+        # Two GFS sources count as one model -> had to wait for met_norway
+        assert ensemble.source_count == 3
+        assert not ensemble.partial
+        assert ensemble.confidence_adjustment == "NONE"
+
+    def test_no_budget_waits_for_all_sources(self):
+        gate = threading.Event()
+        threading.Timer(0.2, gate.set).start()
+        builder = make_builder([
+            FakeSource("open_meteo", "open_meteo_gfs", 70.0),
+            FakeSource("met_norway", "ecmwf", 71.0),
+            FakeSource("tomorrow_io", "tomorrow", 72.0, gate=gate),
+        ])
+
+        ensemble = builder.build("London", TARGET, threshold_f=65.0)
+        assert ensemble.source_count == 3
+        assert ensemble.pending_sources == []
+
+    def test_partial_does_not_degrade_confidence(self):
+        assert degrade_confidence(WeatherConfidence.HIGH, "PARTIAL_SOURCES") == WeatherConfidence.HIGH
+
+
+class CountingSource(FakeSource):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def fetch(self, city, target_time, timeout=None):
+        self.calls += 1
+        return super().fetch(city, target_time, timeout)
+
+
+class TestLadder:
+    def test_one_fetch_consistent_ladder(self):
+        sources = [
+            CountingSource("open_meteo", "open_meteo_gfs", 49.0),
+            CountingSource("met_norway", "ecmwf", 50.5),
+        ]
+        builder = make_builder(sources)
+        intervals = [(None, 47.5), (47.5, 49.5), (49.5, 51.5), (51.5, None), (49.5, None)]
+
+        ladder = builder.build_ladder("London", TARGET, intervals)
+
+        assert [s.calls for s in sources] == [1, 1]
+        probs = [e.ensemble_mean_probability for e in ladder]
+        # Tail + buckets + tail tile the whole line
+        assert abs(sum(probs[:4]) - 1.0) < 1e-9
+        # Strike ">= 49.5" equals the sum of the buckets above it
+        assert abs(probs[4] - (probs[2] + probs[3])) < 1e-9
+        for ensemble in ladder:
+            assert set(ensemble.per_source_probabilities) == {"open_meteo", "met_norway"}
+
+    def test_build_matches_single_interval_ladder(self):
+        builder = make_builder([
+            FakeSource("open_meteo", "open_meteo_gfs", 70.0),
+            FakeSource("met_norway", "ecmwf", 74.0),
+        ])
+        single = builder.build("London", TARGET, threshold_f=72.0)
+        ladder = builder.build_ladder("London", TARGET, [(72.0, None)])[0]
+
+        assert abs(single.ensemble_mean_probability - ladder.ensemble_mean_probability) < 1e-12
+        assert abs(single.ensemble_mean_probability - 0.5) < 1e-9
+        assert single.ensemble_variance > 0
+
+
+class TestMemo:
+    def test_unchanged_forecasts_skip_recomputation(self, monkeypatch):
+        import core.ensemble_builder as ensemble_builder
+        from core.probability_memo import get_ensemble_memo, reset_probability_memos
+
+        reset_probability_memos()
+        calls = []
+        original = ensemble_builder.compute_probability_batch
+
+        def counting(*args, **kwargs):
+            calls.append(1)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(ensemble_builder, "compute_probability_batch", counting)
+        sources = [
+            FakeSource("open_meteo", "open_meteo_gfs", 70.0),
+            FakeSource("met_norway", "ecmwf", 72.0),
+        ]
+
+        first = make_builder(sources).build("London", TARGET, threshold_f=71.0)
+        # New builder (next run), same forecasts
+        second = make_builder(sources).build("London", TARGET, threshold_f=71.0)
+        assert len(calls) == 1
+        assert second.ensemble_mean_probability == first.ensemble_mean_probability
+        assert get_ensemble_memo().stats()["hits"] == 1
+
+        sources[1].temperature_f = 75.0
+        make_builder(sources).build("London", TARGET, threshold_f=71.0)
+        assert len(calls) == 2
+        reset_probability_memos()
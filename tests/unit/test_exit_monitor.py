@@ -0,0 +1,253 @@
+"""
+UNIT TESTS - EXIT MONITOR
+==========================
+Tests for paper_trader/exit_monitor.py (event-driven TP/SL checks),
+paper_trader/state_lock.py and cross-process state refresh
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from paper_trader.capital_manager import CapitalManager
+from paper_trader.exit_monitor import ExitMonitor
+from paper_trader.logger import PaperTradingLogger
+from paper_trader.models import PaperPosition
+from paper_trader.price_feed import LocalFeedServer, PriceFeed
+from paper_trader.state_lock import PositionStateLock
+
+
+def wait_until(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def book(asset, bid, ask):
+    return {
+        "event_type": "book",
+        "asset_id": asset,
+        "bids": [{"price": str(bid), "size": "10"}],
+        "asks": [{"price": str(ask), "size": "10"}],
+    }
+
+
+def make_position(position_id, status="OPEN"):
+    return PaperPosition(
+        position_id=position_id,
+        proposal_id=f"PROP-{position_id}",
+        market_id=f"market-{position_id}",
+        market_question="Will it be hot?",
+        side="YES",
+        status=status,
+        entry_time="2026-01-01T00:00:00",
+        entry_price=0.40,
+        entry_slippage=0.0,
+        size_contracts=250.0,
+        cost_basis_eur=100.0,
+        exit_time=None,
+        exit_price=None,
+        exit_slippage=None,
+        exit_reason=None,
+        realized_pnl_eur=None,
+        pnl_pct=None,
+    )
+
+
+class TestPositionStateLock:
+    def test_reentrant_in_one_thread(self, tmp_path):
+        lock = PositionStateLock(tmp_path / "state.lock")
+        with lock:
+            with lock:
+                pass
+            assert not PositionStateLock(tmp_path / "state.lock").acquire(timeout=0.1)
+        other = PositionStateLock(tmp_path / "state.lock")
+        assert other.acquire(timeout=0.1)
+        other.release()
+
+    def test_other_holder_waits_for_release(self, tmp_path):
+        path = tmp_path / "state.lock"
+        holder, waiter = PositionStateLock(path), PositionStateLock(path)
+        acquired = threading.Event()
+
+        holder.acquire()
+
+        def wait_for_lock():
+            with waiter:
+                acquired.set()
+
+        thread = threading.Thread(target=wait_for_lock)
+        thread.start()
+        assert not acquired.wait(0.2)
+        holder.release()
+        assert acquired.wait(2)
+        thread.join(2)
+
+
+class TestCrossProcessRefresh:
+    def test_capital_reloads_after_external_save(self, tmp_path):
+        config = tmp_path / "data" / "capital_config.json"
+        pipeline = CapitalManager(config_path=config, auto_reconcile=False)
+        monitor = CapitalManager(config_path=config, auto_reconcile=False)
+
+        monitor.release_capital(0.0, 25.0, "TP1")
+        assert pipeline.get_state().available_capital_eur == 5025.0
+        assert json.loads(config.read_text())["realized_pnl_eur"] == 25.0
+
+    def test_open_positions_see_external_appends(self, tmp_path):
+        pipeline = PaperTradingLogger(logs_dir=tmp_path / "logs", reports_dir=tmp_path / "reports")
+        monitor = PaperTradingLogger(logs_dir=tmp_path / "logs", reports_dir=tmp_path / "reports")
+
+        pipeline.log_position(make_position("p1"))
+        assert [p.position_id for p in monitor.get_open_positions()] == ["p1"]
+
+        pipeline.log_position(make_position("p1", status="CLOSED"))
+        assert monitor.get_open_positions() == []
+
+
+class TestExitMonitor:
+    def make_monitor(self, tmp_path, feed=None, check=None, interval=30.0):
+        calls = []
+
+        def default_check():
+            calls.append(time.monotonic())
+            return {"checked": 1, "take_profit": 0, "stop_loss": 0, "pnl_eur": 0.0}
+
+        monitor = ExitMonitor(
+            feed=feed,
+            interval_seconds=interval,
+            min_check_gap_seconds=0.05,
+            check=check or default_check,
+            open_markets=lambda: ["m1"],
+        )
+        return monitor, calls
+
+    def test_price_update_triggers_check_before_interval(self, tmp_path):
+        server = LocalFeedServer()
+        feed = PriceFeed(connect=server.connect, token_resolver=lambda ids: {m: f"tok-{m}" for m in ids})
+        feed.start()
+        monitor, calls = self.make_monitor(tmp_path, feed=feed)
+        try:
+            monitor.start()
+            assert wait_until(lambda: len(calls) == 1)
+            assert wait_until(lambda: server.subscribed_assets() == ["tok-m1"])
+
+            # Updates for markets without a position do not wake the monitor
+            feed.watch(["m2"])
+            server.publish(book("tok-m2", 0.40, 0.42))
+            time.sleep(0.2)
+            assert len(calls) == 1
+
+            server.publish(book("tok-m1", 0.55, 0.57))
+            assert wait_until(lambda: len(calls) == 2, timeout=2)
+            assert monitor.stats()["triggered_checks"] == 1
+        finally:
+            monitor.stop()
+            feed.stop()
+
+    def test_check_counts_exits(self, tmp_path):
+        monitor, _ = self.make_monitor(
+            tmp_path, check=lambda: {"take_profit": 1, "stop_loss": 1, "pnl_eur": 12.5},
+        )
+        summary = monitor.check_once()
+
+        assert summary["take_profit"] == 1
+        assert monitor.stats()["exits"] == 2
+        assert monitor.stats()["pnl_eur"] == 12.5
+
+    def test_failed_check_keeps_loop_alive(self, tmp_path):
+        attempts = []
+
+        def check():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("Gamma down")
+            return {"take_profit": 0, "stop_loss": 0, "pnl_eur": 0.0}
+
+        monitor, _ = self.make_monitor(tmp_path, check=check, interval=0.05)
+        monitor.start()
+        try:
+            assert wait_until(lambda: len(attempts) >= 2)
+        finally:
+            monitor.stop()
+        assert monitor.stats()["errors"] == 1
+
+    def test_default_check_caps_snapshot_age_at_interval(self, tmp_path, monkeypatch):
+        import paper_trader.position_manager as position_manager
+        ages = []
+
+        class FakeManager:
+            def check_mid_trade_exits(self, max_age_seconds=None):
+                ages.append(max_age_seconds)
+                return {"take_profit": 0, "stop_loss": 0, "pnl_eur": 0.0}
+
+        monkeypatch.setattr(position_manager, "get_position_manager", lambda: FakeManager())
+        monitor = ExitMonitor(
+            interval_seconds=5.0,
+            open_markets=lambda: [],
+        )
+        monitor.check_once()
+        assert ages == [5.0]
+
+
+class TestLockScope:
+    """Network calls happen before the position state lock is taken."""
+
+    def test_mid_trade_snapshots_fetched_outside_lock(self, tmp_path, monkeypatch):
+        import paper_trader.position_manager as position_manager
+        lock = PositionStateLock(tmp_path / "state.lock")
+        monkeypatch.setattr(position_manager, "get_position_state_lock", lambda: lock)
+        monkeypatch.setattr(position_manager, "TP_STATE_PATH", tmp_path / "tp_state.json")
+
+        paper_logger = PaperTradingLogger(logs_dir=tmp_path / "logs", reports_dir=tmp_path / "reports")
+        monkeypatch.setattr(position_manager, "get_paper_logger", lambda: paper_logger)
+        manager = position_manager.PositionManager()
+        paper_logger.log_position(make_position("p1"))
+        held_during_fetch = []
+
+        def fetch(market_ids, max_age_seconds=None):
+            other = PositionStateLock(tmp_path / "state.lock")
+            held_during_fetch.append(not other.acquire(timeout=0))
+            if not held_during_fetch[-1]:
+                other.release()
+            # Another holder closes the position while snapshots are fetched
+            paper_logger.log_position(make_position("p1", status="CLOSED"))
+            return {}
+
+        monkeypatch.setattr(position_manager, "get_market_snapshots", fetch)
+        summary = manager.check_mid_trade_exits()
+
+        assert held_during_fetch == [False]
+        # Positions are re-read under the lock
+        assert summary["checked"] == 0
+
+    def test_entry_snapshot_fetched_outside_lock(self, tmp_path, monkeypatch):
+        import paper_trader.simulator as simulator
+        lock = PositionStateLock(tmp_path / "state.lock")
+        monkeypatch.setattr(simulator, "get_position_state_lock", lambda: lock)
+        entered_with = []
+
+        def fetch(market_id):
+            other = PositionStateLock(tmp_path / "state.lock")
+            entered_with.append(other.acquire(timeout=0))
+            other.release()
+            return None
+
+        def enter(self, proposal, snapshot):
+            other = PositionStateLock(tmp_path / "state.lock")
+            entered_with.append(other.acquire(timeout=0))
+            return None, None
+
+        monkeypatch.setattr(simulator, "get_market_snapshot", fetch)
+        monkeypatch.setattr(simulator.ExecutionSimulator, "_enter", enter)
+        sim = simulator.ExecutionSimulator.__new__(simulator.ExecutionSimulator)
+        sim.simulate_entry(type("Proposal", (), {"market_id": "m1"})())
+
+        # Free while fetching, held by the entry
+        assert entered_with == [True, False]
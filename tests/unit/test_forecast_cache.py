@@ -0,0 +1,380 @@
+"""
+UNIT TESTS - FORECAST CACHE
+============================
+Tests for core/forecast_sources/cache.py
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from core.forecast_sources.cache import (
+    ForecastCache,
+    ForecastDiskStore,
+    get_forecast_cache,
+    reset_forecast_cache,
+)
+from shared.rate_limiter import get_rate_limiter, reset_rate_limiter
+
+
+def _open_meteo_payload(start: datetime, hours: int = 72):
+    times = [(start + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M") for i in range(hours)]
+    return {
+        "hourly": {
+            "time": times,
+            "temperature_2m": [10.0 + (i % 24) * 0.5 for i in range(hours)],
+            "precipitation_probability": [0] * hours,
+            "wind_speed_10m": [5.0] * hours,
+        }
+    }
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    get_forecast_cache().attach_store(None)
+    reset_forecast_cache()
+    reset_rate_limiter()
+    yield
+    get_forecast_cache().attach_store(None)
+    reset_forecast_cache()
+    reset_rate_limiter()
+
+
+class TestForecastCache:
+    def test_second_lookup_is_hit(self):
+        cache = ForecastCache()
+        calls = []
+
+        def fetcher():
+            calls.append(1)
+            return {"ok": True}
+
+        assert cache.get_or_fetch("open_meteo", (40.7128, -74.006), fetcher) == {"ok": True}
+        assert cache.get_or_fetch("open_meteo", (40.7128, -74.006), fetcher) == {"ok": True}
+        assert len(calls) == 1
+        assert cache.stats() == {"entries": 1, "hits": 1, "disk_hits": 0, "misses": 1}
+
+    def test_keys_separate_sources_and_cities(self):
+        cache = ForecastCache()
+        cache.get_or_fetch("open_meteo", (1.0, 2.0), lambda: {"a": 1})
+        cache.get_or_fetch("met_norway", (1.0, 2.0), lambda: {"b": 1})
+        cache.get_or_fetch("open_meteo", (3.0, 4.0), lambda: {"c": 1})
+        assert cache.stats()["misses"] == 3
+
+    def test_failed_fetch_is_cached(self):
+        cache = ForecastCache()
+        calls = []
+
+        def fetcher():
+            calls.append(1)
+            return None
+
+        assert cache.get_or_fetch("noaa", (1.0, 2.0), fetcher) is None
+        assert cache.get_or_fetch("noaa", (1.0, 2.0), fetcher) is None
+        assert len(calls) == 1
+
+    def test_fetcher_exception_returns_none(self):
+        cache = ForecastCache()
+
+        def fetcher():
+            raise RuntimeError("boom")
+
+        assert cache.get_or_fetch("noaa", (1.0, 2.0), fetcher) is None
+
+    def test_expired_entry_refetched(self):
+        cache = ForecastCache(source_ttls={"x": 0.01})
+        calls = []
+        cache.get_or_fetch("x", (1.0, 2.0), lambda: calls.append(1) or {})
+        time.sleep(0.02)
+        cache.get_or_fetch("x", (1.0, 2.0), lambda: calls.append(1) or {})
+        assert len(calls) == 2
+
+    def test_concurrent_requests_share_one_fetch(self):
+        cache = ForecastCache()
+        calls = []
+
+        def slow_fetcher():
+            calls.append(1)
+            time.sleep(0.05)
+            return {"ok": True}
+
+        threads = [
+            threading.Thread(target=cache.get_or_fetch, args=("x", (1.0, 2.0), slow_fetcher))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+
+    def test_clear_resets_stats(self):
+        cache = ForecastCache()
+        cache.get_or_fetch("x", (1.0, 2.0), lambda: {})
+        cache.clear()
+        assert cache.stats() == {"entries": 0, "hits": 0, "disk_hits": 0, "misses": 0}
+
+
+class TestForecastDiskStore:
+    def test_restart_reuses_disk_payload(self, tmp_path):
+        first = ForecastCache(store=ForecastDiskStore(tmp_path))
+        first.get_or_fetch("open_meteo", (1.0, 2.0), lambda: {"hourly": {"time": []}})
+
+        # New process: empty memory, same directory
+        second = ForecastCache(store=ForecastDiskStore(tmp_path))
+        calls = []
+        payload = second.get_or_fetch("open_meteo", (1.0, 2.0), lambda: calls.append(1) or {})
+
+        assert payload == {"hourly": {"time": []}}
+        assert calls == []
+        assert second.stats()["disk_hits"] == 1
+        assert second.stats()["misses"] == 0
+
+    def test_disk_entry_respects_source_ttl(self, tmp_path):
+        store = ForecastDiskStore(tmp_path)
+        ForecastCache(store=store).get_or_fetch("met_norway", (1.0, 2.0), lambda: {"v": 1})
+
+        time.sleep(0.02)
+        cache = ForecastCache(source_ttls={"met_norway": 0.01}, store=store)
+        calls = []
+        assert cache.get_or_fetch("met_norway", (1.0, 2.0), lambda: calls.append(1) or {"v": 2}) == {"v": 2}
+        assert calls == [1]
+
+    def test_failed_fetch_not_persisted(self, tmp_path):
+        ForecastCache(store=ForecastDiskStore(tmp_path)).get_or_fetch("noaa", (1.0, 2.0), lambda: None)
+
+        calls = []
+        cache = ForecastCache(store=ForecastDiskStore(tmp_path))
+        cache.get_or_fetch("noaa", (1.0, 2.0), lambda: calls.append(1) or {"ok": 1})
+        assert calls == [1]
+
+    def test_prune_drops_old_rows(self, tmp_path):
+        store = ForecastDiskStore(tmp_path)
+        store.save(("x", 1.0, 2.0), time.time() - 10_000, {"old": True})
+        store.save(("x", 3.0, 4.0), time.time(), {"new": True})
+        assert store.prune(3600) == 1
+        assert store.load(("x", 3.0, 4.0), 3600) is not None
+
+
+class TestSourceCacheIntegration:
+    def test_open_meteo_answers_any_target_time_from_one_request(self):
+        from core.forecast_sources.open_meteo_client import OpenMeteoSource
+
+        start = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+        payload = _open_meteo_payload(start)
+
+        with patch("core.forecast_sources.api_get", return_value=payload) as mock_get:
+            source = OpenMeteoSource()
+            first = source.fetch("New York", start + timedelta(hours=5))
+            second = source.fetch("New York", start + timedelta(hours=30))
+
+        assert mock_get.call_count == 1
+        assert first is not None and second is not None
+        assert first.temperature_f != second.temperature_f
+        assert len(second.hourly_temperatures) == 72
+
+    def test_city_alias_shares_entry(self):
+        from core.noaa_client import fetch_forecast_for_city
+
+        payload = {"properties": {"periods": [
+            {"startTime": datetime.utcnow().isoformat(), "temperature": 70, "temperatureUnit": "F"},
+        ]}}
+        with patch("core.noaa_client._fetch_forecast_uncached", return_value=payload) as mock_fetch:
+            assert fetch_forecast_for_city("nyc", datetime.utcnow()) is not None
+            assert fetch_forecast_for_city("New York", datetime.utcnow()) is not None
+
+        assert mock_fetch.call_count == 1
+        assert get_forecast_cache().stats()["hits"] == 1
+
+
+class TestAsyncPrefetch:
+    def _transport(self, seen_urls, delay=0.0):
+        import asyncio
+        import httpx
+
+        start = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+
+        async def handler(request):
+            seen_urls.append(str(request.url))
+            if delay:
+                await asyncio.sleep(delay)
+            # Open-Meteo answers a coordinate list with a list of locations
+            locations = request.url.params.get("latitude", "").count(",") + 1
+            if locations > 1:
+                return httpx.Response(200, json=[_open_meteo_payload(start)] * locations)
+            return httpx.Response(200, json=_open_meteo_payload(start))
+
+        return httpx.MockTransport(handler)
+
+    def test_prefetch_fills_cache_once_per_city(self):
+        pytest.importorskip("httpx")
+        from core.forecast_sources.async_fetch import prefetch_forecasts
+        from core.forecast_sources.open_meteo_client import OpenMeteoSource
+
+        seen = []
+        summary = prefetch_forecasts(
+            ["New York", "nyc", "London", "New York", "Atlantis"],
+            [OpenMeteoSource()],
+            transport=self._transport(seen),
+        )
+
+        # "nyc" is not in GLOBAL_CITY_COORDINATES, "Atlantis" unknown;
+        # New York + London go out as one batched Open-Meteo request
+        assert summary["requested"] == 1
+        assert summary["fetched"] == 1
+        assert len(seen) == 1
+        assert "latitude=40.7128,51.5074" in seen[0]
+
+        with patch("core.forecast_sources.api_get") as mock_get:
+            forecast = OpenMeteoSource().fetch("London", datetime.utcnow() + timedelta(hours=10))
+        assert forecast is not None
+        mock_get.assert_not_called()
+
+    def test_prefetch_skips_cached_pairs(self):
+        pytest.importorskip("httpx")
+        from core.forecast_sources.async_fetch import prefetch_forecasts
+        from core.forecast_sources.open_meteo_client import OpenMeteoSource
+
+        seen = []
+        prefetch_forecasts(["London"], [OpenMeteoSource()], transport=self._transport(seen))
+        summary = prefetch_forecasts(["London"], [OpenMeteoSource()], transport=self._transport(seen))
+        assert summary["requested"] == 0
+        assert len(seen) == 1
+
+    def test_requests_run_concurrently(self):
+        pytest.importorskip("httpx")
+        from core.forecast_sources.async_fetch import prefetch_forecasts
+        from core.forecast_sources.open_meteo_client import OpenMeteoSource
+        from core.forecast_sources.met_norway_client import MetNorwaySource
+
+        seen = []
+        summary = prefetch_forecasts(
+            ["London", "Paris", "Berlin", "Tokyo"],
+            [OpenMeteoSource(), MetNorwaySource()],
+            transport=self._transport(seen, delay=0.2),
+        )
+        # 1 batched Open-Meteo request + 4 MET Norway requests
+        assert summary["requested"] == 5
+        # 5 requests x 0.2 s serially would be 1.0 s
+        assert summary["duration_seconds"] < 0.6
+
+    def test_failed_requests_are_negative_cached(self):
+        httpx = pytest.importorskip("httpx")
+        from core.forecast_sources.async_fetch import prefetch_forecasts
+        from core.forecast_sources.open_meteo_client import OpenMeteoSource
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(503))
+        summary = prefetch_forecasts(["London"], [OpenMeteoSource()], transport=transport)
+        assert summary["failed"] == 1
+
+        with patch("core.forecast_sources.api_get") as mock_get:
+            assert OpenMeteoSource().fetch("London", datetime.utcnow()) is None
+        mock_get.assert_not_called()
+
+    def test_batch_cities_ride_along_in_one_request(self):
+        pytest.importorskip("httpx")
+        from core.forecast_sources import GLOBAL_CITY_COORDINATES
+        from core.forecast_sources.async_fetch import prefetch_forecasts
+        from core.forecast_sources.open_meteo_client import OpenMeteoSource
+
+        seen = []
+        summary = prefetch_forecasts(
+            ["London"], [OpenMeteoSource()],
+            transport=self._transport(seen),
+            batch_cities=list(GLOBAL_CITY_COORDINATES),
+        )
+        assert summary["requested"] == 1
+        assert get_forecast_cache().stats()["entries"] == len(GLOBAL_CITY_COORDINATES)
+
+    def test_failed_batch_is_not_negative_cached(self):
+        httpx = pytest.importorskip("httpx")
+        from core.forecast_sources.async_fetch import prefetch_forecasts
+        from core.forecast_sources.open_meteo_client import OpenMeteoSource
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(503))
+        prefetch_forecasts(["London", "Paris"], [OpenMeteoSource()], transport=transport)
+
+        start = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+        with patch("core.forecast_sources.api_get", return_value=_open_meteo_payload(start)) as mock_get:
+            assert OpenMeteoSource().fetch("London", datetime.utcnow()) is not None
+        assert mock_get.call_count == 1
+
+    def test_open_circuit_stops_prefetch_before_any_request(self):
+        pytest.importorskip("httpx")
+        from core.forecast_sources.async_fetch import prefetch_forecasts
+        from core.forecast_sources.open_meteo_client import OpenMeteoSource
+        from core.forecast_sources.met_norway_client import MetNorwaySource
+
+        for _ in range(10):
+            get_rate_limiter().record("https://api.open-meteo.com/v1/forecast", 503)
+            get_rate_limiter().record("https://api.met.no/weatherapi", None)
+
+        seen = []
+        summary = prefetch_forecasts(
+            ["London", "Paris"], [OpenMeteoSource(), MetNorwaySource()],
+            transport=self._transport(seen),
+        )
+        assert summary["requested"] == 3
+        assert summary["fetched"] == 0
+        assert seen == []
+
+    def test_429_retry_after_is_recorded(self):
+        httpx = pytest.importorskip("httpx")
+        from core.forecast_sources.async_fetch import prefetch_forecasts
+        from core.forecast_sources.open_meteo_client import OpenMeteoSource
+
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(429, headers={"Retry-After": "120"})
+        )
+        prefetch_forecasts(["London"], [OpenMeteoSource()], transport=transport)
+
+        bucket = get_rate_limiter().bucket("api.open-meteo.com")
+        assert bucket.rate < bucket.base_rate
+        # Host is blocked for Retry-After, beyond the limiter's max wait
+        assert get_rate_limiter().reserve("https://api.open-meteo.com/v1/forecast") is None
+
+
+class TestFetchMany:
+    def test_open_meteo_fetches_all_cities_in_one_request(self):
+        from core.forecast_sources.open_meteo_client import OpenMeteoSource
+
+        start = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+        batch = [_open_meteo_payload(start) for _ in range(3)]
+        with patch("core.forecast_sources.api_get", return_value=batch) as mock_get:
+            results = OpenMeteoSource().fetch_many(
+                ["London", "Paris", "Tokyo", "Atlantis"], start + timedelta(hours=6)
+            )
+
+        assert mock_get.call_count == 1
+        assert list(results) == ["London", "Paris", "Tokyo", "Atlantis"]
+        assert results["Tokyo"] is not None and results["Tokyo"].city == "Tokyo"
+        assert results["Atlantis"] is None
+
+    def test_shape_mismatch_falls_back_to_single_requests(self):
+        from core.forecast_sources.open_meteo_client import OpenMeteoSource
+
+        start = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+        single = _open_meteo_payload(start)
+        responses = [[single], single, single]
+        with patch("core.forecast_sources.api_get", side_effect=responses) as mock_get:
+            results = OpenMeteoSource().fetch_many(["London", "Paris"], start)
+
+        assert mock_get.call_count == 3
+        assert all(r is not None for r in results.values())
+
+    def test_sources_without_batch_emulate_per_city(self):
+        from core.forecast_sources.met_norway_client import MetNorwaySource
+
+        source = MetNorwaySource()
+        with patch.object(source, "fetch", return_value=None) as mock_fetch:
+            results = source.fetch_many(["London", "Paris"], datetime.utcnow())
+
+        assert mock_fetch.call_count == 2
+        assert results == {"London": None, "Paris": None}
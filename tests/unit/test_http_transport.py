@@ -0,0 +1,205 @@
+"""
+UNIT TESTS - HTTP TRANSPORT
+============================
+Tests for shared/http_transport.py (conditional GETs, retries, pooling)
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import json
+
+import pytest
+import requests
+
+from shared.http_transport import HttpTransport, ValidatorStore
+from shared.rate_limiter import RateLimiter
+
+URL = "https://gamma-api.polymarket.com/events?tag_slug=weather"
+
+
+def make_response(status, body=None, headers=None, url=URL):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = json.dumps(body).encode() if body is not None else b""
+    resp.headers.update(headers or {})
+    resp.url = url
+    return resp
+
+
+class FakeSession:
+    """Returns queued responses (or raises queued exceptions)."""
+
+    def __init__(self, *responses):
+        self.headers = {}
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append({"url": url, "headers": dict(headers or {}), "timeout": timeout})
+        item = self.responses.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def close(self):
+        pass
+
+
+def make_transport(*responses, **kwargs):
+    session = FakeSession(*responses)
+    transport = HttpTransport(
+        session=session,
+        limiter=RateLimiter(host_limits={}),
+        sleep=lambda s: None,
+        **kwargs,
+    )
+    return transport, session
+
+
+class TestConditionalGet:
+    def test_304_served_from_validator_store(self):
+        transport, session = make_transport(
+            make_response(200, [{"id": 1}], {"ETag": '"v1"'}),
+            make_response(304),
+        )
+        first = transport.get(URL)
+        second = transport.get(URL)
+
+        assert first.data == [{"id": 1}] and not first.not_modified
+        assert second.ok and second.not_modified
+        assert second.data == [{"id": 1}]
+        assert session.requests[1]["headers"]["If-None-Match"] == '"v1"'
+        assert transport.validators.stats()["revalidated"] == 1
+
+    def test_last_modified_sent(self):
+        transport, session = make_transport(
+            make_response(200, {"a": 1}, {"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}),
+            make_response(304),
+        )
+        transport.get(URL)
+        transport.get(URL)
+        assert session.requests[1]["headers"]["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    def test_revalidated_body_is_a_fresh_copy(self):
+        transport, _ = make_transport(
+            make_response(200, [{"id": 1}], {"ETag": '"v1"'}),
+            make_response(304),
+        )
+        transport.get(URL).data[0]["_event_title"] = "mutated"
+        assert transport.get(URL).data == [{"id": 1}]
+
+    def test_no_validators_no_conditional_headers(self):
+        transport, session = make_transport(make_response(200, {"a": 1}), make_response(200, {"a": 2}))
+        transport.get(URL)
+        assert transport.get(URL).data == {"a": 2}
+        assert "If-None-Match" not in session.requests[1]["headers"]
+
+    def test_validator_store_is_bounded(self):
+        store = ValidatorStore(max_entries=2)
+        for i in range(3):
+            store.put(f"u{i}", f'"e{i}"', None, b"{}")
+        assert store.get("u0") is None
+        assert store.stats()["entries"] == 2
+
+    def test_304_after_eviction_refetches_unconditionally(self):
+        transport, session = make_transport(
+            make_response(200, {"a": 1}, {"ETag": '"v1"'}),
+            make_response(304),
+            make_response(200, {"a": 2}, {"ETag": '"v2"'}),
+            max_attempts=1,
+        )
+        transport.get(URL)
+        # Request goes out with the stored validators, entry evicted meanwhile
+        original_get = session.get
+
+        def evicting_get(url, headers=None, timeout=None):
+            transport.validators.discard(URL)
+            return original_get(url, headers=headers, timeout=timeout)
+
+        session.get = evicting_get
+        response = transport.get(URL)
+
+        assert response.ok and response.data == {"a": 2}
+        assert session.requests[1]["headers"]["If-None-Match"] == '"v1"'
+        assert "If-None-Match" not in session.requests[2]["headers"]
+        assert transport.validators.get(URL)[0] == '"v2"'
+
+    def test_validator_store_evicts_on_total_bytes(self):
+        store = ValidatorStore(max_entries=100, max_body_bytes=100, max_total_bytes=250)
+        for i in range(3):
+            store.put(f"u{i}", f'"e{i}"', None, b"x" * 100)
+        # Third body exceeds the budget: least recently used goes first
+        assert store.get("u0") is None
+        assert store.stats()["entries"] == 2
+        assert store.stats()["bytes"] == 200
+
+        # Replacing an entry does not count its old body twice
+        store.put("u2", '"e2b"', None, b"y" * 50)
+        assert store.stats()["bytes"] == 150
+        assert store.get("u1") is not None
+
+
+class TestRetries:
+    def test_retries_server_errors(self):
+        transport, session = make_transport(
+            make_response(502), make_response(200, {"ok": True}), max_attempts=3,
+        )
+        assert transport.get_json(URL) == {"ok": True}
+        assert len(session.requests) == 2
+
+    def test_retries_network_errors(self):
+        transport, session = make_transport(
+            requests.ConnectionError("reset"), make_response(200, {"ok": True}),
+        )
+        assert transport.get_json(URL) == {"ok": True}
+
+    def test_client_error_not_retried(self):
+        transport, session = make_transport(make_response(404), max_attempts=3)
+        response = transport.get(URL)
+        assert response.status == 404 and not response.ok
+        assert len(session.requests) == 1
+
+    def test_exhausted_attempts_report_error(self):
+        transport, _ = make_transport(make_response(500), make_response(503))
+        response = transport.get(URL)
+        assert not response.ok
+        assert response.error == "HTTP 503"
+
+    def test_params_are_encoded_into_url(self):
+        transport, session = make_transport(make_response(200, []))
+        transport.get("https://gamma-api.polymarket.com/events", params={"limit": 100, "offset": 0})
+        assert session.requests[0]["url"] == "https://gamma-api.polymarket.com/events?limit=100&offset=0"
+
+
+class TestCallers:
+    @pytest.fixture
+    def shared_transport(self, monkeypatch):
+        import shared.http_transport as http_transport
+
+        def install(*responses):
+            transport, session = make_transport(*responses)
+            monkeypatch.setattr(http_transport, "_transport", transport)
+            return session
+        yield install
+
+    def test_collector_events_page_revalidated(self, shared_transport):
+        from collector.client import PolymarketClient
+
+        events = [{"id": "e1", "markets": []}]
+        session = shared_transport(
+            make_response(200, events, {"ETag": '"p1"'}),
+            make_response(304),
+        )
+        client = PolymarketClient()
+        assert client.fetch_events(tag_slug="weather") == events
+        assert client.fetch_events(tag_slug="weather") == events
+        assert session.requests[1]["headers"]["If-None-Match"] == '"p1"'
+
+    def test_collector_client_error_raises(self, shared_transport):
+        from collector.client import PolymarketClient
+
+        shared_transport(make_response(400))
+        with pytest.raises(RuntimeError, match="Client error: 400"):
+            PolymarketClient().fetch_events()
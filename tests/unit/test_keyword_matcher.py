@@ -0,0 +1,85 @@
+"""
+UNIT TESTS - KEYWORD MATCHER
+=============================
+Tests for shared/keyword_matcher.py (single-pass multi-keyword matching)
+"""
+
+import sys
+import re
+import random
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from shared.keyword_matcher import KeywordMatcher
+from core.weather_market_classifier import WeatherMarketClassifier
+
+
+def per_keyword(keywords, text):
+    """Reference: the former one-regex-per-keyword scan."""
+    return {k for k in keywords if re.search(r"\b" + re.escape(k) + r"\b", text, re.IGNORECASE)}
+
+
+class TestWordBoundary:
+    def test_overlapping_keywords_all_found(self):
+        matcher = KeywordMatcher({"temperature", "highest temperature", "record", "record high"})
+        found = matcher.find_all("record high: the highest temperature in nyc")
+        assert found == ["record high", "record", "highest temperature", "temperature"]
+
+    def test_word_boundaries_respected(self):
+        matcher = KeywordMatcher({"rain", "fed", "s&p"})
+        assert matcher.find_all("terrain federal rainfall") == []
+        assert matcher.find_all("Rain, the Fed and the S&P 500") == ["rain", "fed", "s&p"]
+
+    def test_first_is_leftmost(self):
+        matcher = KeywordMatcher({"election", "war"})
+        assert matcher.first("war before the election") == "war"
+        assert matcher.first("sunny") is None
+
+    def test_matches_reference_on_classifier_sets(self):
+        keyword_sets = [
+            WeatherMarketClassifier.ALL_NEGATIVE_KEYWORDS,
+            WeatherMarketClassifier.ALL_TEXT_SIGNALS,
+            WeatherMarketClassifier.RESOLUTION_AUTHORITIES,
+        ]
+        vocabulary = sorted({k for s in keyword_sets for k in s}) + ["x", "the", "s", "&", "heat", "wave", "."]
+        matchers = [(keywords, KeywordMatcher(keywords)) for keywords in keyword_sets]
+        rng = random.Random(7)
+        for _ in range(300):
+            text = " ".join(
+                rng.choice(vocabulary) + rng.choice(["", "", "s", "-", "."])
+                for _ in range(rng.randint(1, 12))
+            )
+            for keywords, matcher in matchers:
+                assert set(matcher.find_all(text)) == per_keyword(keywords, text), text
+
+
+class TestSubstring:
+    def test_substring_mode_matches_in(self):
+        keywords = ["rain", "heat", "high temperature", "temperature"]
+        matcher = KeywordMatcher(keywords, word_boundary=False)
+        text = "drainage in a heatwave: high temperatures"
+        assert set(matcher.find_all(text)) == {k for k in keywords if k in text}
+        assert matcher.matches_any("terrain")
+        assert not matcher.matches_any("sunny")
+
+    def test_empty_keyword_set(self):
+        assert KeywordMatcher([]).find_all("anything") == []
+
+
+class TestIntegration:
+    def test_classifier_signals_in_text_order(self):
+        result = WeatherMarketClassifier().classify_market({
+            "question": "Will the highest temperature in NYC be 90°F or higher on July 20?",
+            "description": "Resolves per NOAA weather station data.",
+            "resolutionSource": "NOAA weather station",
+        })
+        assert result.matched_text_signals[:3] == [
+            "text:highest temperature", "text:temperature", "text:weather",
+        ]
+        assert "authority:noaa" in result.matched_structural_signals
+        assert "authority:weather station" in result.matched_structural_signals
+
+    def test_gamma_discovery_keywords(self):
+        from collector.gamma_discovery import _is_weather_market
+        assert _is_weather_market({"question": "Will NYC see record rainfall?"})
+        assert not _is_weather_market({"question": "Who wins the election?"})
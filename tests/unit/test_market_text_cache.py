@@ -0,0 +1,144 @@
+"""
+UNIT TESTS - MARKET TEXT CACHE
+===============================
+Tests for core/market_text_cache.py and the cached classifier, validator
+and filter text analysis
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import core.market_text_cache as market_text_cache
+from core.market_text_cache import (
+    MarketTextCache,
+    get_market_text_cache,
+    reset_market_text_cache,
+    text_key,
+)
+from core.weather_market_classifier import WeatherMarketClassifier
+from core.weather_market_filter import WeatherMarket, WeatherMarketFilter
+from core.weather_validation import WeatherValidator
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    reset_market_text_cache()
+    yield
+    reset_market_text_cache()
+
+
+RAW_MARKET = {
+    "id": "m-1",
+    "question": "Will the highest temperature in London be 20°C or higher on July 20?",
+    "description": "Resolves using the Met Office weather station at Heathrow.",
+    "_event_tags": ["Weather"],
+}
+
+
+def make_weather_market(odds_yes=0.05):
+    return WeatherMarket(
+        market_id="test-market-001",
+        question="Will London temperature exceed 20°C tomorrow?",
+        resolution_text="Resolves YES if temperature in London exceeds 20°C",
+        description="Weather prediction market for London",
+        category="WEATHER",
+        is_binary=True,
+        liquidity_usd=100.0,
+        odds_yes=odds_yes,
+        resolution_time=datetime.utcnow() + timedelta(hours=72),
+    )
+
+
+FILTER_CONFIG = {
+    "MIN_LIQUIDITY": 50,
+    "MIN_ODDS": 0.01,
+    "MAX_ODDS": 0.10,
+    "MIN_TIME_TO_RESOLUTION_HOURS": 48,
+    "ALLOWED_CITIES": ["London"],
+}
+
+
+class TestClassifier:
+    def test_unchanged_text_skips_matching(self, monkeypatch):
+        classifier = WeatherMarketClassifier()
+        first = classifier.classify_market(RAW_MARKET)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("text was re-analysed")
+
+        monkeypatch.setattr(classifier, "_classify_text", fail)
+        second = classifier.classify_market({**RAW_MARKET, "id": "m-2"})
+
+        assert second.classification == first.classification
+        assert second.matched_text_signals == first.matched_text_signals
+        assert second.market_id == "m-2"
+
+    def test_changed_text_is_reclassified(self):
+        classifier = WeatherMarketClassifier()
+        classifier.classify_market(RAW_MARKET)
+        other = classifier.classify_market({**RAW_MARKET, "question": "Who wins the election?"})
+        assert other.rejection_reason == "Negative filter: 'election'"
+        assert get_market_text_cache().stats()["entries"] == 2
+
+
+class TestValidator:
+    def test_cached_checklist_equal(self, monkeypatch):
+        validator = WeatherValidator()
+        args = ("Will NYC exceed 100°F?", "Per NOAA Central Park station, EST, by 11:59 PM", "")
+        first = validator.validate(*args)
+
+        monkeypatch.setattr(validator, "_validate_text", None)
+        assert validator.validate(*args) == first
+
+
+class TestFilter:
+    def test_text_cached_but_odds_checked_fresh(self, monkeypatch):
+        market_filter = WeatherMarketFilter(FILTER_CONFIG)
+        assert market_filter.filter_market(make_weather_market()).passed
+
+        monkeypatch.setattr(market_filter, "_detect_market_type", None)
+        monkeypatch.setattr(market_filter, "_check_resolution_explicit", None)
+
+        again = make_weather_market()
+        assert market_filter.filter_market(again).passed
+        assert again.detected_city == "London"
+        assert again.detected_range_f == (68.0, None)
+
+        rejected = market_filter.filter_market(make_weather_market(odds_yes=0.5))
+        assert not rejected.passed
+        assert any(r.startswith("ODDS") for r in rejected.rejection_reasons)
+
+
+class TestPersistence:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "cache.json"
+        cache = MarketTextCache(path)
+        cache.put("k", {"range_f": (1.0, None)})
+        cache.flush()
+
+        reloaded = MarketTextCache(path)
+        assert reloaded.get("k") == {"range_f": [1.0, None]}
+
+    def test_version_bump_invalidates(self, tmp_path, monkeypatch):
+        path = tmp_path / "cache.json"
+        cache = MarketTextCache(path)
+        old_key = text_key("classify", "question")
+        cache.put(old_key, {"x": 1})
+        cache.flush()
+
+        monkeypatch.setattr(market_text_cache, "CLASSIFIER_VERSION", market_text_cache.CLASSIFIER_VERSION + 1)
+        assert text_key("classify", "question") != old_key
+        assert len(MarketTextCache(path)) == 0
+
+    def test_stale_entries_pruned(self, tmp_path, monkeypatch):
+        cache = MarketTextCache(tmp_path / "cache.json")
+        cache.put("old", 1)
+        cache._entries["old"][1] -= (market_text_cache.MAX_AGE_DAYS + 1) * 86400
+        cache.put("new", 2)
+        cache.flush()
+        assert len(MarketTextCache(tmp_path / "cache.json")) == 1
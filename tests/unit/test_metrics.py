@@ -0,0 +1,108 @@
+"""
+UNIT TESTS - SOURCE METRICS
+============================
+Tests for shared/metrics.py and its instrumentation points
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+
+from shared.metrics import MetricsRegistry, get_metrics_registry, percentile, reset_metrics
+
+
+@pytest.fixture(autouse=True)
+def _fresh_metrics():
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        values = [float(i) for i in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 99) == 99.0
+
+    def test_empty(self):
+        assert percentile([], 95) == 0.0
+
+
+class TestRegistry:
+    def test_snapshot_per_source(self):
+        registry = MetricsRegistry()
+        for ms in (100, 200, 300, 400):
+            registry.record_request("open_meteo", ms / 1000, success=True, payload_bytes=1000)
+        registry.record_request("noaa", 2.0, success=False)
+        registry.record_request("noaa", 1.0, success=True)
+        registry.record_cache("open_meteo", "hit")
+        registry.record_cache("open_meteo", "hit")
+
+        snap = registry.snapshot()
+        assert list(snap) == ["noaa", "open_meteo"]
+        assert snap["open_meteo"]["requests"] == 4
+        assert snap["open_meteo"]["latency_p50_ms"] == 200.0
+        assert snap["open_meteo"]["latency_p99_ms"] == 400.0
+        assert snap["open_meteo"]["payload_bytes"] == 4000
+        assert snap["open_meteo"]["cache"] == {"hit": 2}
+        assert snap["noaa"]["error_rate"] == 0.5
+
+
+class TestInstrumentation:
+    def test_forecast_cache_records_status(self):
+        from core.forecast_sources.cache import ForecastCache
+
+        cache = ForecastCache()
+        cache.get_or_fetch("met_norway", (1.0, 2.0), lambda: {"ok": 1})
+        cache.get_or_fetch("met_norway", (1.0, 2.0), lambda: {"ok": 1})
+
+        assert get_metrics_registry().snapshot()["met_norway"]["cache"] == {"hit": 1, "miss": 1}
+
+    def test_transport_records_labelled_request(self):
+        import json
+        import requests
+        from shared.http_transport import HttpTransport
+        from shared.rate_limiter import RateLimiter
+
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = json.dumps({"hourly": {}}).encode()
+        resp.url = "https://api.open-meteo.com/v1/forecast"
+
+        class Session:
+            headers = {}
+
+            def get(self, url, headers=None, timeout=None):
+                return resp
+
+        transport = HttpTransport(session=Session(), limiter=RateLimiter(host_limits={}))
+        transport.get("https://api.open-meteo.com/v1/forecast", source="open_meteo")
+        transport.get("https://api.open-meteo.com/v1/forecast")
+
+        snap = get_metrics_registry().snapshot()
+        assert snap["open_meteo"]["requests"] == 1
+        assert snap["open_meteo"]["payload_bytes"] == len(resp._content)
+        # Unlabelled calls fall back to the host
+        assert snap["api.open-meteo.com"]["requests"] == 1
+
+
+class TestStatusSummary:
+    def test_source_lines_sorted_by_p95(self):
+        from app.orchestrator import Orchestrator
+
+        registry = get_metrics_registry()
+        registry.record_request("open_meteo", 0.1, success=True)
+        registry.record_request("noaa", 3.0, success=False)
+
+        lines = Orchestrator._format_source_metrics(registry.snapshot())
+        assert lines[0] == "Source metrics:"
+        assert lines[1].strip().startswith("noaa")
+        assert "err=100.0%" in lines[1]
+        assert "p95=  3000ms" in lines[1]
+
+    def test_no_metrics_no_lines(self):
+        from app.orchestrator import Orchestrator
+        assert Orchestrator._format_source_metrics({}) == []
@@ -0,0 +1,108 @@
+"""
+UNIT TESTS - NOAA CLIENT
+=========================
+Tests for core/noaa_client.py (gridpoint resolution cache)
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from unittest.mock import patch
+
+import pytest
+
+from core import noaa_client
+from core.noaa_client import (
+    GridpointCache,
+    get_gridpoint_cache,
+    _fetch_forecast_uncached,
+)
+
+GRID_URL = "https://api.weather.gov/gridpoints/OKX/33,35/forecast"
+NEW_GRID_URL = "https://api.weather.gov/gridpoints/OKX/34,35/forecast"
+FORECAST = {"properties": {"periods": []}}
+
+
+def _points(url):
+    return {"properties": {"forecast": url}}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_gridpoints():
+    get_gridpoint_cache().attach(None)
+    get_gridpoint_cache().clear()
+    yield
+    get_gridpoint_cache().attach(None)
+    get_gridpoint_cache().clear()
+
+
+class FakeNoaa:
+    """Routes _noaa_get calls: /points/ -> points payload, else forecast."""
+
+    def __init__(self, grid_url=GRID_URL, forecast_responses=None):
+        self.grid_url = grid_url
+        self.forecast_responses = list(forecast_responses or [])
+        self.calls = []
+
+    def __call__(self, url):
+        self.calls.append(url)
+        if "/points/" in url:
+            return 200, _points(self.grid_url), url
+        if self.forecast_responses:
+            return self.forecast_responses.pop(0)
+        return 200, FORECAST, url
+
+    @property
+    def points_calls(self):
+        return [c for c in self.calls if "/points/" in c]
+
+
+class TestGridpointResolution:
+    def test_points_resolved_once(self):
+        fake = FakeNoaa()
+        with patch.object(noaa_client, "_noaa_get", side_effect=fake):
+            assert _fetch_forecast_uncached(40.7128, -74.006) == FORECAST
+            assert _fetch_forecast_uncached(40.7128, -74.006) == FORECAST
+
+        assert len(fake.points_calls) == 1
+        assert len(fake.calls) == 3
+
+    def test_mapping_persisted_across_restart(self, tmp_path):
+        path = tmp_path / "noaa_gridpoints.json"
+        GridpointCache(path).set(40.7128, -74.006, GRID_URL)
+
+        get_gridpoint_cache().attach(path)
+        fake = FakeNoaa()
+        with patch.object(noaa_client, "_noaa_get", side_effect=fake):
+            assert _fetch_forecast_uncached(40.7128, -74.006) == FORECAST
+
+        assert fake.points_calls == []
+        assert fake.calls == [GRID_URL]
+
+    def test_404_triggers_refresh(self):
+        get_gridpoint_cache().set(40.7128, -74.006, GRID_URL)
+        fake = FakeNoaa(grid_url=NEW_GRID_URL, forecast_responses=[(404, None, GRID_URL)])
+        with patch.object(noaa_client, "_noaa_get", side_effect=fake):
+            assert _fetch_forecast_uncached(40.7128, -74.006) == FORECAST
+
+        assert fake.calls[-1] == NEW_GRID_URL
+        assert get_gridpoint_cache().get(40.7128, -74.006) == NEW_GRID_URL
+
+    def test_redirect_triggers_refresh(self):
+        get_gridpoint_cache().set(40.7128, -74.006, GRID_URL)
+        fake = FakeNoaa(grid_url=NEW_GRID_URL, forecast_responses=[(200, FORECAST, NEW_GRID_URL)])
+        with patch.object(noaa_client, "_noaa_get", side_effect=fake):
+            assert _fetch_forecast_uncached(40.7128, -74.006) == FORECAST
+
+        assert len(fake.points_calls) == 1
+        assert get_gridpoint_cache().get(40.7128, -74.006) == NEW_GRID_URL
+
+    def test_server_error_keeps_mapping(self):
+        get_gridpoint_cache().set(40.7128, -74.006, GRID_URL)
+        fake = FakeNoaa(forecast_responses=[(503, None, GRID_URL)])
+        with patch.object(noaa_client, "_noaa_get", side_effect=fake):
+            assert _fetch_forecast_uncached(40.7128, -74.006) is None
+
+        assert fake.points_calls == []
+        assert get_gridpoint_cache().get(40.7128, -74.006) == GRID_URL
@@ -8,6 +8,7 @@
 # - Schema validation rejects bad records
 # - Append-only writer writes exactly one line
 # - Dedup logic
+# - Bulk resolution check
 #
 # =============================================================================
 
@@ -35,10 +36,12 @@ from core.outcome_tracker import (
     get_minute_bucket,
     create_prediction_snapshot,
     create_resolution_record,
+    ResolutionChecker,
     SCHEMA_VERSION,
     VALID_RESOLUTIONS,
     VALID_DECISIONS,
 )
+from collector.client import PolymarketClient
 
 
 # =============================================================================
@@ -592,5 +595,92 @@ class TestStats:
         assert stats["coverage_pct"] == 100.0
 
 
+# =============================================================================
+# TEST: BULK RESOLUTION CHECK
+# =============================================================================
+
+
+class _BulkClient:
+    def __init__(self, markets):
+        self.markets = markets
+        self.calls = []
+
+    def fetch_markets_by_ids(self, market_ids):
+        self.calls.append(list(market_ids))
+        return {mid: self.markets[mid] for mid in market_ids if mid in self.markets}
+
+
+class _GammaClient(PolymarketClient):
+    """Gamma stub whose /markets list omits closed markets (like the live API)."""
+
+    def __init__(self, markets):
+        super().__init__()
+        self.markets = markets
+        self.endpoints = []
+
+    def _request(self, endpoint, params=None):
+        self.endpoints.append(endpoint)
+        if endpoint.startswith("/markets/"):
+            market = self.markets.get(endpoint[len("/markets/"):])
+            if market is None:
+                raise RuntimeError("Client error: 404")
+            return [market]
+        return [
+            m for m in self.markets.values()
+            if m["id"] in params.get("id", []) and not m["closed"]
+        ]
+
+
+class TestBulkResolutionCheck:
+    """check_market_resolutions: one bulk lookup, fail-closed parsing."""
+
+    def test_resolves_from_one_bulk_lookup(self, storage):
+        client = _BulkClient({
+            "1": {"closed": True, "outcomes": '["Yes", "No"]', "outcomePrices": '["1", "0"]'},
+            "2": {"closed": False, "outcomes": '["Yes", "No"]', "outcomePrices": '["0.4", "0.6"]'},
+            "3": {"closed": True, "outcomes": '["Yes", "No"]', "outcomePrices": '["0", "0"]'},
+            "4": {"closed": True, "outcomes": "not json", "outcomePrices": '["1", "0"]'},
+        })
+        results = ResolutionChecker(storage).check_market_resolutions(
+            ["1", "2", "3", "4", "missing"], client=client,
+        )
+
+        assert len(client.calls) == 1
+        assert results["1"].resolution == "YES"
+        assert [results[mid] for mid in ("2", "3", "4")] == [None] * 3
+        assert "missing" not in results
+
+    def test_closed_market_missing_from_bulk_uses_single_lookup(self, storage, monkeypatch):
+        import collector.client
+
+        client = _GammaClient({
+            "closed_1": {"id": "closed_1", "closed": True, "outcomes": '["Yes", "No"]', "outcomePrices": '["0", "1"]'},
+            "open_3": {"id": "open_3", "closed": False, "outcomes": '["Yes", "No"]', "outcomePrices": '["0.4", "0.6"]'},
+        })
+        monkeypatch.setattr(collector.client, "PolymarketClient", lambda timeout=10: client)
+
+        for market_id in ("closed_1", "gone_2", "open_3"):
+            storage.write_prediction(create_prediction_snapshot(
+                market_id=market_id,
+                question="Will test pass?",
+                decision="NO_TRADE",
+                decision_reasons=["test"],
+                engine="baseline",
+                mode="SHADOW",
+                run_id="test_run_001",
+                source="cli",
+            ))
+
+        summary = ResolutionChecker(storage).update_resolutions()
+
+        # One bulk request, single lookups only for the ids it omitted
+        assert client.endpoints.count("/markets") == 1
+        assert sorted(e for e in client.endpoints if e != "/markets") == ["/markets/closed_1", "/markets/gone_2"]
+        assert summary["new_resolutions"] == 1
+        assert summary["errors"] == 1
+        assert [r.resolution for r in storage.read_resolutions()] == ["NO"]
+        assert storage.get_unresolved_market_ids() == {"gone_2", "open_3"}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,173 @@
+"""
+UNIT TESTS - PRICE FEED
+========================
+Tests for paper_trader/price_feed.py (local order book, reconnects,
+snapshot source) against the in-process LocalFeedServer
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import paper_trader.price_feed as price_feed
+from paper_trader.price_feed import LocalFeedServer, OrderBook, PriceFeed
+from paper_trader.snapshot_client import MarketSnapshotClient
+
+
+TOKENS = {"m1": "tok-yes-1", "m2": "tok-yes-2"}
+
+
+def resolver(market_ids):
+    return {m: TOKENS[m] for m in market_ids if m in TOKENS}
+
+
+def book(asset, bids, asks):
+    return {
+        "event_type": "book",
+        "asset_id": asset,
+        "bids": [{"price": str(p), "size": str(s)} for p, s in bids],
+        "asks": [{"price": str(p), "size": str(s)} for p, s in asks],
+    }
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def start_feed(server, markets=("m1",)):
+    feed = PriceFeed(connect=server.connect, token_resolver=resolver)
+    feed.watch(list(markets))
+    feed.start()
+    assert feed.wait_connected(2)
+    return feed
+
+
+class TestOrderBook:
+    def test_levels_and_deltas(self):
+        ob = OrderBook()
+        ob.replace([{"price": "0.40", "size": "10"}, {"price": "0.42", "size": "5"}],
+                   [{"price": "0.45", "size": "3"}, {"price": "0.50", "size": "0"}])
+        assert (ob.best_bid(), ob.best_ask()) == (0.42, 0.45)
+
+        ob.apply("SELL", 0.44, 7)
+        ob.apply("BUY", 0.42, 0)
+        assert (ob.best_bid(), ob.best_ask()) == (0.40, 0.44)
+
+
+class TestPriceFeed:
+    def test_book_and_price_changes_update_top_of_book(self):
+        server = LocalFeedServer()
+        feed = start_feed(server)
+        try:
+            assert server.subscribed_assets() == ["tok-yes-1"]
+            server.publish([book("tok-yes-1", [(0.40, 10)], [(0.46, 5)])])
+            assert wait_until(lambda: feed.top_of_book("m1") == (0.40, 0.46))
+
+            server.publish({
+                "event_type": "price_change",
+                "market": "0xcond",
+                "price_changes": [
+                    {"asset_id": "tok-yes-1", "price": "0.43", "size": "8", "side": "BUY"},
+                    {"asset_id": "tok-yes-1", "price": "0.46", "size": "0", "side": "SELL"},
+                    {"asset_id": "tok-yes-1", "price": "0.47", "size": "2", "side": "SELL"},
+                ],
+            })
+            assert wait_until(lambda: feed.top_of_book("m1") == (0.43, 0.47))
+
+            snapshot = feed.snapshot("m1")
+            assert abs(snapshot.mid_price - 0.45) < 1e-9
+            assert not snapshot.is_resolved
+        finally:
+            feed.stop()
+
+    def test_listener_called_per_update(self):
+        server = LocalFeedServer()
+        feed = start_feed(server)
+        updates = []
+        seen = threading.Event()
+
+        def on_update(market_id):
+            updates.append(market_id)
+            seen.set()
+
+        feed.add_listener(on_update)
+        try:
+            server.publish(book("tok-yes-1", [(0.40, 1)], [(0.41, 1)]))
+            assert seen.wait(2)
+            assert updates == ["m1"]
+        finally:
+            feed.stop()
+
+    def test_watchlist_changes_are_sent_while_connected(self):
+        server = LocalFeedServer()
+        feed = start_feed(server)
+        try:
+            feed.set_watchlist(["m2"])
+            assert server.wait_for_subscriptions(3)
+            assert server.subscribed_assets() == ["tok-yes-2"]
+            assert feed.watched_markets() == ["m2"]
+        finally:
+            feed.stop()
+
+    def test_reconnect_drops_books_and_resubscribes(self, monkeypatch):
+        monkeypatch.setattr(price_feed, "RECONNECT_MIN_SECONDS", 0.01)
+        server = LocalFeedServer()
+        feed = start_feed(server, markets=("m1", "m2"))
+        try:
+            server.publish(book("tok-yes-1", [(0.40, 1)], [(0.41, 1)]))
+            assert wait_until(lambda: feed.top_of_book("m1") is not None)
+
+            server.drop_connections()
+            assert wait_until(lambda: server.connects == 2 and feed.connected)
+            # Old book is gone until the server sends a fresh snapshot
+            assert feed.top_of_book("m1") is None
+            assert server.subscribed_assets() == ["tok-yes-1", "tok-yes-2"]
+
+            server.publish(book("tok-yes-1", [(0.30, 1)], [(0.32, 1)]))
+            assert wait_until(lambda: feed.top_of_book("m1") == (0.30, 0.32))
+        finally:
+            feed.stop()
+
+
+class TestSnapshotSource:
+    def test_live_books_answer_without_gamma(self):
+        server = LocalFeedServer()
+        feed = start_feed(server, markets=("m1", "m2"))
+        calls = []
+
+        class Gamma:
+            def fetch_markets_by_ids(self, market_ids):
+                calls.append(list(market_ids))
+                return {m: {"id": m, "outcomePrices": '["0.9", "0.1"]', "closed": True,
+                            "outcome": "Yes"} for m in market_ids}
+
+        client = MarketSnapshotClient()
+        client._client = Gamma()
+        client.attach_price_feed(feed)
+        try:
+            server.publish(book("tok-yes-1", [(0.40, 1)], [(0.42, 1)]))
+            assert wait_until(lambda: feed.top_of_book("m1") is not None)
+
+            snapshots = client.get_snapshots_batch(["m1", "m2"])
+            assert abs(snapshots["m1"].mid_price - 0.41) < 1e-9
+            assert snapshots["m2"].mid_price == 0.9
+            assert calls == [["m2"]]
+
+            # Resolution checks bypass the feed
+            resolved = client.get_snapshots_batch(["m1"], live=False)
+            assert resolved["m1"].is_resolved
+        finally:
+            feed.stop()
+
+    def test_start_without_websocket_client_is_disabled(self, monkeypatch):
+        monkeypatch.setattr(price_feed, "websocket", None)
+        monkeypatch.setattr(price_feed, "_price_feed", None)
+        assert price_feed.start_price_feed() is None
+        assert price_feed.get_price_feed() is None
@@ -0,0 +1,191 @@
+"""
+UNIT TESTS - RATE LIMITER
+==========================
+Tests for shared/rate_limiter.py (token bucket, Retry-After, circuit breaker)
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import pytest
+
+from shared.rate_limiter import (
+    CircuitBreaker,
+    RateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+    parse_retry_after,
+    reset_rate_limiter,
+)
+
+URL = "https://api.example.com/v1/forecast?lat=1"
+
+
+class FakeClock:
+    """Manual monotonic clock; sleep() advances it."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_limiter(clock, rate=2.0, burst=2, **kwargs):
+    return RateLimiter(
+        host_limits={"api.example.com": (rate, burst)},
+        clock=clock, sleep=clock.sleep, **kwargs,
+    )
+
+
+class TestTokenBucket:
+    def test_burst_then_paced(self, clock):
+        bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_throttle_halves_rate_and_blocks(self, clock):
+        bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+        bucket.on_throttled(retry_after=10)
+        assert bucket.rate == pytest.approx(1.0)
+        assert bucket.reserve() >= 10.0
+
+    def test_success_raises_rate_up_to_cap(self, clock):
+        bucket = TokenBucket(rate=1.0, burst=1, clock=clock)
+        for _ in range(200):
+            bucket.on_success()
+        assert bucket.rate == pytest.approx(bucket.max_rate)
+        assert bucket.rate > 1.0
+
+
+class TestRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("7") == 7.0
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 25 <= parse_retry_after(format_datetime(when, usegmt=True)) <= 31
+
+    def test_garbage(self):
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_in_window(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, window_seconds=60, cooldown_seconds=120, clock=clock)
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+    def test_failures_outside_window_do_not_count(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, window_seconds=60, clock=clock)
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now += 61
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_single_trial(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=120, clock=clock)
+        breaker.record_failure()
+        clock.now += 121
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_trial_reopens(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=120, clock=clock)
+        breaker.record_failure()
+        clock.now += 121
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+
+class TestRateLimiter:
+    def test_acquire_sleeps_for_token(self, clock):
+        limiter = make_limiter(clock)
+        for _ in range(3):
+            assert limiter.acquire(URL)
+        assert clock.slept == [pytest.approx(0.5)]
+
+    def test_429_retry_after_blocks_host(self, clock):
+        limiter = make_limiter(clock)
+        limiter.record(URL, 429, "5")
+        assert limiter.acquire(URL)
+        assert sum(clock.slept) >= 5.0
+
+    def test_retry_after_beyond_max_wait_fails_fast(self, clock):
+        limiter = make_limiter(clock)
+        limiter.record(URL, 429, "600")
+        assert not limiter.acquire(URL, max_wait=30)
+        assert clock.slept == []
+
+    def test_dead_host_is_skipped(self, clock):
+        limiter = make_limiter(clock, failure_threshold=3)
+        for _ in range(3):
+            limiter.record(URL, None)
+        assert not limiter.acquire(URL)
+        # Other hosts are unaffected
+        assert limiter.acquire("https://other.example.org/x")
+        assert limiter.stats()["api.example.com"]["circuit"] == CircuitBreaker.OPEN
+
+    def test_404_counts_as_alive(self, clock):
+        limiter = make_limiter(clock, failure_threshold=2)
+        limiter.record(URL, None)
+        limiter.record(URL, 404)
+        limiter.record(URL, None)
+        assert limiter.acquire(URL)
+
+
+class TestIntegration:
+    @pytest.fixture(autouse=True)
+    def _fresh_limiter(self):
+        from shared.http_transport import reset_http_transport
+        reset_rate_limiter()
+        reset_http_transport()
+        yield
+        reset_rate_limiter()
+        reset_http_transport()
+
+    def test_api_get_skips_open_circuit(self):
+        from core.forecast_sources import api_get
+
+        url = "https://api.open-meteo.com/v1/forecast?latitude=1"
+        for _ in range(10):
+            get_rate_limiter().record(url, 503)
+
+        with patch("requests.Session.get") as mock_get:
+            assert api_get(url) is None
+        mock_get.assert_not_called()
+
+    def test_collector_client_fails_fast_on_open_circuit(self):
+        from collector.client import PolymarketClient
+
+        for _ in range(10):
+            get_rate_limiter().record("https://gamma-api.polymarket.com/events", None)
+
+        with patch("requests.Session.get") as mock_get:
+            with pytest.raises(RuntimeError, match="circuit open"):
+                PolymarketClient().fetch_events(tag_slug="weather")
+        mock_get.assert_not_called()
@@ -0,0 +1,130 @@
+"""
+UNIT TESTS - SNAPSHOT CLIENT
+=============================
+Tests for paper_trader/snapshot_client.py (run-scoped cache, coalescing)
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from paper_trader.snapshot_client import MarketSnapshotClient
+
+
+class FakeGamma:
+    """Stands in for PolymarketClient.fetch_markets_by_ids."""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = []
+
+    def fetch_markets_by_ids(self, market_ids):
+        self.calls.append(list(market_ids))
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("Client error: 500")
+        return {
+            mid: {"id": mid, "outcomePrices": '["0.40", "0.60"]'}
+            for mid in market_ids if mid != "missing"
+        }
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_client(gamma, ttl=60.0, clock=None):
+    client = MarketSnapshotClient(cache_ttl_seconds=ttl, clock=clock or FakeClock())
+    client._client = gamma
+    return client
+
+
+class TestSnapshotCache:
+    def test_repeated_checks_fetch_each_market_once(self):
+        gamma = FakeGamma()
+        client = make_client(gamma)
+
+        # Mid-trade exits, edge reversal, averaging down, resolution check
+        for _ in range(3):
+            snapshots = client.get_snapshots_batch(["1", "2", "missing"])
+        single = client.get_snapshot("2")
+
+        assert gamma.calls == [["1", "2", "missing"]]
+        assert snapshots["1"].mid_price == 0.40
+        assert snapshots["missing"] is None
+        assert single is snapshots["2"]
+        assert client.cache_stats()["misses"] == 3
+
+    def test_only_uncached_ids_are_requested(self):
+        gamma = FakeGamma()
+        client = make_client(gamma)
+        client.get_snapshots_batch(["1"])
+        client.get_snapshots_batch(["1", "2"])
+        assert gamma.calls == [["1"], ["2"]]
+
+    def test_entries_expire_after_ttl(self):
+        gamma = FakeGamma()
+        clock = FakeClock()
+        client = make_client(gamma, ttl=30.0, clock=clock)
+        client.get_snapshots_batch(["1"])
+        clock.now += 31
+        client.get_snapshots_batch(["1"])
+        assert len(gamma.calls) == 2
+
+    def test_max_age_caps_cache_for_frequent_pollers(self):
+        gamma = FakeGamma()
+        clock = FakeClock()
+        client = make_client(gamma, ttl=60.0, clock=clock)
+        client.get_snapshots_batch(["1"])
+        clock.now += 6
+
+        # Pipeline callers still get the cached snapshot ...
+        client.get_snapshots_batch(["1"])
+        assert len(gamma.calls) == 1
+        # ... the exit monitor (5 s interval) gets a fresh one
+        client.get_snapshots_batch(["1"], max_age_seconds=5.0)
+        assert len(gamma.calls) == 2
+
+    def test_failed_fetch_is_not_cached(self):
+        gamma = FakeGamma(fail=True)
+        client = make_client(gamma)
+        assert client.get_snapshots_batch(["1"]) == {"1": None}
+
+        gamma.fail = False
+        assert client.get_snapshots_batch(["1"])["1"] is not None
+        assert len(gamma.calls) == 2
+
+    def test_clear_cache_forces_refetch(self):
+        gamma = FakeGamma()
+        client = make_client(gamma)
+        client.get_snapshots_batch(["1"])
+        client.clear_cache()
+        client.get_snapshots_batch(["1"])
+        assert len(gamma.calls) == 2
+
+
+class TestCoalescing:
+    def test_concurrent_requests_share_one_fetch(self):
+        gamma = FakeGamma(delay=0.2)
+        client = make_client(gamma)
+        results = []
+
+        def ask():
+            results.append(client.get_snapshots_batch(["1", "2"]))
+
+        threads = [threading.Thread(target=ask) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(gamma.calls) == 1
+        assert len(results) == 4
+        assert all(r["1"] is results[0]["1"] for r in results)
@@ -4,6 +4,7 @@ UNIT TESTS - WEATHER ENGINE
 Tests for core/weather_engine.py (observer-only system)
 """
 
+import os
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -45,6 +46,8 @@ def create_test_config():
         "MIN_EDGE": 0.25,
         "MEDIUM_CONFIDENCE_EDGE_MULTIPLIER": 1.5,
         "LOG_ALL_OBSERVATIONS": False,  # Disable logging for tests
+        # Edge observations are still logged: keep them out of the repo's logs/
+        "OBSERVATION_LOG_PATH": os.devnull,
         "CONFIDENCE_THRESHOLDS": {
             "HIGH_CONFIDENCE_MAX_HOURS": 72,
             "MEDIUM_CONFIDENCE_MAX_HOURS": 168,
@@ -420,6 +423,171 @@ def test_engine_multiple_markets():
     assert result.markets_processed == 3
 
 
+def test_engine_concurrent_preserves_market_order():
+    """Test parallel processing overlaps markets but keeps input order."""
+    import time
+
+    config = create_test_config()
+    config["MARKET_WORKERS"] = 4
+    delays = {"New York": 0.2, "London": 0.1, "Tokyo": 0.0, "Seoul": 0.15}
+
+    def market_fetcher():
+        return [
+            create_valid_market(f"m{i}", city, 100.0, 0.03)
+            for i, city in enumerate(delays)
+        ]
+
+    def slow_forecast_fetcher(city, resolution_time):
+        time.sleep(delays[city])
+        return create_forecast(city=city, temperature_f=108.0)
+
+    engine = WeatherEngine(
+        config,
+        market_fetcher=market_fetcher,
+        forecast_fetcher=slow_forecast_fetcher,
+    )
+
+    result = engine.run()
+
+    assert [o.market_id for o in result.observations] == ["m0", "m1", "m2", "m3"]
+    assert set(result.market_latencies) == {"m0", "m1", "m2", "m3"}
+    assert result.market_latencies["m0"] >= 0.2
+    # Sequential would take >= 0.45s
+    assert result.run_duration_seconds < 0.4
+    assert result.to_dict()["market_latency_max_seconds"] >= 0.2
+
+
+def test_engine_ladder_one_build_per_city_date():
+    """Markets of one (city, date) are evaluated from a single ladder build."""
+    from core.ensemble_builder import EnsembleForecast
+
+    config = create_test_config()
+    config["ENSEMBLE"] = {"ENABLED": True}
+    config["MARKET_WORKERS"] = 4
+
+    def market_fetcher():
+        return [
+            create_valid_market("ny-100", "New York", 100.0, 0.03),
+            create_valid_market("lon-95", "London", 95.0, 0.04),
+            create_valid_market("ny-102", "New York", 102.0, 0.03),
+            create_valid_market("ny-98", "New York", 98.0, 0.05),
+        ]
+
+    class StubBuilder:
+        def __init__(self):
+            self.calls = []
+
+        def prefetch(self, cities):
+            return {}
+
+        def precompute_daily_extremes(self, city_dates):
+            return 0
+
+        def local_date(self, city, moment):
+            return moment.date()
+
+        def build_ladder(self, city, target_time, intervals, metric="point"):
+            self.calls.append((city, list(intervals)))
+            return [
+                EnsembleForecast(
+                    city=city, target_time=target_time, source_forecasts=[],
+                    ensemble_temperature_f=99.0, temperature_spread_f=0.0,
+                    source_count=2, independent_model_count=2,
+                    per_source_probabilities={}, ensemble_mean_probability=0.3,
+                    ensemble_variance=0.0, max_source_deviation=0.0,
+                    confidence_adjustment="NONE",
+                )
+                for _ in intervals
+            ]
+
+        def _calculate_sigma(self, days):
+            return 3.5
+
+    engine = WeatherEngine(config, market_fetcher=market_fetcher)
+    stub = StubBuilder()
+    engine._ensemble_builder = stub
+
+    result = engine.run()
+
+    assert [o.market_id for o in result.observations] == ["ny-100", "lon-95", "ny-102", "ny-98"]
+    assert sorted(city for city, _ in stub.calls) == ["London", "New York"]
+    ny_intervals = next(iv for city, iv in stub.calls if city == "New York")
+    assert ny_intervals == [(100.0, None), (102.0, None), (98.0, None)]
+    assert all(o.model_probability == 0.3 for o in result.observations)
+
+
+def test_engine_ladder_groups_by_local_date():
+    """A late-evening US market (after midnight UTC) joins its local day's ladder."""
+    from core.ensemble_builder import EnsembleBuilder
+
+    config = create_test_config()
+    config["ENSEMBLE"] = {"ENABLED": True}
+    config["CITY_CONFIG"] = {"New York": {"timezone": "America/New_York"}}
+    engine = WeatherEngine(config)
+    engine._ensemble_builder = EnsembleBuilder(config)
+
+    day = (datetime.utcnow() + timedelta(days=3)).replace(hour=0, minute=0, second=0, microsecond=0)
+    evening = create_valid_market("ny-evening", "New York", 100.0)
+    evening.resolution_time = day - timedelta(hours=1)          # 18:00/19:00 local, previous day
+    after_midnight_utc = create_valid_market("ny-late", "New York", 102.0)
+    after_midnight_utc.resolution_time = day + timedelta(hours=3)  # 22:00/23:00 local, previous day
+    next_day = create_valid_market("ny-next", "New York", 98.0)
+    next_day.resolution_time = day + timedelta(hours=12)
+
+    units = engine._group_ladders([evening, after_midnight_utc, next_day])
+
+    assert units == [[0, 1], [2]]
+    assert engine._local_date(after_midnight_utc) == (day - timedelta(days=1)).date()
+
+
+def test_plain_threshold_market_keeps_point_forecast():
+    """Daily extremes apply to highest/lowest questions only, not plain thresholds."""
+    from core.ensemble_builder import EnsembleBuilder
+    from core.forecast_sources import SourceForecast
+
+    start = datetime.combine(datetime.utcnow().date() + timedelta(days=3), datetime.min.time())
+    # Cold at the resolution hour, warm later the same day
+    temps = [50.0] * 12 + [80.0] * 12 + [50.0] * 48
+    forecast = SourceForecast(
+        city="New York", target_time=start, forecast_time=start,
+        source_name="open_meteo", model_name="ecmwf", temperature_f=50.0,
+        hourly_temperatures=[(start + timedelta(hours=i), t) for i, t in enumerate(temps)],
+    )
+
+    class Source:
+        source_name = "open_meteo"
+
+        def is_available(self):
+            return True
+
+        def fetch(self, city, target_time, timeout=None):
+            return forecast
+
+    def probability(question, daily_extremes):
+        config = create_test_config()
+        config["ENSEMBLE"] = {"ENABLED": True}
+        config["DAILY_EXTREMES"] = daily_extremes
+        config["CITY_CONFIG"] = {"New York": {"timezone": "UTC"}}
+        engine = WeatherEngine(config)
+        builder = EnsembleBuilder(config)
+        builder._sources = [Source()]
+        engine._ensemble_builder = builder
+        market = create_valid_market("ny-70", "New York", 70.0)
+        market.question = question
+        market.resolution_time = start
+        ladder = builder.build_ladder(
+            "New York", start, [engine._market_interval(market)],
+            metric=engine._market_metric(market),
+        )
+        return ladder[0].ensemble_mean_probability
+
+    plain = "Will New York temperature exceed 70°F tomorrow?"
+    assert probability(plain, True) == probability(plain, False)
+
+    highest = "Will the highest temperature in New York be 70°F or higher?"
+    assert probability(highest, True) > probability(highest, False)
+
+
 def test_engine_filtered_markets():
     """Test that filtered count is less than or equal to processed."""
     config = create_test_config()
@@ -677,6 +845,8 @@ def get_tests() -> List[Tuple[str, Callable]]:
         ("engine_run_duration", test_engine_run_duration),
         ("engine_isolation_no_forbidden_imports", test_engine_isolation_no_forbidden_imports),
         ("engine_multiple_markets", test_engine_multiple_markets),
+        ("engine_concurrent_preserves_market_order", test_engine_concurrent_preserves_market_order),
+        ("engine_ladder_one_build_per_city_date", test_engine_ladder_one_build_per_city_date),
         ("engine_filtered_markets", test_engine_filtered_markets),
         ("engine_actionable_subset", test_engine_actionable_subset),
         ("process_market_no_threshold", test_process_market_no_threshold),
@@ -557,6 +557,48 @@ def test_create_filter_from_config():
         os.unlink(path)
 
 
+
+def test_ladder_event_ranges():
+    """Ladder questions yield whole-degree intervals in °F."""
+    config = create_test_config()
+    f = WeatherMarketFilter(config)
+
+    cases = [
+        ("be between 48-49°F", "between", (47.5, 49.5)),
+        ("be 56°F or higher", "exceeds", (55.5, None)),
+        ("be 31°F or below", "below", (None, 31.5)),
+        ("be 10°C", "between", (9.5 * 9 / 5 + 32, 10.5 * 9 / 5 + 32)),
+        ("exceed 100°F", "exceeds", (100.0, None)),
+        ("be below 32°F", "below", (None, 32.0)),
+        # Inclusive tails tile with the buckets however they are phrased
+        ("reach 56°F or higher", "exceeds", (55.5, None)),
+        ("reach 56°F or above", "exceeds", (55.5, None)),
+        ("reach 56°F+", "exceeds", (55.5, None)),
+        ("be >= 56°F", "exceeds", (55.5, None)),
+        ("reach 31°F or below", "below", (None, 31.5)),
+        ("be <= 31°F", "below", (None, 31.5)),
+        ("be >= 13°C", "exceeds", (12.5 * 9 / 5 + 32, None)),
+    ]
+    for i, (phrase, event_type, expected) in enumerate(cases):
+        market = WeatherMarket(
+            market_id=f"ladder-{i}",
+            question=f"Will the highest temperature in London {phrase} tomorrow?",
+            resolution_text="Resolves per Weather Underground",
+            description="Weather market",
+            category="WEATHER",
+            is_binary=True,
+            liquidity_usd=100.0,
+            odds_yes=0.05,
+            resolution_time=datetime.utcnow() + timedelta(hours=72),
+        )
+        result = f.filter_market(market)
+        assert result.passed is True, (phrase, result.rejection_reasons)
+        assert result.market.detected_event_type == event_type, phrase
+        low, high = result.market.detected_range_f
+        for got, want in ((low, expected[0]), (high, expected[1])):
+            assert (got is None and want is None) or abs(got - want) < 1e-9, phrase
+
+
 def test_all_city_patterns():
     """Test all city pattern aliases are detected correctly."""
     config = create_test_config()
@@ -625,4 +667,5 @@ def get_tests() -> List[Tuple[str, Callable]]:
         ("multiple_rejection_reasons", test_multiple_rejection_reasons),
         ("create_filter_from_config", test_create_filter_from_config),
         ("all_city_patterns", test_all_city_patterns),
+        ("ladder_event_ranges", test_ladder_event_ranges),
     ]
@@ -22,7 +22,12 @@ from core.weather_probability_model import (
     probability_below,
     compute_edge,
     meets_edge_threshold,
+    compute_probability_batch,
+    compute_probability_from_forecast_temp,
+    SigmaHorizonTable,
 )
+from core.probability_memo import get_probability_memo, reset_probability_memos
+import core.weather_probability_model as probability_model
 from core.weather_signal import WeatherConfidence
 
 
@@ -537,6 +542,138 @@ def test_determine_confidence_direct():
     assert model._determine_confidence(500.0) == WeatherConfidence.LOW
 
 
+# =============================================================================
+# BATCH ENGINE TESTS
+# =============================================================================
+
+def test_batch_matches_scalar():
+    """Batch probabilities equal the scalar path row by row."""
+    means = [95.0, 100.0, 60.0, 72.5]
+    sigmas = [3.5, 2.8, 4.2, 7.0]
+    thresholds = [100.0, 100.0, 55.0, 70.0]
+    events = ["exceeds", "below", "exceeds", "below"]
+
+    result = compute_probability_batch(means, sigmas, thresholds, events, groups=[0, 1, 2, 3])
+
+    for i, prob in enumerate(result.probabilities):
+        expected = compute_probability_from_forecast_temp(means[i], thresholds[i], sigmas[i], events[i])
+        assert abs(prob - expected) < 1e-6  # NumPy kernel: A&S erf, |error| < 1.5e-7
+    assert result.group_count == 4
+    assert result.variance == [0.0, 0.0, 0.0, 0.0]
+
+
+def test_batch_group_stats():
+    """Weighted mean, variance and max deviation per group."""
+    # Group 0: two sources at P=0.5 and one far below; group 1: single row
+    result = compute_probability_batch(
+        means=[100.0, 100.0, 90.0, 80.0],
+        sigmas=[3.5] * 4,
+        thresholds=[100.0, 100.0, 100.0, 80.0],
+        weights=[0.5, 0.5, 1.0, 1.0],
+        groups=[0, 0, 0, 1],
+    )
+    p = result.probabilities
+    mean0 = (0.5 * p[0] + 0.5 * p[1] + 1.0 * p[2]) / 2.0
+    var0 = (0.5 * (p[0] - mean0) ** 2 + 0.5 * (p[1] - mean0) ** 2 + (p[2] - mean0) ** 2) / 2.0
+
+    assert abs(result.mean[0] - mean0) < 1e-12
+    assert abs(result.variance[0] - var0) < 1e-12
+    assert abs(result.max_deviation[0] - abs(p[2] - mean0)) < 1e-12
+    assert abs(result.mean[1] - 0.5) < 1e-12
+
+
+def test_batch_rejects_invalid_input():
+    """Invalid sigma, event type or length mismatch raise ValueError."""
+    for kwargs in (
+        {"means": [1.0], "sigmas": [0.0], "thresholds": [1.0]},
+        {"means": [1.0], "sigmas": [1.0], "thresholds": [1.0], "event_types": "between"},
+        {"means": [1.0, 2.0], "sigmas": [1.0], "thresholds": [1.0, 2.0]},
+    ):
+        try:
+            compute_probability_batch(**kwargs)
+            assert False, "Should raise ValueError"
+        except ValueError:
+            pass
+
+
+def test_batch_numpy_matches_python():
+    """NumPy kernel agrees with the pure-Python fallback (if installed)."""
+    args = ([95.0, 100.0, 60.0], [3.5, 2.8, 4.2], [100.0, 98.0, 66.0], ["exceeds", "below", "exceeds"])
+    if probability_model.np is None:
+        try:
+            compute_probability_batch(*args, use_numpy=True)
+            assert False, "Should raise RuntimeError without NumPy"
+        except RuntimeError:
+            pass
+        return
+
+    fast = compute_probability_batch(*args, groups=[0, 0, 1], use_numpy=True)
+    slow = compute_probability_batch(*args, groups=[0, 0, 1], use_numpy=False)
+    for a, b in zip(fast.probabilities + fast.mean + fast.variance + fast.max_deviation,
+                    slow.probabilities + slow.mean + slow.variance + slow.max_deviation):
+        assert abs(a - b) < 1e-6
+
+
+def test_batch_empty():
+    """Empty input yields empty result."""
+    result = compute_probability_batch([], [], [])
+    assert result.probabilities == [] and result.group_count == 0
+
+
+# =============================================================================
+# MEMO / SIGMA TABLE TESTS
+# =============================================================================
+
+def test_sigma_table_matches_linear_scan():
+    """Bisect table picks the largest key <= days (1.0 below the first)."""
+    adjustments = {1: 0.8, 2: 0.9, 3: 1.0, 5: 1.2, 7: 1.5, 10: 2.0}
+    table = SigmaHorizonTable(3.5, adjustments)
+
+    for days in (0.0, 0.99, 1.0, 2.5, 4.99, 5.0, 9.9, 10.0, 30.0):
+        expected = 1.0
+        for key in sorted(adjustments):
+            if days >= key:
+                expected = adjustments[key]
+        assert table.multiplier(days) == expected
+        assert table.sigma(days) == 3.5 * expected
+    assert table.bucket(0.5) == -1
+    assert table.bucket(2.5) == table.bucket(2.9)
+
+
+def test_memo_reuses_unchanged_forecast():
+    """Same forecast + horizon bucket -> memo hit with fresh hours."""
+    reset_probability_memos()
+    model = WeatherProbabilityModel(create_test_config())
+    forecast = create_forecast(temperature_f=95.0, hours_ahead=48.0)
+
+    first = model.compute_probability(forecast, 100.0)
+    second = model.compute_probability(forecast, 100.0)
+
+    assert get_probability_memo().stats()["hits"] == 1
+    assert second.fair_probability == first.fair_probability
+    assert second is not first
+
+    # Changed forecast content -> recomputed
+    changed = create_forecast(temperature_f=97.0, hours_ahead=48.0)
+    third = model.compute_probability(changed, 100.0)
+    assert third.fair_probability > first.fair_probability
+    assert get_probability_memo().stats()["hits"] == 1
+    reset_probability_memos()
+
+
+def test_memo_is_size_bounded():
+    """LRU evicts the least recently used entry."""
+    from core.probability_memo import ProbabilityMemo
+
+    memo = ProbabilityMemo(max_entries=2)
+    memo.put("a", 1)
+    memo.put("b", 2)
+    memo.get("a")
+    memo.put("c", 3)
+    assert memo.get("b") is None
+    assert memo.get("a") == 1 and len(memo) == 2
+
+
 # =============================================================================
 # TEST REGISTRY
 # =============================================================================
@@ -585,4 +722,12 @@ def get_tests() -> List[Tuple[str, Callable]]:
         ("create_low_confidence_result", test_create_low_confidence_result),
         ("calculate_adjusted_sigma_direct", test_calculate_adjusted_sigma_direct),
         ("determine_confidence_direct", test_determine_confidence_direct),
+        ("batch_matches_scalar", test_batch_matches_scalar),
+        ("batch_group_stats", test_batch_group_stats),
+        ("batch_rejects_invalid_input", test_batch_rejects_invalid_input),
+        ("batch_numpy_matches_python", test_batch_numpy_matches_python),
+        ("batch_empty", test_batch_empty),
+        ("sigma_table_matches_linear_scan", test_sigma_table_matches_linear_scan),
+        ("memo_reuses_unchanged_forecast", test_memo_reuses_unchanged_forecast),
+        ("memo_is_size_bounded", test_memo_is_size_bounded),
     ]